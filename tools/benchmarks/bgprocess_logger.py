@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility benchmarks the background process logger
+# (web/pgadmin/misc/bgprocess/process_executor.py) against a synthetic,
+# noisy child process that behaves like a verbose pg_dump/pg_restore,
+# comparing line-by-line writes with the default buffered writes.
+#
+# Usage: python tools/benchmarks/bgprocess_logger.py [--lines N]
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import time
+from subprocess import Popen, PIPE
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'web', 'pgadmin', 'misc',
+                                'bgprocess'))
+
+import process_executor  # noqa: E402
+
+# The same pattern BatchProcess.read_log() uses to parse the log lines
+LOG_LINE_RE = re.compile(r"(\d+),(.*$)")
+
+CHILD_SCRIPT = """
+import sys
+out = sys.stdout
+for i in range({lines}):
+    out.write('pg_dump: dumping contents of table "public.table_%d"\\n' % i)
+    if i % 1000 == 0:
+        sys.stderr.write('pg_dump: processing item %d\\n' % i)
+"""
+
+
+def run_child(out_dir, lines, buffer_size):
+    process_executor._out_dir = out_dir
+
+    stdout = process_executor.ProcessLogger('out', buffer_size=buffer_size)
+    stderr = process_executor.ProcessLogger('err', buffer_size=buffer_size)
+
+    start = time.perf_counter()
+    process = Popen(
+        [sys.executable, '-c', CHILD_SCRIPT.format(lines=lines)],
+        stdout=PIPE, stderr=PIPE
+    )
+    stdout.attach_process_stream(process, process.stdout)
+    stderr.attach_process_stream(process, process.stderr)
+    stdout.start()
+    stderr.start()
+    stdout.join()
+    stderr.join()
+    process.wait()
+    stdout.release()
+    stderr.release()
+
+    return time.perf_counter() - start
+
+
+def count_log_lines(logfile):
+    count = 0
+    with open(logfile, 'rb') as f:
+        for line in f:
+            # Every message ends with its own newline, followed by the
+            # separator; read_log() skips the resulting blank lines too.
+            if not line.strip():
+                continue
+            if len(LOG_LINE_RE.split(line.decode('utf-8', 'replace'))) < 3:
+                raise ValueError('Unparsable log line: {0!r}'.format(line))
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the background process logger.')
+    parser.add_argument('--lines', type=int, default=500000,
+                        help='number of lines the child process writes')
+    args = parser.parse_args()
+
+    for label, buffer_size in (
+        ('line by line', 0),
+        ('buffered', process_executor._LOG_BUFFER_SIZE),
+    ):
+        with tempfile.TemporaryDirectory() as out_dir:
+            elapsed = run_child(out_dir, args.lines, buffer_size)
+            logged = count_log_lines(os.path.join(out_dir, 'out'))
+            if logged != args.lines:
+                raise ValueError('Expected {0} lines, logged {1}'.format(
+                    args.lines, logged))
+
+        print('{0:>14}: {1:8.3f}s, {2:10.0f} lines/s'.format(
+            label, elapsed, args.lines / elapsed))
+
+
+if __name__ == '__main__':
+    main()
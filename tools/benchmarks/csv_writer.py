@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility benchmarks the CSV writer used to download the results of the
+# query tool (web/pgadmin/utils/csv_lib.py), writing synthetic rows of mixed
+# types (with nulls) the way Connection.execute_on_server_as_csv() does, i.e.
+# with a DictWriter per batch of rows.
+#
+# The pure-Python quoting strategies are compared with the fast path (the C
+# csv module), with and without the types of the columns, for each quoting
+# option of the query tool. The outputs are checked to be identical.
+#
+# Usage: python tools/benchmarks/csv_writer.py [--rows N] [--batch N]
+#                                              [--nulls STRING]
+
+import argparse
+import decimal
+import os
+import sys
+import time
+import uuid
+from io import StringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '..', 'web', 'pgadmin', 'utils'))
+
+import csv_lib as csv  # noqa: E402
+
+# (name, type of the column, value generator)
+COLUMNS = [
+    ('id', csv.NUMERIC_COLUMN, lambda i: i),
+    ('amount', csv.NUMERIC_COLUMN,
+     lambda i: decimal.Decimal(i) / 100 if i % 7 else None),
+    ('ratio', csv.NUMERIC_COLUMN, lambda i: i / 3),
+    ('active', csv.NUMERIC_COLUMN, lambda i: i % 2 == 0),
+    ('name', csv.TEXT_COLUMN, lambda i: 'name {0}'.format(i)),
+    ('address', csv.TEXT_COLUMN,
+     lambda i: '{0} "Main" Street, Springfield'.format(i)),
+    ('note', csv.TEXT_COLUMN, lambda i: None if i % 3 else 'note'),
+    ('created', csv.TEXT_COLUMN, lambda i: '2026-01-01 10:00:00'),
+    ('doc', csv.TEXT_COLUMN, lambda i: '{{"key": {0}}}'.format(i)),
+    ('ref', None, lambda i: uuid.UUID(int=i)),
+]
+
+
+def generate_rows(count):
+    names = [name for name, _, _ in COLUMNS]
+    return [dict(zip(names, (value(i) for _, _, value in COLUMNS)))
+            for i in range(count)]
+
+
+def write(rows, batch, quoting, nulls, mode):
+    names = [name for name, _, _ in COLUMNS]
+    column_types = [column_type for _, column_type, _ in COLUMNS] \
+        if mode == 'fast (typed)' else None
+    output = []
+
+    for start in range(0, len(rows), batch):
+        res_io = StringIO()
+        writer = csv.DictWriter(
+            res_io, fieldnames=names, delimiter=',', quoting=quoting,
+            quotechar='"', replace_nulls_with=nulls,
+            column_types=column_types)
+        if mode == 'pure-Python':
+            writer.writer.fast_writer = None
+        if start == 0:
+            writer.writeheader()
+        writer.writerows(rows[start:start + batch])
+        output.append(res_io.getvalue())
+
+    return ''.join(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the CSV writer of the query tool downloads.')
+    parser.add_argument('--rows', type=int, default=1000000,
+                        help='number of rows to write (of {0} cells)'.format(
+                            len(COLUMNS)))
+    parser.add_argument('--batch', type=int, default=2000,
+                        help='rows per DictWriter')
+    parser.add_argument('--nulls', default='NULL',
+                        help='string replacing the null values')
+    args = parser.parse_args()
+
+    rows = generate_rows(args.rows)
+    print('{0} rows, {1} cells'.format(args.rows, args.rows * len(COLUMNS)))
+
+    for label, quoting in (('strings', csv.QUOTE_NONNUMERIC),
+                           ('all', csv.QUOTE_ALL),
+                           ('none', csv.QUOTE_NONE)):
+        outputs = []
+        for mode in ('pure-Python', 'fast', 'fast (typed)'):
+            start = time.perf_counter()
+            outputs.append(write(rows, args.batch, quoting, args.nulls, mode))
+            elapsed = time.perf_counter() - start
+            print('{0:>8} {1:>13}: {2:8.2f}s, {3:8.1f}ns/cell'.format(
+                label, mode, elapsed,
+                elapsed * 1e9 / (args.rows * len(COLUMNS))))
+
+        if any(output != outputs[0] for output in outputs):
+            print('{0:>8}: the outputs differ!'.format(label))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility benchmarks the quoting of the identifiers (the qtIdent and
+# qtTypeIdent Jinja filters) while rendering the DDL of a schema, i.e. the
+# CREATE TABLE statements of --tables synthetic tables (with --columns
+# columns, a primary key, a foreign key to the previous table, an owner and
+# a comment each), using the templates of the tables node.
+#
+# The DDL is rendered with the cache of the quoted identifiers disabled
+# (each identifier is checked against the keyword table, every time), and
+# enabled; the time spent in the qtIdent and qtTypeIdent filters is reported
+# separately. The outputs are checked to be identical.
+#
+# Usage: python tools/benchmarks/identifier_quoting.py [--tables N]
+#                                                      [--columns N]
+#                                                      [--runs N]
+
+import argparse
+import os
+import sys
+import time
+from unittest.mock import patch
+
+WEB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       '..', '..', 'web')
+SERVERS_DIR = os.path.join(WEB_DIR, 'pgadmin', 'browser', 'server_groups',
+                           'servers')
+SCHEMAS_DIR = os.path.join(SERVERS_DIR, 'databases', 'schemas')
+TEMPLATE = 'tables/sql/16_plus/create.sql'
+
+# (name, type) of the columns, repeated as needed
+COLUMNS = [
+    ('id', 'bigint'),
+    ('name', 'character varying'),
+    ('user', 'text'),
+    ('created', 'timestamp with time zone'),
+    ('amount', 'numeric'),
+    ('Status', 'character(1)'),
+    ('order', 'integer'),
+    ('tags', 'text[]'),
+    ('doc', 'jsonb'),
+    ('ratio', 'double precision'),
+]
+
+
+class TimedFilter:
+    """Measures the time spent in a Jinja filter."""
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+        self.elapsed = 0
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        try:
+            return self.func(*args)
+        finally:
+            self.elapsed += time.perf_counter() - start
+            self.calls += 1
+
+
+class FakeConn:
+    """Stands in for a connection, for the qtLiteral filter."""
+    conn = None
+
+    def __bool__(self):
+        return True
+
+
+def create_environment():
+    sys.path.insert(0, WEB_DIR)
+    import config  # noqa: F401
+    from jinja2 import Environment, FileSystemLoader
+    from pgadmin.utils.driver.psycopg3 import Driver
+
+    env = Environment(trim_blocks=True, loader=FileSystemLoader([
+        os.path.join(SCHEMAS_DIR, 'tables', 'templates'),
+        os.path.join(SCHEMAS_DIR, 'types', 'templates'),
+        os.path.join(SCHEMAS_DIR, 'templates'),
+        os.path.join(SERVERS_DIR, 'templates'),
+    ]))
+    env.filters['qtLiteral'] = Driver.qtLiteral
+    env.filters['qtIdent'] = TimedFilter(Driver.qtIdent)
+    env.filters['qtTypeIdent'] = TimedFilter(Driver.qtTypeIdent)
+    return env
+
+
+def generate_tables(count, columns):
+    tables = []
+    for idx in range(count):
+        names = []
+        cols = []
+        for col in range(columns):
+            name, cltype = COLUMNS[col % len(COLUMNS)]
+            if col >= len(COLUMNS):
+                name = '{0}_{1}'.format(name, col // len(COLUMNS))
+            names.append(name)
+            cols.append(dict(name=name, cltype=cltype.replace('[]', ''),
+                             attnotnull=col == 0, attlen=None,
+                             attprecision=None,
+                             hasSqrBracket=cltype.endswith('[]')))
+        table = dict(
+            name='table_{0}'.format(idx), schema='public',
+            relowner='postgres', description='Table {0}'.format(idx),
+            columns=cols,
+            primary_key=[dict(name='table_{0}_pkey'.format(idx),
+                              columns=[dict(column=names[0])])],
+            foreign_key=[])
+        if idx:
+            table['foreign_key'].append(dict(
+                name='table_{0}_fkey'.format(idx),
+                columns=[dict(local_column=names[0], referenced=names[0])],
+                remote_schema='public', remote_table='table_{0}'.format(
+                    idx - 1), confupdtype='a', confdeltype='c',
+                convalidated=True))
+        tables.append(table)
+    return tables
+
+
+def render(env, tables):
+    template = env.get_template(TEMPLATE)
+    conn = FakeConn()
+    return '\n'.join(template.render(data=table, conn=conn)
+                     for table in tables)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the quoting of the identifiers, rendering '
+                    'the DDL of a schema.')
+    parser.add_argument('--tables', type=int, default=5000,
+                        help='number of tables in the schema')
+    parser.add_argument('--columns', type=int, default=20,
+                        help='number of columns per table')
+    parser.add_argument('--runs', type=int, default=3,
+                        help='number of renderings (the best is reported)')
+    args = parser.parse_args()
+
+    env = create_environment()
+    from pgadmin.utils.driver import psycopg3
+    quote_identifier = psycopg3.quote_identifier
+    tables = generate_tables(args.tables, args.columns)
+    # Compile the templates
+    render(env, tables[:1])
+
+    filters = [env.filters['qtIdent'], env.filters['qtTypeIdent']]
+    outputs = []
+    for label, quote in (('uncached', quote_identifier.__wrapped__),
+                         ('cached', quote_identifier)):
+        quote_identifier.cache_clear()
+        best = None
+        with patch.object(psycopg3, 'quote_identifier', quote):
+            for _ in range(args.runs):
+                for timed in filters:
+                    timed.calls = timed.elapsed = 0
+                start = time.perf_counter()
+                output = render(env, tables)
+                elapsed = time.perf_counter() - start
+                if best is None or elapsed < best[0]:
+                    best = (elapsed, sum(timed.elapsed for timed in filters))
+        outputs.append(output)
+
+        print('{0:>9}: {1:8.3f}s for {2} tables, {3:8.3f}s in {4} calls of '
+              'the filters'.format(label, best[0], args.tables, best[1],
+                                   sum(timed.calls for timed in filters)))
+
+    if any(output != outputs[0] for output in outputs):
+        print('The outputs differ!')
+
+
+if __name__ == '__main__':
+    main()
@@ -993,6 +993,54 @@ AUTO_DISCOVER_SERVERS = True
 #############################################################################
 SERVER_HEARTBEAT_TIMEOUT = 30  # In seconds
 
+#############################################################################
+# REVERSE_ENGINEERED_SQL_CACHE_TTL is the time (in seconds) the reverse
+# engineered SQL of an object (shown in the SQL tab of the tables and of the
+# partitions) is cached. A fingerprint of the catalog rows it is built from
+# is checked, with a single query, before the cached SQL is used, so that the
+# DDL run outside pgAdmin is taken into account. The objects renamed outside
+# the catalog rows of the object (e.g. the owner role) are seen within that
+# time. Set it to 0 to disable the cache.
+# REVERSE_ENGINEERED_SQL_CACHE_SIZE is the maximum number of objects cached.
+#############################################################################
+REVERSE_ENGINEERED_SQL_CACHE_TTL = 600  # In seconds
+REVERSE_ENGINEERED_SQL_CACHE_SIZE = 256
+
+#############################################################################
+# DDL_SCRIPT_WORKERS is the number of schemas scripted in parallel, each with
+# its own connection to the database, when the DDL script of a database is
+# generated.
+#############################################################################
+DDL_SCRIPT_WORKERS = 4
+
+#############################################################################
+# COLLECTION_STATISTICS_CACHE_TTL is the time (in seconds) the statistics of
+# all the tables of a schema (the Statistics tab of the Tables collection)
+# are cached. Set it to 0 to disable the cache.
+# COLLECTION_STATISTICS_PGSTATTUPLE adds the dead tuples and free space
+# reported by the pgstattuple extension, if it is installed in the database,
+# to these statistics. The tables larger than PGSTATTUPLE_APPROX_MIN_SIZE
+# (in bytes) are estimated by pgstattuple_approx, which skips their
+# all-visible pages, instead of being scanned in full.
+#############################################################################
+COLLECTION_STATISTICS_CACHE_TTL = 10  # In seconds
+COLLECTION_STATISTICS_PGSTATTUPLE = False
+PGSTATTUPLE_APPROX_MIN_SIZE = 100 * 1024 * 1024
+
+#############################################################################
+# DEPENDENCY_GRAPH_CACHE_TTL is the time (in seconds) the dependency graph of
+# a database, from which the Dependencies and Dependents tabs of its objects
+# are shown, is cached. It is built with a single scan of pg_depend and
+# pg_shdepend, and discarded as soon as pgAdmin modifies an object of the
+# server; the changes made outside pgAdmin are seen within that time. Set it
+# to 0 to disable the cache (the dependencies of each object are then
+# fetched by their own query).
+# DEPENDENCY_GRAPH_CACHE_SIZE is the maximum number of graphs cached (one per
+# user and database).
+#############################################################################
+DEPENDENCY_GRAPH_CACHE_TTL = 30  # In seconds
+DEPENDENCY_GRAPH_CACHE_SIZE = 16
+
 #############################################################################
 # ENABLE_SERVER_PASS_EXEC_CMD is used to enable/disable Password exec command
 # field in server properties. This is used to specify a shell command to be
@@ -1012,6 +1060,17 @@ MAX_SERVER_TAGS_ALLOWED = 5
 
 ON_DEMAND_LOG_COUNT = 10000
 
+##############################################################################
+# Dashboard graphs
+# The dashboards open on the same server or database share a background
+# sampler that collects the graph statistics every DASHBOARD_SAMPLE_INTERVAL
+# seconds and keeps the last DASHBOARD_SAMPLE_HISTORY samples, which are
+# sent to every dashboard as it opens.
+##############################################################################
+
+DASHBOARD_SAMPLE_INTERVAL = 1
+DASHBOARD_SAMPLE_HISTORY = 300
+
 ##########################################################################
 # AI/LLM Settings
 ##########################################################################
@@ -1120,6 +1179,19 @@ ALLOWED_LLM_API_URLS = [
 # Users can override this in their preferences.
 MAX_LLM_TOOL_ITERATIONS = 20
 
+# Schema Context Cache
+# Results of the AI assistant's schema inspection tools are cached per
+# server and database for LLM_SCHEMA_CACHE_TTL seconds. The catalog is
+# checked for DDL changes at most every LLM_SCHEMA_CACHE_CHECK_INTERVAL
+# seconds; if it has changed, the cached results are discarded.
+LLM_SCHEMA_CACHE_TTL = 300
+LLM_SCHEMA_CACHE_CHECK_INTERVAL = 30
+
+# Maximum size (in characters) of the compact schema summary that is
+# included in the AI assistant's system prompt. Larger schemas are
+# summarised by object name only, and truncated if still too large.
+LLM_SCHEMA_SUMMARY_MAX_CHARS = 8000
+
 #############################################################################
 # Patch the default config with custom config and other manipulations
 #############################################################################
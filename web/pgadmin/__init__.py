@@ -19,7 +19,7 @@ import shutil
 
 from types import MethodType
 from collections import defaultdict
-from importlib import import_module
+from importlib.metadata import version
 
 from flask import Flask, abort, request, current_app, session, url_for
 from flask_socketio import SocketIO
@@ -34,7 +34,7 @@ from flask_security.utils import login_user, logout_user
 from flask_migrate import Migrate
 from werkzeug.datastructures import ImmutableDict
 from werkzeug.local import LocalProxy
-from werkzeug.utils import find_modules
+from werkzeug.routing import Map, Rule
 from jinja2 import select_autoescape
 from flask_wtf.csrf import CSRFError
 
@@ -75,7 +75,61 @@ socketio = SocketIO(manage_session=False, async_mode='threading',
 _INDEX_PATH = 'browser.index'
 
 
+class LazyBuilderRule(Rule):
+    """
+    A URL rule generating the code of its URL builder the first time a URL
+    is built for it, rather than when it is added to the URL map.
+
+    Werkzeug generates and compiles two Python functions per rule to build
+    its URLs. With well over a thousand rules registered by the browser
+    nodes and tools, that was about half of the application start up time,
+    while only a fraction of the rules are ever used with url_for().
+
+    This overrides a private method of the werkzeug Rule, so it is only used
+    with the werkzeug versions it is known to work with (see
+    get_url_rule_class()).
+    """
+
+    def compile_builder(self, append_unknown=True):
+        """Returns the URL builder of the rule, compiled by werkzeug."""
+        return super()._compile_builder(append_unknown)
+
+    def _compile_builder(self, append_unknown=True):
+        builder = None
+
+        def _lazy_builder(rule, **values):
+            nonlocal builder
+            if builder is None:
+                builder = rule.compile_builder(append_unknown)
+            return builder(rule, **values)
+
+        return _lazy_builder
+
+
+def get_url_rule_class():
+    """
+    Returns LazyBuilderRule if it builds the same URLs as the werkzeug Rule
+    with the installed werkzeug (3.x, see requirements.txt), or the werkzeug
+    Rule otherwise.
+    """
+    if not version('werkzeug').startswith('3.'):
+        return Rule
+
+    try:
+        rule = LazyBuilderRule('/<int:id>/<path:name>', endpoint='probe')
+        Map([rule])
+        if rule.build({'id': 1, 'name': 'a/b', 'x': 'y'}) == \
+                ('', '/1/a/b?x=y'):
+            return LazyBuilderRule
+    except Exception:
+        pass
+
+    return Rule
+
+
 class PgAdmin(Flask):
+    url_rule_class = get_url_rule_class()
+
     def __init__(self, *args, **kwargs):
         # Set the template loader to a postgres-version-aware loader
         self.jinja_options = ImmutableDict(
@@ -87,23 +141,6 @@ class PgAdmin(Flask):
 
         super().__init__(*args, **kwargs)
 
-    def find_submodules(self, basemodule):
-        try:
-            for module_name in find_modules(basemodule, True):
-                if module_name in self.config['MODULE_BLACKLIST']:
-                    self.logger.info(
-                        'Skipping blacklisted module: %s' % module_name
-                    )
-                    continue
-                self.logger.info(
-                    'Examining potential module: %s' % module_name)
-                module = import_module(module_name)
-                for key in list(module.__dict__.keys()):
-                    if isinstance(module.__dict__[key], PgAdminModule):
-                        yield module.__dict__[key]
-        except Exception:
-            return []
-
     @property
     def submodules(self):
         for blueprint in self.blueprints.values():
@@ -170,7 +207,8 @@ class PgAdmin(Flask):
 
     def run_before_app_start(self):
         # call before app starts or is exported
-        with self.app_context(), self.test_request_context():
+        with self.app_context(), self.test_request_context(), \
+                Preferences.bulk_registration():
             for callback in self.before_app_start:
                 callback()
 
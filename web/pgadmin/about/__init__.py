@@ -19,7 +19,6 @@ from pgadmin.utils.constants import MIMETYPE_APP_JS
 from pgadmin.utils.ajax import make_json_response
 import config
 from pgadmin.model import User
-from user_agents import parse
 import platform
 import re
 import sys
@@ -133,6 +132,9 @@ def detect_browser(request):
     except Exception as _:
         os_details = ''
 
+    # user_agents is slow to import (it compiles its regexes at import
+    # time), and only needed here.
+    from user_agents import parse
     os_details += parse(platform.platform()).ua_string
 
     if 'Electron' in agent:
@@ -455,5 +455,29 @@ class ServerGroupView(NodeView):
     def node(self, gid):
         return self.nodes(gid)
 
+    @pga_login_required
+    def children(self, gid):
+        """
+        Return the servers of the group, for the browser tree.
+
+        A page of them (sorted by name) is returned, along with their total
+        count, when the 'limit' (and 'offset') arguments are given, so that
+        a group with a large number of servers can be listed a page at a
+        time.
+        """
+        limit = request.args.get('limit', type=int)
+        if not limit or limit < 0:
+            return super().children(gid=gid)
+        offset = max(request.args.get('offset', 0, type=int), 0)
+
+        from .servers import blueprint as servers_module
+        servers = servers_module.get_group_servers(gid)
+
+        return make_json_response(
+            data=list(servers_module.get_nodes(
+                gid, servers[offset:offset + limit])),
+            result={'total': len(servers), 'offset': offset, 'limit': limit}
+        )
+
 
 ServerGroupView.register_node_view(blueprint)
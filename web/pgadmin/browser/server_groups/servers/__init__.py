@@ -38,7 +38,7 @@ from pgadmin.browser.server_groups.servers.utils import \
      check_ssl_fields, get_db_restriction)
 from pgadmin.utils.constants import UNAUTH_REQ, MIMETYPE_APP_JS, \
     SERVER_CONNECTION_CLOSED, RESTRICTION_TYPE_SQL
-from sqlalchemy import or_
+from sqlalchemy import or_, and_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import object_session
 from sqlalchemy.orm.attributes import flag_modified
@@ -47,7 +47,7 @@ from .... import socketio as sio
 from pgadmin.utils import get_complete_file_path
 from pgadmin.settings.utils import with_object_filters
 from pgadmin.utils.server_access import get_server, \
-    get_user_server_query, get_server_group
+    get_user_server_query, get_server_group, set_request_servers
 
 
 # File-path keys in connection_params that are per-user and must
@@ -233,29 +233,42 @@ class ServerModule(sg.ServerGroupPluginModule):
 
         return server
 
+    @staticmethod
+    def load_servers(servers):
+        """
+        Load the servers of the given query, along with the SharedServer
+        record of the current user for each of them, in a single query.
+        :param servers: query of the servers
+        :return: list of (server, shared server or None)
+        """
+        return servers.outerjoin(
+            SharedServer, and_(SharedServer.osid == Server.id,
+                               SharedServer.user_id == current_user.id)
+        ).add_entity(SharedServer).all()
+
     def get_servers(self, all_servers, hide_shared_server, gid):
         """
         This function creates list of servers which needs to display
         in browser tree
-        :param all_servers:
+        :param all_servers: query of the servers
         :param hide_shared_server:
         :param gid:
         :return: list of servers
         """
         servers = []
-        for server in all_servers:
+        shared_ids = set()
+        for server, shared_server in self.load_servers(all_servers):
             if server.discovery_id and \
                 not server.shared and \
                 config.SERVER_MODE and \
-                SharedServer.query.filter_by(
-                    user_id=current_user.id,
-                    osid=server.id).first() is not None \
+                shared_server is not None \
                     and not hide_shared_server:
                 continue
 
             if _is_non_owner(server):
 
-                shared_server = self.get_shared_server(server, gid)
+                if shared_server is None:
+                    shared_server = self.get_shared_server(server, gid)
 
                 if hide_shared_server:
                     # Don't include shared server if hide shared server is
@@ -264,8 +277,17 @@ class ServerModule(sg.ServerGroupPluginModule):
 
                 server = self.get_shared_server_properties(server,
                                                            shared_server)
+                shared_ids.add(server.id)
             servers.append(server)
 
+        # Spare the connection managers a look up of each server. They are
+        # created from the owner's record of the shared servers, not from
+        # the (detached) ones with the overlay.
+        set_request_servers(s for s in servers if s.id not in shared_ids)
+        if shared_ids:
+            set_request_servers(
+                all_servers.filter(Server.id.in_(shared_ids)))
+
         return servers
 
     def has_tag(self, server, object_filters):
@@ -286,15 +308,32 @@ class ServerModule(sg.ServerGroupPluginModule):
 
     @with_object_filters
     @pga_login_required
-    def get_nodes(self, gid, object_filters):
-        """Return a JSON document listing the server groups for the user"""
-
+    def get_group_servers(self, gid, object_filters):
+        """
+        Return the servers of the group to be listed in the browser tree,
+        sorted by name.
+        """
         hide_shared_server = get_preferences()
         servers = get_user_server_query().filter(
             Server.servergroup_id == gid, Server.is_adhoc == 0)
 
+        return sorted(
+            (server for server in
+             self.get_servers(servers, hide_shared_server, gid)
+             if self.has_tag(server, object_filters)),
+            key=lambda server: server.name
+        )
+
+    @pga_login_required
+    def get_nodes(self, gid, servers=None):
+        """
+        Return the browser nodes of the servers of the group (or of the
+        given servers of the group, e.g. a page of them).
+        """
+        if servers is None:
+            servers = self.get_group_servers(gid)
+
         driver = get_driver(PG_DEFAULT_DRIVER)
-        servers = self.get_servers(servers, hide_shared_server, gid)
 
         for server in servers:
             connected = False
@@ -306,9 +345,6 @@ class ServerModule(sg.ServerGroupPluginModule):
             server_type = 'pg'
             user_info = None
 
-            if not self.has_tag(server, object_filters):
-                continue
-
             try:
                 manager = driver.connection_manager(server.id)
                 conn = manager.connection()
@@ -20,6 +20,8 @@ from flask_security import current_user
 from pgadmin.browser.server_groups import servers
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.collection import CollectionNodeModule
+from pgadmin.browser.server_groups.servers.databases.ddl_script import \
+    DDLScript
 from pgadmin.browser.server_groups.servers.databases.utils import \
     parse_sec_labels_from_db, parse_variables_from_db, \
     get_attributes_from_db_info
@@ -167,6 +169,9 @@ class DatabaseView(PGChildNodeView):
         'sql': [
             {'get': 'sql'}
         ],
+        'ddl_script': [
+            {'get': 'ddl_script', 'post': 'ddl_script'}
+        ],
         'msql': [
             {'get': 'msql'},
             {'get': 'msql'}
@@ -1344,6 +1349,24 @@ class DatabaseView(PGChildNodeView):
 
         return ajax_response(response=SQL)
 
+    @check_precondition()
+    def ddl_script(self, gid, sid, did):
+        """
+        This function will stream the DDL script of the objects of the
+        database, or write it to the file given by the 'file' posted.
+        """
+        if not self.db_allow_connection:
+            return internal_server_error(
+                errormsg=_("Connections to the database are not allowed."))
+
+        if not self.conn.connected():
+            status, msg = self.conn.connect()
+            if not status:
+                return internal_server_error(errormsg=msg)
+
+        return DDLScript(gid, sid, did, self.manager).response(
+            '{0}.sql'.format(self.manager.db_info[did]['datname']))
+
     @check_precondition()
     def dependents(self, gid, sid, did):
         """
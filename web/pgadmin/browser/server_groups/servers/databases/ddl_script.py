@@ -0,0 +1,276 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Generation of the DDL script of a database, or of a schema.
+
+The objects to be scripted are listed with a single catalog query (see
+databases/sql/default/ddl_objects.sql), instead of walking the browser tree
+node by node, and the SQL of each object is generated in-process by its
+node view (the same code which generates its SQL tab), without any HTTP
+round trip.
+
+The schemas are scripted in parallel by DDL_SCRIPT_WORKERS threads, each
+using its own connections to the database (see
+ServerManager.thread_connections), and the script is streamed in the order
+of the schemas as they are done.
+"""
+
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Response, copy_current_request_context, current_app, \
+    render_template, request, stream_with_context
+from flask_babel import gettext
+
+import config
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.utils import filename_with_file_manager_path
+from pgadmin.utils.ajax import make_json_response, internal_server_error, \
+    bad_request
+
+# The objects of a schema, in the order they are created in
+SCHEMA_NODES = (
+    'collation', 'fts_parser', 'fts_template', 'fts_dictionary',
+    'fts_configuration', 'type', 'domain', 'sequence', 'function',
+    'trigger_function', 'procedure', 'table', 'foreign_table', 'view',
+    'mview', 'package', 'synonym'
+)
+
+# The objects of a database, created before and after its schemas
+PRE_SCHEMA_NODES = (
+    'extension', 'language', 'foreign_data_wrapper', 'foreign_server',
+    'user_mapping'
+)
+POST_SCHEMA_NODES = ('cast', 'event_trigger', 'subscription')
+
+
+def _response_sql(response):
+    """
+    Returns the SQL of a node view response (or its error message as a SQL
+    comment, if it has failed).
+    """
+    if isinstance(response, str):
+        return response
+
+    try:
+        data = json.loads(response.get_data(as_text=True))
+    except (AttributeError, ValueError):
+        return '-- {0}'.format(gettext('Failed to generate the SQL.'))
+
+    if isinstance(data, str):
+        return data
+
+    return '-- {0}'.format(
+        (data.get('errormsg') or gettext('Failed to generate the SQL.'))
+        .replace('\n', '\n-- '))
+
+
+class DDLScript:
+    """
+    The DDL script of a database (scid = None), or of one of its schemas.
+
+    Methods:
+    -------
+    * generate()
+      - Generator of the script, one schema (or database object) at a time.
+
+    * response(filename)
+      - Streams the script to the client (GET), or writes it to the file
+        requested by a POST (relative to the storage directory).
+    """
+
+    def __init__(self, gid, sid, did, manager, scid=None):
+        self.gid = gid
+        self.sid = sid
+        self.did = did
+        self.scid = scid
+        self.manager = manager
+        self.conn = manager.connection(did=did)
+        self.template_path = 'databases/sql/#{0}#'.format(manager.version)
+
+    def get_objects(self):
+        """
+        Returns the (status, objects) of the schemas, i.e. the list of the
+        (scid, schema name, [(node type, oid, name)]) in the order of the
+        schemas.
+        """
+        SQL = render_template(
+            "/".join([self.template_path, 'ddl_objects.sql']),
+            scid=self.scid, server_type=self.manager.server_type
+        )
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return False, res
+
+        schemas = dict()
+        for row in res['rows']:
+            objects = schemas.setdefault(
+                row['scid'], (row['scid'], row['schema'], list()))[2]
+            if row['node_type'] in SCHEMA_NODES:
+                objects.append((row['node_type'], row['oid'], row['name']))
+
+        for _, _, objects in schemas.values():
+            objects.sort(key=lambda obj: (SCHEMA_NODES.index(obj[0]),
+                                          obj[2]))
+
+        return True, sorted(schemas.values(), key=lambda schema: schema[1])
+
+    def _get_schema_sql(self, scid):
+        view = SchemaDiffRegistry.get_node_view('schema')
+        return _response_sql(view.sql(gid=self.gid, sid=self.sid,
+                                      did=self.did, scid=scid))
+
+    def _get_object_sql(self, view, node_type, scid, oid):
+        params = dict(gid=self.gid, sid=self.sid, did=self.did, scid=scid)
+
+        if node_type == 'table':
+            return view.get_sql_from_table_diff(
+                tid=oid, json_resp=False, add_not_exists_clause=True,
+                **params)
+        if node_type in ('view', 'mview'):
+            return view.get_sql_from_view_diff(tid=oid, json_resp=False,
+                                               **params)
+        return view.get_sql_from_diff(oid=oid, **params)
+
+    def get_schema_script(self, schema):
+        """
+        Returns the script of the objects of a schema, generated using the
+        connections of the current thread.
+        """
+        scid, schema_name, objects = schema
+        sql = list()
+        views = dict()
+
+        for node_type, oid, name in objects:
+            if node_type not in views:
+                views[node_type] = SchemaDiffRegistry.get_node_view(
+                    node_type)
+            try:
+                obj_sql = _response_sql(self._get_object_sql(
+                    views[node_type], node_type, scid, oid))
+            except Exception as e:
+                current_app.logger.exception(e)
+                obj_sql = '-- {0}'.format(str(e).replace('\n', '\n-- '))
+
+            sql.append('-- {0}: {1}.{2}\n\n{3}'.format(
+                node_type.replace('_', ' ').upper(), schema_name, name,
+                obj_sql.strip('\n')))
+
+        return ''.join('{0}\n\n'.format(obj_sql) for obj_sql in sql)
+
+    def get_database_script(self, nodes):
+        """
+        Returns the script of the database objects (e.g. extensions,
+        casts) of the given types.
+        """
+        sql = list()
+        params = dict(gid=self.gid, sid=self.sid, did=self.did)
+
+        for node_type in nodes:
+            view = SchemaDiffRegistry.get_node_view(node_type)
+            objects = view.fetch_objects_to_compare(sid=self.sid,
+                                                    did=self.did)
+            if not isinstance(objects, dict):
+                sql.append(_response_sql(objects))
+                continue
+
+            for name in sorted(objects):
+                obj_params = dict(params, oid=objects[name]['oid'])
+                # Foreign servers and user mappings
+                for key in ('fdwid', 'fsid'):
+                    if key in objects[name]:
+                        obj_params[key] = objects[name][key]
+                sql.append(_response_sql(
+                    view.get_sql_from_diff(**obj_params)).strip('\n'))
+
+        return ''.join('{0}\n\n'.format(obj_sql) for obj_sql in sql)
+
+    def generate(self):
+        """
+        Generator of the script, the schemas of which are generated in
+        parallel.
+        """
+        status, schemas = self.get_objects()
+        if not status:
+            yield '-- {0}\n'.format(schemas)
+            return
+
+        if self.scid is None:
+            for scid, _, _ in schemas:
+                yield self._get_schema_sql(scid) + '\n\n'
+            yield self.get_database_script(PRE_SCHEMA_NODES)
+        else:
+            yield self._get_schema_sql(self.scid) + '\n\n'
+
+        conn_id = 'DDL-Script-{0}'.format(uuid.uuid4())
+
+        def get_schema_script(schema):
+            with self.manager.thread_connections(
+                    '{0}-{1}'.format(conn_id, schema[0])):
+                status, msg = self.manager.connection(did=self.did).connect()
+                if not status:
+                    return '-- {0}\n\n'.format(msg)
+                return self.get_schema_script(schema)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(config.DDL_SCRIPT_WORKERS, 1),
+            thread_name_prefix='ddl_script')
+        try:
+            # Each worker needs its own copy of the request context
+            futures = [executor.submit(
+                copy_current_request_context(get_schema_script), schema)
+                for schema in schemas]
+            for future in futures:
+                yield future.result()
+        finally:
+            # Do not script the remaining schemas, if the client has gone
+            executor.shutdown(cancel_futures=True)
+
+        if self.scid is None:
+            yield self.get_database_script(POST_SCHEMA_NODES)
+
+    def response(self, filename):
+        """
+        Streams the script to the client as an attachment, or writes it to
+        the file given by the 'file' of the data posted.
+        """
+        if request.method != 'POST':
+            # werkzeug only supports the latin-1 file names
+            try:
+                filename.encode('latin-1', 'strict')
+            except UnicodeEncodeError:
+                filename = 'script.sql'
+
+            response = Response(stream_with_context(self.generate()),
+                                mimetype='text/plain')
+            response.headers['Content-Disposition'] = \
+                'attachment;filename={0}'.format(filename)
+            return response
+
+        data = request.form if request.form else json.loads(
+            request.data or '{}')
+        output_file = data.get('file', None)
+        if not output_file:
+            return bad_request(errormsg=gettext(
+                'Please provide the file to write the script to.'))
+
+        try:
+            file_path = filename_with_file_manager_path(output_file)
+            if isinstance(file_path, Response):
+                return file_path
+
+            with open(file_path, 'w', encoding='utf-8') as script_file:
+                for sql in self.generate():
+                    script_file.write(sql)
+        except Exception as e:
+            current_app.logger.exception(e)
+            return internal_server_error(errormsg=str(e))
+
+        return make_json_response(data={'file': output_file})
@@ -15,6 +15,8 @@ from flask import render_template, request, jsonify, current_app
 from flask_babel import gettext
 
 from pgadmin.browser.server_groups import servers
+from pgadmin.browser.server_groups.servers.databases.ddl_script import \
+    DDLScript
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.collection import CollectionNodeModule, PGChildModule
 from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
@@ -282,6 +284,10 @@ class SchemaView(PGChildNodeView):
       - This function will generate sql to show it in sql pane for the schema
         node.
 
+    * ddl_script(gid, sid, did, scid):
+      - This function will generate the DDL script of the schema node and its
+        objects.
+
     * dependency(gid, sid, did, scid):
       - This function will generate dependency list show it in dependency
         pane for the selected schema node.
@@ -312,6 +318,7 @@ class SchemaView(PGChildNodeView):
         'children': [{'get': 'children'}],
         'nodes': [{'get': 'nodes'}, {'get': 'nodes'}],
         'sql': [{'get': 'sql'}],
+        'ddl_script': [{'get': 'ddl_script', 'post': 'ddl_script'}],
         'msql': [{'get': 'msql'}, {'get': 'msql'}],
         'stats': [{'get': 'statistics'}],
         'dependency': [{'get': 'dependencies'}],
@@ -978,6 +985,34 @@ It may have been removed by another user.
 
         return ajax_response(response=SQL.strip("\n"))
 
+    @check_precondition
+    def ddl_script(self, gid, sid, did, scid):
+        """
+        This function will stream the DDL script of the schema and of all
+        its objects, or write it to the file given by the 'file' posted.
+
+         Args:
+           gid: Server Group ID
+           sid: Server ID
+           did: Database ID
+           scid: Schema ID
+        """
+        SQL = render_template(
+            "/".join([self.template_path, 'sql/get_name.sql']),
+            scid=scid, conn=self.conn
+        )
+        status, name = self.conn.execute_scalar(SQL)
+        if not status:
+            return internal_server_error(errormsg=name)
+
+        if name is None:
+            return gone(gettext(
+                'Could not find the schema in the database.'
+                ' It may have been removed by another user.'))
+
+        return DDLScript(gid, sid, did, self.manager, scid=scid).response(
+            '{0}.sql'.format(name))
+
     @check_precondition
     def dependents(self, gid, sid, did, scid):
         """
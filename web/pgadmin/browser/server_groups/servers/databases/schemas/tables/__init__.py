@@ -30,6 +30,7 @@ from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
     constraints.exclusion_constraint import utils as exclusion_utils
 from pgadmin.utils.exception import ExecuteError
+from pgadmin.utils.ddl_cache import cached_reverse_engineered_sql
 
 
 class TableModule(SchemaChildModule):
@@ -1415,6 +1416,7 @@ class TableView(BaseTableView, DataTypeReader, SchemaDiffTableCompare):
         return BaseTableView.get_table_dependencies(self, tid)
 
     @BaseTableView.check_precondition
+    @cached_reverse_engineered_sql('tid')
     def sql(self, gid, sid, did, scid, tid):
         """
         This function will creates reverse engineered sql for
@@ -125,12 +125,6 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
     :return:
     """
 
-    # To check if column is primary key
-    _check_primary_column(data)
-
-    # Fetch length and precision
-    data = fetch_length_precision(data)
-
     # We need to fetch inherited tables for each table
     is_error, errmsg = _fetch_inherited_tables(
         tid, data, fetch_inherited_tables, template_path, conn)
@@ -138,6 +132,46 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
     if is_error:
         return errmsg
 
+    # We need to parse & convert ACL coming from database to json format
+    SQL = render_template("/".join([template_path, 'acl.sql']),
+                          tid=tid, clid=clid)
+    status, acl = conn.execute_dict(SQL)
+
+    if not status:
+        return internal_server_error(errormsg=acl)
+
+    # we are receiving request when in edit mode
+    # we will send filtered types related to current type
+    type_id = data['atttypid']
+
+    if edit_types_list is None:
+        edit_types_list = []
+        SQL = render_template("/".join([template_path,
+                                        'edit_mode_types.sql']),
+                              type_id=type_id)
+        status, rset = conn.execute_2darray(SQL)
+        edit_types_list = [row['typname'] for row in rset['rows']]
+
+    return format_column(data, acl['rows'], edit_types_list)
+
+
+def format_column(data, acl_rows, edit_types_list):
+    """
+    This function will format a column row, as returned by properties.sql,
+    as per client model format. Unlike column_formatter it does not run
+    any query, so callers that load many columns at once can fetch the
+    ACLs and edit types in bulk.
+    :param data: Column properties
+    :param acl_rows: Rows of acl.sql for this column
+    :param edit_types_list: Types the column type can be changed to
+    :return:
+    """
+    # To check if column is primary key
+    _check_primary_column(data)
+
+    # Fetch length and precision
+    data = fetch_length_precision(data)
+
     # We need to format variables according to client js collection
     if 'attoptions' in data and data['attoptions'] is not None:
         data['attoptions'] = parse_column_variables(data['attoptions'])
@@ -155,34 +189,14 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
     if 'attfdwoptions' in data and data['attfdwoptions'] != '':
         data['coloptions'] = parse_options_for_column(data['attfdwoptions'])
 
-    # We need to parse & convert ACL coming from database to json format
-    SQL = render_template("/".join([template_path, 'acl.sql']),
-                          tid=tid, clid=clid)
-    status, acl = conn.execute_dict(SQL)
-
-    if not status:
-        return internal_server_error(errormsg=acl)
-
     # We will set get privileges from acl sql so we don't need
     # it from properties sql
     data['attacl'] = []
 
-    for row in acl['rows']:
+    for row in acl_rows:
         priv = parse_priv_from_db(row)
         data.setdefault(row['deftype'], []).append(priv)
 
-    # we are receiving request when in edit mode
-    # we will send filtered types related to current type
-    type_id = data['atttypid']
-
-    if edit_types_list is None:
-        edit_types_list = []
-        SQL = render_template("/".join([template_path,
-                                        'edit_mode_types.sql']),
-                              type_id=type_id)
-        status, rset = conn.execute_2darray(SQL)
-        edit_types_list = [row['typname'] for row in rset['rows']]
-
     # We will need present type in edit mode
     edit_types_list.append(data['typname'])
     data['edit_types'] = sorted(edit_types_list)
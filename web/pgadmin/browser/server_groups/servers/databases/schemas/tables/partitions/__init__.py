@@ -26,6 +26,7 @@ from pgadmin.utils.ajax import make_json_response
 from pgadmin.browser.utils import PGChildModule
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.compare import SchemaDiffObjectCompare
+from pgadmin.utils.ddl_cache import cached_reverse_engineered_sql
 
 
 def backend_supported(module, manager, **kwargs):
@@ -449,6 +450,7 @@ class PartitionsView(BaseTableView, DataTypeReader, SchemaDiffObjectCompare):
         return res
 
     @BaseTableView.check_precondition
+    @cached_reverse_engineered_sql('ptid')
     def sql(self, gid, sid, did, scid, tid, ptid):
         """
         This function will creates reverse engineered sql for
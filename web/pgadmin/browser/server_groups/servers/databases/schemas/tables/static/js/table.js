@@ -32,7 +32,7 @@ define('pgadmin.node.table', [
         columns: ['name', 'relowner', 'is_partitioned', 'description'],
         hasStatistics: true,
         statsPrettifyFields: [gettext('Total Size'), gettext('Indexes size'), gettext('Table size'),
-          gettext('TOAST table size'), gettext('Tuple length'),
+          gettext('TOAST table size'), gettext('Estimated bloat'), gettext('Tuple length'),
           gettext('Dead tuple length'), gettext('Free space')],
         canDrop: SchemaChildTreeNode.isTreeItemOfChildOfSchema,
         canDropCascade: SchemaChildTreeNode.isTreeItemOfChildOfSchema,
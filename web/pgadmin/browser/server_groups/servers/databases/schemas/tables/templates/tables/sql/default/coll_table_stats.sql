@@ -1,29 +1,88 @@
+{### Statistics of all the tables of a schema, in a single query: the bloat ###}
+{### of each table is estimated from the average width of its columns.    ###}
+WITH tbl AS (
+    SELECT cl.oid, cl.relname, cl.relkind, cl.relpages, cl.reltuples,
+        cl.reltoastrelid,
+        COALESCE(SUBSTRING(pg_catalog.array_to_string(cl.reloptions, ' ')
+            FROM 'fillfactor=([0-9]+)')::int, 100) AS fillfactor
+    FROM pg_catalog.pg_class cl
+    WHERE cl.relnamespace = {{ scid }}::oid AND cl.relkind IN ('r','s','t','p')
+), width AS (
+    SELECT tablename, SUM((1 - null_frac) * avg_width)::numeric AS width
+    FROM pg_catalog.pg_stats
+    WHERE schemaname = {{ schema_name|qtLiteral(conn) }} AND NOT inherited
+    GROUP BY tablename
+), bloat AS (
+    SELECT tbl.oid, tbl.relpages::numeric * bs AS table_bytes,
+        GREATEST(tbl.relpages - CEIL(tbl.reltuples::numeric / GREATEST(FLOOR(
+            (bs - 24) * tbl.fillfactor / 100 /
+            (CEIL((23 + width.width) / 8) * 8 + 4)), 1)), 0) * bs
+            AS bloat_bytes
+    FROM tbl
+        JOIN width ON width.tablename = tbl.relname,
+        (SELECT pg_catalog.current_setting('block_size')::numeric AS bs) s
+    WHERE tbl.relkind != 'p' AND tbl.reltuples >= 0 AND tbl.relpages > 0
+)
 SELECT
-    st.relname AS {{ conn|qtIdent(_('Table name')) }},
-    pg_catalog.pg_relation_size(st.relid)
-        + CASE WHEN cl.reltoastrelid = 0 THEN 0 ELSE pg_catalog.pg_relation_size(cl.reltoastrelid)
-        + COALESCE((SELECT SUM(pg_catalog.pg_relation_size(indexrelid))
-                        FROM pg_catalog.pg_index WHERE indrelid=cl.reltoastrelid)::int8, 0) END
-        + COALESCE((SELECT SUM(pg_catalog.pg_relation_size(indexrelid))
-                        FROM pg_catalog.pg_index WHERE indrelid=st.relid)::int8, 0) AS {{ conn|qtIdent(_('Total Size')) }},
-    n_tup_ins AS {{ conn|qtIdent(_('Tuples inserted')) }},
-    n_tup_upd AS {{ conn|qtIdent(_('Tuples updated')) }},
-    n_tup_del AS {{ conn|qtIdent(_('Tuples deleted')) }},
-    n_tup_hot_upd AS {{ conn|qtIdent(_('Tuples HOT updated')) }},
-    n_live_tup AS {{ conn|qtIdent(_('Live tuples')) }},
-    n_dead_tup AS {{ conn|qtIdent(_('Dead tuples')) }},
-    last_vacuum AS {{ conn|qtIdent(_('Last vacuum')) }},
-    last_autovacuum AS {{ conn|qtIdent(_('Last autovacuum')) }},
-    last_analyze AS {{ conn|qtIdent(_('Last analyze')) }},
-    last_autoanalyze AS {{ conn|qtIdent(_('Last autoanalyze')) }},
-    vacuum_count AS {{ conn|qtIdent(_('Vacuum counter')) }},
-    autovacuum_count AS {{ conn|qtIdent(_('Autovacuum counter')) }},
-    analyze_count AS {{ conn|qtIdent(_('Analyze counter')) }},
-    autoanalyze_count AS {{ conn|qtIdent(_('Autoanalyze counter')) }}
+    tbl.relname AS {{ conn|qtIdent(_('Table name')) }},
+    pg_catalog.pg_total_relation_size(tbl.oid) AS {{ conn|qtIdent(_('Total Size')) }},
+    pg_catalog.pg_relation_size(tbl.oid) AS {{ conn|qtIdent(_('Table size')) }},
+    pg_catalog.pg_indexes_size(tbl.oid) AS {{ conn|qtIdent(_('Indexes size')) }},
+    CASE WHEN tbl.reltoastrelid = 0 THEN NULL
+        ELSE pg_catalog.pg_total_relation_size(tbl.reltoastrelid)
+        END AS {{ conn|qtIdent(_('TOAST table size')) }},
+    bloat.bloat_bytes AS {{ conn|qtIdent(_('Estimated bloat')) }},
+    ROUND(100 * bloat.bloat_bytes / bloat.table_bytes, 2) AS {{ conn|qtIdent(_('Estimated bloat percent')) }},
+    st.seq_scan AS {{ conn|qtIdent(_('Sequential scans')) }},
+    st.idx_scan AS {{ conn|qtIdent(_('Index scans')) }},
+    ROUND(100.0 * st.idx_scan / NULLIF(st.seq_scan + st.idx_scan, 0), 2) AS {{ conn|qtIdent(_('Index scans percent')) }},
+    st.n_tup_ins AS {{ conn|qtIdent(_('Tuples inserted')) }},
+    st.n_tup_upd AS {{ conn|qtIdent(_('Tuples updated')) }},
+    st.n_tup_del AS {{ conn|qtIdent(_('Tuples deleted')) }},
+    st.n_tup_hot_upd AS {{ conn|qtIdent(_('Tuples HOT updated')) }},
+    st.n_live_tup AS {{ conn|qtIdent(_('Live tuples')) }},
+    st.n_dead_tup AS {{ conn|qtIdent(_('Dead tuples')) }},
+{% if is_pgstattuple %}
+    pst.dead_tuple_percent AS {{ conn|qtIdent(_('Dead tuple percent')) }},
+    pst.free_space AS {{ conn|qtIdent(_('Free space')) }},
+    pst.free_percent AS {{ conn|qtIdent(_('Free percent')) }},
+    pst.approximate AS {{ conn|qtIdent(_('Approximate')) }},
+{% endif %}
+    st.last_vacuum AS {{ conn|qtIdent(_('Last vacuum')) }},
+    st.last_autovacuum AS {{ conn|qtIdent(_('Last autovacuum')) }},
+    st.last_analyze AS {{ conn|qtIdent(_('Last analyze')) }},
+    st.last_autoanalyze AS {{ conn|qtIdent(_('Last autoanalyze')) }},
+    st.vacuum_count AS {{ conn|qtIdent(_('Vacuum counter')) }},
+    st.autovacuum_count AS {{ conn|qtIdent(_('Autovacuum counter')) }},
+    st.analyze_count AS {{ conn|qtIdent(_('Analyze counter')) }},
+    st.autoanalyze_count AS {{ conn|qtIdent(_('Autoanalyze counter')) }}
 FROM
-    pg_catalog.pg_stat_all_tables st
+    tbl
 JOIN
-    pg_catalog.pg_class cl on cl.oid=st.relid and cl.relkind IN ('r','s','t','p')
-WHERE
-    schemaname = {{schema_name|qtLiteral(conn)}}
-ORDER BY st.relname;
+    pg_catalog.pg_stat_all_tables st ON st.relid = tbl.oid
+LEFT JOIN
+    bloat ON bloat.oid = tbl.oid
+{% if is_pgstattuple %}
+{### The tables larger than approx_min_size are estimated by ###}
+{### pgstattuple_approx, which skips their all-visible pages ###}
+{### The functions are strict: they are given a NULL (rather ###}
+{### than filtered by a WHERE, which may be checked after the ###}
+{### call) for the other relations (e.g. partitioned tables), ###}
+{### and for the tables without the privilege.                ###}
+LEFT JOIN LATERAL (
+    SELECT dead_tuple_percent, free_space, free_percent, false AS approximate
+    FROM pgstattuple(CASE WHEN tbl.relkind = 'r' AND
+        pg_catalog.has_table_privilege(tbl.oid, 'SELECT') AND
+        pg_catalog.pg_relation_size(tbl.oid) <= {{ approx_min_size }}
+        THEN tbl.oid::regclass END)
+    WHERE dead_tuple_percent IS NOT NULL
+    UNION ALL
+    SELECT dead_tuple_percent, approx_free_space, approx_free_percent, true
+    FROM pgstattuple_approx(CASE WHEN tbl.relkind = 'r' AND
+        pg_catalog.has_table_privilege(tbl.oid, 'SELECT') AND
+        pg_catalog.pg_relation_size(tbl.oid) > {{ approx_min_size }}
+        THEN tbl.oid::regclass END)
+    WHERE dead_tuple_percent IS NOT NULL
+) pst ON true
+{% endif %}
+ORDER BY tbl.relname;
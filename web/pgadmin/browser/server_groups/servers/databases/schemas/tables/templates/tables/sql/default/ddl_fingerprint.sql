@@ -0,0 +1,83 @@
+{### Fingerprint of the catalog rows the reverse engineered SQL of the ###}
+{### table (and of its partitions) is built from: changed by any DDL    ###}
+{### (including the options of its owned, e.g. identity, sequences)   ###}
+WITH RECURSIVE rels(oid) AS (
+    SELECT {{ tid }}::oid
+    UNION
+    SELECT inh.inhrelid FROM pg_catalog.pg_inherits inh
+    JOIN rels ON inh.inhparent = rels.oid
+), objs(classid, oid) AS (
+    SELECT 'pg_class'::regclass, oid FROM rels
+    UNION
+    SELECT 'pg_class'::regclass, indexrelid FROM pg_catalog.pg_index
+    WHERE indrelid IN (SELECT oid FROM rels)
+    UNION
+    SELECT 'pg_class'::regclass, inhparent FROM pg_catalog.pg_inherits
+    WHERE inhrelid IN (SELECT oid FROM rels)
+    UNION
+    SELECT 'pg_class'::regclass, dep.objid FROM pg_catalog.pg_depend dep
+    WHERE dep.classid = 'pg_class'::regclass
+        AND dep.refclassid = 'pg_class'::regclass
+        AND dep.refobjid IN (SELECT oid FROM rels)
+        AND dep.deptype IN ('a', 'i')
+        AND EXISTS (SELECT 1 FROM pg_catalog.pg_sequence seq
+                    WHERE seq.seqrelid = dep.objid)
+    UNION
+    SELECT 'pg_namespace'::regclass, relnamespace FROM pg_catalog.pg_class
+    WHERE oid = {{ tid }}::oid
+    UNION
+    SELECT 'pg_constraint'::regclass, oid FROM pg_catalog.pg_constraint
+    WHERE conrelid IN (SELECT oid FROM rels)
+    UNION
+    SELECT 'pg_trigger'::regclass, oid FROM pg_catalog.pg_trigger
+    WHERE tgrelid IN (SELECT oid FROM rels)
+    UNION
+    SELECT 'pg_policy'::regclass, oid FROM pg_catalog.pg_policy
+    WHERE polrelid IN (SELECT oid FROM rels)
+    UNION
+    SELECT 'pg_rewrite'::regclass, oid FROM pg_catalog.pg_rewrite
+    WHERE ev_class IN (SELECT oid FROM rels)
+), tuples(xmin) AS (
+    SELECT c.xmin FROM pg_catalog.pg_class c
+    JOIN objs ON objs.classid = 'pg_class'::regclass AND c.oid = objs.oid
+    UNION ALL
+    SELECT n.xmin FROM pg_catalog.pg_namespace n
+    JOIN objs ON objs.classid = 'pg_namespace'::regclass AND n.oid = objs.oid
+    UNION ALL
+    SELECT a.xmin FROM pg_catalog.pg_attribute a
+    WHERE a.attrelid IN (SELECT oid FROM objs
+                         WHERE classid = 'pg_class'::regclass)
+    UNION ALL
+    SELECT d.xmin FROM pg_catalog.pg_attrdef d
+    WHERE d.adrelid IN (SELECT oid FROM rels)
+    UNION ALL
+    SELECT s.xmin FROM pg_catalog.pg_sequence s
+    JOIN objs ON objs.classid = 'pg_class'::regclass AND s.seqrelid = objs.oid
+    UNION ALL
+    SELECT i.xmin FROM pg_catalog.pg_index i
+    WHERE i.indrelid IN (SELECT oid FROM rels)
+    UNION ALL
+    SELECT i.xmin FROM pg_catalog.pg_inherits i
+    WHERE i.inhrelid IN (SELECT oid FROM rels)
+    UNION ALL
+    SELECT c.xmin FROM pg_catalog.pg_constraint c
+    JOIN objs ON objs.classid = 'pg_constraint'::regclass AND c.oid = objs.oid
+    UNION ALL
+    SELECT t.xmin FROM pg_catalog.pg_trigger t
+    JOIN objs ON objs.classid = 'pg_trigger'::regclass AND t.oid = objs.oid
+    UNION ALL
+    SELECT p.xmin FROM pg_catalog.pg_policy p
+    JOIN objs ON objs.classid = 'pg_policy'::regclass AND p.oid = objs.oid
+    UNION ALL
+    SELECT r.xmin FROM pg_catalog.pg_rewrite r
+    JOIN objs ON objs.classid = 'pg_rewrite'::regclass AND r.oid = objs.oid
+    UNION ALL
+    SELECT d.xmin FROM pg_catalog.pg_description d
+    JOIN objs ON d.classoid = objs.classid AND d.objoid = objs.oid
+    UNION ALL
+    SELECT s.xmin FROM pg_catalog.pg_seclabel s
+    JOIN objs ON s.classoid = objs.classid AND s.objoid = objs.oid
+)
+SELECT pg_catalog.count(*) || ':' ||
+    COALESCE(pg_catalog.sum(xmin::text::bigint), 0) AS fingerprint
+FROM tuples
@@ -0,0 +1,151 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import uuid
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    utils as table_view_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tests import \
+    utils as schema_utils
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils as utils
+from . import utils as tables_utils
+
+
+class TableCollectionStatisticsTestCase(BaseTestGenerator):
+    """
+    This class will fetch the statistics of all the tables of a schema, add
+    a table, and fetch them again (from the cache, if it is enabled); or
+    fetch the statistics of a partitioned table, and of its partition, with
+    pgstattuple (if it is available).
+    """
+    url = '/browser/table/stats/'
+
+    scenarios = [
+        ('Fetch the cached statistics of the tables of a schema', dict(
+            cache_ttl=10, expect_new_table=False)),
+        ('Fetch the statistics of the tables of a schema, uncached', dict(
+            cache_ttl=0, expect_new_table=True)),
+        ('Fetch the statistics of a partitioned table, with pgstattuple',
+         dict(cache_ttl=0, partitioned=True)),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.db_name = parent_node_dict["database"][-1]["db_name"]
+        schema_info = parent_node_dict["schema"][-1]
+        self.server_id = schema_info["server_id"]
+        self.db_id = schema_info["db_id"]
+        db_con = database_utils.connect_database(self, utils.SERVER_GROUP,
+                                                 self.server_id, self.db_id)
+        if not db_con['data']["connected"]:
+            raise Exception("Could not connect to database to add a table.")
+
+        self.schema_id = schema_info["schema_id"]
+        self.schema_name = schema_info["schema_name"]
+        schema_response = schema_utils.verify_schemas(self.server,
+                                                      self.db_name,
+                                                      self.schema_name)
+        if not schema_response:
+            raise Exception("Could not find the schema to add a table.")
+
+        self.table_name = "test_table_coll_stats_%s" % \
+            (str(uuid.uuid4())[1:8])
+        self.table_id = tables_utils.create_table(self.server, self.db_name,
+                                                  self.schema_name,
+                                                  self.table_name)
+        self.pgstattuple_created = False
+        if getattr(self, 'partitioned', False):
+            self._create_partitioned_table()
+        # Do not use the statistics cached by the previous tests
+        table_view_utils._coll_stats_cache.clear()
+
+    def _create_partitioned_table(self):
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'],
+                                             self.server['sslmode'])
+        pg_cursor = connection.cursor()
+        pg_cursor.execute(
+            "CREATE TABLE {0}.{1}_part (id integer) PARTITION BY RANGE (id);"
+            "CREATE TABLE {0}.{1}_part1 PARTITION OF {0}.{1}_part "
+            "FOR VALUES FROM (0) TO (100);"
+            "INSERT INTO {0}.{1}_part SELECT generate_series(0, 99);"
+            .format(self.schema_name, self.table_name))
+        pg_cursor.execute(
+            "SELECT EXISTS(SELECT 1 FROM pg_catalog.pg_available_extensions "
+            "WHERE name = 'pgstattuple' AND installed_version IS NULL)")
+        if pg_cursor.fetchone()[0]:
+            pg_cursor.execute("CREATE EXTENSION pgstattuple")
+            self.pgstattuple_created = True
+        connection.commit()
+        connection.close()
+
+    def _drop_pgstattuple(self):
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'],
+                                             self.server['sslmode'])
+        pg_cursor = connection.cursor()
+        pg_cursor.execute("DROP EXTENSION IF EXISTS pgstattuple")
+        connection.commit()
+        connection.close()
+
+    def _get_statistics(self):
+        response = tables_utils.api_get(self, "")
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data.decode('utf-8'))['data']
+        return [column['name'] for column in data['columns']], \
+            [row['Table name'] for row in data['rows']]
+
+    def runTest(self):
+        """This function will fetch the statistics of the tables twice."""
+        if getattr(self, 'partitioned', False):
+            # pgstattuple is not run for the partitioned table
+            with patch.object(table_view_utils.config,
+                              'COLLECTION_STATISTICS_CACHE_TTL', 0), \
+                    patch.object(table_view_utils.config,
+                                 'COLLECTION_STATISTICS_PGSTATTUPLE', True):
+                _, tables = self._get_statistics()
+            self.assertIn(self.table_name + '_part', tables)
+            self.assertIn(self.table_name + '_part1', tables)
+            return
+
+        with patch.object(table_view_utils.config,
+                          'COLLECTION_STATISTICS_CACHE_TTL', self.cache_ttl):
+            columns, tables = self._get_statistics()
+            for column in ('Total Size', 'Live tuples', 'Estimated bloat',
+                           'Index scans percent'):
+                self.assertIn(column, columns)
+            self.assertIn(self.table_name, tables)
+
+            new_table_name = self.table_name + '_new'
+            tables_utils.create_table(self.server, self.db_name,
+                                      self.schema_name, new_table_name)
+            _, tables = self._get_statistics()
+
+        if self.expect_new_table:
+            self.assertIn(new_table_name, tables)
+        else:
+            self.assertNotIn(new_table_name, tables)
+
+    def tearDown(self):
+        if self.pgstattuple_created:
+            self._drop_pgstattuple()
+        table_view_utils._coll_stats_cache.clear()
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
@@ -0,0 +1,137 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import uuid
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tests import \
+    utils as schema_utils
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils import dependency_graph
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils as utils
+from . import utils as tables_utils
+
+
+class TableDependencyGraphTestCase(BaseTestGenerator):
+    """
+    This class will fetch the dependencies (or the dependents) of a table
+    from the cached dependency graph of the database, and check they are
+    the same as those fetched by the query of the table.
+    """
+    url = '/browser/table/'
+
+    scenarios = [
+        ('Fetch the dependencies of a table from the dependency graph',
+         dict(endpoint='dependency/')),
+        ('Fetch the dependents of a table from the dependency graph',
+         dict(endpoint='dependent/')),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.db_name = parent_node_dict["database"][-1]["db_name"]
+        schema_info = parent_node_dict["schema"][-1]
+        self.server_id = schema_info["server_id"]
+        self.db_id = schema_info["db_id"]
+        db_con = database_utils.connect_database(self, utils.SERVER_GROUP,
+                                                 self.server_id, self.db_id)
+        if not db_con['data']["connected"]:
+            raise Exception("Could not connect to database to add a table.")
+
+        self.schema_id = schema_info["schema_id"]
+        self.schema_name = schema_info["schema_name"]
+        schema_response = schema_utils.verify_schemas(self.server,
+                                                      self.db_name,
+                                                      self.schema_name)
+        if not schema_response:
+            raise Exception("Could not find the schema to add a table.")
+
+        self.table_name = "test_table_dep_graph_%s" % \
+            (str(uuid.uuid4())[1:8])
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'],
+                                             self.server['sslmode'])
+        pg_cursor = connection.cursor()
+        pg_cursor.execute(
+            "CREATE SEQUENCE {0}.{1}_seq;"
+            "CREATE TABLE {0}.{1} (id integer DEFAULT "
+            "nextval('{0}.{1}_seq'), name text);"
+            "CREATE VIEW {0}.{1}_view AS SELECT id, name FROM {0}.{1};"
+            "CREATE VIEW {0}.{1}_view2 AS SELECT id FROM {0}.{1}_view;"
+            .format(self.schema_name, self.table_name))
+        pg_cursor.execute(
+            "SELECT '{0}.{1}_seq'::regclass::oid, '{0}.{1}'::regclass::oid,"
+            " '{0}.{1}_view'::regclass::oid,"
+            " '{0}.{1}_view2'::regclass::oid".format(self.schema_name,
+                                                     self.table_name))
+        self.seq_id, self.table_id, self.view_id, self.view2_id = \
+            pg_cursor.fetchone()
+        connection.commit()
+        connection.close()
+
+        # Do not use the graphs cached by the previous tests
+        dependency_graph._dependency_graphs.clear()
+
+    def _get_dependencies(self):
+        response = tables_utils.api_get(self)
+        self.assertEqual(response.status_code, 200)
+        return sorted(json.loads(response.data.decode('utf-8')),
+                      key=lambda dep: (dep['type'], dep['name']))
+
+    def runTest(self):
+        """This function will fetch the dependencies of the table."""
+        self.url = self.url + self.endpoint
+        with patch.object(dependency_graph.config,
+                          'DEPENDENCY_GRAPH_CACHE_TTL', 0):
+            expected = self._get_dependencies()
+        self.assertTrue(len(expected) > 0)
+
+        graphs = list()
+
+        def build_dependency_graph(conn):
+            status, graph = build(conn)
+            graphs.append(graph)
+            return status, graph
+
+        build = dependency_graph.build_dependency_graph
+        with patch.object(dependency_graph.config,
+                          'DEPENDENCY_GRAPH_CACHE_TTL', 30), \
+                patch.object(dependency_graph, 'build_dependency_graph',
+                             side_effect=build_dependency_graph):
+            self.assertEqual(self._get_dependencies(), expected)
+            self.assertEqual(self._get_dependencies(), expected)
+
+        # The graph is built once, and then used from the cache
+        self.assertEqual(len(graphs), 1)
+        graph = graphs[0]
+
+        # Dropping the table drops both views, the dependent one first
+        closure = graph.get_dependents_closure(self.table_id)
+        self.assertIn(self.view_id, closure)
+        self.assertIn(self.view2_id, closure)
+        self.assertNotIn(self.seq_id, closure)
+        self.assertLess(closure.index(self.view2_id),
+                        closure.index(self.view_id))
+
+        # The objects are created after the objects they depend on
+        self.assertEqual(
+            graph.sort_by_dependency([self.view2_id, self.view_id,
+                                      self.table_id, self.seq_id]),
+            [self.seq_id, self.table_id, self.view_id, self.view2_id])
+
+    def tearDown(self):
+        dependency_graph._dependency_graphs.clear()
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
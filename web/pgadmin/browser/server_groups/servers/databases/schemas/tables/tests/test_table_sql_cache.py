@@ -0,0 +1,145 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import uuid
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.utils \
+    import BaseTableView
+from pgadmin.browser.server_groups.servers.databases.schemas.tests import \
+    utils as schema_utils
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils as utils
+from . import utils as tables_utils
+
+
+def unchanged_fingerprint(view, tid):
+    return True, 'unchanged'
+
+
+class TableSqlCacheTestCase(BaseTestGenerator):
+    """
+    This class will fetch the reverse engineered sql of a table twice, and
+    check the cached sql is only used if the table has not been changed
+    (outside pgAdmin, or by pgAdmin) in the meantime.
+    """
+    url = '/browser/table/sql/'
+
+    scenarios = [
+        ('Fetch the cached sql of an unchanged table', dict(
+            change=None, expected_calls=1, expected_sql=None)),
+        ('Fetch the sql of a table changed outside pgAdmin', dict(
+            change='outside', expected_calls=2,
+            expected_sql='CREATE INDEX IF NOT EXISTS {0}_idx')),
+        ('Fetch the sql of a table, the identity of which is changed', dict(
+            change='identity', expected_calls=2,
+            expected_sql='INCREMENT 5')),
+        ('Fetch the sql of a table changed by pgAdmin', dict(
+            change='pgadmin', expected_calls=2,
+            expected_sql="IS 'Changed by pgAdmin'")),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.db_name = parent_node_dict["database"][-1]["db_name"]
+        schema_info = parent_node_dict["schema"][-1]
+        self.server_id = schema_info["server_id"]
+        self.db_id = schema_info["db_id"]
+        db_con = database_utils.connect_database(self, utils.SERVER_GROUP,
+                                                 self.server_id, self.db_id)
+        if not db_con['data']["connected"]:
+            raise Exception("Could not connect to database to add a table.")
+
+        self.schema_id = schema_info["schema_id"]
+        self.schema_name = schema_info["schema_name"]
+        schema_response = schema_utils.verify_schemas(self.server,
+                                                      self.db_name,
+                                                      self.schema_name)
+        if not schema_response:
+            raise Exception("Could not find the schema to add a table.")
+
+        self.table_name = "test_table_sql_cache_%s" % \
+            (str(uuid.uuid4())[1:8])
+        self.table_id = tables_utils.create_table(self.server, self.db_name,
+                                                  self.schema_name,
+                                                  self.table_name)
+        if self.change == 'identity':
+            self._execute_outside(
+                "ALTER TABLE {0}.{1} ADD COLUMN idn integer "
+                "GENERATED BY DEFAULT AS IDENTITY")
+
+    def _get_sql(self):
+        response = tables_utils.api_get(self)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.data.decode('utf-8'))
+
+    def _execute_outside(self, sql):
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'],
+                                             self.server['sslmode'])
+        pg_cursor = connection.cursor()
+        pg_cursor.execute(sql.format(self.schema_name, self.table_name))
+        connection.commit()
+        connection.close()
+
+    def _change_outside(self):
+        self._execute_outside("CREATE INDEX {1}_idx ON {0}.{1} (name)")
+
+    def _change_by_pgadmin(self):
+        self.url = '/browser/table/obj/'
+        self.data = {'id': self.table_id,
+                     'description': 'Changed by pgAdmin'}
+        response = tables_utils.api_put(self)
+        self.url = '/browser/table/sql/'
+        self.assertEqual(response.status_code, 200)
+
+    def runTest(self):
+        """This function will fetch the sql of the table twice."""
+        get_ddl_fingerprint = BaseTableView.get_ddl_fingerprint
+        if self.change == 'pgadmin':
+            # The cached sql of a table changed by pgAdmin is discarded,
+            # even if the fingerprint of its catalog rows has not changed.
+            get_ddl_fingerprint = unchanged_fingerprint
+
+        with patch.object(
+            BaseTableView, 'get_reverse_engineered_sql',
+            wraps=BaseTableView.get_reverse_engineered_sql
+        ) as generate, patch.object(
+            BaseTableView, 'get_ddl_fingerprint', get_ddl_fingerprint
+        ):
+            first_sql = self._get_sql()
+
+            if self.change == 'outside':
+                self._change_outside()
+            elif self.change == 'identity':
+                # Only changes the pg_sequence row of the identity sequence
+                self._execute_outside(
+                    "ALTER TABLE {0}.{1} ALTER COLUMN idn SET INCREMENT 5")
+            elif self.change == 'pgadmin':
+                self._change_by_pgadmin()
+
+            second_sql = self._get_sql()
+
+        self.assertEqual(generate.call_count, self.expected_calls)
+        if self.expected_sql is None:
+            self.assertEqual(second_sql, first_sql)
+        else:
+            expected_sql = self.expected_sql.format(self.table_name)
+            self.assertNotIn(expected_sql, first_sql)
+            self.assertIn(expected_sql, second_sql)
+
+    def tearDown(self):
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
@@ -11,10 +11,13 @@
 
 import re
 import copy
+import threading
+import time
 from functools import wraps
 import json
 from flask import render_template, jsonify, request
 from flask_babel import gettext
+from flask_security import current_user
 
 from pgadmin.browser.server_groups.servers.databases.schemas\
     .tables.base_partition_table import BasePartitionTable
@@ -27,6 +30,7 @@ from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.compile_template_name import compile_template_path
 from pgadmin.utils.driver import get_driver
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
     columns import utils as column_utils
@@ -50,6 +54,11 @@ from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import VacuumSettings
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 
+# Statistics of all the tables of a schema:
+# {(user id, sid, database, scid): (expiry time, statistics)}
+_coll_stats_cache = {}
+_coll_stats_lock = threading.Lock()
+
 
 class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
     """
@@ -78,6 +87,9 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
       - Returns the statistics for a particular table if tid is specified,
         otherwise it will return statistics for all the tables in that
         schema.
+
+    * get_coll_table_statistics(self, scid, schema_name):
+      - Returns the (cached) statistics of all the tables of the schema.
     * get_reverse_engineered_sql(self, did, scid, tid, main_sql, data):
       - This function will creates reverse engineered sql for
         the table object.
@@ -445,13 +457,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             return internal_server_error(errormsg=schema_name)
 
         if tid is None:
-            status, res = self.conn.execute_dict(
-                render_template(
-                    "/".join([self.table_template_path,
-                              'coll_table_stats.sql']), conn=self.conn,
-                    schema_name=schema_name
-                )
-            )
+            return self.get_coll_table_statistics(scid, schema_name)
         else:
             # For Individual table stats
             status, is_pgstattuple = check_pgstattuple(self.conn, tid)
@@ -485,6 +491,56 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             status=200
         )
 
+    def get_coll_table_statistics(self, scid, schema_name):
+        """
+        Returns the statistics (sizes, tuples, estimated bloat and index
+        usage) of all the tables of the schema, fetched with a single query
+        and cached for COLLECTION_STATISTICS_CACHE_TTL seconds.
+
+        Args:
+            scid: Schema Id
+            schema_name: Schema name
+        """
+        key = (current_user.id, self.manager.sid, self.conn.db, scid)
+        with _coll_stats_lock:
+            cached = _coll_stats_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return make_json_response(data=cached[1], status=200)
+
+        is_pgstattuple = False
+        if config.COLLECTION_STATISTICS_PGSTATTUPLE:
+            status, is_pgstattuple = self.conn.execute_scalar(
+                "SELECT EXISTS(SELECT 1 FROM pg_catalog.pg_extension "
+                "WHERE extname = 'pgstattuple')")
+            if not status:
+                return internal_server_error(errormsg=is_pgstattuple)
+
+        status, res = self.conn.execute_dict(
+            render_template(
+                "/".join([self.table_template_path,
+                          'coll_table_stats.sql']), conn=self.conn,
+                scid=scid, schema_name=schema_name,
+                is_pgstattuple=is_pgstattuple,
+                approx_min_size=int(config.PGSTATTUPLE_APPROX_MIN_SIZE)
+            )
+        )
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        if config.COLLECTION_STATISTICS_CACHE_TTL > 0:
+            now = time.monotonic()
+            with _coll_stats_lock:
+                for expired in [k for k, v in _coll_stats_cache.items()
+                                if v[0] <= now]:
+                    del _coll_stats_cache[expired]
+                _coll_stats_cache[key] = (
+                    now + config.COLLECTION_STATISTICS_CACHE_TTL, res)
+
+        return make_json_response(
+            data=res,
+            status=200
+        )
+
     def get_types_condition_sql(self, show_system_objects):
         condition = render_template(
             "/".join([
@@ -1119,6 +1175,12 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             if not status:
                 return internal_server_error(errormsg=res)
 
+            with _coll_stats_lock:
+                for key in [key for key in _coll_stats_cache
+                            if key[1:] == (self.manager.sid, self.conn.db,
+                                           scid)]:
+                    del _coll_stats_cache[key]
+
             return make_json_response(
                 success=1,
                 info=gettext("Table statistics have been reset"),
@@ -2129,6 +2191,18 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
                 )
         return ''
 
+    def get_ddl_fingerprint(self, tid):
+        """
+        This function will fetch the fingerprint of the catalog rows the
+        reverse engineered sql of the table (and of its partitions) is
+        built from, which changes with any DDL on the table.
+
+        :param tid: Table Id.
+        """
+        return self.conn.execute_scalar(
+            render_template("/".join([self.table_template_path,
+                                      'ddl_fingerprint.sql']), tid=tid))
+
     def get_schema_and_table_name(self, tid):
         """
         This function will fetch the schema qualified name of the
@@ -0,0 +1,169 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import os
+import tempfile
+import uuid
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils.driver.psycopg3.server_manager import ServerManager
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils as utils
+from . import utils as schema_utils
+
+
+class SchemaDDLScriptTestCase(BaseTestGenerator):
+    """
+    This class will generate the DDL script of a schema with a few objects,
+    and of its database.
+    """
+    url = '/browser/{0}/ddl_script/'
+
+    scenarios = [
+        ('Stream the DDL script of a schema', dict(
+            node='schema', output='stream', status_code=200)),
+        ('Write the DDL script of a schema to a file', dict(
+            node='schema', output='file', status_code=200)),
+        ('Stream the DDL script of a database', dict(
+            node='database', output='stream', status_code=200)),
+        ('Stream the DDL script of a non-existent schema', dict(
+            node='schema', output='stream', status_code=410,
+            wrong_schema_id=True)),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.database_info = parent_node_dict["database"][-1]
+        self.db_name = self.database_info["db_name"]
+        self.server_id = self.database_info["server_id"]
+        self.db_id = self.database_info["db_id"]
+        db_con = database_utils.connect_database(self, utils.SERVER_GROUP,
+                                                 self.server_id, self.db_id)
+        if not db_con['data']["connected"]:
+            raise Exception("Could not connect to database.")
+
+        self.schema_name = "schema_ddl_%s" % str(uuid.uuid4())[1:8]
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'],
+                                             self.server['sslmode'])
+        self.schema_id = schema_utils.create_schema(connection,
+                                                    self.schema_name)[0]
+
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'],
+                                             self.server['sslmode'])
+        pg_cursor = connection.cursor()
+        pg_cursor.execute(
+            "CREATE SEQUENCE {0}.ddl_seq;"
+            "CREATE TABLE {0}.ddl_table (id integer DEFAULT "
+            "nextval('{0}.ddl_seq'), name text);"
+            "CREATE VIEW {0}.ddl_view AS SELECT id FROM {0}.ddl_table;"
+            "CREATE FUNCTION {0}.ddl_func(integer) RETURNS integer "
+            "LANGUAGE sql AS 'SELECT $1';".format(self.schema_name))
+        connection.commit()
+        connection.close()
+
+    def get_ddl_script(self, file_path=None):
+        url = self.url.format(self.node) + str(utils.SERVER_GROUP) + '/' + \
+            str(self.server_id) + '/' + str(self.db_id)
+        if self.node == 'schema':
+            url += '/' + str(self.schema_id)
+
+        # Keep the connections of the worker threads, and check they are
+        # not among the (shared) connections of the manager
+        connection = ServerManager.connection
+
+        def get_connection(manager, **kwargs):
+            conn = connection(manager, **kwargs)
+            if 'DDL-Script' in conn.conn_id:
+                self.worker_conns.append(conn)
+                self.assertNotIn(conn.conn_id, manager.connections)
+            return conn
+
+        with patch.object(ServerManager, 'connection', autospec=True,
+                          side_effect=get_connection):
+            if file_path is not None:
+                return self.tester.post(
+                    url, data=json.dumps({'file': file_path}),
+                    content_type='html/json', follow_redirects=True)
+            response = self.tester.get(url, follow_redirects=True)
+            # The script is streamed, i.e. generated as it is read
+            response.get_data()
+            return response
+
+    def runTest(self):
+        """ This function will check the DDL script of the schema. """
+        if hasattr(self, "wrong_schema_id"):
+            self.schema_id = 99999
+        self.worker_conns = list()
+
+        if self.output == 'file':
+            file_path = os.path.join(tempfile.mkdtemp(),
+                                     self.schema_name + '.sql')
+            with patch('pgadmin.browser.server_groups.servers.databases.'
+                       'ddl_script.filename_with_file_manager_path',
+                       return_value=file_path):
+                response = self.get_ddl_script(file_path)
+            self.assertEqual(response.status_code, self.status_code)
+            self.assertEqual(json.loads(response.data.decode('utf-8'))[
+                'data']['file'], file_path)
+            with open(file_path, encoding='utf-8') as script_file:
+                script = script_file.read()
+            os.remove(file_path)
+        else:
+            response = self.get_ddl_script()
+            self.assertEqual(response.status_code, self.status_code)
+            if self.status_code != 200:
+                return
+            self.assertIn('attachment', response.headers[
+                'Content-Disposition'])
+            script = response.data.decode('utf-8')
+
+        # The objects are created in the order of their dependencies
+        statements = [
+            'CREATE SCHEMA IF NOT EXISTS {0}',
+            'CREATE SEQUENCE IF NOT EXISTS {0}.ddl_seq',
+            'CREATE OR REPLACE FUNCTION {0}.ddl_func(',
+            'CREATE TABLE IF NOT EXISTS {0}.ddl_table',
+            'CREATE OR REPLACE VIEW {0}.ddl_view',
+        ]
+        positions = list()
+        for statement in statements:
+            statement = statement.format(self.schema_name)
+            self.assertIn(statement, script)
+            positions.append(script.index(statement))
+        self.assertEqual(positions, sorted(positions))
+
+        # The connections of the worker threads are released
+        self.assertTrue(self.worker_conns)
+        for conn in self.worker_conns:
+            self.assertFalse(conn.connected())
+
+    def tearDown(self):
+        connection = utils.get_db_connection(self.db_name,
+                                             self.server['username'],
+                                             self.server['db_password'],
+                                             self.server['host'],
+                                             self.server['port'],
+                                             self.server['sslmode'])
+        pg_cursor = connection.cursor()
+        pg_cursor.execute("DROP SCHEMA {0} CASCADE".format(self.schema_name))
+        connection.commit()
+        connection.close()
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
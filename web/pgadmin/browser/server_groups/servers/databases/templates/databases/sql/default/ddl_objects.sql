@@ -0,0 +1,121 @@
+{### Objects of the schemas, of which the DDL script is generated, i.e. ###}
+{### not members of an extension, nor created along with another object ###}
+WITH nsp AS (
+    SELECT nsp.oid FROM pg_catalog.pg_namespace nsp
+    WHERE
+{% if scid %}
+        nsp.oid = {{ scid }}::oid
+{% else %}
+        nsp.nspname NOT LIKE E'pg\\_%' AND
+        nsp.nspname != 'information_schema'
+{% endif %}
+{% if server_type == 'ppas' %}
+        AND nsp.nspparent = 0
+{% endif %}
+), objs(scid, node_type, oid, name) AS (
+    SELECT nsp.oid, 'schema', nsp.oid, NULL FROM nsp
+    UNION ALL
+    SELECT c.relnamespace, CASE c.relkind
+        WHEN 'r' THEN 'table' WHEN 'p' THEN 'table'
+        WHEN 'v' THEN 'view' WHEN 'm' THEN 'mview'
+        WHEN 'S' THEN 'sequence' WHEN 'f' THEN 'foreign_table' END,
+        c.oid, c.relname::text
+    FROM pg_catalog.pg_class c
+    WHERE c.relnamespace IN (SELECT oid FROM nsp)
+        AND c.relkind IN ('r', 'p', 'v', 'm', 'S', 'f')
+        AND NOT c.relispartition
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_catalog.pg_depend d
+            WHERE d.classid = 'pg_class'::regclass AND d.objid = c.oid
+                AND d.deptype IN ('e', 'i'))
+    UNION ALL
+    SELECT p.pronamespace, CASE
+        WHEN p.prokind = 'p' THEN 'procedure'
+        WHEN p.prorettype IN ('trigger'::regtype, 'event_trigger'::regtype)
+            THEN 'trigger_function'
+        ELSE 'function' END,
+        p.oid, p.proname || '(' ||
+        pg_catalog.pg_get_function_identity_arguments(p.oid) || ')'
+    FROM pg_catalog.pg_proc p
+        JOIN pg_catalog.pg_language l ON l.oid = p.prolang
+    WHERE p.pronamespace IN (SELECT oid FROM nsp)
+        AND p.prokind IN ('f', 'w', 'p')
+        AND NOT (p.prorettype IN ('trigger'::regtype,
+                                  'event_trigger'::regtype)
+                 AND l.lanname IN ('edbspl', 'sql', 'internal'))
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_catalog.pg_depend d
+            WHERE d.classid = 'pg_proc'::regclass AND d.objid = p.oid
+                AND d.deptype = 'e')
+    UNION ALL
+    SELECT t.typnamespace, CASE
+        WHEN t.typtype = 'd' THEN 'domain' ELSE 'type' END,
+        t.oid, t.typname::text
+    FROM pg_catalog.pg_type t
+        LEFT JOIN pg_catalog.pg_class c ON c.oid = t.typrelid
+    WHERE t.typnamespace IN (SELECT oid FROM nsp)
+        AND t.typtype IN ('b', 'c', 'd', 'e', 'r')
+        AND t.typname NOT LIKE E'\\_%'
+        AND (c.oid IS NULL OR c.relkind = 'c')
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_catalog.pg_depend d
+            WHERE d.classid = 'pg_type'::regclass AND d.objid = t.oid
+                AND d.deptype = 'e')
+    UNION ALL
+    SELECT c.collnamespace, 'collation', c.oid, c.collname::text
+    FROM pg_catalog.pg_collation c
+    WHERE c.collnamespace IN (SELECT oid FROM nsp)
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_catalog.pg_depend d
+            WHERE d.classid = 'pg_collation'::regclass AND d.objid = c.oid
+                AND d.deptype = 'e')
+    UNION ALL
+    SELECT c.cfgnamespace, 'fts_configuration', c.oid, c.cfgname::text
+    FROM pg_catalog.pg_ts_config c
+    WHERE c.cfgnamespace IN (SELECT oid FROM nsp)
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_catalog.pg_depend d
+            WHERE d.classid = 'pg_ts_config'::regclass AND d.objid = c.oid
+                AND d.deptype = 'e')
+    UNION ALL
+    SELECT d.dictnamespace, 'fts_dictionary', d.oid, d.dictname::text
+    FROM pg_catalog.pg_ts_dict d
+    WHERE d.dictnamespace IN (SELECT oid FROM nsp)
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_catalog.pg_depend dep
+            WHERE dep.classid = 'pg_ts_dict'::regclass AND dep.objid = d.oid
+                AND dep.deptype = 'e')
+    UNION ALL
+    SELECT p.prsnamespace, 'fts_parser', p.oid, p.prsname::text
+    FROM pg_catalog.pg_ts_parser p
+    WHERE p.prsnamespace IN (SELECT oid FROM nsp)
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_catalog.pg_depend d
+            WHERE d.classid = 'pg_ts_parser'::regclass AND d.objid = p.oid
+                AND d.deptype = 'e')
+    UNION ALL
+    SELECT t.tmplnamespace, 'fts_template', t.oid, t.tmplname::text
+    FROM pg_catalog.pg_ts_template t
+    WHERE t.tmplnamespace IN (SELECT oid FROM nsp)
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_catalog.pg_depend d
+            WHERE d.classid = 'pg_ts_template'::regclass AND d.objid = t.oid
+                AND d.deptype = 'e')
+{% if server_type == 'ppas' %}
+    UNION ALL
+    SELECT pkg.nspparent, 'package', pkg.oid, pkg.nspname::text
+    FROM pg_catalog.pg_namespace pkg
+    WHERE pkg.nspparent IN (SELECT oid FROM nsp)
+        AND pkg.nspobjecttype = 0
+        AND NOT pkg.nspcompoundtrigger
+    UNION ALL
+    SELECT s.synnamespace, 'synonym', s.oid, s.synname::text
+    FROM pg_catalog.pg_synonym s
+    WHERE s.synnamespace IN (SELECT oid FROM nsp)
+{% endif %}
+)
+SELECT objs.scid, nsp.nspname AS schema, objs.node_type, objs.oid,
+    objs.name
+FROM objs
+    JOIN pg_catalog.pg_namespace nsp ON nsp.oid = objs.scid
+ORDER BY nsp.nspname, objs.node_type, objs.name
@@ -111,19 +111,6 @@ ALLOWLIST = [
       "'{{ tid }}'"), 1,
      "tid is a numeric table OID from the URL path, used with ::regclass."),
 
-    # ------------------------------------------------------------------
-    # Fixed enum strings supplied by the dashboard module. The value
-    # passed for ``log_format`` is selected from the server's
-    # ``log_destination`` GUC and can only be ``csvlog``, ``stderr`` or
-    # ``jsonlog`` (the only values pg_current_logfile accepts).
-    # ------------------------------------------------------------------
-    (('pgadmin/dashboard/templates/dashboard/sql/default/logs.sql',
-      "'{{log_format}}'"), 1,
-     "log_format is a fixed enum (csvlog/stderr/jsonlog) from server GUC."),
-    (('pgadmin/dashboard/templates/dashboard/sql/default/log_stat.sql',
-      "'{{log_format}}'"), 1,
-     "log_format is a fixed enum (csvlog/stderr/jsonlog) from server GUC."),
-
     # ------------------------------------------------------------------
     # ``constraint_type`` is a single-char pg_constraint contype code
     # ('c', 'f', 'p', 'u', 'x', ...) passed by pgAdmin's own handler when
@@ -31,6 +31,9 @@ SELECT DISTINCT dep.deptype, dep.classid, cl.relkind, ad.adbin, pg_get_expr(ad.a
         ftsdns.nspname, ftspns.nspname, ftstns.nspname) AS nspname,
     CASE WHEN inhits.inhparent IS NOT NULL THEN '1' ELSE '0' END AS is_inherits,
     CASE WHEN inhed.inhparent IS NOT NULL THEN '1' ELSE '0' END AS is_inherited
+{% if graph %}
+    , dep.refobjid AS graph_key
+{% endif %}
 FROM pg_catalog.pg_depend dep
 LEFT JOIN pg_catalog.pg_class cl ON dep.objid=cl.oid
 LEFT JOIN pg_catalog.pg_attribute att ON dep.objid=att.attrelid AND dep.objsubid=att.attnum
@@ -32,6 +32,9 @@ SELECT DISTINCT dep.deptype, dep.refclassid, dep.refobjid, cl.relkind, ad.adbin,
         ftsdns.nspname, ftspns.nspname, ftstns.nspname, synns.nspname) AS nspname,
     CASE WHEN inhits.inhparent IS NOT NULL THEN '1' ELSE '0' END AS is_inherits,
     CASE WHEN inhed.inhparent IS NOT NULL THEN '1' ELSE '0' END AS is_inherited
+{% if graph %}
+    , dep.objid AS graph_key
+{% endif %}
 FROM pg_catalog.pg_depend dep
 LEFT JOIN pg_catalog.pg_class cl ON dep.refobjid=cl.oid
 LEFT JOIN pg_catalog.pg_attribute att ON dep.refobjid=att.attrelid AND dep.refobjsubid=att.attnum
@@ -84,10 +87,20 @@ SELECT DISTINCT dep.deptype, dep.refclassid, dep.refobjid, cl.relkind, ad.adbin,
 	CASE WHEN cl.relname IS NOT NULL OR att.attname IS NOT NULL THEN cl.relname || COALESCE('.' || att.attname, '')
     ELSE cl.relname END AS refname,
     nsc.nspname AS nspname, '0' AS is_inherits, '0' AS is_inherited
+{% if graph %}
+    , rw.ev_class AS graph_key
+{% endif %}
 FROM pg_catalog.pg_depend dep
+{% if graph %}
+JOIN pg_catalog.pg_rewrite rw ON rw.oid=dep.objid
+{% endif %}
 LEFT JOIN pg_catalog.pg_class cl ON dep.refobjid=cl.oid
 LEFT JOIN pg_catalog.pg_attribute att ON dep.refobjid=att.attrelid AND dep.refobjsubid=att.attnum
 LEFT JOIN pg_catalog.pg_namespace nsc ON cl.relnamespace=nsc.oid
 LEFT JOIN pg_catalog.pg_attrdef ad ON ad.adrelid=att.attrelid AND ad.adnum=att.attnum
+{% if graph %}
+WHERE rw.ev_class > {{last_system_oid}}::oid AND cl.relkind not in ('v', 'm')
+{% else %}
 WHERE dep.objid IN (SELECT oid FROM pg_catalog.pg_rewrite WHERE ev_class={{object_id}}) AND cl.relkind not in ('v', 'm')
+{% endif %}
 ORDER BY refclassid, relkind
@@ -1,4 +1,7 @@
 SELECT rolname AS refname, refclassid, deptype
+{% if graph %}
+    , dep.objid AS graph_key
+{% endif %}
 FROM pg_catalog.pg_shdepend dep
 LEFT JOIN pg_catalog.pg_roles r ON refclassid=1260 AND refobjid=r.oid
 {{where_clause}}
@@ -0,0 +1,94 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+
+from sqlalchemy import event
+
+from pgadmin.model import db, Server, ServerGroup
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils import test_utils as utils
+
+
+class ServerGroupChildrenPages(BaseTestGenerator):
+    """
+    This class will list the servers of a server group a page at a time,
+    and check the number of statements run against the configuration
+    database does not grow with the number of servers.
+    """
+    SERVERS = 30
+
+    scenarios = [
+        ('List the servers of the group a page at a time', dict(
+            url='/browser/server_group/children/', page_size=7)),
+        ('List all the servers of the group in one page', dict(
+            url='/browser/server_group/children/', page_size=1000)),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        with self.app.app_context():
+            group = ServerGroup.query.get(utils.SERVER_GROUP)
+            self.server_ids = []
+            for idx in range(self.SERVERS):
+                server = Server(
+                    user_id=group.user_id, servergroup_id=group.id,
+                    name='test_sg_children_pages_{0:02d}'.format(idx),
+                    host='localhost', port=5432, maintenance_db='postgres',
+                    username='postgres', save_password=0, use_ssh_tunnel=0,
+                    tunnel_authentication=0, tunnel_prompt_password=0,
+                    shared=False)
+                db.session.add(server)
+                db.session.flush()
+                self.server_ids.append(server.id)
+            db.session.commit()
+            self.engine = db.engine
+
+    def _get(self, **params):
+        statements = []
+
+        def _count(*args):
+            statements.append(args[2])
+
+        event.listen(self.engine, 'before_cursor_execute', _count)
+        try:
+            response = self.tester.get(
+                self.url + str(utils.SERVER_GROUP), query_string=params,
+                content_type='html/json')
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', _count)
+
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.data.decode('utf8')), statements
+
+    def runTest(self):
+        """This function will list the servers of the group in pages."""
+        response_data, _ = self._get()
+        expected = [node['label'] for node in response_data['data']]
+
+        labels = []
+        total = None
+        while total is None or len(labels) < total:
+            response_data, statements = self._get(
+                offset=len(labels), limit=self.page_size)
+            total = response_data['result']['total']
+            self.assertLessEqual(len(response_data['data']), self.page_size)
+            self.assertLess(len(statements), self.SERVERS)
+            labels.extend(node['label'] for node in response_data['data'])
+
+        self.assertEqual(total, len(expected))
+        self.assertEqual(labels, sorted(expected))
+        self.assertEqual(
+            sum(label.startswith('test_sg_children_pages_')
+                for label in labels), self.SERVERS)
+
+    def tearDown(self):
+        with self.app.app_context():
+            Server.query.filter(Server.id.in_(self.server_ids)).delete()
+            db.session.commit()
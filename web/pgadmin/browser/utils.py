@@ -16,12 +16,32 @@ from flask import render_template, current_app
 from flask.views import View, MethodView
 from flask_babel import gettext
 
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.ajax import make_json_response, precondition_required,\
     internal_server_error, service_unavailable
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
 from pgadmin.utils.constants import DATABASE_LAST_SYSTEM_OID
+from pgadmin.utils.ddl_cache import invalidate_ddl_cache
+from pgadmin.utils.dependency_graph import get_dependency_graph, \
+    invalidate_dependency_graph
+
+# Functions called with (sid, did) when the objects of a server (or of one
+# of its databases) may have been modified, see register_node_change_callback
+_node_change_callbacks = []
+
+
+def register_node_change_callback(callback):
+    """
+    Register a function to be called with the server id and the database id
+    (None for the objects of the server) when the objects of a server or a
+    database may have been modified through the browser tree, so that a
+    module (e.g. the LLM tools) can discard what it has cached about them.
+    :param callback: function taking (sid, did)
+    """
+    if callback not in _node_change_callbacks:
+        _node_change_callbacks.append(callback)
 
 
 def underscore_escape(text):
@@ -306,7 +326,19 @@ class NodeView(View, metaclass=type(MethodView)):
                 )
             )
 
-        return method(*args, **kwargs)
+        response = method(*args, **kwargs)
+
+        # The objects of the database (or of the server) may have been
+        # modified, discard their cached reverse engineered sql, the cached
+        # dependency graphs, and whatever the other modules have cached
+        # about them.
+        if http_method != 'get' and 'sid' in kwargs:
+            invalidate_ddl_cache(kwargs['sid'], kwargs.get('did'))
+            invalidate_dependency_graph(kwargs['sid'])
+            for callback in _node_change_callbacks:
+                callback(kwargs['sid'], kwargs.get('did'))
+
+        return response
 
     @classmethod
     def register_node_view(cls, blueprint):
@@ -489,6 +521,14 @@ class PGChildNodeView(NodeView):
 
         Returns: Dictionary of dependencies for the selected node.
         """
+        graph = self.__get_dependency_graph(conn, object_id, where)
+        if graph is not None:
+            dependencies = self.__format_dependency(
+                graph.get_dependencies(int(object_id)), show_system_objects,
+                is_schema_diff)
+            self.__format_role_dependency(
+                graph.get_role_dependencies(int(object_id)), dependencies)
+            return dependencies
 
         # Set the sql_path
         sql_path = 'depends/{0}/#{1}#'.format(
@@ -516,24 +556,36 @@ class PGChildNodeView(NodeView):
             if not status:
                 current_app.logger.error(result)
 
-            for row in result['rows']:
-                ref_name = row['refname']
-                dep_str = row['deptype']
-                dep_type = ''
+            self.__format_role_dependency(result['rows'], dependencies)
 
-                if dep_str == 'a':
-                    dep_type = 'ACL'
-                elif dep_str == 'o':
-                    dep_type = 'Owner'
+        return dependencies
 
-                if row['refclassid'] == 1260:
-                    dependencies.append(
-                        {'type': 'role',
-                         'name': ref_name,
-                         'field': dep_type}
-                    )
+    @staticmethod
+    def __format_role_dependency(rows, dependencies):
+        """
+        This function is used to append the role dependencies (i.e. the
+        owner and the privileges) to the dependencies of the selected node.
 
-        return dependencies
+        Args:
+            rows: Rows of the role dependencies
+            dependencies: Dependencies of the selected node
+        """
+        for row in rows:
+            ref_name = row['refname']
+            dep_str = row['deptype']
+            dep_type = ''
+
+            if dep_str == 'a':
+                dep_type = 'ACL'
+            elif dep_str == 'o':
+                dep_type = 'Owner'
+
+            if row['refclassid'] == 1260:
+                dependencies.append(
+                    {'type': 'role',
+                     'name': ref_name,
+                     'field': dep_type}
+                )
 
     def get_dependents(self, conn, object_id, where=None):
         """
@@ -546,6 +598,11 @@ class PGChildNodeView(NodeView):
 
         Returns: Dictionary of dependents for the selected node.
         """
+        graph = self.__get_dependency_graph(conn, object_id, where)
+        if graph is not None:
+            return self.__format_dependency(
+                graph.get_dependents(int(object_id)))
+
         # Set the sql_path
         sql_path = 'depends/{0}/#{1}#'.format(
             conn.manager.server_type, conn.manager.version)
@@ -562,6 +619,31 @@ class PGChildNodeView(NodeView):
 
         return dependents
 
+    @staticmethod
+    def __get_dependency_graph(conn, object_id, where):
+        """
+        This function is used to get the (cached) dependency graph of the
+        database, if the dependencies of the selected node can be found in
+        it, i.e. it is not a system object (nor a column).
+
+        Args:
+            conn: Connection object
+            object_id: Object Id of the selected node.
+            where: where clause for the sql query (optional)
+
+        Returns: Dependency graph of the database, or None.
+        """
+        if where is not None or config.DEPENDENCY_GRAPH_CACHE_TTL <= 0 or \
+                int(object_id) <= DATABASE_LAST_SYSTEM_OID:
+            return None
+
+        status, graph = get_dependency_graph(conn)
+        if not status:
+            current_app.logger.error(graph)
+            return None
+
+        return graph
+
     def __fetch_dependency(self, conn, query, show_system_objects=None,
                            is_schema_diff=False):
         """
@@ -573,6 +655,26 @@ class PGChildNodeView(NodeView):
             show_system_objects: System object status
             is_schema_diff: True when function gets called from schema diff.
 
+        Returns: Dictionary of dependency for the selected node.
+        """
+        status, result = conn.execute_dict(query)
+        if not status:
+            current_app.logger.error(result)
+
+        return self.__format_dependency(result['rows'], show_system_objects,
+                                        is_schema_diff)
+
+    def __format_dependency(self, rows, show_system_objects=None,
+                            is_schema_diff=False):
+        """
+        This function is used to format the rows of the dependencies (or
+        dependents) of the selected node.
+
+        Args:
+            rows: Rows of the dependencies/dependents
+            show_system_objects: System object status
+            is_schema_diff: True when function gets called from schema diff.
+
         Returns: Dictionary of dependency for the selected node.
         """
 
@@ -618,13 +720,9 @@ class PGChildNodeView(NodeView):
             'p': None
         }
 
-        status, result = conn.execute_dict(query)
-        if not status:
-            current_app.logger.error(result)
-
         dependency = list()
 
-        for row in result['rows']:
+        for row in rows:
             _ref_name = row['refname']
             type_str = row['type']
             dep_str = row['deptype']
@@ -9,10 +9,13 @@
 
 """A blueprint module implementing the dashboard frame."""
 import math
-import re
+import secrets
 
-from flask import render_template, Response, g, request
+from flask import render_template, Response, g, request, \
+    copy_current_request_context
 from flask_babel import gettext
+from flask_security import current_user
+from flask_socketio import join_room, leave_room
 from pgadmin.user_login_check import pga_login_required
 import json
 from pgadmin.utils import PgAdminModule
@@ -23,11 +26,16 @@ from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS, \
     PREF_LABEL_REFRESH_RATES, ERROR_SERVER_ID_NOT_SPECIFIED
 
+from pgadmin.authenticate import socket_permissions_required
 from .precondition import check_precondition
 from .pgd_replication import blueprint as pgd_replication
+from .sampler import DashboardSampler, dashboard_samplers
+from .server_logs import server_log_tails
 from config import PG_DEFAULT_DRIVER, ON_DEMAND_LOG_COUNT
+from .. import socketio
 
 MODULE_NAME = 'dashboard'
+SOCKETIO_NAMESPACE = '/{0}'.format(MODULE_NAME)
 
 
 class DashboardModule(PgAdminModule):
@@ -519,11 +527,14 @@ def log_formats(sid=None):
 @check_precondition
 def logs(log_format=None, disp_format=None, sid=None, page=0):
     """
-    This function returns server logs details
-    """
+    This function returns server logs details.
 
-    LOG_STATEMENTS = 'DEBUG:|STATEMENT:|LOG:|WARNING:|NOTICE:|INFO:' \
-                     '|ERROR:|FATAL:|PANIC:'
+    Only what has been appended to the log file since the previous request
+    is read from the server, and the text (or the parsed entries) cached,
+    see server_logs.py. Only the end of a large log file is shown: its last
+    MAX_LOG_TEXT bytes, of which at most the last MAX_LOG_ENTRIES entries
+    are paged through in the table view.
+    """
     if not sid:
         return internal_server_error(
             errormsg=gettext('Server ID not specified.'))
@@ -542,91 +553,37 @@ def logs(log_format=None, disp_format=None, sid=None, page=0):
         log_format = ''
 
     sql = render_template(
-        "/".join([g.template_path, 'log_stat.sql']),
+        "/".join([g.template_path, 'log_file.sql']),
         log_format=log_format, conn=g.conn
     )
 
-    status, res = g.conn.execute_scalar(sql)
+    status, res = g.conn.execute_dict(sql)
     if not status:
         return internal_server_error(errormsg=res)
-    if not res or len(res) <= 0:
-        return ajax_response(
-            response={'logs_disabled': True},
-            status=200
-        )
-
-    file_stat = json.loads(res[0])
 
-    if file_stat <= 0:
+    log_file = res['rows'][0]['log_file'] if res['rows'] else None
+    size = res['rows'][0]['size'] if res['rows'] else None
+    if not log_file or not size or size <= 0:
         return ajax_response(
             response={'logs_disabled': True},
             status=200
         )
 
-    _start = 0
-    _end = ON_DEMAND_LOG_COUNT
-    page = int(page)
-    final_cols = []
-    if page > 0:
-        _start = page * int(ON_DEMAND_LOG_COUNT)
-        _end = _start + int(ON_DEMAND_LOG_COUNT)
-
-    if _start < file_stat:
-        if disp_format == 'plain':
-            _end = file_stat
-        sql = render_template(
-            "/".join([g.template_path, 'logs.sql']), st=_start, ed=_end,
-            log_format=log_format, conn=g.conn
-        )
-        status, res = g.conn.execute_dict(sql)
+    plain = disp_format == 'plain'
+    tail = server_log_tails.get((current_user.id, sid, log_format, plain),
+                                log_file, size, log_format,
+                                g.conn.python_encoding, plain)
+    with tail.lock:
+        status, res = tail.read(g.conn, g.template_path, size)
         if not status:
             return internal_server_error(errormsg=res)
 
-        final_res = res['rows'][0]['pg_read_file'].split('\n')
-        # Json format
-        if log_format == 'jsonlog':
-            for f in final_res:
-                try:
-                    _tmp_log = json.loads(f)
-                    final_cols.append(
-                        {"error_severity": _tmp_log['error_severity'],
-                         "timestamp": _tmp_log['timestamp'],
-                         "message": _tmp_log['message']})
-                except Exception:
-                    pass
-
-        # CSV format
-        elif log_format == 'csvlog':
-            for f in final_res:
-                try:
-                    _tmp_log = f.split(',')
-                    final_cols.append({"error_severity": _tmp_log[11],
-                                       "timestamp": _tmp_log[0],
-                                       "message": _tmp_log[13]})
-                except Exception:
-                    pass
-
+        if plain:
+            final_response = [{'pg_read_file': tail.text}]
         else:
-            _pattern = re.compile(LOG_STATEMENTS)
-            for f in final_res:
-                tmp = re.search(LOG_STATEMENTS, f)
-                if not tmp or tmp.group((0)) == 'STATEMENT:':
-                    last_val = final_cols.pop() if len(final_cols) > 0\
-                        else {'message': ''}
-                    last_val['message'] += f
-                    final_cols.append(last_val)
-                else:
-                    _tmp = re.split(LOG_STATEMENTS, f)
-
-                    final_cols.append({
-                        "error_severity": tmp.group(0)[:len(tmp.group(0)) - 1],
-                        "timestamp": _tmp[0],
-                        "message": _tmp[1] if len(_tmp) > 1 else ''})
-
-    if disp_format == 'plain':
-        final_response = res['rows']
-    else:
-        final_response = final_cols
+            final_response = tail.get_entries(
+                int(page) * int(ON_DEMAND_LOG_COUNT),
+                int(ON_DEMAND_LOG_COUNT))
 
     return ajax_response(
         response=final_response,
@@ -800,3 +757,112 @@ def replication_slots(sid=None):
         response=res['rows'],
         status=200
     )
+
+
+@socketio.on('connect', namespace=SOCKETIO_NAMESPACE)
+def connect():
+    """
+    Connect to the server through socket.
+    """
+    socketio.emit('connected', {'sid': request.sid},
+                  namespace=SOCKETIO_NAMESPACE,
+                  to=request.sid)
+
+
+@socketio.on('subscribe', namespace=SOCKETIO_NAMESPACE)
+@socket_permissions_required()
+def subscribe(params):
+    """
+    Subscribe to the shared sampler of the server (and database) given in
+    params, starting it if needed, see sampler.py.
+
+    The samples taken so far are sent straight away with 'history', then
+    each new sample with 'sample'. 'subscribe_failed' is sent if the
+    server/database is not connected, and 'sampler_failed' to everyone
+    subscribed if sampling fails later on.
+    """
+    sid = params.get('sid')
+    did = params.get('did') or None
+
+    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
+    conn = manager.connection(did=did) if manager is not None else None
+    if conn is None or not conn.connected():
+        socketio.emit('subscribe_failed', gettext(
+            "Please connect to the selected {0} to view the graph.".format(
+                'database' if did else 'server')),
+            namespace=SOCKETIO_NAMESPACE, to=request.sid)
+        return
+
+    key = (sid, did, manager.user)
+    leave_sampler_room(dashboard_samplers.unsubscribe(request.sid))
+    sampler, started = dashboard_samplers.subscribe(
+        request.sid, key,
+        lambda: DashboardSampler(
+            key, None, 'dashboard/sql/#{0}#'.format(manager.version),
+            did=did, on_sample=emit_sample, on_error=emit_sampler_failed)
+    )
+    join_room(get_sampler_room(sampler), namespace=SOCKETIO_NAMESPACE)
+
+    socketio.emit('history', sampler.history(),
+                  namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+    if started:
+        socketio.start_background_task(
+            copy_current_request_context(run_sampler), sampler, manager)
+
+
+@socketio.on('unsubscribe', namespace=SOCKETIO_NAMESPACE)
+def unsubscribe():
+    """
+    Stop receiving samples, see subscribe().
+    """
+    leave_sampler_room(dashboard_samplers.unsubscribe(request.sid))
+
+
+@socketio.on('disconnect', namespace=SOCKETIO_NAMESPACE)
+def disconnect():
+    """
+    Unsubscribe when the client goes away.
+    """
+    dashboard_samplers.unsubscribe(request.sid)
+
+
+def get_sampler_room(sampler):
+    return 'sampler-{0}-{1}-{2}'.format(*sampler.key)
+
+
+def leave_sampler_room(sampler):
+    if sampler is not None:
+        leave_room(get_sampler_room(sampler), namespace=SOCKETIO_NAMESPACE)
+
+
+def emit_sample(sampler, sample):
+    socketio.emit('sample', sample, namespace=SOCKETIO_NAMESPACE,
+                  to=get_sampler_room(sampler))
+
+
+def emit_sampler_failed(sampler, error):
+    dashboard_samplers.remove(sampler)
+    socketio.emit('sampler_failed', str(error),
+                  namespace=SOCKETIO_NAMESPACE,
+                  to=get_sampler_room(sampler))
+
+
+def run_sampler(sampler, manager):
+    """
+    Run a sampler on a connection of its own, released when it stops.
+    """
+    conn_id = 'DASHBOARD:{0}'.format(secrets.choice(range(1, 9999999)))
+    try:
+        sampler.conn = manager.connection(did=sampler.did, conn_id=conn_id,
+                                          auto_reconnect=False)
+        status, msg = sampler.conn.connect()
+        if not status:
+            emit_sampler_failed(sampler, msg)
+            return
+
+        sampler.run()
+    except Exception as e:
+        emit_sampler_failed(sampler, e)
+    finally:
+        manager.release(did=sampler.did, conn_id=conn_id)
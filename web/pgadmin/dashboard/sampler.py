@@ -0,0 +1,203 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Shared background sampler for the dashboard graphs.
+
+Rather than every open dashboard polling the server for its graphs, the
+dashboards showing the same server/database subscribe to a single
+DashboardSampler. It runs the dashboard statistics query every
+DASHBOARD_SAMPLE_INTERVAL seconds on a connection of its own, keeps the
+last DASHBOARD_SAMPLE_HISTORY samples in a ring buffer so that a new
+subscriber starts with the same history as everyone else, and hands each
+new sample to a callback that broadcasts it.
+
+Samplers are shared between dashboards connected to the server as the same
+database role only, so no one is shown statistics their role could not
+read. A sampler stops, and releases its connection, when the last
+subscriber goes away or the query fails.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+
+from flask import render_template
+
+import config
+
+# The graphs the sampler collects, as named in dashboard_stats.sql
+CHART_NAMES = ['session_stats', 'tps_stats', 'ti_stats', 'to_stats',
+               'bio_stats']
+
+
+class DashboardSampler:
+    """
+    Samples the dashboard statistics of one server/database on a fixed
+    interval, see the module documentation.
+    """
+
+    def __init__(self, key, conn, template_path, did=None, on_sample=None,
+                 on_error=None, interval=None, history=None):
+        self.key = key
+        self.conn = conn
+        self.template_path = template_path
+        self.did = did
+        self.on_sample = on_sample
+        self.on_error = on_error
+        self.interval = interval or getattr(
+            config, 'DASHBOARD_SAMPLE_INTERVAL', 1)
+        self.samples = deque(maxlen=history or getattr(
+            config, 'DASHBOARD_SAMPLE_HISTORY', 300))
+        self.subscribers = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    @property
+    def stopped(self):
+        return self._stopped.is_set()
+
+    def history(self):
+        """Return the samples taken so far, oldest first."""
+        with self._lock:
+            return list(self.samples)
+
+    def sample(self):
+        """
+        Run the statistics query once and record the result.
+
+        Returns:
+            (True, sample) or (False, error message)
+        """
+        sql = render_template(
+            "/".join([self.template_path, 'dashboard_stats.sql']),
+            did=self.did, chart_names=CHART_NAMES
+        )
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return False, res
+
+        sample = {
+            'time': time.time(),
+            'stats': {
+                row['chart_name']: json.loads(row['chart_data'])
+                for row in res['rows']
+            }
+        }
+        with self._lock:
+            self.samples.append(sample)
+
+        return True, sample
+
+    def run(self):
+        """
+        Take samples until stop() is called or a sample fails. Meant to be
+        run in a background task of its own.
+        """
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            try:
+                status, res = self.sample()
+            except Exception as e:
+                status, res = False, str(e)
+
+            if self._stopped.is_set():
+                break
+
+            if not status:
+                self._stopped.set()
+                if self.on_error:
+                    self.on_error(self, res)
+                break
+
+            if self.on_sample:
+                self.on_sample(self, res)
+
+            self._stopped.wait(
+                max(0, self.interval - (time.monotonic() - started)))
+
+    def stop(self):
+        self._stopped.set()
+
+
+class DashboardSamplers:
+    """
+    Registry of the running samplers, and of which subscriber (socket id)
+    listens to which.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samplers = {}
+        self._subscriptions = {}
+
+    def get(self, key):
+        with self._lock:
+            sampler = self._samplers.get(key)
+            return None if sampler is None or sampler.stopped else sampler
+
+    def subscribe(self, subscriber, key, create):
+        """
+        Subscribe to the sampler for key, creating one with create() if
+        none is running.
+
+        Returns:
+            (sampler, started), started being True if the sampler was
+            created by this call and still has to be run.
+        """
+        self.unsubscribe(subscriber)
+
+        with self._lock:
+            sampler = self._samplers.get(key)
+            started = sampler is None or sampler.stopped
+            if started:
+                sampler = create()
+                self._samplers[key] = sampler
+
+            sampler.subscribers.add(subscriber)
+            self._subscriptions[subscriber] = key
+
+        return sampler, started
+
+    def unsubscribe(self, subscriber):
+        """
+        Unsubscribe from the current sampler, stopping it if nobody else
+        is listening.
+
+        Returns:
+            The sampler, or None if there was no subscription.
+        """
+        with self._lock:
+            key = self._subscriptions.pop(subscriber, None)
+            sampler = self._samplers.get(key)
+            if sampler is None:
+                return None
+
+            sampler.subscribers.discard(subscriber)
+            if not sampler.subscribers:
+                sampler.stop()
+                del self._samplers[key]
+
+        return sampler
+
+    def remove(self, sampler):
+        """
+        Forget a sampler that has stopped on its own, along with its
+        subscriptions.
+        """
+        with self._lock:
+            if self._samplers.get(sampler.key) is sampler:
+                del self._samplers[sampler.key]
+            for subscriber in sampler.subscribers:
+                if self._subscriptions.get(subscriber) == sampler.key:
+                    del self._subscriptions[subscriber]
+            sampler.subscribers.clear()
+
+
+dashboard_samplers = DashboardSamplers()
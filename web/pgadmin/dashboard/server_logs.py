@@ -0,0 +1,268 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Incremental reading and parsing of the server log for the dashboard.
+
+Each ServerLogTail remembers how far into the current log file it has
+read, so a refresh only reads (and parses) what has been appended since.
+Either the raw text (for the plain text view) or the parsed entries (for
+the table view) are kept in memory, bounded, so that paging through the
+table is served without going back to the server.
+
+Only the end of a large log file is read: its last MAX_LOG_TEXT bytes, of
+which at most the last MAX_LOG_ENTRIES entries are kept. The older entries
+cannot be paged to in the table view (nor shown in the plain text view);
+they are to be read from the log file itself.
+ServerLogParser is fed arbitrary chunks of the log and understands entries
+spanning several lines in all three formats: quoted CSV fields with
+embedded newlines, and continuation lines (e.g. STATEMENT: or DETAIL:) in
+the plain stderr format. JSON log entries are always single lines.
+"""
+
+import base64
+import codecs
+import csv
+import json
+import re
+import threading
+from collections import OrderedDict, deque
+from itertools import islice
+
+from flask import render_template
+
+LOG_STATEMENTS = 'DEBUG:|STATEMENT:|LOG:|WARNING:|NOTICE:|INFO:' \
+                 '|ERROR:|FATAL:|PANIC:'
+_LOG_STATEMENTS_RE = re.compile(LOG_STATEMENTS)
+
+# Only the last MAX_LOG_TEXT characters of the log are kept, and shown in
+# the plain text view. A larger file is read from that far from its end, in
+# both views.
+MAX_LOG_TEXT = 10 * 1024 * 1024
+
+# Maximum number of parsed entries kept per log file, i.e. shown in the
+# table view: the older ones are dropped.
+MAX_LOG_ENTRIES = 100000
+
+# Number of bytes read from the log file per query.
+LOG_READ_CHUNK = 1024 * 1024
+
+# Maximum number of log files (per user, server and format) kept in memory.
+MAX_LOG_TAILS = 16
+
+
+class ServerLogParser:
+    """
+    Streaming parser for the csvlog, jsonlog and plain (stderr) formats,
+    see the module documentation.
+    """
+
+    def __init__(self, log_format):
+        self.log_format = log_format
+        self._partial = ''
+        self._record = []
+        self._pending = None
+
+    def feed(self, text):
+        """
+        Parse a chunk of the log.
+
+        Returns:
+            The list of entries completed by this chunk. A trailing
+            incomplete line is kept for the next call, as is the last plain
+            text entry, which may still be continued; see pending().
+        """
+        lines = (self._partial + text).split('\n')
+        self._partial = lines.pop()
+
+        entries = []
+        for line in lines:
+            self._parse_line(line, entries)
+        return entries
+
+    def pending(self):
+        """
+        Return the entry still open for continuation lines, if any.
+        """
+        return dict(self._pending) if self._pending is not None else None
+
+    def _parse_line(self, line, entries):
+        if self.log_format == 'jsonlog':
+            try:
+                _tmp_log = json.loads(line)
+                entries.append(
+                    {"error_severity": _tmp_log['error_severity'],
+                     "timestamp": _tmp_log['timestamp'],
+                     "message": _tmp_log['message']})
+            except Exception:
+                pass
+
+        elif self.log_format == 'csvlog':
+            # A quoted field may span several lines, the record is complete
+            # once the quotes are balanced.
+            self._record.append(line)
+            record = '\n'.join(self._record)
+            if record.count('"') % 2:
+                return
+            self._record = []
+
+            try:
+                _tmp_log = next(csv.reader([record]))
+                entries.append({"error_severity": _tmp_log[11],
+                                "timestamp": _tmp_log[0],
+                                "message": _tmp_log[13]})
+            except Exception:
+                pass
+
+        else:
+            tmp = _LOG_STATEMENTS_RE.search(line)
+            if not tmp or tmp.group(0) == 'STATEMENT:':
+                if self._pending is None:
+                    self._pending = {"error_severity": '', "timestamp": '',
+                                     "message": ''}
+                self._pending['message'] += line
+            else:
+                if self._pending is not None:
+                    entries.append(self._pending)
+                _tmp = _LOG_STATEMENTS_RE.split(line)
+                self._pending = {
+                    "error_severity": tmp.group(0)[:-1],
+                    "timestamp": _tmp[0],
+                    "message": _tmp[1] if len(_tmp) > 1 else ''}
+
+
+class ServerLogTail:
+    """
+    The part of one log file read so far, see the module documentation: its
+    raw text if plain, or its parsed entries otherwise.
+    """
+
+    def __init__(self, log_file, log_format, encoding='utf-8', plain=False):
+        self.log_file = log_file
+        self.log_format = log_format
+        self.plain = plain
+        self.offset = 0
+        self.text = ''
+        self.entries = deque(maxlen=MAX_LOG_ENTRIES)
+        self.lock = threading.Lock()
+        self._parser = ServerLogParser(log_format)
+        self._decoder = codecs.getincrementaldecoder(encoding)('replace')
+
+    def skip_to(self, offset):
+        """
+        Drop everything read so far and continue reading from offset.
+        """
+        self.offset = offset
+        self.text = ''
+        self.entries.clear()
+        self._parser = ServerLogParser(self.log_format)
+        self._decoder.reset()
+
+    def append(self, data):
+        """Add the next bytes of the log file."""
+        self.offset += len(data)
+        text = self._decoder.decode(data)
+        if not self.plain:
+            self.entries.extend(self._parser.feed(text))
+            return
+
+        self.text += text
+        if len(self.text) > MAX_LOG_TEXT:
+            self.text = self.text[-MAX_LOG_TEXT:]
+            # Start at a line boundary
+            self.text = self.text[self.text.find('\n') + 1:]
+
+    def read(self, conn, template_path, size):
+        """
+        Read what has been appended to the log file, up to size bytes,
+        since the last call. At most the last MAX_LOG_TEXT bytes are read.
+
+        Must be called with the lock held.
+
+        Returns:
+            (True, None) or (False, error message)
+        """
+        skip_partial_line = False
+        if size - self.offset > MAX_LOG_TEXT:
+            # Skip ahead, and restart parsing on a clean line.
+            self.skip_to(size - MAX_LOG_TEXT)
+            skip_partial_line = True
+
+        while self.offset < size:
+            sql = render_template(
+                "/".join([template_path, 'log_read.sql']),
+                log_file=self.log_file, offset=self.offset,
+                length=min(LOG_READ_CHUNK, size - self.offset), conn=conn
+            )
+            status, res = conn.execute_scalar(sql)
+            if not status:
+                return False, res
+
+            data = base64.b64decode(res or '')
+            if not data:
+                break
+
+            if skip_partial_line:
+                newline = data.find(b'\n')
+                if newline < 0:
+                    self.offset += len(data)
+                    continue
+                skip_partial_line = False
+                self.offset += newline + 1
+                data = data[newline + 1:]
+
+            self.append(data)
+
+        return True, None
+
+    def get_entries(self, start, count):
+        """
+        Return count entries from start, oldest first, among the last
+        MAX_LOG_ENTRIES entries of the last MAX_LOG_TEXT bytes of the file.
+        """
+        entries = list(islice(self.entries, start, start + count))
+        pending = self._parser.pending()
+        if pending is not None and len(entries) < count and \
+                start <= len(self.entries):
+            entries.append(pending)
+        return entries
+
+
+class ServerLogTails:
+    """
+    Size-bounded cache of ServerLogTail objects, keyed by (user id, server
+    id, log format, plain).
+    """
+
+    def __init__(self, max_tails=MAX_LOG_TAILS):
+        self.max_tails = max_tails
+        self._lock = threading.Lock()
+        self._tails = OrderedDict()
+
+    def get(self, key, log_file, size, log_format, encoding, plain=False):
+        """
+        Return the tail for key, starting a new one if there is none yet or
+        the log file has been rotated or truncated since.
+        """
+        with self._lock:
+            tail = self._tails.get(key)
+            if tail is None or tail.log_file != log_file or \
+                    tail.offset > size:
+                tail = ServerLogTail(log_file, log_format, encoding, plain)
+                self._tails[key] = tail
+            self._tails.move_to_end(key)
+            while len(self._tails) > self.max_tails:
+                self._tails.popitem(last=False)
+            return tail
+
+    def clear(self):
+        with self._lock:
+            self._tails.clear()
+
+
+server_log_tails = ServerLogTails()
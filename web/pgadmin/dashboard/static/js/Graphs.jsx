@@ -18,6 +18,7 @@ import PropTypes from 'prop-types';
 import StreamingChart from '../../../static/js/components/PgChart/StreamingChart';
 import { Grid, useTheme } from '@mui/material';
 import { getChartColor, toPrettySize } from '../../../static/js/utils';
+import { openSocket } from '../../../static/js/socket_instance';
 
 export const X_AXIS_LENGTH = 75;
 
@@ -99,7 +100,9 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
   const [toStats, toStatsReduce] = useReducer(statsReducer, chartsDefault['to_stats']);
   const [bioStats, bioStatsReduce] = useReducer(statsReducer, chartsDefault['bio_stats']);
 
-  const [counterData, setCounterData] = useState({});
+  const counterData = useRef({});
+  const onSampleRef = useRef(null);
+  const [usingSampler, setUsingSampler] = useState(false);
 
   const [errorMsg, setErrorMsg] = useState(null);
   const [pollDelay, setPollDelay] = useState(1000);
@@ -145,8 +148,8 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
     }
   }, [pageVisible]);
 
-  useInterval(()=>{
-    const currEpoch = getEpoch();
+  /* Get the charts due for a refresh at the given time */
+  const getDueCharts = (currEpoch)=>{
     if(refreshOn.current === null) {
       let tmpRef = {};
       Object.keys(chartsDefault).forEach((name)=>{
@@ -162,33 +165,99 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
         refreshOn.current[name] = currEpoch + preferences[name+'_refresh'];
       }
     });
+    return getFor;
+  };
+
+  const resetCharts = ()=>{
+    sessionStatsReduce({reset: chartsDefault['session_stats']});
+    tpsStatsReduce({reset:chartsDefault['tps_stats']});
+    tiStatsReduce({reset:chartsDefault['ti_stats']});
+    toStatsReduce({reset:chartsDefault['to_stats']});
+    bioStatsReduce({reset:chartsDefault['bio_stats']});
+    counterData.current = {};
+  };
+
+  const addStats = (data)=>{
+    setErrorMsg(null);
+    sessionStatsReduce({incoming: data['session_stats']});
+    tpsStatsReduce({incoming: data['tps_stats'], counter: true, counterData: counterData.current['tps_stats']});
+    tiStatsReduce({incoming: data['ti_stats'], counter: true, counterData: counterData.current['ti_stats']});
+    toStatsReduce({incoming: data['to_stats'], counter: true, counterData: counterData.current['to_stats']});
+    bioStatsReduce({incoming: data['bio_stats'], counter: true, counterData: counterData.current['bio_stats']});
+
+    counterData.current = {
+      ...counterData.current,
+      ...data,
+    };
+  };
+
+  /* Samples pushed by the server side sampler carry all the charts, only
+   * use the ones due for a refresh as per the preferences.
+   */
+  onSampleRef.current = (sample)=>{
+    let data = {};
+    getDueCharts(Math.floor(sample.time)).forEach((name)=>{
+      data[name] = sample.stats[name];
+    });
+    if(Object.keys(data).length > 0) {
+      addStats(data);
+    }
+  };
+
+  /* Subscribe to the sampler shared by all the dashboards of the same
+   * server/database. Polling is used until it is known to work, and again
+   * if it stops.
+   */
+  useEffect(()=>{
+    if(!enablePoll) {
+      return;
+    }
+
+    let socket = null, closed = false;
+    const stopSampler = ()=>{
+      socket?.disconnect();
+      setUsingSampler(false);
+    };
+
+    openSocket('/dashboard')
+      .then((socketObj)=>{
+        if(closed) {
+          socketObj.disconnect();
+          return;
+        }
+        socket = socketObj;
+        socket.on('history', (samples)=>{
+          /* Start over from the shared history */
+          resetCharts();
+          refreshOn.current = null;
+          samples.forEach((sample)=>onSampleRef.current(sample));
+          setUsingSampler(true);
+        });
+        socket.on('sample', (sample)=>onSampleRef.current(sample));
+        socket.on('subscribe_failed', stopSampler);
+        socket.on('sampler_failed', stopSampler);
+        socket.on('disconnect', ()=>setUsingSampler(false));
+        socket.emit('subscribe', {sid: sid, did: did > 0 ? did : null});
+      })
+      .catch(()=>{/* Keep polling */});
+
+    return ()=>{
+      closed = true;
+      socket?.disconnect();
+    };
+  }, [enablePoll]);
+
+  useInterval(()=>{
+    let getFor = getDueCharts(getEpoch());
 
     let path = getStatsUrl(sid, did, getFor);
     axios.get(path)
       .then((resp)=>{
-        let data = resp.data;
-        setErrorMsg(null);
-        sessionStatsReduce({incoming: data['session_stats']});
-        tpsStatsReduce({incoming: data['tps_stats'], counter: true, counterData: counterData['tps_stats']});
-        tiStatsReduce({incoming: data['ti_stats'], counter: true, counterData: counterData['ti_stats']});
-        toStatsReduce({incoming: data['to_stats'], counter: true, counterData: counterData['to_stats']});
-        bioStatsReduce({incoming: data['bio_stats'], counter: true, counterData: counterData['bio_stats']});
-
-        setCounterData((prevCounterData)=>{
-          return {
-            ...prevCounterData,
-            ...data,
-          };
-        });
+        addStats(resp.data);
       })
       .catch((error)=>{
         if(!errorMsg) {
-          sessionStatsReduce({reset: chartsDefault['session_stats']});
-          tpsStatsReduce({reset:chartsDefault['tps_stats']});
-          tiStatsReduce({reset:chartsDefault['ti_stats']});
-          toStatsReduce({reset:chartsDefault['to_stats']});
-          bioStatsReduce({reset:chartsDefault['bio_stats']});
-          setCounterData({});
+          resetCharts();
           if(error.response) {
             if (error.response.status === 428) {
               setErrorMsg(gettext('Please connect to the selected server to view the graph.'));
@@ -203,7 +272,7 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
           }
         }
       });
-  }, enablePoll ? pollDelay : -1);
+  }, enablePoll && !usingSampler ? pollDelay : -1);
 
   return (
     <>
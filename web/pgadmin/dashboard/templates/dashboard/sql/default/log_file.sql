@@ -0,0 +1,3 @@
+/*pga4dash*/
+SELECT log_file, (pg_catalog.pg_stat_file(log_file, true)).size
+FROM (SELECT pg_catalog.pg_current_logfile({% if log_format != '' %}{{ log_format|qtLiteral(conn) }}{% endif %}) AS log_file) t;
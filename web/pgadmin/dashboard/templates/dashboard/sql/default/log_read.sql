@@ -0,0 +1,2 @@
+/*pga4dash*/
+SELECT pg_catalog.encode(pg_catalog.pg_read_binary_file({{ log_file|qtLiteral(conn) }}, {{ offset }}, {{ length }}), 'base64');
@@ -0,0 +1,88 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import time
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseSocketTestGenerator
+from pgadmin.utils import server_utils
+from regression import parent_node_dict
+from pgAdmin4 import app
+from ... import socketio
+from ...dashboard import sampler as dashboard_sampler
+
+
+class DashboardSamplerTestCase(BaseSocketTestGenerator):
+    """
+    This class tests the shared sampler feeding the dashboard graphs over
+    socket.io.
+    """
+    SOCKET_NAMESPACE = '/dashboard'
+
+    scenarios = [
+        ('Server dashboard sampler', dict(did=None)),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.server_id = parent_node_dict["server"][-1]["server_id"]
+        server_response = server_utils.connect_server(self, self.server_id)
+        if server_response["info"] != "Server connected.":
+            raise Exception("Could not connect to server.")
+
+    def _wait_for(self, client, name, timeout=10):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            for msg in client.get_received(self.SOCKET_NAMESPACE):
+                if msg['name'] == name:
+                    return msg['args'][0]
+            time.sleep(0.1)
+        self.fail('{0} not received'.format(name))
+
+    def runTest(self):
+        received = self.socket_client.get_received(self.SOCKET_NAMESPACE)
+        self.assertEqual(received[0]['name'], 'connected')
+
+        with patch.object(dashboard_sampler.config,
+                          'DASHBOARD_SAMPLE_INTERVAL', 0.2):
+            self.socket_client.emit('subscribe', {'sid': self.server_id,
+                                                  'did': self.did},
+                                    namespace=self.SOCKET_NAMESPACE)
+            self.assertEqual(self._wait_for(self.socket_client, 'history'),
+                             [])
+
+            sample = self._wait_for(self.socket_client, 'sample')
+            self.assertEqual(set(sample['stats'].keys()),
+                             set(dashboard_sampler.CHART_NAMES))
+
+            # A second viewer shares the same sampler and its history
+            other_client = socketio.test_client(
+                app, namespace=self.SOCKET_NAMESPACE,
+                flask_test_client=self.tester)
+            other_client.emit('subscribe', {'sid': self.server_id,
+                                            'did': self.did},
+                              namespace=self.SOCKET_NAMESPACE)
+            history = self._wait_for(other_client, 'history')
+            self.assertGreaterEqual(len(history), 1)
+            self.assertEqual(history[0]['time'], sample['time'])
+
+            sampler = next(
+                s for s in dashboard_sampler.dashboard_samplers._samplers
+                .values() if s.key[0] == self.server_id)
+            self.assertEqual(len(sampler.subscribers), 2)
+
+            # The sampler stops once the last viewer has gone
+            other_client.disconnect(namespace=self.SOCKET_NAMESPACE)
+            self.assertFalse(sampler.stopped)
+            self.socket_client.emit('unsubscribe',
+                                    namespace=self.SOCKET_NAMESPACE)
+            self.assertTrue(sampler.stopped)
+
+    def tearDown(self):
+        super().tearDown()
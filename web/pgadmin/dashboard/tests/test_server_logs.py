@@ -0,0 +1,225 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import base64
+import re
+from unittest.mock import patch, MagicMock
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard import server_logs
+from pgadmin.dashboard.server_logs import ServerLogParser, ServerLogTail, \
+    ServerLogTails
+
+CSV_LOG = (
+    '2026-01-01 10:00:00 UTC,"postgres","postgres",1,"[local]",a,1,'
+    '"idle",2026-01-01 10:00:00 UTC,3/4,0,ERROR,42601,'
+    '"syntax error at or near ""x""",,,,,,"SELECT x\n  FROM y;",,,"psql"\n'
+    '2026-01-01 10:00:01 UTC,,,2,,b,1,,2026-01-01 10:00:00 UTC,,0,LOG,'
+    '00000,"checkpoint starting: time",,,,,,,,,""\n'
+)
+
+JSON_LOG = (
+    '{"timestamp":"2026-01-01 10:00:00 UTC","error_severity":"ERROR",'
+    '"message":"division by zero"}\n'
+    '{"timestamp":"2026-01-01 10:00:01 UTC","error_severity":"LOG",'
+    '"message":"checkpoint starting: time\\nline two"}\n'
+)
+
+PLAIN_LOG = (
+    '2026-01-01 10:00:00 UTC [1] ERROR:  relation "x" does not exist\n'
+    '2026-01-01 10:00:00 UTC [1] STATEMENT:  SELECT * FROM x;\n'
+    '\tDETAIL: more\n'
+    '2026-01-01 10:00:01 UTC [2] LOG:  checkpoint starting: time\n'
+)
+
+
+class ServerLogParserTestCase(BaseTestGenerator):
+    """Test cases for the streaming server log parser."""
+
+    scenarios = [
+        ('CSV log with a multi-line quoted field', dict(
+            log_format='csvlog',
+            log=CSV_LOG,
+            expected=[
+                ('ERROR', '2026-01-01 10:00:00 UTC',
+                 'syntax error at or near "x"'),
+                ('LOG', '2026-01-01 10:00:01 UTC',
+                 'checkpoint starting: time'),
+            ]
+        )),
+        ('JSON log', dict(
+            log_format='jsonlog',
+            log=JSON_LOG,
+            expected=[
+                ('ERROR', '2026-01-01 10:00:00 UTC', 'division by zero'),
+                ('LOG', '2026-01-01 10:00:01 UTC',
+                 'checkpoint starting: time\nline two'),
+            ]
+        )),
+        ('Plain log with continuation lines', dict(
+            log_format='',
+            log=PLAIN_LOG,
+            expected=[
+                ('ERROR', '2026-01-01 10:00:00 UTC [1] ',
+                 '  relation "x" does not exist'
+                 '2026-01-01 10:00:00 UTC [1] STATEMENT:  SELECT * FROM x;'
+                 '\tDETAIL: more'),
+                ('LOG', '2026-01-01 10:00:01 UTC [2] ',
+                 '  checkpoint starting: time'),
+            ]
+        )),
+    ]
+
+    def setUp(self):
+        pass
+
+    def _parse(self, chunks):
+        parser = ServerLogParser(self.log_format)
+        entries = []
+        for chunk in chunks:
+            entries.extend(parser.feed(chunk))
+        if parser.pending() is not None:
+            entries.append(parser.pending())
+        return [(e['error_severity'], e['timestamp'], e['message'])
+                for e in entries]
+
+    def runTest(self):
+        self.assertEqual(self._parse([self.log]), self.expected)
+
+        # The result does not depend on where the chunks are split
+        for size in (1, 7, 50):
+            chunks = [self.log[i:i + size]
+                      for i in range(0, len(self.log), size)]
+            self.assertEqual(self._parse(chunks), self.expected, size)
+
+    def tearDown(self):
+        pass
+
+
+class ServerLogTailTestCase(BaseTestGenerator):
+    """Test cases for the incremental reading of the server log."""
+
+    scenarios = [
+        ('Server log tail - Reads only appended data', dict(
+            action='incremental'
+        )),
+        ('Server log tail - Skips ahead in a large file', dict(
+            action='skip_ahead'
+        )),
+        ('Server log tail - Pages only the last entries', dict(
+            action='limit'
+        )),
+        ('Server log tail - New tail after rotation', dict(
+            action='rotation'
+        )),
+    ]
+
+    def setUp(self):
+        self.log = PLAIN_LOG.encode()
+        self.reads = []
+
+    def _conn(self):
+        conn = MagicMock()
+
+        def execute_scalar(sql):
+            offset, length = (int(v) for v in re.search(
+                r", (\d+), (\d+)\)", sql).groups())
+            self.reads.append((offset, length))
+            return True, base64.b64encode(
+                self.log[offset:offset + length]).decode()
+
+        conn.execute_scalar.side_effect = execute_scalar
+        return conn
+
+    def _read(self, tail, size):
+        with patch.object(server_logs, 'render_template',
+                          side_effect=lambda _t, **kw: 'SELECT read({0}, '
+                          '{1}, {2})'.format(kw['log_file'], kw['offset'],
+                                             kw['length'])):
+            self.assertEqual(tail.read(self._conn(), 'path', size),
+                             (True, None))
+
+    def runTest(self):
+        getattr(self, '_' + self.action)()
+
+    def _incremental(self):
+        tail = ServerLogTail('log', '')
+        first = len(PLAIN_LOG.split('\n')[0]) + 1
+        self._read(tail, first)
+        self.assertEqual(len(tail.get_entries(0, 10)), 1)
+
+        self._read(tail, len(self.log))
+        self.assertEqual(self.reads, [(0, first),
+                                      (first, len(self.log) - first)])
+        # The raw text is only kept for the plain text view
+        self.assertEqual(tail.text, '')
+        self.assertEqual([e['error_severity']
+                          for e in tail.get_entries(0, 10)],
+                         ['ERROR', 'LOG'])
+        self.assertEqual(tail.get_entries(1, 1)[0]['error_severity'], 'LOG')
+        self.assertEqual(tail.get_entries(2, 10), [])
+
+        # Nothing new, nothing read
+        self._read(tail, len(self.log))
+        self.assertEqual(len(self.reads), 2)
+
+        plain = ServerLogTail('log', '', plain=True)
+        self._read(plain, first)
+        self._read(plain, len(self.log))
+        self.assertEqual(plain.text, PLAIN_LOG)
+        self.assertEqual(plain.get_entries(0, 10), [])
+
+    def _skip_ahead(self):
+        tail = ServerLogTail('log', '')
+        plain = ServerLogTail('log', '', plain=True)
+        with patch.object(server_logs, 'MAX_LOG_TEXT', 70), \
+                patch.object(server_logs, 'LOG_READ_CHUNK', 16):
+            self._read(tail, len(self.log))
+            self._read(plain, len(self.log))
+
+        # Only the last line of the log fits, the partial line before it is
+        # skipped.
+        self.assertEqual(self.reads[0][0], len(self.log) - 70)
+        self.assertEqual(plain.text, PLAIN_LOG.split('\n')[-2] + '\n')
+        self.assertEqual([e['error_severity']
+                          for e in tail.get_entries(0, 10)], ['LOG'])
+
+    def _limit(self):
+        # The table view cannot page to the entries before the last
+        # MAX_LOG_ENTRIES ones (and the last one, not complete yet).
+        self.log = (PLAIN_LOG * 3).encode()
+        with patch.object(server_logs, 'MAX_LOG_ENTRIES', 2):
+            tail = ServerLogTail('log', '')
+            self._read(tail, len(self.log))
+
+        self.assertEqual([e['error_severity']
+                          for e in tail.get_entries(0, 10)],
+                         ['LOG', 'ERROR', 'LOG'])
+        self.assertEqual(len(tail.get_entries(2, 10)), 1)
+        self.assertEqual(tail.get_entries(3, 10), [])
+
+    def _rotation(self):
+        tails = ServerLogTails(max_tails=1)
+        tail = tails.get((1, 1, ''), 'log.1', 100, '', 'utf-8')
+        tail.offset = 100
+        self.assertIs(tails.get((1, 1, ''), 'log.1', 120, '', 'utf-8'),
+                      tail)
+        # Rotated to a new file, or truncated
+        self.assertIsNot(tails.get((1, 1, ''), 'log.2', 120, '', 'utf-8'),
+                         tail)
+        tail = tails.get((1, 1, ''), 'log.2', 120, '', 'utf-8')
+        tail.offset = 100
+        self.assertIsNot(tails.get((1, 1, ''), 'log.2', 50, '', 'utf-8'),
+                         tail)
+        # Bounded
+        tails.get((1, 2, ''), 'log', 10, '', 'utf-8')
+        self.assertEqual(list(tails._tails.keys()), [(1, 2, '')])
+
+    def tearDown(self):
+        pass
@@ -19,7 +19,8 @@ from typing import Optional, Union
 
 from pgadmin.llm.client import get_llm_client, is_llm_available
 from pgadmin.llm.models import Message, LLMResponse, StopReason
-from pgadmin.llm.tools import DATABASE_TOOLS, execute_tool, DatabaseToolError
+from pgadmin.llm.tools import DATABASE_TOOLS, execute_tool, \
+    DatabaseToolError, prepare_schema_context
 from pgadmin.llm.utils import get_max_tool_iterations
 
 
@@ -42,6 +43,26 @@ DEFAULT_SYSTEM_PROMPT = (
     "complex queries"
 )
 
+# Appended to the system prompt when a precomputed schema summary is
+# included in the conversation.
+SCHEMA_SUMMARY_PROMPT = (
+    "\n\nDatabase schema summary (collected when this message was sent; "
+    "there is no need to call get_database_schema unless the summary "
+    "is marked as truncated, and get_table_info should only be needed "
+    "for constraint and index details):\n{summary}"
+)
+
+
+def _with_schema_summary(system_prompt: str, sid: int, did: int) -> str:
+    """
+    Append the compact schema summary for the database to a system
+    prompt. The prompt is returned unchanged if no summary is available.
+    """
+    summary = prepare_schema_context(sid, did)
+    if not summary:
+        return system_prompt
+    return system_prompt + SCHEMA_SUMMARY_PROMPT.format(summary=summary)
+
 
 def chat_with_database(
     user_message: str,
@@ -51,7 +72,8 @@ def chat_with_database(
     system_prompt: Optional[str] = None,
     max_tool_iterations: Optional[int] = None,
     provider: Optional[str] = None,
-    model: Optional[str] = None
+    model: Optional[str] = None,
+    include_schema_summary: bool = False
 ) -> tuple[str, list[Message]]:
     """
     Run an LLM chat conversation with database tool access.
@@ -70,6 +92,9 @@ def chat_with_database(
             rounds. Uses preference setting if None.
         provider: Optional LLM provider override
         model: Optional model override
+        include_schema_summary: If True, a compact summary of the
+            database schema is appended to the system prompt, saving
+            the model a number of schema inspection tool calls
 
     Returns:
         Tuple of (final_response_text, updated_conversation_history)
@@ -94,6 +119,9 @@ def chat_with_database(
     if system_prompt is None:
         system_prompt = DEFAULT_SYSTEM_PROMPT
 
+    if include_schema_summary:
+        system_prompt = _with_schema_summary(system_prompt, sid, did)
+
     # Get max iterations from preferences if not specified
     if max_tool_iterations is None:
         max_tool_iterations = get_max_tool_iterations()
@@ -162,14 +190,16 @@ def chat_with_database_stream(
     system_prompt: Optional[str] = None,
     max_tool_iterations: Optional[int] = None,
     provider: Optional[str] = None,
-    model: Optional[str] = None
+    model: Optional[str] = None,
+    include_schema_summary: bool = False
 ) -> Generator[Union[str, tuple], None, None]:
     """
     Stream an LLM chat conversation with database tool access.
 
     Like chat_with_database, but yields text chunks as the final
     response streams in. During tool-use iterations, no text is
-    yielded (tools are executed silently).
+    yielded (tools are executed silently). See chat_with_database for
+    the arguments.
 
     Yields:
         str: Text content chunks from the final LLM response.
@@ -195,6 +225,9 @@ def chat_with_database_stream(
     if system_prompt is None:
         system_prompt = DEFAULT_SYSTEM_PROMPT
 
+    if include_schema_summary:
+        system_prompt = _with_schema_summary(system_prompt, sid, did)
+
     if max_tool_iterations is None:
         max_tool_iterations = get_max_tool_iterations()
 
@@ -0,0 +1,294 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Tests for the LLM schema-context cache."""
+
+from unittest.mock import patch, MagicMock
+
+from pgadmin.browser.utils import NodeView
+from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.llm.tools import database, schema_cache
+from pgadmin.llm.tools.schema_cache import SchemaContextCache, MISS
+
+
+class SchemaContextCacheTestCase(BaseTestGenerator):
+    """Test cases for SchemaContextCache."""
+
+    scenarios = [
+        ('Schema Cache - Miss Without Context', dict(
+            action='miss_without_context'
+        )),
+        ('Schema Cache - Hit With Same Fingerprint', dict(
+            action='hit_same_fingerprint'
+        )),
+        ('Schema Cache - Fingerprint Change Drops Results', dict(
+            action='fingerprint_change'
+        )),
+        ('Schema Cache - Unread Fingerprint Drops Results', dict(
+            action='fingerprint_unread'
+        )),
+        ('Schema Cache - TTL Expiry', dict(
+            action='ttl_expiry'
+        )),
+        ('Schema Cache - Invalidate Database', dict(
+            action='invalidate_database'
+        )),
+        ('Schema Cache - Results Are Copies', dict(
+            action='results_are_copies'
+        )),
+    ]
+
+    key = (1, 1, 16384)
+    other_key = (1, 1, 16385)
+
+    def setUp(self):
+        self.cache = SchemaContextCache()
+
+    def runTest(self):
+        getattr(self, '_' + self.action)()
+
+    def _miss_without_context(self):
+        self.assertTrue(self.cache.needs_check(self.key))
+        # Results are not stored until a fingerprint has been recorded
+        self.cache.store(self.key, ('t',), {'a': 1})
+        self.assertIs(self.cache.lookup(self.key, ('t',)), MISS)
+
+    def _hit_same_fingerprint(self):
+        self.assertFalse(self.cache.validate(self.key, 'fp1'))
+        self.cache.store(self.key, ('t',), {'a': 1})
+        self.assertFalse(self.cache.needs_check(self.key))
+        self.assertTrue(self.cache.validate(self.key, 'fp1'))
+        self.assertEqual(self.cache.lookup(self.key, ('t',)), {'a': 1})
+
+    def _fingerprint_change(self):
+        self.cache.validate(self.key, 'fp1')
+        self.cache.store(self.key, ('t',), {'a': 1})
+        self.cache.set_summary(self.key, 'summary')
+        self.assertFalse(self.cache.validate(self.key, 'fp2'))
+        self.assertIs(self.cache.lookup(self.key, ('t',)), MISS)
+        self.assertIsNone(self.cache.get_summary(self.key))
+
+    def _fingerprint_unread(self):
+        self.cache.validate(self.key, 'fp1')
+        self.cache.store(self.key, ('t',), {'a': 1})
+        self.assertFalse(self.cache.validate(self.key, None))
+        self.assertIs(self.cache.lookup(self.key, ('t',)), MISS)
+        # Nothing is cached until the fingerprint can be read again
+        self.assertFalse(self.cache.validate(self.key, None))
+        self.cache.store(self.key, ('t',), {'a': 1})
+        self.assertIs(self.cache.lookup(self.key, ('t',)), MISS)
+        self.assertTrue(self.cache.needs_check(self.key))
+
+    def _ttl_expiry(self):
+        with patch('pgadmin.llm.tools.schema_cache.time.monotonic',
+                   return_value=1000.0):
+            self.cache.validate(self.key, 'fp1')
+            self.cache.store(self.key, ('t',), {'a': 1})
+
+        with patch('pgadmin.llm.tools.schema_cache.time.monotonic',
+                   return_value=1000.0 + 10000):
+            self.assertIs(self.cache.lookup(self.key, ('t',)), MISS)
+            self.assertTrue(self.cache.needs_check(self.key))
+
+    def _invalidate_database(self):
+        self.cache.validate(self.key, 'fp1')
+        self.cache.validate(self.other_key, 'fp1')
+        self.cache.store(self.key, ('t',), 1)
+        self.cache.store(self.other_key, ('t',), 2)
+
+        self.cache.invalidate(sid=1, did=16384)
+
+        self.assertIs(self.cache.lookup(self.key, ('t',)), MISS)
+        self.assertEqual(self.cache.lookup(self.other_key, ('t',)), 2)
+
+    def _results_are_copies(self):
+        self.cache.validate(self.key, 'fp1')
+        value = {'columns': [{'name': 'id'}]}
+        self.cache.store(self.key, ('t',), value)
+        value['columns'].append({'name': 'changed'})
+
+        cached = self.cache.lookup(self.key, ('t',))
+        self.assertEqual(len(cached['columns']), 1)
+        cached['columns'].clear()
+        self.assertEqual(len(self.cache.lookup(self.key, ('t',))['columns']),
+                         1)
+
+    def tearDown(self):
+        pass
+
+
+class SchemaContextCachedToolTestCase(BaseTestGenerator):
+    """Test cases for the schema context caching of the database tools."""
+
+    scenarios = [
+        ('Cached Tool - Repeated Calls Use Cache', dict(
+            fingerprints=['fp1', 'fp1'],
+            expected_calls=1
+        )),
+        ('Cached Tool - DDL Change Refetches', dict(
+            fingerprints=['fp1', 'fp2'],
+            expected_calls=2
+        )),
+        ('Cached Tool - Unread Fingerprint Refetches', dict(
+            fingerprints=['fp1', None],
+            expected_calls=2
+        )),
+    ]
+
+    def setUp(self):
+        self.cache = SchemaContextCache()
+
+    def runTest(self):
+        calls = []
+
+        def fake_tool(sid, did, schema_name, table_name):
+            calls.append((schema_name, table_name))
+            return {'schema': schema_name, 'table': table_name}
+
+        fingerprints = iter(self.fingerprints)
+
+        def fake_check(sid, did, key):
+            return self.cache.validate(key, next(fingerprints))
+
+        cached_tool = database._schema_context_cached(fake_tool)
+
+        with patch.object(database, 'schema_context_cache', self.cache), \
+                patch.object(database, '_check_schema_context',
+                             side_effect=fake_check):
+            first = cached_tool(1, 16384, 'public', 'orders')
+            # Force a fingerprint check on the second call
+            for ctx in self.cache._contexts.values():
+                ctx.checked_at = -1e9
+            second = cached_tool(1, 16384, 'public', 'orders')
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(calls), self.expected_calls)
+
+    def tearDown(self):
+        pass
+
+
+class _TestNodeView(NodeView):
+    node_type = 'llm_test_node'
+    parent_ids = [
+        {'type': 'int', 'id': 'gid'},
+        {'type': 'int', 'id': 'sid'},
+        {'type': 'int', 'id': 'did'}
+    ]
+    ids = [{'type': 'int', 'id': 'oid'}]
+    operations = dict({
+        'obj': [{'get': 'properties', 'put': 'update'}]
+    })
+
+    def properties(self, **kwargs):
+        return make_json_response()
+
+    def update(self, **kwargs):
+        return make_json_response()
+
+
+class SchemaContextNodeViewTestCase(BaseTestGenerator):
+    """
+    Test cases for the invalidation of the schema context when an object is
+    modified through the browser tree.
+    """
+
+    scenarios = [
+        ('Node View - Update Drops The Database Context', dict(
+            method='PUT', dropped=True
+        )),
+        ('Node View - Read Keeps The Database Context', dict(
+            method='GET', dropped=False
+        )),
+    ]
+
+    key = (1, 1, 16384)
+    other_key = (1, 1, 16385)
+
+    def setUp(self):
+        self.cache = SchemaContextCache()
+
+    def runTest(self):
+        self.cache.validate(self.key, 'fp1')
+        self.cache.validate(self.other_key, 'fp1')
+        self.cache.store(self.key, ('t',), 1)
+        self.cache.store(self.other_key, ('t',), 2)
+
+        with patch.object(schema_cache, 'schema_context_cache', self.cache), \
+                self.app.test_request_context(method=self.method):
+            _TestNodeView(cmd='obj').dispatch_request(gid=1, sid=1,
+                                                      did=16384, oid=1)
+
+        self.assertEqual(self.cache.lookup(self.key, ('t',)) is MISS,
+                         self.dropped)
+        self.assertEqual(self.cache.lookup(self.other_key, ('t',)), 2)
+
+    def tearDown(self):
+        pass
+
+
+class SchemaSummaryTestCase(BaseTestGenerator):
+    """Test cases for the compact schema summary."""
+
+    relations = [
+        {'schema_name': 'public', 'name': 'customers', 'relkind': 'r',
+         'columns': 'id integer PK, name text'},
+        {'schema_name': 'public', 'name': 'orders', 'relkind': 'r',
+         'columns': 'id integer PK, customer_id integer'},
+        {'schema_name': 'public', 'name': 'order_totals', 'relkind': 'v',
+         'columns': 'customer_id integer, total numeric'},
+    ]
+    fkeys = [
+        {'source': 'orders', 'source_columns': 'customer_id',
+         'target': 'customers', 'target_columns': 'id'},
+    ]
+
+    scenarios = [
+        ('Schema Summary - Full Detail', dict(
+            max_chars=8000,
+            expected_in=['public.customers: id integer PK, name text',
+                         'public.order_totals (view)',
+                         'orders(customer_id) -> customers(id)'],
+            expected_not_in=['truncated']
+        )),
+        ('Schema Summary - Names Only', dict(
+            max_chars=200,
+            expected_in=['- public.customers', '- public.orders'],
+            expected_not_in=['name text', 'truncated']
+        )),
+        ('Schema Summary - Truncated', dict(
+            max_chars=150,
+            expected_in=['- public.customers', 'truncated'],
+            expected_not_in=['order_totals']
+        )),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.execute_dict.side_effect = [
+            (True, {'rows': self.relations}),
+            (True, {'rows': self.fkeys}),
+        ]
+
+        with patch.object(database.config, 'LLM_SCHEMA_SUMMARY_MAX_CHARS',
+                          self.max_chars, create=True):
+            summary = database._build_schema_summary(conn)
+
+        self.assertLessEqual(len(summary), self.max_chars)
+        for text in self.expected_in:
+            self.assertIn(text, summary)
+        for text in self.expected_not_in:
+            self.assertNotIn(text, summary)
+
+    def tearDown(self):
+        pass
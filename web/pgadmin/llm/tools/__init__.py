@@ -15,9 +15,11 @@ from pgadmin.llm.tools.database import (
     get_table_columns,
     get_table_info,
     execute_tool,
+    prepare_schema_context,
     DatabaseToolError,
     DATABASE_TOOLS
 )
+from pgadmin.llm.tools.schema_cache import invalidate_schema_context
 
 __all__ = [
     'execute_readonly_query',
@@ -25,6 +27,8 @@ __all__ = [
     'get_table_columns',
     'get_table_info',
     'execute_tool',
+    'prepare_schema_context',
+    'invalidate_schema_context',
     'DatabaseToolError',
     'DATABASE_TOOLS'
 ]
@@ -16,6 +16,7 @@ to prevent any data modification.
 Uses pgAdmin's SQL template infrastructure for version-aware queries.
 """
 
+import functools
 import secrets
 from typing import Optional
 
@@ -25,6 +26,8 @@ from flask import render_template
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.compile_template_name import compile_template_path
 from pgadmin.llm.models import Tool
+from pgadmin.llm.tools.schema_cache import schema_context_cache, \
+    context_key, MISS
 import config
 
 
@@ -457,6 +460,291 @@ def execute_readonly_query(
                 pass
 
 
+# Cheap probe used to detect DDL since a schema context was cached.
+# Any CREATE/ALTER/DROP/COMMENT touches at least one of these catalogs,
+# changing either a row count or the newest row version (xmin).
+CATALOG_FINGERPRINT_SQL = """
+    SELECT pg_catalog.concat_ws(':',
+        (SELECT pg_catalog.count(*) FROM pg_catalog.pg_namespace),
+        (SELECT pg_catalog.max(xmin::text::bigint)
+           FROM pg_catalog.pg_namespace),
+        (SELECT pg_catalog.count(*) FROM pg_catalog.pg_class),
+        (SELECT pg_catalog.max(xmin::text::bigint)
+           FROM pg_catalog.pg_class),
+        (SELECT pg_catalog.max(xmin::text::bigint)
+           FROM pg_catalog.pg_attribute),
+        (SELECT pg_catalog.count(*) FROM pg_catalog.pg_constraint),
+        (SELECT pg_catalog.max(xmin::text::bigint)
+           FROM pg_catalog.pg_constraint),
+        (SELECT pg_catalog.count(*) FROM pg_catalog.pg_description),
+        (SELECT pg_catalog.max(xmin::text::bigint)
+           FROM pg_catalog.pg_description)
+    ) AS fingerprint
+"""
+
+# All user relations with their columns, in a single pass over the
+# catalog, for the compact schema summary.
+SCHEMA_SUMMARY_RELATIONS_SQL = """
+    SELECT n.nspname AS schema_name,
+           c.relname AS name,
+           c.relkind,
+           pg_catalog.string_agg(
+               pg_catalog.quote_ident(a.attname) || ' ' ||
+               pg_catalog.format_type(a.atttypid, a.atttypmod) ||
+               CASE WHEN a.attnum = ANY(pk.conkey) THEN ' PK' ELSE '' END,
+               ', ' ORDER BY a.attnum
+           ) AS columns
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_catalog.pg_constraint pk
+        ON pk.conrelid = c.oid AND pk.contype = 'p'
+    LEFT JOIN pg_catalog.pg_attribute a
+        ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+    WHERE c.relkind IN ('r', 'p', 'v', 'm', 'f')
+      AND NOT c.relispartition
+      AND n.nspname NOT LIKE 'pg\\_%'
+      AND n.nspname <> 'information_schema'
+    GROUP BY n.nspname, c.relname, c.relkind
+    ORDER BY n.nspname, c.relname
+"""
+
+# All foreign keys between user tables, for the compact schema summary.
+SCHEMA_SUMMARY_FKEYS_SQL = """
+    SELECT con.conrelid::pg_catalog.regclass::text AS source,
+           (SELECT pg_catalog.string_agg(
+                       pg_catalog.quote_ident(a.attname), ', '
+                       ORDER BY k.ord)
+              FROM pg_catalog.unnest(con.conkey)
+                   WITH ORDINALITY AS k(attnum, ord)
+              JOIN pg_catalog.pg_attribute a
+                ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+           ) AS source_columns,
+           con.confrelid::pg_catalog.regclass::text AS target,
+           (SELECT pg_catalog.string_agg(
+                       pg_catalog.quote_ident(a.attname), ', '
+                       ORDER BY k.ord)
+              FROM pg_catalog.unnest(con.confkey)
+                   WITH ORDINALITY AS k(attnum, ord)
+              JOIN pg_catalog.pg_attribute a
+                ON a.attrelid = con.confrelid AND a.attnum = k.attnum
+           ) AS target_columns
+    FROM pg_catalog.pg_constraint con
+    JOIN pg_catalog.pg_namespace n ON n.oid = con.connamespace
+    WHERE con.contype = 'f'
+      AND con.conparentid = 0
+      AND n.nspname NOT LIKE 'pg\\_%'
+      AND n.nspname <> 'information_schema'
+    ORDER BY 1, 3
+"""
+
+# Human readable names for the relkinds included in the summary. Plain
+# and partitioned tables are left unlabelled.
+_SUMMARY_RELKIND_LABELS = {
+    'v': 'view',
+    'm': 'materialized view',
+    'f': 'foreign table',
+}
+
+
+def _get_catalog_fingerprint(conn) -> Optional[str]:
+    """
+    Read the catalog fingerprint on an open, read-only connection.
+
+    Returns:
+        The fingerprint string, or None if it could not be read
+    """
+    status, res = conn.execute_dict(CATALOG_FINGERPRINT_SQL)
+    if not status or not res or not res.get('rows'):
+        return None
+    return res['rows'][0].get('fingerprint')
+
+
+def _build_schema_summary(conn) -> str:
+    """
+    Build a compact, plain-text summary of all user tables, views and
+    foreign keys in the database, suitable for inclusion in a system
+    prompt.
+
+    The summary is limited to LLM_SCHEMA_SUMMARY_MAX_CHARS characters.
+    If the full summary (with columns) does not fit, only the relation
+    names are listed; if that still does not fit, the list is truncated
+    and the model is told to use the tools for the rest.
+    """
+    max_chars = getattr(config, 'LLM_SCHEMA_SUMMARY_MAX_CHARS', 8000)
+
+    status, rel_res = conn.execute_dict(SCHEMA_SUMMARY_RELATIONS_SQL)
+    if not status:
+        raise DatabaseToolError(f"Schema summary query failed: {rel_res}",
+                                code="QUERY_ERROR")
+
+    status, fk_res = conn.execute_dict(SCHEMA_SUMMARY_FKEYS_SQL)
+    if not status:
+        raise DatabaseToolError(f"Schema summary query failed: {fk_res}",
+                                code="QUERY_ERROR")
+
+    relations = rel_res.get('rows', []) if rel_res else []
+    fkeys = fk_res.get('rows', []) if fk_res else []
+
+    if not relations:
+        return 'The database contains no user tables or views.'
+
+    def _rel_name(row):
+        label = _SUMMARY_RELKIND_LABELS.get(row.get('relkind'))
+        name = f"{row['schema_name']}.{row['name']}"
+        return f"{name} ({label})" if label else name
+
+    # Full detail: one line per relation with its columns, then the
+    # foreign key graph.
+    lines = ['Relations (columns; PK marks primary key columns):']
+    for row in relations:
+        lines.append(f"- {_rel_name(row)}: {row.get('columns') or ''}")
+    if fkeys:
+        lines.append('Foreign keys:')
+        for row in fkeys:
+            lines.append(
+                f"- {row['source']}({row['source_columns']}) -> "
+                f"{row['target']}({row['target_columns']})"
+            )
+
+    summary = '\n'.join(lines)
+    if len(summary) <= max_chars:
+        return summary
+
+    # Too large: list relation names only, grouped by schema.
+    truncated_note = (
+        '... (truncated; use get_database_schema and get_table_info '
+        'for the remaining objects)'
+    )
+    lines = ['Relations (use get_table_info for columns):']
+    length = len(lines[0])
+    for row in relations:
+        line = f"- {_rel_name(row)}"
+        if length + len(line) + len(truncated_note) + 2 > max_chars:
+            lines.append(truncated_note)
+            break
+        lines.append(line)
+        length += len(line) + 1
+
+    return '\n'.join(lines)
+
+
+def _check_schema_context(sid: int, did: int, key) -> bool:
+    """
+    Re-read the catalog fingerprint and validate the cached context.
+
+    Returns:
+        True if the cached results for key are still valid
+    """
+    conn_id = f"llm_{secrets.choice(range(1, 9999999))}"
+    manager = None
+
+    try:
+        manager, conn = _get_connection(sid, did, conn_id)
+        status, error = _connect_readonly(manager, conn, conn_id)
+        if not status:
+            raise DatabaseToolError(f"Connection failed: {error}",
+                                    code="CONNECTION_ERROR")
+
+        return schema_context_cache.validate(
+            key, _get_catalog_fingerprint(conn)
+        )
+
+    finally:
+        if manager and conn_id:
+            try:
+                manager.release(conn_id=conn_id)
+            except Exception:
+                pass
+
+
+def _schema_context_cached(func):
+    """
+    Decorator that serves a schema inspection tool from the schema
+    context cache.
+
+    The wrapped function must take (sid, did, *args) with hashable
+    positional arguments. The catalog fingerprint is re-checked (which
+    costs one cheap query) only when the cached context is older than
+    LLM_SCHEMA_CACHE_CHECK_INTERVAL seconds.
+    """
+    @functools.wraps(func)
+    def wrapper(sid, did, *args):
+        key = context_key(sid, did)
+        result_key = (func.__name__,) + args
+
+        if schema_context_cache.needs_check(key):
+            _check_schema_context(sid, did, key)
+
+        result = schema_context_cache.lookup(key, result_key)
+        if result is MISS:
+            result = func(sid, did, *args)
+            schema_context_cache.store(key, result_key, result)
+
+        return result
+
+    return wrapper
+
+
+def prepare_schema_context(sid: int, did: int) -> Optional[str]:
+    """
+    Validate the schema context for a database and return its compact
+    schema summary, building it if required.
+
+    This is intended to be called once at the start of a chat turn: it
+    takes a single connection, checks the catalog fingerprint (dropping
+    cached tool results if DDL has been run since they were cached) and
+    reuses the cached summary when the schema is unchanged.
+
+    Args:
+        sid: Server ID
+        did: Database ID
+
+    Returns:
+        The schema summary text, or None if it could not be built
+    """
+    key = context_key(sid, did)
+    conn_id = f"llm_{secrets.choice(range(1, 9999999))}"
+    manager = None
+
+    try:
+        manager, conn = _get_connection(sid, did, conn_id)
+        status, _ = _connect_readonly(manager, conn, conn_id)
+        if not status:
+            return None
+
+        status, _ = conn.execute_void("BEGIN TRANSACTION READ ONLY")
+        if not status:
+            return None
+
+        try:
+            if schema_context_cache.validate(
+                key, _get_catalog_fingerprint(conn)
+            ):
+                summary = schema_context_cache.get_summary(key)
+                if summary is not None:
+                    return summary
+
+            summary = _build_schema_summary(conn)
+            schema_context_cache.set_summary(key, summary)
+            return summary
+
+        finally:
+            conn.execute_void("ROLLBACK")
+
+    except Exception:
+        # The summary is an optimisation; the model can still discover
+        # the schema through the tools.
+        return None
+
+    finally:
+        if manager and conn_id:
+            try:
+                manager.release(conn_id=conn_id)
+            except Exception:
+                pass
+
+
+@_schema_context_cached
 def get_database_schema(sid: int, did: int) -> dict:
     """
     Get the schema information for a database.
@@ -578,6 +866,7 @@ def get_database_schema(sid: int, did: int) -> dict:
                 pass
 
 
+@_schema_context_cached
 def get_table_columns(
     sid: int,
     did: int,
@@ -688,6 +977,7 @@ def get_table_columns(
                 pass
 
 
+@_schema_context_cached
 def get_table_info(
     sid: int,
     did: int,
@@ -0,0 +1,232 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Schema-context cache for the LLM database tools.
+
+The schema inspection tools (get_database_schema, get_table_columns and
+get_table_info) are frequently called several times with the same
+arguments during a single conversation. This module keeps their results
+in memory, per (user, server, database), so repeated calls do not hit
+the catalog again.
+
+Each context remembers a catalog fingerprint taken when it was created.
+Entries expire after LLM_SCHEMA_CACHE_TTL seconds, and the fingerprint
+is re-checked at most every LLM_SCHEMA_CACHE_CHECK_INTERVAL seconds; a
+changed fingerprint (i.e. DDL has been run against the database) drops
+every cached result for that database, as does a fingerprint which could
+not be read. The objects modified through the browser tree are dropped
+straight away (see register_node_change_callback).
+
+This module only holds data. The catalog queries that produce the
+fingerprint and the schema summary live in database.py.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import config
+from pgadmin.browser.utils import register_node_change_callback
+
+
+# Sentinel returned by SchemaContextCache.lookup() on a cache miss, as
+# None is a perfectly valid cached value.
+MISS = object()
+
+# Maximum number of (user, server, database) contexts kept in memory.
+MAX_CONTEXTS = 64
+
+# Maximum number of tool results kept per context.
+MAX_RESULTS_PER_CONTEXT = 256
+
+
+class SchemaContext:
+    """Cached schema information for a single database."""
+
+    def __init__(self, fingerprint: str, now: float):
+        self.fingerprint = fingerprint
+        self.created_at = now
+        self.checked_at = now
+        self.results = OrderedDict()
+        self.summary = None
+
+
+class SchemaContextCache:
+    """
+    Thread-safe, size-bounded cache of SchemaContext objects.
+
+    Contexts are keyed by an opaque hashable key, normally the tuple
+    (user id, server id, database id) built by context_key().
+    """
+
+    def __init__(self, max_contexts: int = MAX_CONTEXTS,
+                 max_results: int = MAX_RESULTS_PER_CONTEXT):
+        self.max_contexts = max_contexts
+        self.max_results = max_results
+        self._lock = threading.Lock()
+        self._contexts = OrderedDict()
+
+    @staticmethod
+    def _ttl() -> float:
+        return getattr(config, 'LLM_SCHEMA_CACHE_TTL', 300)
+
+    @staticmethod
+    def _check_interval() -> float:
+        return getattr(config, 'LLM_SCHEMA_CACHE_CHECK_INTERVAL', 30)
+
+    def _get_live_context(self, key, now: float) -> Optional[SchemaContext]:
+        """Return the context for key, dropping it if it has expired.
+
+        Must be called with the lock held.
+        """
+        ctx = self._contexts.get(key)
+        if ctx is None:
+            return None
+
+        if now - ctx.created_at > self._ttl():
+            del self._contexts[key]
+            return None
+
+        self._contexts.move_to_end(key)
+        return ctx
+
+    def needs_check(self, key) -> bool:
+        """
+        Check whether the catalog fingerprint for key should be re-read
+        before trusting the cached results.
+        """
+        now = time.monotonic()
+        with self._lock:
+            ctx = self._get_live_context(key, now)
+            return ctx is None or \
+                now - ctx.checked_at > self._check_interval()
+
+    def validate(self, key, fingerprint: Optional[str]) -> bool:
+        """
+        Record a freshly read catalog fingerprint for key.
+
+        If the fingerprint differs from the one the context was built
+        with, the context is discarded and a new, empty one is started.
+        If the fingerprint could not be read (None), the context is
+        discarded and none is started, so nothing is cached until it can
+        be read again.
+
+        Returns:
+            True if the existing cached results are still valid, False if
+            they were discarded (or there were none).
+        """
+        now = time.monotonic()
+        with self._lock:
+            if fingerprint is None:
+                self._contexts.pop(key, None)
+                return False
+
+            ctx = self._get_live_context(key, now)
+            if ctx is not None and ctx.fingerprint == fingerprint:
+                ctx.checked_at = now
+                return True
+
+            self._contexts[key] = SchemaContext(fingerprint, now)
+            self._contexts.move_to_end(key)
+            while len(self._contexts) > self.max_contexts:
+                self._contexts.popitem(last=False)
+            return False
+
+    def lookup(self, key, result_key) -> Any:
+        """
+        Return a copy of the cached result for result_key, or MISS.
+        """
+        with self._lock:
+            ctx = self._get_live_context(key, time.monotonic())
+            if ctx is None or result_key not in ctx.results:
+                return MISS
+            ctx.results.move_to_end(result_key)
+            value = ctx.results[result_key]
+
+        return copy.deepcopy(value)
+
+    def store(self, key, result_key, value) -> None:
+        """
+        Cache a tool result. Ignored if there is no live context for key,
+        i.e. the fingerprint has not been read yet.
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            ctx = self._get_live_context(key, time.monotonic())
+            if ctx is None:
+                return
+            ctx.results[result_key] = value
+            ctx.results.move_to_end(result_key)
+            while len(ctx.results) > self.max_results:
+                ctx.results.popitem(last=False)
+
+    def get_summary(self, key) -> Optional[str]:
+        """Return the cached schema summary for key, if any."""
+        with self._lock:
+            ctx = self._get_live_context(key, time.monotonic())
+            return ctx.summary if ctx is not None else None
+
+    def set_summary(self, key, summary: str) -> None:
+        """Cache the schema summary for key."""
+        with self._lock:
+            ctx = self._get_live_context(key, time.monotonic())
+            if ctx is not None:
+                ctx.summary = summary
+
+    def invalidate(self, sid: Optional[int] = None,
+                   did: Optional[int] = None) -> None:
+        """
+        Drop cached contexts.
+
+        Args:
+            sid: Only drop contexts for this server (all if None)
+            did: Only drop contexts for this database (all on the server
+                if None)
+        """
+        with self._lock:
+            if sid is None:
+                self._contexts.clear()
+                return
+
+            for key in list(self._contexts.keys()):
+                _, key_sid, key_did = key
+                if key_sid == sid and (did is None or key_did == did):
+                    del self._contexts[key]
+
+
+schema_context_cache = SchemaContextCache()
+
+
+def context_key(sid: int, did: int) -> tuple:
+    """
+    Build the cache key for a server/database pair.
+
+    The current user is part of the key so that, in server mode, cached
+    catalog information is never shared between users.
+    """
+    try:
+        from flask_login import current_user
+        user_id = getattr(current_user, 'id', None)
+    except Exception:
+        user_id = None
+
+    return (user_id, sid, did)
+
+
+def invalidate_schema_context(sid: Optional[int] = None,
+                              did: Optional[int] = None) -> None:
+    """Drop cached schema information for a server and/or database."""
+    schema_context_cache.invalidate(sid, did)
+
+
+# Nothing is cached before this module is loaded, hence it is registered
+# when it is loaded.
+register_node_change_callback(invalidate_schema_context)
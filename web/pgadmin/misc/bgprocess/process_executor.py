@@ -37,8 +37,9 @@ import subprocess
 import locale
 from datetime import datetime, timedelta, tzinfo, timezone
 from subprocess import Popen, PIPE
-from threading import Thread
+from threading import Thread, Lock, Event
 import signal
+import time
 
 _IS_WIN = (os.name == 'nt')
 _ZERO = timedelta(0)
@@ -48,6 +49,14 @@ _out_dir = None
 _log_file = None
 _subprocess_encoding = None
 
+# The stdout/stderr log files are written in batches. Buffered lines are
+# written once they add up to _LOG_BUFFER_SIZE bytes, and at least every
+# _LOG_FLUSH_INTERVAL seconds so that the output keeps showing up in the
+# UI while the process runs.
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_FLUSH_INTERVAL = 0.5
+_LINESEP = os.linesep.encode('utf-8')
+
 
 def _log(msg):
     with open(_log_file, 'a') as fp:
@@ -144,6 +153,11 @@ class ProcessLogger(Thread):
     This class definition is responsible for capturing & logging
     stdout & stderr messages from subprocess
 
+    Every message is written as a 'timestamp,message' line, which is what
+    BatchProcess.read_log() parses. Lines are buffered in memory and
+    written in batches, see _LOG_BUFFER_SIZE and _LOG_FLUSH_INTERVAL; only
+    complete lines are ever written, so a reader never sees half a line.
+
     Methods:
     --------
     * __init__(stream_type)
@@ -152,27 +166,42 @@ class ProcessLogger(Thread):
     * log(msg)
      - Log message in the orderly manner.
 
+    * flush()
+     - Write the buffered messages to the log file.
+
     * run()
      - Reads the stdout/stderr for messages and sent them to logger
     """
 
-    def __init__(self, stream_type):
+    def __init__(self, stream_type, buffer_size=_LOG_BUFFER_SIZE,
+                 flush_interval=_LOG_FLUSH_INTERVAL):
         """
         This method is use to initialize the ProcessLogger class object
 
         Args:
             stream_type: Type of STD (std)
+            buffer_size: Write the buffered lines once they reach this
+                many bytes (0 writes every line straight away)
+            flush_interval: Write the buffered lines at least this often
+                (in seconds)
 
         Returns:
             None
         """
-        import codecs
-
         Thread.__init__(self)
         self.process = None
         self.stream = None
-        self.logger = open(os.path.join(_out_dir, stream_type), 'wb',
-                           buffering=0)
+        self.logger = open(os.path.join(_out_dir, stream_type), 'wb')
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._buffered = 0
+        self._lock = Lock()
+        self._ts_second = None
+        self._ts_prefix = None
+        self._released = Event()
+        self._flusher = Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
 
     def attach_process_stream(self, process, stream):
         """
@@ -188,12 +217,29 @@ class ProcessLogger(Thread):
         self.process = process
         self.stream = stream
 
+    def _timestamp(self):
+        """
+        Return the current time, formatted as '%y%m%d%H%M%S%f' (UTC).
+
+        Only the microseconds change from one line to the next, so the
+        rest is formatted once per second.
+        """
+        now = time.time()
+        second = int(now)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = datetime.fromtimestamp(
+                second, timezone.utc).strftime('%y%m%d%H%M%S').encode('utf-8')
+
+        return b'%s%06d' % (self._ts_prefix,
+                            min(int((now - second) * 1000000), 999999))
+
     def log(self, msg):
         """
         This function will update log file
 
         Args:
-            msg: message (bytes from subprocess)
+            msg: message (bytes from subprocess, or str)
 
         Returns:
             None
@@ -201,12 +247,8 @@ class ProcessLogger(Thread):
         # Write into log file
         if self.logger:
             if msg:
-                self.logger.write(
-                    get_current_time(
-                        format='%y%m%d%H%M%S%f'
-                    ).encode('utf-8')
-                )
-                self.logger.write(b',')
+                if isinstance(msg, str):
+                    msg = msg.encode('utf-8')
 
                 # Convert subprocess output from system encoding to UTF-8
                 # This fixes garbled text on Windows with non-UTF-8 locales
@@ -222,12 +264,39 @@ class ProcessLogger(Thread):
                         # If decoding fails, write as-is
                         pass
 
-                self.logger.write(msg)
-                self.logger.write(os.linesep.encode('utf-8'))
+                with self._lock:
+                    line = b''.join((self._timestamp(), b',', msg,
+                                     _LINESEP))
+                    self._buffer.append(line)
+                    self._buffered += len(line)
+
+                    if self._buffered >= self.buffer_size:
+                        self._write_buffer()
 
             return True
         return False
 
+    def _write_buffer(self):
+        """
+        Write the buffered lines. Must be called with the lock held.
+        """
+        if self._buffer and self.logger:
+            self.logger.write(b''.join(self._buffer))
+            self.logger.flush()
+        self._buffer = []
+        self._buffered = 0
+
+    def flush(self):
+        """
+        Write the buffered lines to the log file.
+        """
+        with self._lock:
+            self._write_buffer()
+
+    def _flush_periodically(self):
+        while not self._released.wait(self.flush_interval):
+            self.flush()
+
     def run(self):
         if self.process and self.stream:
             while True:
@@ -240,9 +309,12 @@ class ProcessLogger(Thread):
                         break
 
     def release(self):
-        if self.logger:
-            self.logger.close()
-            self.logger = None
+        self._released.set()
+        with self._lock:
+            if self.logger:
+                self._write_buffer()
+                self.logger.close()
+                self.logger = None
 
 
 def update_status(**kw):
@@ -389,13 +461,15 @@ def execute(argv):
     except Exception as e:
         _handle_execute_exception(e, args, process_stderr, exit_code=-1)
     finally:
-        # Update the execution end_time, and exit-code.
-        update_status(**args)
-        _log('Exiting the process executor...')
+        # Write out the buffered output before the exit code is recorded,
+        # as readers treat the logs as complete once it is.
         if process_stderr:
             process_stderr.release()
         if process_stdout:
             process_stdout.release()
+        # Update the execution end_time, and exit-code.
+        update_status(**args)
+        _log('Exiting the process executor...')
         _log('Bye!')
 
 
@@ -24,15 +24,8 @@ from pgacloud.utils.azure_cache import load_persistent_cache, \
     TokenCachePersistenceOptions
 import os
 
-
-from azure.mgmt.rdbms.postgresql_flexibleservers import \
-    PostgreSQLManagementClient
-from azure.identity import AzureCliCredential, DeviceCodeCredential,\
-    AuthenticationRecord
-from azure.mgmt.resource import ResourceManagementClient
-from azure.mgmt.subscription import SubscriptionClient
-from azure.mgmt.rdbms.postgresql_flexibleservers.models import \
-    NameAvailabilityRequest
+# The Azure SDK is slow to import and only needed once a deployment is
+# started, so it is imported where it is used.
 
 MODULE_NAME = 'azure'
 
@@ -367,6 +360,7 @@ class Azure:
 
     def _azure_cli_auth(self):
         if self._cli_credentials is None:
+            from azure.identity import AzureCliCredential
             self._cli_credentials = AzureCliCredential()
             self.list_subscriptions()
         return self._cli_credentials
@@ -380,6 +374,9 @@ class Azure:
         session['azure']['azure_auth_code'] = azure_auth_code
 
     def _azure_interactive_auth(self):
+        from azure.identity import DeviceCodeCredential, \
+            AuthenticationRecord
+
         if self.authentication_record_json is None:
             _interactive_credential = DeviceCodeCredential(
                 tenant_id=self._tenant_id,
@@ -413,12 +410,16 @@ class Azure:
         _, _credentials = self._get_azure_credentials()
 
         if type == 'postgresql':
+            from azure.mgmt.rdbms.postgresql_flexibleservers import \
+                PostgreSQLManagementClient
             client = PostgreSQLManagementClient(_credentials,
                                                 self.subscription_id)
         elif type == 'resource':
+            from azure.mgmt.resource import ResourceManagementClient
             client = ResourceManagementClient(_credentials,
                                               self.subscription_id)
         elif type == 'subscription':
+            from azure.mgmt.subscription import SubscriptionClient
             client = SubscriptionClient(_credentials)
 
         self._clients[type] = client
@@ -429,6 +430,9 @@ class Azure:
         Checks whether given server name is available or not
         :param cluster_name
         """
+        from azure.mgmt.rdbms.postgresql_flexibleservers.models import \
+            NameAvailabilityRequest
+
         postgresql_client = self._get_azure_client('postgresql')
         res = postgresql_client.check_name_availability.execute(
             NameAvailabilityRequest(
@@ -25,8 +25,9 @@ from pgadmin.user_login_check import pga_login_required
 from flask import session, current_app, request
 from flask_babel import gettext as _
 
-from oauthlib.oauth2 import AccessDeniedError
-
+# The Google API client libraries are slow to import and only needed once a
+# deployment is started, so they are imported where they are used.
+#
 # pgAdmin only authenticates to Google via google-auth and
 # google-auth-oauthlib, never the long-deprecated oauth2client.
 # googleapiclient still tries to import oauth2client optionally, and on
@@ -38,11 +39,6 @@ from oauthlib.oauth2 import AccessDeniedError
 # fall back to google-auth cleanly. See issue #10110.
 sys.modules.setdefault('oauth2client', None)
 
-from googleapiclient import discovery
-from googleapiclient.errors import HttpError
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-
 MODULE_NAME = 'google'
 os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'  # Required for Oauth2
 
@@ -467,6 +463,8 @@ class Google:
         self._verification_successful = False
         self._verification_error = None
         try:
+            from google_auth_oauthlib.flow import InstalledAppFlow
+
             self._redirect_url = host_url + 'google/callback'
             flow = InstalledAppFlow.from_client_config(
                 client_config=self._client_config, scopes=self._scopes,
@@ -486,6 +484,9 @@ class Google:
         :param flask_request:
         :return: Success or error message
         """
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from oauthlib.oauth2 import AccessDeniedError
+
         try:
             authorization_response = flask_request.url
             if session['state'] != flask_request.args.get('state', None):
@@ -532,6 +533,7 @@ class Google:
             if self._credentials and self._credentials.expired and \
                     self._credentials.refresh_token and \
                     self._credentials.has_scopes(scopes):
+                from google.auth.transport.requests import Request
                 self._credentials.refresh(Request())
                 return self._credentials
         return self._credentials
@@ -543,6 +545,9 @@ class Google:
         """
         projects = []
         error = None
+        from googleapiclient import discovery
+        from googleapiclient.errors import HttpError
+
         credentials = self._get_credentials(self._scopes)
         service = discovery.build('cloudresourcemanager',
                                   self._cloud_resource_manager_api_version,
@@ -566,6 +571,9 @@ class Google:
         :return:
         """
         self._project_id = project
+        from googleapiclient import discovery
+        from googleapiclient.errors import HttpError
+
         credentials = self._get_credentials(self._scopes)
         service = discovery.build('compute',
                                   self._compute_api_version,
@@ -611,6 +619,9 @@ class Google:
         high_mem = []
         instance_types = {}
         error = None
+        from googleapiclient import discovery
+        from googleapiclient.errors import HttpError
+
         credentials = self._get_credentials(self._scopes)
         service = discovery.build('sqladmin',
                                   self._sqladmin_api_version,
@@ -659,6 +670,9 @@ class Google:
         pg_database_versions = []
         database_versions = []
         error = None
+        from googleapiclient import discovery
+        from googleapiclient.errors import HttpError
+
         credentials = self._get_credentials(self._scopes)
         service = discovery.build('sqladmin',
                                   self._sqladmin_api_version,
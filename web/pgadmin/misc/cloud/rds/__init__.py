@@ -10,9 +10,7 @@
 # AWS RDS Cloud Deployment Implementation
 
 import requests
-import boto3
 import json
-from boto3.session import Session
 from flask_babel import gettext
 from flask import session, current_app, request
 from pgadmin.user_login_check import pga_login_required
@@ -151,6 +149,8 @@ def get_db_versions():
 def get_regions():
     """GET Regions for AWS."""
     try:
+        from boto3.session import Session
+
         clear_aws_session()
         _session = Session()
         res = _session.get_available_regions('rds')
@@ -192,6 +192,9 @@ class RDS():
         if type in self._clients:
             return self._clients[type]
 
+        # boto3 is slow to import, and only needed here.
+        import boto3
+
         session = boto3.Session(
             aws_access_key_id=self._access_key,
             aws_secret_access_key=self._secret_key,
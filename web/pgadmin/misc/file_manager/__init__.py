@@ -37,6 +37,7 @@ from pgadmin.utils.constants import PREF_LABEL_OPTIONS, MIMETYPE_APP_JS, \
 from pgadmin.settings.utils import get_file_type_setting
 from pgadmin.tools.user_management.PgAdminPermissions import AllPermissionTypes
 from config import SHARED_STORAGE
+from .listing import listing_cache, get_page
 
 # Checks if platform is Windows
 if _platform == "win32":
@@ -100,17 +101,6 @@ def getdrivesize(path):
         return free_bytes.value
 
 
-# split extension for files
-def splitext(path):
-    for ext in ['.tar.gz', '.tar.bz2']:
-        if path.endswith(ext):
-            path, ext = path[:-len(ext)], path[-len(ext):]
-            break
-    else:
-        path, ext = os.path.splitext(path)
-    return ext[1:]
-
-
 # check if file is hidden in windows platform
 def is_folder_hidden(filepath):
     if _platform == "win32":
@@ -788,7 +778,8 @@ class Filemanager():
     @staticmethod
     def get_files_in_path(
         show_hidden_files, files_only, folders_only, supported_types,
-            file_type, user_dir, orig_path):
+            file_type, user_dir, orig_path, search=None, sort_by='name',
+            sort_order='asc', cursor=None, limit=None):
         """
         Get list of files and dirs in the path
         :param show_hidden_files: boolean
@@ -798,60 +789,64 @@ class Filemanager():
         :param file_type: file type
         :param user_dir: base user dir
         :param orig_path: path after user dir
-        :return:
+        :param search: only list names containing this, case-insensitive
+        :param sort_by: name, modified, created, size or type
+        :param sort_order: asc or desc
+        :param cursor: cursor of the page to return, None for the first one
+        :param limit: maximum number of files to return, None for all
+        :return: (files, cursor of the next page, total number of files)
         """
-        files = []
-
-        for f in sorted(os.listdir(orig_path)):
-            system_path = os.path.join(os.path.join(orig_path, f))
+        entries = []
+        search = search.lower() if search else None
 
+        for entry in listing_cache.get(orig_path):
             # continue if file/folder is hidden (based on user preference)
-            if not show_hidden_files and is_folder_hidden(system_path):
+            if not show_hidden_files and entry.hidden:
                 continue
-            try:
-                user_path = os.path.join(os.path.join(user_dir, f))
-                created = time.ctime(os.path.getctime(system_path))
-                modified = time.ctime(os.path.getmtime(system_path))
-                file_extension = str(splitext(system_path))
-            except Exception:
+            if search and search not in entry.name.lower():
                 continue
 
-            # set protected to 1 if no write or read permission
-            protected = 0
-            if (not os.access(system_path, os.R_OK) or
-                    not os.access(system_path, os.W_OK)):
-                protected = 1
-
             # list files only or folders only
-            if os.path.isdir(system_path):
+            if entry.is_dir:
                 if files_only == 'true':
                     continue
-                file_extension = "dir"
             # filter files based on file_type
             elif Filemanager._skip_file_extension(
-                    file_type, supported_types, folders_only, file_extension):
+                    file_type, supported_types, folders_only,
+                    entry.extension):
                 continue
 
-            # create a list of files and folders
-            files.append({
-                "Filename": f,
-                "Path": user_path,
-                "file_type": file_extension,
-                "Protected": protected,
-                "Properties": {
-                    "Date Created": created,
-                    "Date Modified": modified,
-                    "Size": sizeof_fmt(getsize(system_path))
-                }
-            })
+            entries.append(entry)
+
+        page, next_cursor = get_page(entries, sort_by, sort_order, cursor,
+                                     limit)
+
+        # create a list of files and folders
+        files = [{
+            "Filename": entry.name,
+            "Path": os.path.join(user_dir, entry.name),
+            "file_type": entry.extension,
+            "Protected": entry.protected,
+            "Properties": {
+                "Date Created": time.ctime(entry.created),
+                "Date Modified": time.ctime(entry.modified),
+                "Size": sizeof_fmt(entry.size)
+            }
+        } for entry in page]
 
-        return files
+        return files, next_cursor, len(entries)
 
     @staticmethod
-    def list_filesystem(in_dir, path, trans_data, file_type, show_hidden):
+    def list_filesystem(in_dir, path, trans_data, file_type, show_hidden,
+                        **page_args):
         """
         It lists all file and folders within the given
         directory.
+
+        If a limit is given in page_args, only one page of the listing is
+        returned, as a dict with the files, the cursor of the next page
+        and the total number of files; see get_files_in_path for the
+        paging, sorting and filtering arguments.
         """
         Filemanager.suspend_windows_warning()
         is_show_hidden_files = show_hidden
@@ -879,6 +874,9 @@ class Filemanager():
                     }
                 })
             Filemanager.resume_windows_warning()
+            if page_args.get('limit') is not None:
+                return {'files': files, 'next_cursor': None,
+                        'total': len(files)}
             return files
 
         orig_path = Filemanager.get_abs_path(in_dir, path)
@@ -896,10 +894,14 @@ class Filemanager():
 
         orig_path = unquote(orig_path)
         try:
-            files = Filemanager.get_files_in_path(
+            files, next_cursor, total = Filemanager.get_files_in_path(
                 is_show_hidden_files, files_only, folders_only,
-                supported_types, file_type, user_dir, orig_path
+                supported_types, file_type, user_dir, orig_path,
+                **page_args
             )
+        except ValueError as e:
+            Filemanager.resume_windows_warning()
+            return bad_request(errormsg=str(e))
         except Exception as e:
             Filemanager.resume_windows_warning()
             err_msg = str(e)
@@ -908,6 +910,9 @@ class Filemanager():
                 err_msg = str(e.strerror)
             return unauthorized(err_msg)
         Filemanager.resume_windows_warning()
+        if page_args.get('limit') is not None:
+            return {'files': files, 'next_cursor': next_cursor,
+                    'total': total}
         return files
 
     @staticmethod
@@ -983,9 +988,12 @@ class Filemanager():
         return False if capability not in trans_data['capabilities'] \
             else Filemanager.check_capability_permission(capability)
 
-    def getfolder(self, path=None, file_type="", show_hidden=False):
+    def getfolder(self, path=None, file_type="", show_hidden=False,
+                  search=None, sort_by='name', sort_order='asc',
+                  cursor=None, limit=None):
         """
-        Returns files and folders in give path
+        Returns files and folders in give path, or one page of them if a
+        limit is given
         """
         trans_data = Filemanager.get_trasaction_selection(self.trans_id)
         the_dir = None
@@ -998,8 +1006,18 @@ class Filemanager():
             if the_dir is not None and not the_dir.endswith('/'):
                 the_dir += '/'
 
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                return bad_request(errormsg=gettext("Invalid limit."))
+            if limit < 1:
+                return bad_request(errormsg=gettext("Invalid limit."))
+
         filelist = self.list_filesystem(
-            the_dir, path, trans_data, file_type, show_hidden)
+            the_dir, path, trans_data, file_type, show_hidden,
+            search=search, sort_by=sort_by, sort_order=sort_order,
+            cursor=cursor, limit=limit)
         return filelist
 
     def check_access(self, ss):
@@ -1052,6 +1070,8 @@ class Filemanager():
         except OSError as e:
             return internal_server_error("{0} {1}".format(
                 gettext('There was an error renaming the file:'), e.strerror))
+        finally:
+            listing_cache.invalidate_parent(oldpath_sys)
 
         return {
             'Old Path': old,
@@ -1082,6 +1102,8 @@ class Filemanager():
         except OSError as e:
             return internal_server_error("{0} {1}".format(
                 gettext('There was an error deleting the file:'), e.strerror))
+        finally:
+            listing_cache.invalidate_parent(orig_path)
 
         return make_json_response(status=200)
 
@@ -1124,6 +1146,7 @@ class Filemanager():
                     if not data:
                         break
                     f.write(data)
+            listing_cache.invalidate_parent(new_name)
         except OSError as e:
             return internal_server_error("{0} {1}".format(
                 gettext('There was an error adding the file:'), e.strerror))
@@ -1275,6 +1298,7 @@ class Filemanager():
             os.mkdir(create_path)
         except OSError as e:
             return internal_server_error(str(e.strerror))
+        listing_cache.invalidate_parent(create_path)
 
         result = {
             'Parent': path,
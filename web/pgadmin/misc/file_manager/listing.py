@@ -0,0 +1,246 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Directory listing for the file manager.
+
+A directory is read with os.scandir() and every entry is stat'ed once;
+whether an entry is a folder, hidden or protected, and its dates and size
+are all derived from that one stat result. The raw listing is cached for a
+few seconds per directory, and dropped as soon as the modification time of
+the directory changes (i.e. an entry has been added, removed or renamed),
+so that paging, sorting and filtering a large directory does not read it
+again for every request.
+"""
+
+import base64
+import json
+import os
+import stat
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple
+from sys import platform as _platform
+
+from flask_babel import gettext
+
+# Number of seconds a listing is reused for, as long as the directory has
+# not been modified.
+LISTING_CACHE_TTL = 5
+
+# Maximum number of directory listings kept in memory.
+MAX_CACHED_LISTINGS = 32
+
+SORT_KEYS = {
+    'name': lambda e: e.name,
+    'modified': lambda e: e.modified,
+    'created': lambda e: e.created,
+    'size': lambda e: e.size,
+    'type': lambda e: e.extension,
+}
+
+ListingEntry = namedtuple('ListingEntry', [
+    'name', 'extension', 'is_dir', 'hidden', 'protected', 'created',
+    'modified', 'size'
+])
+
+
+# split extension for files
+def splitext(path):
+    for ext in ['.tar.gz', '.tar.bz2']:
+        if path.endswith(ext):
+            return ext[1:]
+    return os.path.splitext(path)[1][1:]
+
+
+def _access_checker():
+    """
+    Return a function telling from a stat result whether the current user
+    can not both read and write the file, as os.access() would, without
+    calling it for every file. ACLs are not taken into account.
+    """
+    if _platform == 'win32':
+        # Only the read-only attribute is checked by os.access() on Windows
+        return lambda st: not st.st_mode & stat.S_IWRITE
+
+    uid = os.geteuid()
+    if uid == 0:
+        return lambda st: False
+
+    groups = set(os.getgroups())
+    groups.add(os.getegid())
+
+    def _is_protected(st):
+        if st.st_uid == uid:
+            bits = stat.S_IRUSR | stat.S_IWUSR
+        elif st.st_gid in groups:
+            bits = stat.S_IRGRP | stat.S_IWGRP
+        else:
+            bits = stat.S_IROTH | stat.S_IWOTH
+        return st.st_mode & bits != bits
+
+    return _is_protected
+
+
+def _is_hidden(name, st):
+    if _platform == 'win32':
+        return bool(getattr(st, 'st_file_attributes', 0) &
+                    stat.FILE_ATTRIBUTE_HIDDEN)
+    return name.startswith('.')
+
+
+def scan_directory(path):
+    """
+    Read the entries of a directory, stat'ing each of them once. Entries
+    which can not be stat'ed (e.g. dangling symbolic links) are skipped.
+
+    Returns:
+        List of ListingEntry, in no particular order
+    """
+    is_protected = _access_checker()
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                # Follows symbolic links, as os.path.getmtime() etc. did
+                st = entry.stat()
+            except OSError:
+                continue
+
+            is_dir = stat.S_ISDIR(st.st_mode)
+            entries.append(ListingEntry(
+                name=entry.name,
+                extension='dir' if is_dir else str(splitext(entry.name)),
+                is_dir=is_dir,
+                hidden=_is_hidden(entry.name, st),
+                protected=1 if is_protected(st) else 0,
+                created=st.st_ctime,
+                modified=st.st_mtime,
+                size=st.st_size
+            ))
+    return entries
+
+
+class DirectoryListingCache:
+    """
+    Short-lived cache of directory listings, see the module documentation.
+    """
+
+    def __init__(self, ttl=LISTING_CACHE_TTL,
+                 max_listings=MAX_CACHED_LISTINGS):
+        self.ttl = ttl
+        self.max_listings = max_listings
+        self._lock = threading.Lock()
+        self._listings = OrderedDict()
+
+    def get(self, path):
+        """
+        Return the listing of path, reading the directory only if there is
+        no recent enough listing of it.
+        """
+        path = os.path.normpath(path)
+        mtime = os.stat(path).st_mtime_ns
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._listings.get(path)
+            if cached is not None and cached[0] == mtime and \
+                    now - cached[1] < self.ttl:
+                self._listings.move_to_end(path)
+                return cached[2]
+
+        entries = scan_directory(path)
+
+        with self._lock:
+            self._listings[path] = (mtime, now, entries)
+            self._listings.move_to_end(path)
+            while len(self._listings) > self.max_listings:
+                self._listings.popitem(last=False)
+
+        return entries
+
+    def invalidate(self, path):
+        """Forget the listing of path, e.g. after changing its content."""
+        with self._lock:
+            self._listings.pop(os.path.normpath(path), None)
+
+    def invalidate_parent(self, path):
+        """Forget the listing of the directory containing path."""
+        self.invalidate(os.path.dirname(os.path.normpath(path)))
+
+    def clear(self):
+        with self._lock:
+            self._listings.clear()
+
+
+listing_cache = DirectoryListingCache()
+
+
+def encode_cursor(entry, sort_by):
+    """Return the opaque cursor of the page following the given entry."""
+    return base64.urlsafe_b64encode(json.dumps(
+        [sort_by, SORT_KEYS[sort_by](entry), entry.name]
+    ).encode()).decode()
+
+
+def decode_cursor(cursor, sort_by):
+    """
+    Return the sort key of the last entry of the previous page.
+
+    Raises:
+        ValueError if the cursor is not valid for the sort order
+    """
+    try:
+        cur_sort_by, value, name = json.loads(
+            base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError(gettext('Invalid cursor.'))
+
+    if cur_sort_by != sort_by:
+        raise ValueError(gettext('Invalid cursor.'))
+    return value, name
+
+
+def get_page(entries, sort_by='name', sort_order='asc', cursor=None,
+             limit=None):
+    """
+    Sort the entries and return the page following cursor. The cursor
+    refers to the position of an entry in the sort order rather than to an
+    index, so the pages stay consistent while entries come and go.
+
+    Returns:
+        (list of entries, cursor of the next page or None)
+
+    Raises:
+        ValueError if sort_by, sort_order or the cursor is not valid
+    """
+    if sort_by not in SORT_KEYS or sort_order not in ('asc', 'desc'):
+        raise ValueError(gettext('Invalid sort order.'))
+
+    sort_key = SORT_KEYS[sort_by]
+    entries = sorted(entries, key=lambda e: (sort_key(e), e.name))
+    keys = [(sort_key(e), e.name) for e in entries]
+
+    if sort_order == 'asc':
+        start = 0
+        if cursor:
+            start = bisect_right(keys, decode_cursor(cursor, sort_by))
+        end = len(entries) if limit is None else start + limit
+        page = entries[start:end]
+        more = end < len(entries)
+    else:
+        end = len(entries)
+        if cursor:
+            end = bisect_left(keys, decode_cursor(cursor, sort_by))
+        start = 0 if limit is None else max(0, end - limit)
+        page = entries[start:end][::-1]
+        more = start > 0
+
+    return page, (encode_cursor(page[-1], sort_by) if more and page
+                  else None)
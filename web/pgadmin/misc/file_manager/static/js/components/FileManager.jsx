@@ -34,7 +34,7 @@ import convert from 'convert-units';
 import PropTypes from 'prop-types';
 import DownloadUtils from '../../../../../static/js/DownloadUtils';
 import ErrorBoundary from '../../../../../static/js/helpers/ErrorBoundary';
-import { MY_STORAGE } from './FileManagerConstants';
+import { FOLDER_PAGE_SIZE, MY_STORAGE } from './FileManagerConstants';
 import _ from 'lodash';
 
 const StyledBox = styled(Box)(({theme}) => ({
@@ -224,7 +224,7 @@ export class FileManagerUtils {
     return filename.split('.').pop();
   }
 
-  async getFolder(path, sharedFolder=null) {
+  async getFolder(path, sharedFolder=null, cursor=null) {
     const newPath = path || this.fileRoot;
     let res = await this.api.post(this.fileConnectorUrl, {
       'path': newPath,
@@ -232,6 +232,8 @@ export class FileManagerUtils {
       'file_type': this.config.options.last_selected_format || '*',
       'show_hidden': this.showHiddenFiles,
       'storage_folder': sharedFolder,
+      'cursor': cursor,
+      'limit': FOLDER_PAGE_SIZE,
     });
     this.currPath = newPath;
     return res.data.data.result;
@@ -490,6 +492,7 @@ export default function FileManager({params, closeModal, onOK, onCancel, sharedS
   const [sortColumns, setSortColumns] = useState([]);
   const [selectedRow, setSelectedRow] = useState();
   const selectedRowIdx = useRef();
+  const openDirId = useRef(0);
   const optionsRef = React.useRef(null);
   const saveAsRef = React.useRef(null);
   const sharedSRef = React.useRef(null);
@@ -528,10 +531,20 @@ export default function FileManager({params, closeModal, onOK, onCancel, sharedS
       if(fmUtilsObj.isWinDrive(dirPath)) {
         dirPath += fmUtilsObj.separator;
       }
-      let newItems = await fmUtilsObj.getFolder(dirPath || fmUtilsObj.currPath, changeStoragePath);
-      setItems(newItems);
+      const openId = ++openDirId.current;
+      let page = await fmUtilsObj.getFolder(dirPath || fmUtilsObj.currPath, changeStoragePath);
+      setItems(page.files);
       setPath(fmUtilsObj.currPath);
       setTimeout(()=>{fmUtilsObj.setLastVisitedDir(dirPath || fmUtilsObj.currPath, changeStoragePath);}, 100);
+      setLoaderText('');
+      // Show the first page right away, and add the others as they come
+      // unless another folder has been opened meanwhile.
+      while(page.next_cursor && openId == openDirId.current) {
+        page = await fmUtilsObj.getFolder(fmUtilsObj.currPath, changeStoragePath, page.next_cursor);
+        if(openId == openDirId.current) {
+          setItems((prev)=>[...prev, ...page.files]);
+        }
+      }
     } catch (error) {
       console.error(error);
       setErrorMsg(parseApiError(error));
@@ -10,4 +10,7 @@ export const FILE_MANGER_EVENTS = {
   ADD_FOLDER: 'ADD_FOLDER'
 };
 
-export const MY_STORAGE = 'my_storage';
\ No newline at end of file
+export const MY_STORAGE = 'my_storage';
+
+// Number of files fetched per request when listing a folder
+export const FOLDER_PAGE_SIZE = 1000;
@@ -0,0 +1,182 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pgadmin.misc.file_manager import Filemanager, listing
+from pgadmin.misc.file_manager.listing import DirectoryListingCache, \
+    get_page
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class _FileListingMixin:
+    """Mixin (NOT a TestCase) creating a directory to list."""
+
+    def setUp(self):
+        # Filesystem-only unit tests, no server connection needed.
+        unittest.TestCase.setUp(self)
+        self.dir = tempfile.mkdtemp(prefix="pga_filemgr_listing_")
+        for i in range(10):
+            with open(os.path.join(self.dir, 'f{0}.sql'.format(i)),
+                      'w') as f:
+                f.write('x' * (i * 7 % 10))
+        with open(os.path.join(self.dir, 'notes.txt'), 'w') as f:
+            f.write('notes')
+        with open(os.path.join(self.dir, '.hidden.sql'), 'w') as f:
+            f.write('hidden')
+        os.mkdir(os.path.join(self.dir, 'backups'))
+        listing.listing_cache.clear()
+
+    def tearDown(self):
+        listing.listing_cache.clear()
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def list_files(self, **kwargs):
+        args = dict(show_hidden_files=False, files_only=False,
+                    folders_only=False, supported_types=['sql'],
+                    file_type='sql', user_dir='/', orig_path=self.dir)
+        args.update(kwargs)
+        return Filemanager.get_files_in_path(**args)
+
+
+class FileListingPaginationTestCase(_FileListingMixin, BaseTestGenerator):
+    """Test cases for the paginated, sorted directory listing."""
+
+    scenarios = [
+        ('File listing - By name', dict(
+            sort_by='name', sort_order='asc', limit=3
+        )),
+        ('File listing - By size, descending', dict(
+            sort_by='size', sort_order='desc', limit=4
+        )),
+        ('File listing - By modification time', dict(
+            sort_by='modified', sort_order='asc', limit=1
+        )),
+    ]
+
+    def runTest(self):
+        everything, next_cursor, total = self.list_files(
+            sort_by=self.sort_by, sort_order=self.sort_order)
+        self.assertIsNone(next_cursor)
+        # Hidden files and other file types are not listed, folders are
+        self.assertEqual(total, 11)
+        self.assertEqual(len(everything), 11)
+        self.assertIn('backups', [f['Filename'] for f in everything])
+
+        pages = []
+        cursor = None
+        while True:
+            files, cursor, total = self.list_files(
+                sort_by=self.sort_by, sort_order=self.sort_order,
+                cursor=cursor, limit=self.limit)
+            self.assertLessEqual(len(files), self.limit)
+            self.assertEqual(total, 11)
+            pages.extend(files)
+            if cursor is None:
+                break
+
+        self.assertEqual([f['Filename'] for f in pages],
+                         [f['Filename'] for f in everything])
+
+        if self.sort_by == 'name':
+            self.assertEqual([f['Filename'] for f in pages],
+                             sorted(f['Filename'] for f in pages))
+
+    def tearDown(self):
+        _FileListingMixin.tearDown(self)
+
+
+class FileListingCursorTestCase(_FileListingMixin, BaseTestGenerator):
+    """Test cases for the listing cursor and filters."""
+
+    scenarios = [
+        ('File listing - Cursor survives new files', dict(
+            action='new_files'
+        )),
+        ('File listing - Search', dict(
+            action='search'
+        )),
+        ('File listing - Invalid cursor', dict(
+            action='invalid_cursor'
+        )),
+    ]
+
+    def runTest(self):
+        getattr(self, '_' + self.action)()
+
+    def _new_files(self):
+        files, cursor, _ = self.list_files(limit=5)
+        self.assertEqual(files[-1]['Filename'], 'f3.sql')
+
+        # Entries added before the cursor do not shift the next page
+        with open(os.path.join(self.dir, 'a.sql'), 'w') as f:
+            f.write('a')
+        files, cursor, total = self.list_files(limit=5, cursor=cursor)
+        self.assertEqual(total, 12)
+        self.assertEqual(files[0]['Filename'], 'f4.sql')
+
+    def _search(self):
+        files, _, total = self.list_files(search='F1')
+        self.assertEqual([f['Filename'] for f in files], ['f1.sql'])
+        self.assertEqual(total, 1)
+
+        files, _, _ = self.list_files(search='note', file_type='*')
+        self.assertEqual([f['Filename'] for f in files], ['notes.txt'])
+
+    def _invalid_cursor(self):
+        _, cursor, _ = self.list_files(limit=5)
+        with self.assertRaises(ValueError):
+            self.list_files(limit=5, cursor='garbage')
+        # A cursor is only valid for the sort order it was created with
+        with self.assertRaises(ValueError):
+            self.list_files(limit=5, cursor=cursor, sort_by='size')
+        with self.assertRaises(ValueError):
+            get_page([], sort_by='owner')
+
+    def tearDown(self):
+        _FileListingMixin.tearDown(self)
+
+
+class DirectoryListingCacheTestCase(_FileListingMixin, BaseTestGenerator):
+    """Test cases for the directory listing cache."""
+
+    scenarios = [
+        ('Directory listing cache', dict()),
+    ]
+
+    def runTest(self):
+        cache = DirectoryListingCache(ttl=60)
+        with patch.object(listing, 'scan_directory',
+                          wraps=listing.scan_directory) as scan:
+            entries = cache.get(self.dir)
+            self.assertIs(cache.get(self.dir + '/'), entries)
+            self.assertEqual(scan.call_count, 1)
+
+            # Permissions come from the stat result of the entries
+            with patch.object(os, 'access') as access:
+                cache.invalidate(self.dir)
+                cache.get(self.dir)
+            access.assert_not_called()
+
+            # A change in the directory is seen at once
+            os.utime(self.dir, ns=(0, 0))
+            self.assertEqual(len(cache.get(self.dir)), len(entries))
+            self.assertEqual(scan.call_count, 3)
+
+            # Expired
+            cache.ttl = 0
+            cache.get(self.dir)
+            self.assertEqual(scan.call_count, 4)
+
+    def tearDown(self):
+        _FileListingMixin.tearDown(self)
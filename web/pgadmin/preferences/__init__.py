@@ -24,7 +24,8 @@ from pgadmin.utils.ajax import success_return, \
     make_response as ajax_response, internal_server_error
 from pgadmin.utils.ajax import make_json_response
 from pgadmin.utils.preferences import Preferences
-from pgadmin.utils.constants import MIMETYPE_APP_JS
+from pgadmin.utils.constants import MIMETYPE_APP_JS, \
+    REVALIDATE_CACHE_CONTROL
 from pgadmin.browser.server_groups import ServerGroupModule as sgm
 
 MODULE_NAME = 'preferences'
@@ -178,11 +179,21 @@ def preferences_s():
                     p['module'] = m['name']
                     res.append(p)
 
-    return ajax_response(
+    response = ajax_response(
         response=res,
         status=200
     )
 
+    # The preferences are fetched on every page load, and by every tool
+    # opened in a new tab. Let the browser keep them, and revalidate its
+    # copy with the ETag, so that they are only sent again when changed.
+    response.headers['Cache-Control'] = REVALIDATE_CACHE_CONTROL
+    response.headers.pop('Pragma', None)
+    response.headers.pop('Expires', None)
+    response.add_etag()
+
+    return response.make_conditional(request)
+
 
 @blueprint.route("/get_all_cli", methods=["GET"], endpoint='get_all_cli')
 @pga_login_required
@@ -0,0 +1,92 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import json
+
+from sqlalchemy import event
+from werkzeug.datastructures import Headers
+
+from pgadmin.model import db
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils import test_utils as utils
+
+CURRENT_PATH = os.path.dirname(os.path.realpath(__file__))
+with open(CURRENT_PATH + "/preferences_test_data.json") as data_file:
+    test_cases = json.load(data_file)
+
+PREF_MODULE = 'sqleditor'
+PREF_NAME = 'view_edit_promotion_warning'
+
+
+class GetAllPreferencesTest(BaseTestGenerator):
+    """
+    This class will fetch all Preferences for caching, checking that the
+    values of the user are fetched in a single query, and that the
+    response can be revalidated with its ETag.
+    """
+
+    scenarios = utils.generate_scenarios('get_all_preferences', test_cases)
+
+    def setUp(self):
+        self.original_value = self._get_value(self.get_all()[0])
+
+    def get_all(self, etag=None):
+        statements = []
+
+        def _count(conn, cursor, statement, *args):
+            if 'user_preferences' in statement:
+                statements.append(statement)
+
+        headers = Headers({'If-None-Match': etag} if etag else {})
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', _count)
+        try:
+            response = self.tester.get(self.url, headers=headers)
+        finally:
+            event.remove(engine, 'before_cursor_execute', _count)
+        return response, statements
+
+    def set_value(self, value):
+        response = self.tester.put(
+            '/preferences/update',
+            data=json.dumps({'pref_data': json.dumps([{
+                'name': PREF_NAME, 'value': value, 'module': PREF_MODULE
+            }])}),
+            content_type='html/json')
+        self.assertEqual(response.status_code, 200)
+
+    def _get_value(self, response):
+        return next(p['value'] for p in json.loads(response.data)
+                    if p['module'] == PREF_MODULE and p['name'] == PREF_NAME)
+
+    def runTest(self):
+        response, statements = self.get_all()
+        self.assertEqual(response.status_code,
+                         self.expected_data['status_code'])
+        self.assertEqual(len(statements), 1)
+        etag = response.headers.get('ETag')
+        self.assertIsNotNone(etag)
+        self.assertNotIn('no-store', response.headers['Cache-Control'])
+
+        # Nothing changed
+        response, _ = self.get_all(etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+        # The preferences changed
+        self.set_value(not self.original_value)
+        response, _ = self.get_all(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers.get('ETag'), etag)
+        self.assertEqual(self._get_value(response), not self.original_value)
+
+    def tearDown(self):
+        self.set_value(self.original_value)
@@ -17,6 +17,9 @@ import gettext from 'sources/gettext';
 import { unix } from 'path-fx';
 import getApiInstance, { parseApiError } from '../api_instance';
 
+// The servers of a group are fetched this many at a time
+const SERVER_GROUP_PAGE_SIZE = 500;
+
 export class ManageTreeNodes {
   constructor() {
     this.tree = {};
@@ -76,6 +79,23 @@ export class ManageTreeNodes {
     res(treeNode);
   });
 
+  /* Fetch the servers of a group a page at a time, so that each request
+   * stays short for the groups with a large number of servers. */
+  public readServerGroupPages = async (api, url: string) => {
+    let treeData = [];
+    let total = null;
+    while (total === null || treeData.length < total) {
+      const res = await api.get(url, {timeout: 30000, params: {
+        offset: treeData.length, limit: SERVER_GROUP_PAGE_SIZE,
+      }});
+      const page = res.data.data ?? [];
+      treeData = treeData.concat(page);
+      total = res.data.result?.total ?? treeData.length;
+      if (page.length == 0) break;
+    }
+    return treeData;
+  };
+
   public readNode = async (_path: string) => {
     let temp_tree_path = _path;
     const node = this.findNode(_path);
@@ -121,8 +141,12 @@ export class ManageTreeNodes {
     let treeData = [];
     if (url) {
       try {
-        const res = await api.get(url, {timeout: 30000});
-        treeData = res.data.data;
+        if (node?.metadata?.data?._type == 'server_group') {
+          treeData = await self.readServerGroupPages(api, url);
+        } else {
+          const res = await api.get(url, {timeout: 30000});
+          treeData = res.data.data;
+        }
       } catch (error) {
         /* react-aspen does not handle reject case */
         console.error(error);
@@ -13,6 +13,9 @@ import json
 import secrets
 import re
 import copy
+import select
+import threading
+import time
 
 from flask import render_template, request, current_app
 from flask_babel import gettext
@@ -39,8 +42,11 @@ from pgadmin.tools.user_management.PgAdminPermissions \
     import AllPermissionTypes
 from pgadmin.utils.server_access import get_server
 from pgadmin.preferences import preferences
+from pgadmin.authenticate import socket_permissions_required
+from ... import socketio
 
 MODULE_NAME = 'debugger'
+SOCKETIO_NAMESPACE = '/{0}'.format(MODULE_NAME)
 
 # Constants
 PLDBG_EXTN = 'pldbgapi'
@@ -51,6 +57,18 @@ DEBUGGER_SQL_V1_PATH = 'debugger/sql/v1'
 DEBUGGER_SQL_V3_PATH = 'debugger/sql/v3'
 SET_SEARCH_PATH = "SET search_path={0};"
 
+# How long a socket.io request waits for the debugger to have something to
+# report before answering with the busy status: briefly while stepping,
+# much longer while waiting for the target to be invoked or to finish.
+SOCKET_ACTIVE_WAIT = 0.25
+SOCKET_IDLE_WAIT = 30
+# Upper bound on a single wait for activity on the target connection.
+SOCKET_RECHECK_INTERVAL = 0.5
+
+# Socket.io requests waiting for a result, keyed by socket id. Setting the
+# event stops the wait when the client goes away.
+socket_waits = {}
+
 
 class DebuggerModule(PgAdminModule):
     """
@@ -1325,38 +1343,44 @@ def messages(trans_id):
             }
         )
 
-    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
-        de_inst.debugger_data['server_id'])
-    conn = manager.connection(
-        did=de_inst.debugger_data['database_id'],
-        conn_id=de_inst.debugger_data['conn_id'])
+    conn = get_debugger_connection(de_inst, 'conn_id')
+    response = fetch_messages(de_inst, conn)
+    if response is None:
+        return internal_server_error(errormsg=str(SERVER_CONNECTION_CLOSED))
 
-    port_number = ''
+    return make_json_response(**response)
 
-    if conn.connected():
-        status = 'Busy'
-        notify = conn.messages()
-        if notify:
-            # In notice message we need to find "PLDBGBREAK" string to find
-            # the port number to attach.
-            # Notice message returned by the server is
-            # "NOTICE:  PLDBGBREAK:7".
-            # From the above message we need to find out port number
-            # as "7" so below logic will find 7 as port number
-            # and attach listened to that port number
-            tmp_list = [x for x in notify if 'PLDBGBREAK' in x]
-            if len(tmp_list) > 0:
-                port_number = re.search(r'\d+', tmp_list[0])
-                if port_number is not None:
-                    status = 'Success'
-                    port_number = port_number.group(0)
 
-        return make_json_response(
-            data={'status': status, 'result': port_number}
-        )
-    else:
-        result = SERVER_CONNECTION_CLOSED
-        return internal_server_error(errormsg=str(result))
+def fetch_messages(de_inst, conn):
+    """
+    Look for the port number to attach to in the notices received on the
+    debugger connection.
+
+    Returns the arguments for make_json_response(), or None if the
+    connection has been closed.
+    """
+    if not conn.connected():
+        return None
+
+    status = 'Busy'
+    port_number = ''
+    notify = conn.messages()
+    if notify:
+        # In notice message we need to find "PLDBGBREAK" string to find
+        # the port number to attach.
+        # Notice message returned by the server is
+        # "NOTICE:  PLDBGBREAK:7".
+        # From the above message we need to find out port number
+        # as "7" so below logic will find 7 as port number
+        # and attach listened to that port number
+        tmp_list = [x for x in notify if 'PLDBGBREAK' in x]
+        if len(tmp_list) > 0:
+            port_number = re.search(r'\d+', tmp_list[0])
+            if port_number is not None:
+                status = 'Success'
+                port_number = port_number.group(0)
+
+    return dict(data={'status': status, 'result': port_number})
 
 
 @blueprint.route(
@@ -2102,11 +2126,11 @@ def check_result(result, conn, statusmsg):
     :param result:
     :param conn:
     :param statusmsg:
-    :return:
+    :return: the arguments for make_json_response()
     """
     if 'ERROR' in result:
         status = 'ERROR'
-        return make_json_response(
+        return dict(
             info=gettext("Execution completed with an error."),
             data={
                 'status': status,
@@ -2119,7 +2143,7 @@ def check_result(result, conn, statusmsg):
 
         columns, result = convert_data_to_dict(conn, result)
 
-        return make_json_response(
+        return dict(
             success=1,
             info=gettext("Execution Completed."),
             data={
@@ -2130,6 +2154,18 @@ def check_result(result, conn, statusmsg):
         )
 
 
+def get_debugger_connection(de_inst, conn_id_key):
+    """
+    Get the debugger connection stored under conn_id_key ('conn_id' or
+    'exe_conn_id') in the debugger data.
+    """
+    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
+        de_inst.debugger_data['server_id'])
+    return manager.connection(
+        did=de_inst.debugger_data['database_id'],
+        conn_id=de_inst.debugger_data[conn_id_key])
+
+
 @blueprint.route(
     '/poll_end_execution_result/<int:trans_id>/',
     methods=["GET"], endpoint='poll_end_execution_result'
@@ -2155,17 +2191,21 @@ def poll_end_execution_result(trans_id):
                   }
         )
 
-    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
-        de_inst.debugger_data['server_id'])
-    conn = manager.connection(
-        did=de_inst.debugger_data['database_id'],
-        conn_id=de_inst.debugger_data['conn_id'])
+    conn = get_debugger_connection(de_inst, 'conn_id')
+    return make_json_response(**fetch_end_execution_result(de_inst, conn))
+
+
+def fetch_end_execution_result(de_inst, conn):
+    """
+    Check whether the debugged function has finished executing.
 
+    Returns the arguments for make_json_response().
+    """
     if conn.connected():
         status, result, statusmsg = poll_data(conn)
         if not status:
             status = 'ERROR'
-            return make_json_response(
+            return dict(
                 info=gettext("Execution completed with an error."),
                 data={
                     'status': status,
@@ -2180,7 +2220,7 @@ def poll_end_execution_result(trans_id):
             status = 'Success'
             _, statusmsg = get_additional_msgs(conn, statusmsg)
 
-            return make_json_response(
+            return dict(
                 success=1,
                 info=gettext("Execution Completed."),
                 data={
@@ -2193,7 +2233,7 @@ def poll_end_execution_result(trans_id):
         else:
             status = 'Busy'
             _, statusmsg = get_additional_msgs(conn, statusmsg)
-            return make_json_response(
+            return dict(
                 data={
                     'status': status,
                     'result': result,
@@ -2204,7 +2244,7 @@ def poll_end_execution_result(trans_id):
         status = 'NotConnected'
         result = SERVER_CONNECTION_CLOSED
 
-    return make_json_response(data={'status': status, 'result': result})
+    return dict(data={'status': status, 'result': result})
 
 
 @blueprint.route(
@@ -2232,12 +2272,17 @@ def poll_result(trans_id):
             }
         )
 
-    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
-        de_inst.debugger_data['server_id'])
-    conn = manager.connection(
-        did=de_inst.debugger_data['database_id'],
-        conn_id=de_inst.debugger_data['exe_conn_id'])
+    conn = get_debugger_connection(de_inst, 'exe_conn_id')
+    return make_json_response(**fetch_poll_result(de_inst, conn))
+
 
+def fetch_poll_result(de_inst, conn):
+    """
+    Fetch the result of the last query run on the executer connection,
+    i.e. the current frame after a step or continue.
+
+    Returns the arguments for make_json_response().
+    """
     if conn.connected():
         status, result = conn.poll()
         if not status:
@@ -2251,7 +2296,7 @@ def poll_result(trans_id):
         status = 'NotConnected'
         result = SERVER_CONNECTION_CLOSED
 
-    return make_json_response(
+    return dict(
         data={
             'status': status,
             'result': result
@@ -2310,3 +2355,146 @@ def close_debugger_session(_trans_id, close_all=False):
         except Exception:
             de_inst.clear()
             raise
+
+
+@socketio.on('connect', namespace=SOCKETIO_NAMESPACE)
+def connect():
+    """
+    Connect to the server through socket.
+    """
+    socketio.emit('connected', {'sid': request.sid},
+                  namespace=SOCKETIO_NAMESPACE,
+                  to=request.sid)
+
+
+@socketio.on('disconnect', namespace=SOCKETIO_NAMESPACE)
+def disconnect():
+    """
+    Stop any wait in progress when the client goes away.
+    """
+    cancelled = socket_waits.pop(request.sid, None)
+    if cancelled is not None:
+        cancelled.set()
+
+
+@socketio.on('poll_result', namespace=SOCKETIO_NAMESPACE)
+@socket_permissions_required(AllPermissionTypes.tools_debugger)
+def socket_poll_result(params):
+    """
+    Socket.io counterpart of poll_result(), see emit_when_ready().
+    """
+    emit_when_ready('poll_result', params, 'exe_conn_id', fetch_poll_result)
+
+
+@socketio.on('poll_end_execution_result', namespace=SOCKETIO_NAMESPACE)
+@socket_permissions_required(AllPermissionTypes.tools_debugger)
+def socket_poll_end_execution_result(params):
+    """
+    Socket.io counterpart of poll_end_execution_result(), see
+    emit_when_ready().
+    """
+    emit_when_ready('poll_end_execution_result', params, 'conn_id',
+                    fetch_end_execution_result)
+
+
+@socketio.on('messages', namespace=SOCKETIO_NAMESPACE)
+@socket_permissions_required(AllPermissionTypes.tools_debugger)
+def socket_messages(params):
+    """
+    Socket.io counterpart of messages(), see emit_when_ready().
+    """
+    emit_when_ready('messages', params, 'conn_id', fetch_messages)
+
+
+def emit_when_ready(event, params, conn_id_key, fetch):
+    """
+    Answer a socket.io request for one of the polling endpoints.
+
+    Instead of answering 'Busy' straight away and having the client ask
+    again, the request is held until the debugger has something to report
+    (a result, an error or new notices), waiting on the target connection's
+    socket in between checks. If nothing happens within SOCKET_ACTIVE_WAIT
+    seconds, or SOCKET_IDLE_WAIT if params['wait'] is set, the busy status
+    is sent after all.
+
+    The response is sent as <event>_success in the same form as the HTTP
+    endpoint's, along with the request_id given in params, or as
+    <event>_failed.
+    """
+    sid = request.sid
+    request_id = params.get('request_id')
+    cancelled = socket_waits.setdefault(sid, threading.Event())
+
+    try:
+        de_inst = DebuggerInstance(params['trans_id'])
+        if de_inst.debugger_data is None:
+            response = dict(data={
+                'status': 'NotConnected',
+                'result': SERVER_CONNECTION_CLOSED
+            })
+        else:
+            conn = get_debugger_connection(de_inst, conn_id_key)
+            deadline = time.monotonic() + (
+                SOCKET_IDLE_WAIT if params.get('wait') else SOCKET_ACTIVE_WAIT)
+
+            while True:
+                response = fetch(de_inst, conn)
+                remaining = deadline - time.monotonic()
+                if response is None or not _is_busy(response) or \
+                        remaining <= 0 or cancelled.is_set():
+                    break
+                _wait_for_connection(conn, cancelled,
+                                     min(remaining, SOCKET_RECHECK_INTERVAL))
+
+        if response is None:
+            _emit_failed(event, request_id, str(SERVER_CONNECTION_CLOSED))
+            return
+
+        socketio.emit(event + '_success', {
+            'request_id': request_id,
+            'response': make_json_response(**response).json
+        }, namespace=SOCKETIO_NAMESPACE, to=sid)
+    except Exception as e:
+        current_app.logger.exception(e)
+        _emit_failed(event, request_id, str(e))
+
+
+def _emit_failed(event, request_id, error):
+    socketio.emit(event + '_failed', {
+        'request_id': request_id,
+        'error': error
+    }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+
+def _is_busy(response):
+    """
+    Check if a response has nothing to report yet: busy (or a finished query
+    without any rows, which the client simply asks again for), and no new
+    notices to show in the meantime.
+    """
+    data = response.get('data') or {}
+    if data.get('status_message'):
+        return False
+    return data.get('status') == 'Busy' or \
+        (data.get('status') == 'Success' and data.get('result') == [])
+
+
+def _wait_for_connection(conn, cancelled, timeout):
+    """
+    Wait until the server sends something on the connection (a notice, a
+    result or an error), the timeout expires or the wait is cancelled.
+
+    The data itself is read by the request that started the query, so this
+    only tells us when it is worth checking again.
+    """
+    try:
+        readable, _, _ = select.select([conn.conn.fileno()], [], [],
+                                       timeout)
+    except Exception:
+        # Not connected any more; the next check will report it.
+        cancelled.wait(timeout)
+        return
+
+    if readable:
+        # Give the request running the query a moment to read the data.
+        cancelled.wait(0.01)
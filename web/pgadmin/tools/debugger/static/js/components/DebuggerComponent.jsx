@@ -18,6 +18,7 @@ import Loader from 'sources/components/Loader';
 import Layout, { LayoutDocker } from '../../../../../static/js/helpers/Layout';
 import EventBus from '../../../../../static/js/helpers/EventBus';
 import getApiInstance, { callFetch } from '../../../../../static/js/api_instance';
+import { openSocket } from '../../../../../static/js/socket_instance';
 
 import { PANELS, DEBUGGER_EVENTS, MENUS } from '../DebuggerConstants';
 import { retrieveNodeName } from '../../../../sqleditor/static/js/show_view_data';
@@ -45,6 +46,8 @@ export default function DebuggerComponent({ pgAdmin, selectedNodeInfo, panelId,
   const [loaderText, setLoaderText] = React.useState('');
   const editor = useRef(null);
   const preferencesStore = usePreferences();
+  const debuggerSocket = useRef(null);
+  const socketRequestId = useRef(0);
   let timeOut = null;
 
   const [preferences, setPreferences] = useState({
@@ -82,6 +85,60 @@ export default function DebuggerComponent({ pgAdmin, selectedNodeInfo, panelId,
     return httpStatus.data.data.status === 'Busy';
   };
 
+  const socketGet = (endpoint, data) => {
+    return new Promise((resolve, reject) => {
+      const socket = debuggerSocket.current;
+      const requestId = ++socketRequestId.current;
+      const cleanup = () => {
+        socket.off(`${endpoint}_success`, onSuccess);
+        socket.off(`${endpoint}_failed`, onFailed);
+        socket.off('disconnect', onDisconnect);
+      };
+      const onSuccess = (res) => {
+        if (res.request_id !== requestId) return;
+        cleanup();
+        resolve(res.response);
+      };
+      const onFailed = (res) => {
+        if (res.request_id !== requestId) return;
+        cleanup();
+        reject(new Error(res.error));
+      };
+      const onDisconnect = () => {
+        cleanup();
+        reject(new Error(gettext('Connection to pgAdmin server has been lost')));
+      };
+
+      socket.on(`${endpoint}_success`, onSuccess);
+      socket.on(`${endpoint}_failed`, onFailed);
+      socket.on('disconnect', onDisconnect);
+      socket.emit(endpoint, { ...data, request_id: requestId });
+    });
+  };
+
+  /* Get the response of one of the polling endpoints. Over the socket, the
+    server answers as soon as the debugger has something to report, waiting
+    up to the idle timeout if wait is set. Without the socket (or if it
+    fails), fall back to polling the HTTP endpoint after the given delay.
+  */
+  const fetchDebuggerStatus = (endpoint, transId, wait, delay) => {
+    if (debuggerSocket.current?.connected) {
+      return socketGet(endpoint, { trans_id: transId, wait: wait })
+        .then((res) => ({ data: res }))
+        .catch(() => {
+          debuggerSocket.current = null;
+          return fetchDebuggerStatus(endpoint, transId, wait, delay);
+        });
+    }
+
+    return new Promise((resolve) => {
+      timeOut = setTimeout(resolve, delay);
+    }).then(() => api({
+      url: url_for(`debugger.${endpoint}`, { 'trans_id': transId }),
+      method: 'GET',
+    }));
+  };
+
   // Function to set breakpoints in the editor given a list of line numbers
   const applyBreakpointsToEditor = (breakpoints) => {
     if (!editor.current) return;
@@ -206,15 +263,8 @@ export default function DebuggerComponent({ pgAdmin, selectedNodeInfo, panelId,
   };
 
   const messages = (transId) => {
-    // Make ajax call to listen the database message
-    let baseUrl = url_for('debugger.messages', {
-      'trans_id': transId,
-    });
-
-    api({
-      url: baseUrl,
-      method: 'GET',
-    })
+    // Listen for the database message
+    fetchDebuggerStatus('messages', transId, true, 0)
       .then(function (res) {
         if (isSuccess(res)) {
           enableToolbarButtons();
@@ -335,33 +385,46 @@ export default function DebuggerComponent({ pgAdmin, selectedNodeInfo, panelId,
   };
 
   useEffect(() => {
-    let baseUrl = '';
-    if (params.transId != undefined && !params.directDebugger.debug_type) {
-      // Make ajax call to execute the and start the target for execution
-      baseUrl = url_for('debugger.start_listener', {
-        'trans_id': params.transId,
-      });
+    const startListener = () => {
+      let baseUrl = '';
+      if (params.transId != undefined && !params.directDebugger.debug_type) {
+        // Make ajax call to execute the and start the target for execution
+        baseUrl = url_for('debugger.start_listener', {
+          'trans_id': params.transId,
+        });
 
-      api({
-        url: baseUrl,
-        method: 'POST',
-      })
-        .catch(raiseJSONError);
-      enableToolbarButtons();
-      pollResult(params.transId);
-    } else if (params.transId != undefined) {
-      // Make api call to execute the and start the target for execution
-      baseUrl = url_for('debugger.start_listener', {
-        'trans_id': params.transId,
-      });
+        api({
+          url: baseUrl,
+          method: 'POST',
+        })
+          .catch(raiseJSONError);
+        enableToolbarButtons();
+        pollResult(params.transId);
+      } else if (params.transId != undefined) {
+        // Make api call to execute the and start the target for execution
+        baseUrl = url_for('debugger.start_listener', {
+          'trans_id': params.transId,
+        });
 
-      api({
-        url: baseUrl,
-        method: 'POST',
+        api({
+          url: baseUrl,
+          method: 'POST',
+        })
+          .catch(raiseJSONError);
+        messages(params.transId);
+      }
+    };
+
+    /* Results are pushed over the socket when it can be opened, otherwise
+    they are polled for. Either way, start listening once that is known. */
+    openSocket('/debugger')
+      .then((socket) => {
+        debuggerSocket.current = socket;
       })
-        .catch(raiseJSONError);
-      messages(params.transId);
-    }
+      .catch(() => {
+        debuggerSocket.current = null;
+      })
+      .finally(startListener);
 
     const closeConn = ()=>{
       /* Using fetch with keepalive as the browser may
@@ -382,6 +445,7 @@ export default function DebuggerComponent({ pgAdmin, selectedNodeInfo, panelId,
 
     return ()=>{
       window.removeEventListener('unload', closeConn);
+      debuggerSocket.current?.disconnect();
     };
   }, []);
 
@@ -620,11 +684,7 @@ export default function DebuggerComponent({ pgAdmin, selectedNodeInfo, panelId,
       return;
     }
 
-    // Make ajax call to listen the database message
-    let baseUrl = url_for('debugger.poll_end_execution_result', {
-        'trans_id': transId,
-      }),
-      poll_end_timeout;
+    let poll_end_timeout;
 
     /*
       * During the execution we should poll the result in minimum seconds
@@ -641,58 +701,53 @@ export default function DebuggerComponent({ pgAdmin, selectedNodeInfo, panelId,
       poll_end_timeout = 250;
     }
 
-    timeOut = setTimeout(
-      function () {
-        api({
-          url: baseUrl,
-          method: 'GET',
-        })
-          .then(function (res) {
-            if (isSuccess(res)) {
-              if (res.data.data.result == undefined) {
-                /*
-                "result" is undefined only in case of EDB procedure.
-                As Once the EDB procedure execution is completed then we are
-                not getting any result so we need to ignore the result.
-                */
-                editor.current.setActiveLine(-1);
-                params.directDebugger.direct_execution_completed = true;
-                params.directDebugger.polling_timeout_idle = true;
-
-                //Set the message to inform the user that execution is completed.
-                pgAdmin.Browser.notifier.success(res.data.info, 3000);
-
-                // Update the message tab of the debugger
-                updateMessages(res.data.data.status_message);
-
-                // Execution completed so disable the buttons other than
-                // "Continue/Start" button because user can still
-                // start the same execution again.
-                disableToolbarButtons();
-                enableToolbarButtons(MENUS.START);
-
-                // Stop further polling
-                params.directDebugger.is_polling_required = false;
-              } else {
-                updateResultAndMessages(res);
-              }
-            } else if (isBusy(res)) {
-              // If status is Busy then poll the result by recursive call to
-              // the poll function
-              pollEndExecutionResult(transId);
-              // Update the message tab of the debugger
-              updateMessages(res.data.data.status_message);
-            } else if (res.data.status === 'NotConnected') {
-              pgAdmin.Browser.notifier.alertText(
-                gettext('Debugger poll end execution error'),
-                res.data.result
-              );
-            } else if (res.data.data.status === 'ERROR') {
-              pollEndExecuteError(res);
-            }
-          })
-          .catch(raisePollingError);
-      }, poll_end_timeout);
+    fetchDebuggerStatus('poll_end_execution_result', transId,
+      params.directDebugger.polling_timeout_idle, poll_end_timeout)
+      .then(function (res) {
+        if (isSuccess(res)) {
+          if (res.data.data.result == undefined) {
+            /*
+            "result" is undefined only in case of EDB procedure.
+            As Once the EDB procedure execution is completed then we are
+            not getting any result so we need to ignore the result.
+            */
+            editor.current.setActiveLine(-1);
+            params.directDebugger.direct_execution_completed = true;
+            params.directDebugger.polling_timeout_idle = true;
+
+            //Set the message to inform the user that execution is completed.
+            pgAdmin.Browser.notifier.success(res.data.info, 3000);
+
+            // Update the message tab of the debugger
+            updateMessages(res.data.data.status_message);
+
+            // Execution completed so disable the buttons other than
+            // "Continue/Start" button because user can still
+            // start the same execution again.
+            disableToolbarButtons();
+            enableToolbarButtons(MENUS.START);
+
+            // Stop further polling
+            params.directDebugger.is_polling_required = false;
+          } else {
+            updateResultAndMessages(res);
+          }
+        } else if (isBusy(res)) {
+          // If status is Busy then poll the result by recursive call to
+          // the poll function
+          pollEndExecutionResult(transId);
+          // Update the message tab of the debugger
+          updateMessages(res.data.data.status_message);
+        } else if (res.data.status === 'NotConnected') {
+          pgAdmin.Browser.notifier.alertText(
+            gettext('Debugger poll end execution error'),
+            res.data.result
+          );
+        } else if (res.data.data.status === 'ERROR') {
+          pollEndExecuteError(res);
+        }
+      })
+      .catch(raisePollingError);
 
   };
 
@@ -928,11 +983,7 @@ export default function DebuggerComponent({ pgAdmin, selectedNodeInfo, panelId,
       return;
     }
 
-    // Make ajax call to listen the database message
-    let baseUrl = url_for('debugger.poll_result', {
-        'trans_id': transId,
-      }),
-      poll_timeout;
+    let poll_timeout;
 
     /*
           During the execution we should poll the result in minimum seconds but
@@ -947,37 +998,27 @@ export default function DebuggerComponent({ pgAdmin, selectedNodeInfo, panelId,
       poll_timeout = 200;
     }
 
-    setTimeout(
-      function () {
-        api({
-          url: baseUrl,
-          method: 'GET',
-          beforeSend: function (xhr) {
-            xhr.setRequestHeader(
-              pgAdmin.csrf_token_header, pgAdmin.csrf_token
-            );
-          },
-        })
-          .then(function (res) {
-            if (isSuccess(res)) {
-              // If no result then poll again to wait for results.
-              if (res.data.data.result == null || res.data.data.result.length == 0) {
-                pollResult(transId);
-              } else {
-                updateInfo(res, transId);
-              }
-            } else if (isBusy(res)) {
-              params.directDebugger.polling_timeout_idle = true;
-              checkDebuggerStatus(transId);
-            } else if (res.data.data.status === 'NotConnected') {
-              pgAdmin.Browser.notifier.alert(
-                gettext('Debugger Error: poll_result'),
-                gettext('Error while polling result.')
-              );
-            }
-          })
-          .catch(raisePollingError);
-      }, poll_timeout);
+    fetchDebuggerStatus('poll_result', transId,
+      params.directDebugger.polling_timeout_idle, poll_timeout)
+      .then(function (res) {
+        if (isSuccess(res)) {
+          // If no result then poll again to wait for results.
+          if (res.data.data.result == null || res.data.data.result.length == 0) {
+            pollResult(transId);
+          } else {
+            updateInfo(res, transId);
+          }
+        } else if (isBusy(res)) {
+          params.directDebugger.polling_timeout_idle = true;
+          checkDebuggerStatus(transId);
+        } else if (res.data.data.status === 'NotConnected') {
+          pgAdmin.Browser.notifier.alert(
+            gettext('Debugger Error: poll_result'),
+            gettext('Error while polling result.')
+          );
+        }
+      })
+      .catch(raisePollingError);
 
   };
 
@@ -0,0 +1,100 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch, MagicMock
+
+from pgadmin.utils.route import BaseSocketTestGenerator
+from pgadmin.utils.constants import SERVER_CONNECTION_CLOSED
+from ... import debugger
+
+BUSY = dict(data={'status': 'Busy', 'result': None})
+RESULT = dict(data={'status': 'Success', 'result': [{'linenumber': 3}]})
+NOTICE = dict(data={'status': 'Busy', 'result': None,
+                    'status_message': 'NOTICE:  step'})
+
+
+class DebuggerSocket(BaseSocketTestGenerator):
+    """ This class tests the socket.io channel of the debugger."""
+    SOCKET_NAMESPACE = '/debugger'
+
+    scenarios = [
+        ('Poll result of an unknown transaction', dict(
+            event='poll_result',
+            debugger_data=None,
+            fetched=[],
+            expected_event='poll_result_success',
+            expected_data={'status': 'NotConnected',
+                           'result': SERVER_CONNECTION_CLOSED},
+            expected_fetches=0,
+        )),
+        ('Poll result waits while busy', dict(
+            event='poll_result',
+            debugger_data={},
+            fetched=[BUSY, BUSY, RESULT],
+            expected_event='poll_result_success',
+            expected_data=RESULT['data'],
+            expected_fetches=3,
+        )),
+        ('Poll end execution result sends notices', dict(
+            event='poll_end_execution_result',
+            debugger_data={},
+            fetched=[BUSY, NOTICE, BUSY],
+            expected_event='poll_end_execution_result_success',
+            expected_data=NOTICE['data'],
+            expected_fetches=2,
+        )),
+        ('Messages on a closed connection', dict(
+            event='messages',
+            debugger_data={},
+            fetched=[None],
+            expected_event='messages_failed',
+            expected_data=None,
+            expected_fetches=1,
+        )),
+    ]
+
+    fetch_functions = {
+        'poll_result': 'fetch_poll_result',
+        'poll_end_execution_result': 'fetch_end_execution_result',
+        'messages': 'fetch_messages',
+    }
+
+    def runTest(self):
+        received = self.socket_client.get_received(self.SOCKET_NAMESPACE)
+        self.assertEqual(received[0]['name'], 'connected')
+
+        de_inst = MagicMock(debugger_data=self.debugger_data)
+        conn = MagicMock()
+        # No socket to wait on, the handler falls back to sleeping.
+        conn.conn.fileno.side_effect = AttributeError
+
+        with patch.object(debugger, 'DebuggerInstance',
+                          return_value=de_inst), \
+                patch.object(debugger, 'get_debugger_connection',
+                             return_value=conn), \
+                patch.object(debugger, self.fetch_functions[self.event],
+                             side_effect=self.fetched) as fetch, \
+                patch.object(debugger, 'SOCKET_RECHECK_INTERVAL', 0.01):
+            self.socket_client.emit(
+                self.event, {'trans_id': 1, 'request_id': 7, 'wait': True},
+                namespace=self.SOCKET_NAMESPACE)
+
+        received = self.socket_client.get_received(self.SOCKET_NAMESPACE)
+        self.assertEqual(len(received), 1, received)
+        self.assertEqual(received[0]['name'], self.expected_event)
+        # Nothing more is fetched once there is something to report
+        self.assertEqual(fetch.call_count, self.expected_fetches)
+
+        response = received[0]['args'][0]
+        self.assertEqual(response['request_id'], 7)
+        if self.expected_data is None:
+            self.assertEqual(response['error'], SERVER_CONNECTION_CLOSED)
+        else:
+            self.assertEqual(response['response']['data'],
+                             self.expected_data)
@@ -9,6 +9,8 @@
 
 """A blueprint module implementing the erd tool."""
 import json
+import threading
+from collections import deque
 
 from flask import request, Response, session
 from flask import render_template, current_app as app
@@ -40,6 +42,10 @@ from ... import socketio
 MODULE_NAME = 'erd'
 SOCKETIO_NAMESPACE = '/{0}'.format(MODULE_NAME)
 
+# Table loads in progress in chunked mode, keyed by socket id. Setting the
+# event stops the load before the next chunk.
+table_loads = {}
+
 
 class ERDModule(PgAdminModule):
     """
@@ -781,18 +787,29 @@ def connect():
 @socketio.on('tables', namespace=SOCKETIO_NAMESPACE)
 @socket_permissions_required(AllPermissionTypes.tools_erd_tool)
 def tables(params):
+    """
+    Load the tables to generate the ERD for.
+
+    By default all the tables are sent at once with tables_success. If
+    chunk_size is given, the tables are loaded and sent in batches of that
+    many tables as tables_chunk events, each carrying the number of tables
+    loaded so far and the total, so that the whole set never has to be
+    held in memory and the client can render as they arrive. The load can
+    be stopped between batches with tables_cancel.
+    """
     try:
         helper = ERDHelper(params['trans_id'], params['sid'], params['did'])
         _get_connection(params['sid'], params['did'], params['trans_id'])
 
+        if params.get('chunk_size'):
+            _emit_tables_in_chunks(helper, params)
+            return
+
         status, tables = helper.get_all_tables(params.get('scid', None),
                                                params.get('tid', None))
 
         if not status:
-            tables = tables.json if isinstance(tables, Response) else tables
-            socketio.emit('tables_failed', tables,
-                          namespace=SOCKETIO_NAMESPACE,
-                          to=request.sid)
+            _emit_tables_failed(tables)
             return
         socketio.emit('tables_success', tables, namespace=SOCKETIO_NAMESPACE,
                       to=request.sid)
@@ -801,6 +818,90 @@ def tables(params):
                       to=request.sid)
 
 
+def _emit_tables_failed(error):
+    error = error.json if isinstance(error, Response) else error
+    socketio.emit('tables_failed', error, namespace=SOCKETIO_NAMESPACE,
+                  to=request.sid)
+
+
+def _emit_tables_in_chunks(helper, params):
+    """
+    Send the tables in batches, see tables().
+    """
+    chunk_size = max(int(params['chunk_size']), 1)
+    tid = params.get('tid', None)
+
+    status, table_list = helper.get_table_list(params.get('scid', None), tid)
+    if not status:
+        _emit_tables_failed(table_list)
+        return
+
+    total = len(table_list)
+    table_oids = None
+    if tid is not None:
+        table_oids = set(table['oid'] for table in table_list)
+
+    # Tables are dropped from the queue once sent, so only the current
+    # batch is held with its columns and constraints.
+    pending = deque(table_list)
+    del table_list
+
+    cancelled = threading.Event()
+    table_loads[request.sid] = cancelled
+    try:
+        socketio.emit('tables_progress', {'loaded': 0, 'total': total},
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+        loaded = 0
+        while pending:
+            if cancelled.is_set():
+                socketio.emit('tables_cancelled',
+                              {'loaded': loaded, 'total': total},
+                              namespace=SOCKETIO_NAMESPACE, to=request.sid)
+                return
+
+            batch = [pending.popleft()
+                     for _ in range(min(chunk_size, len(pending)))]
+            status, batch = helper.get_table_details(batch, table_oids)
+            if not status:
+                _emit_tables_failed(batch)
+                return
+
+            loaded += len(batch)
+            socketio.emit('tables_chunk',
+                          {'tables': batch, 'loaded': loaded, 'total': total},
+                          namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+        socketio.emit('tables_success', {'loaded': loaded, 'total': total},
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+    finally:
+        if table_loads.get(request.sid) is cancelled:
+            del table_loads[request.sid]
+
+
+def _cancel_table_load():
+    cancelled = table_loads.get(request.sid)
+    if cancelled is not None:
+        cancelled.set()
+
+
+@socketio.on('tables_cancel', namespace=SOCKETIO_NAMESPACE)
+@socket_permissions_required(AllPermissionTypes.tools_erd_tool)
+def tables_cancel():
+    """
+    Stop a chunked table load, see tables().
+    """
+    _cancel_table_load()
+
+
+@socketio.on('disconnect', namespace=SOCKETIO_NAMESPACE)
+def disconnect():
+    """
+    Stop any table load in progress when the client goes away.
+    """
+    _cancel_table_load()
+
+
 @blueprint.route('/close/<int:trans_id>/<int:sgid>/<int:sid>/<int:did>',
                  methods=["DELETE"],
                  endpoint='close')
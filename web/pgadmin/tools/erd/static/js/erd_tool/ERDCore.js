@@ -636,19 +636,27 @@ export default class ERDCore {
 
   deserializeData(data){
     let oidUidMap = {};
-    let newNodes = [];
+    this.deserializeNodes(data, oidUidMap);
+    this.deserializeLinks(oidUidMap);
+  }
 
-    /* Add the nodes */
+  /* Add the nodes for a batch of tables. oidUidMap collects the node uids
+   * so that the links can be added once all the batches are in.
+   */
+  deserializeNodes(data, oidUidMap){
     data.forEach((nodeData)=>{
       const newNode = this.addNode(TableSchema.getErdSupportedData(nodeData));
       oidUidMap[nodeData.oid] = newNode.getID();
-      newNodes.push(newNode);
     });
+  }
+
+  deserializeLinks(oidUidMap){
+    const tableNodesDict = this.getModel().getNodesDict();
 
     // When generating for schema, there may be a reference to another schema table
     // We'll remove the FK completely in such cases
-    newNodes.forEach((node) => {
-      const nodeData = node.getData();
+    Object.values(oidUidMap).forEach((uid) => {
+      const nodeData = tableNodesDict[uid].getData();
       nodeData.original_foreign_keys = nodeData.original_foreign_keys?.filter(fk => 
         fk.columns?.[0]?.references && oidUidMap[fk.columns[0].references]
       );
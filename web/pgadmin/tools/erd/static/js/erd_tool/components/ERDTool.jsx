@@ -44,6 +44,9 @@ import { useEffect } from 'react';
 import { FileManagerUtils } from '../../../../../../misc/file_manager/static/js/components/FileManager';
 import SearchNode from './SearchNode';
 
+/* Number of tables the server sends per batch when generating an ERD */
+const TABLES_CHUNK_SIZE = 50;
+
 /* Custom react-diagram action for keyboard events */
 export class KeyboardShortcutAction extends Action {
   constructor(shortcut_handlers=[]) {
@@ -178,6 +181,8 @@ export default class ERDTool extends React.Component {
     this.restore = props.params.restore == 'true';
     this.eventBus = new EventBus();
     this.toolbarPrefs = null;
+    /* The table load in progress, see loadTablesData */
+    this.tablesLoad = null;
 
     _.bindAll(this, ['onLoadDiagram', 'onSaveDiagram', 'onSQLClick',
       'onImageClick', 'onSearchNode', 'onAddNewNode', 'onEditTable', 'onCloneNode', 'onDeleteNode', 'onNoteClick',
@@ -406,6 +411,10 @@ export default class ERDTool extends React.Component {
     }
   }
 
+  componentWillUnmount() {
+    this.cancelTablesLoad();
+  }
+
 
   restoreToolContent = async (toolContent) => {
     if(toolContent){
@@ -1044,26 +1053,61 @@ export default class ERDTool extends React.Component {
     }
   }
 
+  /* Stop the table load in progress, if any: the server stops loading the
+   * remaining batches. */
+  cancelTablesLoad() {
+    const load = this.tablesLoad;
+    this.tablesLoad = null;
+    if(load?.socket) {
+      load.socket.emit('tables_cancel');
+      load.socket.disconnect();
+    }
+  }
+
   async loadTablesData() {
+    this.cancelTablesLoad();
+    const load = this.tablesLoad = {socket: null};
     this.setLoading(gettext('Fetching schema data...'));
-    let resData = [];
+    let oidUidMap = {};
     let socket;
     try {
-      socket = await openSocket('/erd');
-      resData = await socketApiGet(socket, 'tables', {
+      socket = load.socket = await openSocket('/erd');
+      if(this.tablesLoad !== load) {
+        /* Cancelled while connecting */
+        socket.disconnect();
+        return;
+      }
+      /* Tables arrive in batches, add them to the diagram as they come */
+      socket.on('tables_chunk', (data)=>{
+        this.setLoading(gettext('Fetching schema data (%s of %s tables)...', data.loaded, data.total));
+        try {
+          this.diagram.deserializeNodes(data.tables, oidUidMap);
+        } catch (error) {
+          this.handleAxiosCatch(error);
+        }
+      });
+      await socketApiGet(socket, 'tables', {
         trans_id: parseInt(this.props.params.trans_id),
         sgid: parseInt(this.props.params.sgid),
         sid: parseInt(this.props.params.sid),
         did: parseInt(this.props.params.did),
         scid: this.props.params.scid ? parseInt(this.props.params.scid) : undefined,
         tid: this.props.params.tid ? parseInt(this.props.params.tid) : undefined,
+        chunk_size: TABLES_CHUNK_SIZE,
       });
     } catch (error) {
-      this.handleAxiosCatch(error);
+      if(this.tablesLoad === load) {
+        this.handleAxiosCatch(error);
+      }
+    }
+    if(this.tablesLoad !== load) {
+      /* Cancelled, the diagram is left to the new load, if any */
+      return;
     }
+    this.tablesLoad = null;
     socket?.disconnect();
     try {
-      this.diagram.deserializeData(resData);
+      this.diagram.deserializeLinks(oidUidMap);
     } catch (error) {
       this.handleAxiosCatch(error);
     }
@@ -0,0 +1,37 @@
+SELECT d.attrelid AS tid, d.attnum, 'attacl' as deftype,
+    COALESCE(gt.rolname, 'PUBLIC') grantee,
+    g.rolname grantor,
+    pg_catalog.array_agg(privilege_type order by privilege_type) as privileges,
+    pg_catalog.array_agg(is_grantable) as grantable
+FROM
+  (SELECT
+    a.attrelid, a.attnum,
+    (a.d).grantee AS grantee, (a.d).grantor AS grantor,
+    (a.d).is_grantable AS is_grantable,
+    CASE (a.d).privilege_type
+        WHEN 'CONNECT' THEN 'c'
+        WHEN 'CREATE' THEN 'C'
+        WHEN 'DELETE' THEN 'd'
+        WHEN 'EXECUTE' THEN 'X'
+        WHEN 'INSERT' THEN 'a'
+        WHEN 'REFERENCES' THEN 'x'
+        WHEN 'SELECT' THEN 'r'
+        WHEN 'TEMPORARY' THEN 'T'
+        WHEN 'TRIGGER' THEN 't'
+        WHEN 'TRUNCATE' THEN 'D'
+        WHEN 'UPDATE' THEN 'w'
+        WHEN 'USAGE' THEN 'U'
+        ELSE 'UNKNOWN'
+    END AS privilege_type
+  FROM
+    (SELECT att.attrelid, att.attnum, pg_catalog.aclexplode(att.attacl) AS d
+        FROM pg_catalog.pg_attribute att
+        WHERE att.attrelid = ANY(ARRAY[{{ tids|join(',') }}]::oid[])
+        AND att.attnum > 0
+        AND att.attacl IS NOT NULL
+    ) a
+  ) d
+  LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
+  LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
+GROUP BY d.attrelid, d.attnum, g.rolname, gt.rolname
+ORDER BY d.attrelid, d.attnum, grantee;
@@ -0,0 +1,62 @@
+SELECT DISTINCT ON (att.attrelid, att.attnum) att.attrelid AS tid,
+    att.attname as name, att.atttypid, att.attlen, att.attnum, att.attndims,
+    att.atttypmod, att.attacl, att.attnotnull, att.attoptions, att.attfdwoptions, att.attstattarget,
+    att.attstorage, att.attidentity,
+    pg_catalog.pg_get_expr(def.adbin, def.adrelid) AS defval,
+    pg_catalog.format_type(ty.oid,NULL) AS typname,
+    pg_catalog.format_type(ty.oid,att.atttypmod) AS displaytypname,
+    pg_catalog.format_type(ty.oid,att.atttypmod) AS cltype,
+    (SELECT pg_catalog.quote_ident(pnsp.nspname)||'.'||pg_catalog.quote_ident(parent.relname)
+     FROM pg_catalog.pg_inherits ph
+        JOIN pg_catalog.pg_class parent ON parent.oid = ph.inhparent
+        JOIN pg_catalog.pg_namespace pnsp ON pnsp.oid = parent.relnamespace
+        JOIN pg_catalog.pg_attribute pat ON pat.attrelid = parent.oid
+            AND pat.attname = att.attname AND pat.attnum > 0 AND NOT pat.attisdropped
+     WHERE ph.inhrelid = att.attrelid
+     ORDER BY ph.inhseqno
+     LIMIT 1) AS inheritedfromtable,
+    (SELECT pg_catalog.quote_ident(tnsp.nspname)||'.'||pg_catalog.quote_ident(trel.relname)
+     FROM pg_catalog.pg_type typ
+        JOIN pg_catalog.pg_class trel ON trel.oid = typ.typrelid
+        JOIN pg_catalog.pg_namespace tnsp ON tnsp.oid = trel.relnamespace
+        JOIN pg_catalog.pg_attribute tatt ON tatt.attrelid = trel.oid
+            AND tatt.attname = att.attname AND tatt.attnum > 0 AND NOT tatt.attisdropped
+     WHERE typ.oid = tab.reloftype) AS inheritedfromtype,
+    CASE WHEN ty.typelem > 0 THEN ty.typelem ELSE ty.oid END as elemoid,
+    (SELECT nspname FROM pg_catalog.pg_namespace WHERE oid = ty.typnamespace) as typnspname,
+    ty.typstorage AS defaultstorage,
+    description, pi.indkey,
+    (SELECT count(1) FROM pg_catalog.pg_type t2 WHERE t2.typname=ty.typname) > 1 AS isdup,
+    CASE WHEN length(coll.collname::text) > 0 AND length(nspc.nspname::text) > 0  THEN
+      pg_catalog.concat(pg_catalog.quote_ident(nspc.nspname),'.',pg_catalog.quote_ident(coll.collname))
+    ELSE '' END AS collspcname,
+    EXISTS(SELECT 1 FROM pg_catalog.pg_constraint WHERE conrelid=att.attrelid AND contype='f' AND att.attnum=ANY(conkey)) As is_fk,
+    (SELECT pg_catalog.array_agg(provider || '=' || label) FROM pg_catalog.pg_seclabels sl1 WHERE sl1.objoid=att.attrelid AND sl1.objsubid=att.attnum) AS seclabels,
+    (CASE WHEN (att.attnum < 1) THEN true ElSE false END) AS is_sys_column,
+    (CASE WHEN (att.attidentity in ('a', 'd')) THEN 'i' WHEN (att.attgenerated in ('s')) THEN 'g' ELSE 'n' END) AS colconstype,
+    (CASE WHEN (att.attgenerated in ('s')) THEN pg_catalog.pg_get_expr(def.adbin, def.adrelid) END) AS genexpr, tab.relname as relname,
+    (CASE WHEN tab.relkind = 'v' THEN true ELSE false END) AS is_view_only,
+    (CASE WHEN att.attcompression = 'p' THEN 'pglz' WHEN att.attcompression = 'l' THEN 'lz4' END) AS attcompression,
+    (SELECT dsd.refobjid
+     FROM pg_catalog.pg_depend dsd
+       JOIN pg_catalog.pg_class dsc ON dsd.refclassid='pg_catalog.pg_class'::regclass
+         AND dsd.refobjid=dsc.oid AND dsc.relkind='S'
+     WHERE dsd.classid='pg_catalog.pg_attrdef'::regclass
+       AND dsd.objid=def.oid AND dsd.deptype='n'
+     ORDER BY dsd.refobjid
+     LIMIT 1) AS defseqrelid,
+    seq.*
+FROM pg_catalog.pg_attribute att
+  JOIN pg_catalog.pg_type ty ON ty.oid=atttypid
+  LEFT OUTER JOIN pg_catalog.pg_attrdef def ON adrelid=att.attrelid AND adnum=att.attnum
+  LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=att.attrelid AND des.objsubid=att.attnum AND des.classoid='pg_class'::regclass)
+  LEFT OUTER JOIN (pg_catalog.pg_depend dep JOIN pg_catalog.pg_class cs ON dep.classid='pg_class'::regclass AND dep.objid=cs.oid AND cs.relkind='S') ON dep.refobjid=att.attrelid AND dep.refobjsubid=att.attnum
+  LEFT OUTER JOIN pg_catalog.pg_index pi ON pi.indrelid=att.attrelid AND indisprimary
+  LEFT OUTER JOIN pg_catalog.pg_collation coll ON att.attcollation=coll.oid
+  LEFT OUTER JOIN pg_catalog.pg_namespace nspc ON coll.collnamespace=nspc.oid
+  LEFT OUTER JOIN pg_catalog.pg_sequence seq ON cs.oid=seq.seqrelid
+  LEFT OUTER JOIN pg_catalog.pg_class tab on tab.oid = att.attrelid
+WHERE att.attrelid = ANY(ARRAY[{{ tids|join(',') }}]::oid[])
+    AND att.attnum > 0
+    AND att.attisdropped IS FALSE
+ORDER BY att.attrelid, att.attnum;
@@ -0,0 +1,3 @@
+SELECT ct.conrelid, ct.confrelid
+FROM pg_catalog.pg_constraint ct
+WHERE ct.contype = 'f';
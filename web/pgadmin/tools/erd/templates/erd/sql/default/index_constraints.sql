@@ -0,0 +1,31 @@
+SELECT idx.indrelid AS tid,
+    con.contype,
+    cls.oid,
+    cls.relname as name,
+    indnkeyatts as col_count,
+    CASE WHEN length(spcname::text) > 0 THEN spcname ELSE
+        (SELECT sp.spcname FROM pg_catalog.pg_database dtb
+        JOIN pg_catalog.pg_tablespace sp ON dtb.dattablespace=sp.oid
+        WHERE dtb.oid = {{ did }}::oid)
+    END as spcname,
+    desp.description AS comment,
+    condeferrable,
+    condeferred,
+    conislocal,
+    substring(pg_catalog.array_to_string(cls.reloptions, ',') from 'fillfactor=([0-9]*)') AS fillfactor,
+    ARRAY(SELECT pg_catalog.pg_get_indexdef(cls.oid, k, true)
+          FROM pg_catalog.generate_series(1, idx.indnkeyatts) k
+          ORDER BY k) AS column_names,
+    ARRAY(SELECT a.attname
+          FROM pg_catalog.unnest(idx.indkey::int2[]) WITH ORDINALITY AS ik(attnum, ord)
+          JOIN pg_catalog.pg_attribute a ON a.attrelid = idx.indrelid AND a.attnum = ik.attnum
+          WHERE ik.ord > idx.indnkeyatts
+          ORDER BY ik.ord) AS include
+FROM pg_catalog.pg_index idx
+JOIN pg_catalog.pg_class cls ON cls.oid=indexrelid
+LEFT OUTER JOIN pg_catalog.pg_tablespace ta on ta.oid=cls.reltablespace
+JOIN pg_catalog.pg_constraint con ON con.conindid = cls.oid AND con.conrelid = idx.indrelid
+LEFT OUTER JOIN pg_catalog.pg_description desp ON (desp.objoid=con.oid AND desp.objsubid = 0 AND desp.classoid='pg_constraint'::regclass)
+WHERE idx.indrelid = ANY(ARRAY[{{ tids|join(',') }}]::oid[])
+AND con.contype IN ('p', 'u')
+ORDER BY cls.relname;
@@ -0,0 +1,8 @@
+SELECT idx.indrelid AS tid, cls.relname AS idxname,
+    ARRAY(SELECT pg_catalog.pg_get_indexdef(cls.oid, k, true)
+          FROM pg_catalog.generate_series(1, idx.indnatts) k
+          ORDER BY k) AS column_names
+FROM pg_catalog.pg_index idx
+    JOIN pg_catalog.pg_class cls ON cls.oid=indexrelid
+WHERE idx.indrelid = ANY(ARRAY[{{ tids|join(',') }}]::oid[])
+ORDER BY cls.relname;
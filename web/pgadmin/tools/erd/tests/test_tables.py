@@ -10,6 +10,7 @@
 import json
 import uuid
 import secrets
+from unittest.mock import patch
 from pgadmin.utils.route import BaseTestGenerator, BaseSocketTestGenerator
 from regression.python_test_utils import test_utils as utils
 from regression import parent_node_dict
@@ -22,11 +23,19 @@ from pgadmin.browser.server_groups.servers.databases.schemas.tests import \
     utils as schema_utils
 from pgAdmin4 import app
 from .... import socketio
+from ... import erd
+from ...erd.utils import ERDHelper
 
 
 class ERDTables(BaseSocketTestGenerator):
     SOCKET_NAMESPACE = '/erd'
 
+    scenarios = [
+        ('Fetch all tables', dict(chunk_size=None, cancel=False)),
+        ('Fetch tables in chunks', dict(chunk_size=1, cancel=False)),
+        ('Cancel fetching tables in chunks', dict(chunk_size=1, cancel=True)),
+    ]
+
     def dropDB(self):
         connection = utils.get_db_connection(self.server['db'],
                                              self.server['username'],
@@ -78,13 +87,60 @@ class ERDTables(BaseSocketTestGenerator):
             'did': self.did,
         }
 
+        if self.chunk_size:
+            data['chunk_size'] = self.chunk_size
+
+        if self.cancel:
+            self._emit_and_cancel(data)
+            return
+
         self.socket_client.emit('tables', data,
                                 namespace=self.SOCKET_NAMESPACE)
         received = self.socket_client.get_received(self.SOCKET_NAMESPACE)
-        response_data = received[0]['args'][0]
-        self.assertEqual(received[0]['name'], "tables_success", response_data)
+
+        if not self.chunk_size:
+            response_data = received[0]['args'][0]
+            self.assertEqual(received[0]['name'], "tables_success",
+                             response_data)
+            self.assertEqual(self.tables, [[tab['schema'], tab['name']]
+                                           for tab in response_data])
+            return
+
+        self.assertEqual([msg['name'] for msg in received],
+                         ['tables_progress', 'tables_chunk', 'tables_chunk',
+                          'tables_success'], received)
+        tables = []
+        for msg in received[1:3]:
+            response_data = msg['args'][0]
+            self.assertEqual(len(response_data['tables']), self.chunk_size)
+            tables.extend(response_data['tables'])
+            self.assertEqual(response_data['loaded'], len(tables))
+            self.assertEqual(response_data['total'], len(self.tables))
         self.assertEqual(self.tables, [[tab['schema'], tab['name']]
-                                       for tab in response_data])
+                                       for tab in tables])
+
+    def _emit_and_cancel(self, data):
+        get_table_details = ERDHelper.get_table_details
+
+        def get_table_details_and_cancel(helper, *args, **kwargs):
+            # Simulate tables_cancel arriving while the first batch loads
+            res = get_table_details(helper, *args, **kwargs)
+            for cancelled in erd.table_loads.values():
+                cancelled.set()
+            return res
+
+        with patch.object(ERDHelper, 'get_table_details',
+                          get_table_details_and_cancel):
+            self.socket_client.emit('tables', data,
+                                    namespace=self.SOCKET_NAMESPACE)
+        received = self.socket_client.get_received(self.SOCKET_NAMESPACE)
+
+        self.assertEqual([msg['name'] for msg in received],
+                         ['tables_progress', 'tables_chunk',
+                          'tables_cancelled'], received)
+        self.assertEqual(received[2]['args'][0],
+                         {'loaded': 1, 'total': len(self.tables)})
+        self.assertEqual(erd.table_loads, {})
 
     def tearDown(self):
         super().tearDown()
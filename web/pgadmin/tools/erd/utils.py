@@ -7,12 +7,19 @@
 #
 ##########################################################################
 
+from collections import OrderedDict, defaultdict, deque
+
+from flask import render_template
+
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.utils \
     import BaseTableView
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.columns \
+    import utils as column_utils
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import get_schemas
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import DataTypeReader
+from pgadmin.utils.ajax import internal_server_error
 from pgadmin.utils.preferences import Preferences
 
 
@@ -35,70 +42,234 @@ class ERDTableView(BaseTableView, DataTypeReader):
     def get_geometry_types(self, conn_id=None, did=None, sid=None):
         return DataTypeReader.get_geometry_types(self, self.conn)
 
-    @BaseTableView.check_precondition
-    def fetch_all_tables(self, did=None, sid=None, scid=None):
-        all_tables = []
-        schemas = {'rows': []}
+    def _execute_erd_sql(self, name, **kwargs):
+        """
+        Render one of the ERD bulk queries and return its rows.
+        """
+        sql = render_template(
+            "/".join(['erd/sql/#{0}#'.format(self.manager.version), name]),
+            **kwargs)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return False, internal_server_error(errormsg=res)
+
+        return True, res['rows']
+
+    def _fetch_columns(self, tables, tids):
+        """
+        Fetch and format the columns of all the given tables.
+        """
+        status, columns = self._execute_erd_sql('columns.sql', tids=tids)
+        if not status:
+            return status, columns
+
+        status, acls = self._execute_erd_sql('column_acl.sql', tids=tids)
+        if not status:
+            return status, acls
+
+        column_acls = defaultdict(list)
+        for row in acls:
+            column_acls[(row.pop('tid'), row.pop('attnum'))].append(row)
+
+        edit_types = {col['atttypid']: [] for col in columns}
+        if edit_types:
+            sql = render_template(
+                "/".join(['columns/sql/#{0}#'.format(self.manager.version),
+                          'edit_mode_types_multi.sql']),
+                type_ids=",".join(map(str, edit_types.keys())))
+            status, res = self.conn.execute_2darray(sql)
+            if not status:
+                return False, internal_server_error(errormsg=res)
+
+            for row in res['rows']:
+                edit_types[row['main_oid']] = sorted(row['edit_types'])
+
+        for col in columns:
+            tid = col.pop('tid')
+            column_utils.reproject_serial_column(col)
+            tables[tid]['columns'].append(column_utils.format_column(
+                col, column_acls[(tid, col['attnum'])],
+                list(edit_types[col['atttypid']])))
+
+        return True, None
+
+    def _fetch_index_constraints(self, did, tables, tids):
+        """
+        Fetch the primary keys and unique constraints of all the given
+        tables.
+        """
+        status, constraints = self._execute_erd_sql(
+            'index_constraints.sql', did=did, tids=tids)
+        if not status:
+            return status, constraints
+
+        index_constraints = {
+            'p': 'primary_key', 'u': 'unique_constraint'
+        }
+        for cons in constraints:
+            tid = cons.pop('tid')
+            cons['columns'] = [{'column': col.strip('"')}
+                               for col in cons.pop('column_names')]
+            tables[tid][index_constraints[cons.pop('contype')]].append(cons)
+
+        return True, None
+
+    def _fetch_foreign_keys(self, tables, tids):
+        """
+        Fetch the foreign keys of all the given tables, along with the
+        index covering the local columns of each foreign key, if any.
+        """
+        status, foreign_keys = self._execute_erd_sql(
+            'foreign_keys.sql', tids=tids)
+        if not status:
+            return status, foreign_keys
+
+        status, indexes = self._execute_erd_sql('indexes.sql', tids=tids)
+        if not status:
+            return status, indexes
+
+        table_indexes = defaultdict(list)
+        for idx in indexes:
+            table_indexes[idx['tid']].append(
+                (idx['idxname'],
+                 set(col.strip('"') for col in idx['column_names'])))
+
+        for fk in foreign_keys:
+            tid = fk.pop('tid')
+            local_columns = fk.pop('local_columns')
+            referenced_columns = fk.pop('referenced_columns')
+            fk['columns'] = [{
+                'local_column': local_col,
+                'references': fk['confrelid'],
+                'referenced': ref_col,
+                'references_table_name': fk['refnsp'] + '.' + fk['reftab']
+            } for local_col, ref_col in zip(local_columns,
+                                            referenced_columns)]
+            fk['remote_schema'] = fk['refnsp']
+            fk['remote_table'] = fk['reftab']
+
+            fk['coveringindex'] = None
+            for idxname, idx_cols in table_indexes[tid]:
+                if idx_cols == set(local_columns):
+                    fk['coveringindex'] = idxname
+                    break
+            fk['autoindex'] = fk['coveringindex'] is None
+            fk['hasindex'] = not fk['autoindex']
+
+            tables[tid]['foreign_key'].append(fk)
+
+        return True, None
+
+    def _get_table_list(self, scid=None, tid=None, maxdepth=-1):
+        """
+        Fetch the tables an ERD is to be generated for, without their
+        columns and constraints.
+
+        If tid is given, that table and the tables related to it via
+        foreign keys, in either direction, up to maxdepth relations away
+        (no limit if maxdepth is negative) are returned. The foreign key
+        graph of the whole database is loaded with a single query and
+        walked in memory. Otherwise, the tables of the given schema, or
+        of all the schemas, are returned.
+        """
+        if tid is not None:
+            status, edges = self._execute_erd_sql('fk_graph.sql')
+            if not status:
+                return status, edges
+
+            neighbours = defaultdict(set)
+            for edge in edges:
+                neighbours[edge['conrelid']].add(edge['confrelid'])
+                neighbours[edge['confrelid']].add(edge['conrelid'])
+
+            depths = {tid: 0}
+            queue = deque([tid])
+            while queue:
+                curr = queue.popleft()
+                if depths[curr] == maxdepth:
+                    continue
+                for ref in neighbours[curr]:
+                    if ref not in depths:
+                        depths[ref] = depths[curr] + 1
+                        queue.append(ref)
+
+            return self._execute_erd_sql('tables.sql',
+                                         tids=list(depths.keys()))
+
         if scid is None:
             status, schemas = get_schemas(self.conn, show_system_objects=False)
             if not status:
                 return status, schemas
+            scids = [row['oid'] for row in schemas['rows']]
         else:
-            schemas['rows'].append({'oid': scid})
+            scids = [scid]
 
-        for row in schemas['rows']:
-            status, res = \
-                BaseTableView.fetch_tables(self, sid, did, row['oid'],
-                                           with_serial_cols=True)
-            if not status:
-                return status, res
+        if len(scids) == 0:
+            return True, []
 
-            all_tables.extend(res.values())
+        return self._execute_erd_sql('tables.sql', scids=scids)
 
-        return True, all_tables
+    def _get_table_details(self, did, rows, table_oids=None):
+        """
+        Add everything the ERD needs to draw them to the given tables, as
+        returned by _get_table_list().
 
-    @BaseTableView.check_precondition
-    def traverse_related_tables(self, did=None, sid=None, scid=None,
-                                tid=None, related=None, maxdepth=0,
-                                currdepth=0):
+        Rather than running the table, column and constraint property
+        queries once per table, each kind of object is fetched for all
+        the tables at once, so the number of queries does not depend on
+        the number of tables.
+
+        If table_oids is given, foreign keys referencing tables not in it
+        are left out of the diagram.
+        """
+        if len(rows) == 0:
+            return True, []
 
-        status, res = \
-            BaseTableView.fetch_tables(self, sid, did, scid, tid=tid,
-                                       with_serial_cols=True)
+        tables = OrderedDict()
+        for row in rows:
+            row.update(columns=[], primary_key=[], unique_constraint=[],
+                       foreign_key=[])
+            tables[row['oid']] = row
+        tids = list(tables.keys())
+
+        status, res = self._fetch_columns(tables, tids)
+        if not status:
+            return status, res
 
+        status, res = self._fetch_index_constraints(did, tables, tids)
         if not status:
             return status, res
 
-        if related is None:
-            related = list()
+        status, res = self._fetch_foreign_keys(tables, tids)
+        if not status:
+            return status, res
 
-        related[tid] = res
-        # Max depth limit reached
-        if currdepth == maxdepth:
-            new_fks = []
-            for fk in related[tid].pop('foreign_key', []):
-                if fk['confrelid'] in related:
-                    new_fks.append(fk)
+        if table_oids is not None:
+            for table in tables.values():
+                table['foreign_key'] = [
+                    fk for fk in table['foreign_key']
+                    if fk['confrelid'] in table_oids
+                ]
 
-            related[tid]['foreign_key'] = new_fks
-            return True, None
+        return True, list(tables.values())
 
-        status, depending_res = BaseTableView.get_fk_ref_tables(
-            self, tid)
+    @BaseTableView.check_precondition
+    def fetch_table_list(self, did=None, sid=None, scid=None, tid=None,
+                         maxdepth=-1):
+        return self._get_table_list(scid=scid, tid=tid, maxdepth=maxdepth)
 
+    @BaseTableView.check_precondition
+    def fetch_table_details(self, did=None, sid=None, tables=None,
+                            table_oids=None):
+        return self._get_table_details(did, tables, table_oids)
+
+    @BaseTableView.check_precondition
+    def fetch_all_tables(self, did=None, sid=None, scid=None):
+        status, rows = self._get_table_list(scid=scid)
         if not status:
-            return status, depending_res
-
-        for fk in [*res.get('foreign_key', []), *depending_res]:
-            if fk['confrelid'] in related:
-                continue
-            status, res = self.traverse_related_tables(
-                did=did, sid=sid, scid=fk['refnspoid'], tid=fk['confrelid'],
-                related=related, maxdepth=maxdepth, currdepth=currdepth + 1)
-            if not status:
-                return status, res
+            return status, rows
 
-        return True, None
+        return self._get_table_details(did, rows)
 
 
 class ERDHelper:
@@ -124,21 +295,31 @@ class ERDHelper:
             data=data, with_drop=with_drop)
         return SQL
 
-    def get_all_tables(self, scid, tid):
-        if tid is None and scid is None:
-            status, res = self.table_view.fetch_all_tables(
-                did=self.did, sid=self.sid)
-        elif tid is None:
-            status, res = self.table_view.fetch_all_tables(
-                did=self.did, sid=self.sid, scid=scid)
-        else:
+    def get_table_list(self, scid, tid):
+        """
+        Fetch the tables to generate the ERD for, see
+        ERDTableView._get_table_list().
+        """
+        maxdepth = -1
+        if tid is not None:
             prefs = Preferences.module('erd')
-            table_relation_depth = prefs.preference('table_relation_depth')
-            related = {}
-            status, res = self.table_view.traverse_related_tables(
-                did=self.did, sid=self.sid, scid=scid, tid=tid,
-                related=related, maxdepth=table_relation_depth.get()
-            )
-            if status:
-                res = list(related.values())
-        return status, res
+            maxdepth = prefs.preference('table_relation_depth').get()
+
+        return self.table_view.fetch_table_list(
+            did=self.did, sid=self.sid, scid=scid, tid=tid,
+            maxdepth=maxdepth)
+
+    def get_table_details(self, tables, table_oids=None):
+        return self.table_view.fetch_table_details(
+            did=self.did, sid=self.sid, tables=tables, table_oids=table_oids)
+
+    def get_all_tables(self, scid, tid):
+        status, tables = self.get_table_list(scid, tid)
+        if not status:
+            return status, tables
+
+        table_oids = None
+        if tid is not None:
+            table_oids = set(table['oid'] for table in tables)
+
+        return self.get_table_details(tables, table_oids)
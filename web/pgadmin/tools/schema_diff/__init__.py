@@ -33,6 +33,7 @@ from pgadmin import socketio
 from pgadmin.tools.user_management.PgAdminPermissions import AllPermissionTypes
 from pgadmin.utils.server_access import \
     get_server as get_server_access, get_user_server_query
+from pgadmin.utils.dependency_graph import get_dependency_graph
 
 MODULE_NAME = 'schema_diff'
 COMPARE_MSG = gettext("Comparing objects...")
@@ -631,6 +632,9 @@ def compare_database(params):
                 comparison_result = \
                     comparison_result + comparison_schema_result
 
+        sort_by_dependency(comparison_result, params['source_sid'],
+                           params['source_did'])
+
         # Update the message and total percentage done in session object
         update_session_diff_transaction(params['trans_id'], session_obj,
                                         diff_model_obj)
@@ -696,6 +700,9 @@ def compare_schema(params):
         comparison_result = \
             comparison_result + comparison_schema_result
 
+        sort_by_dependency(comparison_result, params['source_sid'],
+                           params['source_did'])
+
         # Update the message and total percentage done in session object
         update_session_diff_transaction(params['trans_id'], session_obj,
                                         diff_model_obj)
@@ -942,6 +949,47 @@ def compare_schema_objects(**kwargs):
     return comparison_result, total_percent
 
 
+def sort_by_dependency(comparison_result, source_sid, source_did):
+    """
+    This function is used to set the order (dependency_order) in which the
+    DDL of the compared objects is written in the generated script, i.e.
+    each object of the source database after the objects it depends on,
+    using the dependency graph of the source database. The other objects
+    keep their place.
+
+    :param comparison_result:
+    :param source_sid:
+    :param source_did:
+    :return:
+    """
+    order = list(range(len(comparison_result)))
+    slots = [index for index, row in enumerate(comparison_result)
+             if row['status'] != gettext('Target Only') and
+             row.get('oid') is not None]
+
+    driver = get_driver(PG_DEFAULT_DRIVER)
+    conn = driver.connection_manager(source_sid).connection(did=source_did)
+    status, graph = get_dependency_graph(conn)
+    if status:
+        source_objects = dict()
+        for index in slots:
+            source_objects.setdefault(
+                comparison_result[index]['oid'], list()).append(index)
+
+        sorted_indexes = [
+            index for oid in graph.sort_by_dependency(source_objects)
+            for index in source_objects[oid]]
+        for slot, index in zip(slots, sorted_indexes):
+            order[slot] = index
+    else:
+        app.logger.warning(
+            'Failed to fetch the dependency graph of the source '
+            'database: {0}'.format(graph))
+
+    for position, index in enumerate(order):
+        comparison_result[index]['dependency_order'] = position
+
+
 def fetch_compare_schemas(source_sid, source_did, target_sid, target_did):
     """
     This function is used to fetch all the schemas of source and target
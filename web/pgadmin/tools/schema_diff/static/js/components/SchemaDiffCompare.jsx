@@ -57,7 +57,8 @@ function checkAndGetSchemaQuery(data, script_array) {
 }
 
 function getGenerateScriptData(rows, selectedIds, script_array, selectedFilters) {
-  for (let selRowVal of rows) {
+  // Write the objects in the order of their dependencies
+  for (let selRowVal of _.sortBy(rows, 'dependency_order')) {
     if (selectedIds.includes(`${selRowVal.id}`)) {
       let data = selRowVal;
       if (!_.isUndefined(data.diff_ddl) && selectedFilters.indexOf(data.status) > -1) {
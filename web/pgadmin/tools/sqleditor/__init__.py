@@ -26,7 +26,7 @@ from config import PG_DEFAULT_DRIVER, ALLOW_SAVE_PASSWORD
 from werkzeug.user_agent import UserAgent
 from flask import Response, url_for, render_template, session, current_app, \
     send_file
-from flask import request
+from flask import request, stream_with_context
 from flask_babel import gettext
 from pgadmin.tools.sqleditor.utils.query_tool_connection_check \
     import query_tool_connection_check
@@ -39,6 +39,12 @@ from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
     ASYNC_EXECUTION_ABORTED, \
     CONNECTION_STATUS_MESSAGE_MAPPING, TX_STATUS_INERROR
 from pgadmin.tools.sqleditor.utils.start_running_query import StartRunningQuery
+from pgadmin.tools.sqleditor.utils.result_view import sort_filter_result, \
+    sort_filter_sql, SORT_ORDERS, FILTER_OPERATORS
+from pgadmin.tools.sqleditor.utils.run_script import ScriptRunner, \
+    ON_ERROR_STOP, ON_ERROR_CONTINUE
+from pgadmin.tools.sqleditor.utils.copy_import import CopyImporter, \
+    read_chunks, IMPORT_MODE_INSERT
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
 from pgadmin.utils import PgAdminModule
@@ -121,10 +127,13 @@ class SqlEditorModule(PgAdminModule):
 
             'sqleditor.view_data_start',
             'sqleditor.query_tool_start',
+            'sqleditor.query_tool_script',
             'sqleditor.poll',
             'sqleditor.fetch_window',
             'sqleditor.fetch_all_from_start',
+            'sqleditor.sort_filter_result',
             'sqleditor.save',
+            'sqleditor.copy_import',
             'sqleditor.inclusive_filter',
             'sqleditor.exclusive_filter',
             'sqleditor.remove_filter',
@@ -981,6 +990,7 @@ def start_view_data(trans_id):
 
         # Fetch the applied filter.
         filter_applied = trans_obj.is_filter_applied()
+        data_sorting = trans_obj.get_data_sorting()
 
         # Fetch the limit for the SQL query
         limit = trans_obj.get_limit()
@@ -1009,6 +1019,7 @@ def start_view_data(trans_id):
         status = False
         result = error_msg
         filter_applied = False
+        data_sorting = None
         can_edit = False
         can_filter = False
         sql = None
@@ -1017,6 +1028,7 @@ def start_view_data(trans_id):
         data={
             'status': status, 'result': result,
             'filter_applied': filter_applied,
+            'data_sorting': data_sorting,
             'limit': limit, 'can_edit': can_edit,
             'can_filter': can_filter, 'sql': sql,
         }
@@ -1065,6 +1077,100 @@ def extract_sql_from_network_parameters(request_data, request_arguments,
         return request_arguments or request_form_data
 
 
+@blueprint.route(
+    '/query_tool/script/<int:trans_id>',
+    methods=["POST"], endpoint='query_tool_script'
+)
+@pga_login_required
+def run_query_tool_script(trans_id):
+    """
+    Run a script of SQL statements, one statement after the other, and
+    stream the outcome of each of them via Server-Sent Events (SSE).
+
+    Args:
+        trans_id: unique transaction id
+
+    Request Body (JSON):
+        sql: The script to run
+        on_error: 'stop' (default) to stop at the first failing statement,
+                  or 'continue'
+
+    Returns:
+        SSE stream with events:
+        - {type: "results", executed: ..., results: [...]} - Outcome of the
+          statements executed since the previous event
+        - {type: "complete", status: ..., ...} - End of the script
+        - {type: "error", message: "...", info: "..."} - Execution aborted
+    """
+    data = request.get_json(silent=True) or {}
+    sql = data.get('sql')
+    on_error = data.get('on_error', ON_ERROR_STOP)
+
+    if not sql or not isinstance(sql, str):
+        return bad_request(gettext('Please provide the script to run.'))
+    if on_error not in (ON_ERROR_STOP, ON_ERROR_CONTINUE):
+        return bad_request(gettext('Invalid error handling mode.'))
+
+    status, error_msg, conn, trans_obj, session_obj = \
+        check_transaction_status(trans_id)
+
+    if type(error_msg) is Response:
+        return error_msg
+
+    if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
+        return make_json_response(success=0, errormsg=error_msg,
+                                  info='DATAGRID_TRANSACTION_REQUIRED',
+                                  status=404)
+
+    if not isinstance(trans_obj, QueryToolCommand):
+        return bad_request(
+            gettext('Scripts can only be run in the Query Tool.'))
+
+    if not conn.connected():
+        return service_unavailable(
+            gettext("Connection to the server has been lost."),
+            info="CONNECTION_LOST",
+        )
+
+    # The results of the previous query are replaced
+    trans_obj.update_fetched_row_cnt(0)
+    session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+    update_session_grid_transaction(trans_id, session_obj)
+    conn.release_async_cursor()
+
+    def generate():
+        """Generator for SSE events."""
+        try:
+            for event in ScriptRunner(conn, trans_obj, on_error).run(sql):
+                yield _nlq_sse_event(event)
+        except (ConnectionLost, SSHTunnelConnectionLost) as e:
+            yield _nlq_sse_event({
+                'type': 'error',
+                'message': str(e),
+                'info': 'CONNECTION_LOST'
+            })
+        except Exception as e:
+            current_app.logger.exception(e)
+            yield _nlq_sse_event({
+                'type': 'error',
+                'message': str(e)
+            })
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache, no-store, must-revalidate',
+            'Pragma': 'no-cache',
+            'Expires': '0',
+            'Connection': 'keep-alive',
+            'X-Accel-Buffering': 'no',
+        }
+    )
+    response.direct_passthrough = True
+    return response
+
+
 @blueprint.route('/poll/<int:trans_id>', methods=["GET"], endpoint='poll')
 @pga_login_required
 def poll(trans_id):
@@ -1331,6 +1437,7 @@ def fetch_window(trans_id, from_rownum=0, to_rownum=0):
     result = None
     rows_fetched_from = 0
     rows_fetched_to = 0
+    total_rows = None
 
     # Check the transaction and connection status
     status, error_msg, conn, trans_obj, session_obj = \
@@ -1346,9 +1453,16 @@ def fetch_window(trans_id, from_rownum=0, to_rownum=0):
         # to_rownum: Fetch 1 extra row to check whether next
         # recordset is available or not, this is required for server cursor.
 
-        status, result = conn.async_fetchmany_2darray(
-            records=None, from_rownum=from_rownum - 1, to_rownum=to_rownum if
-            trans_obj.server_cursor else to_rownum - 1)
+        if conn.result_order is not None and not trans_obj.server_cursor:
+            # The result has been sorted/filtered in memory
+            total_rows = len(conn.result_order)
+            status, result = conn.async_fetch_rows(
+                conn.result_order[max(from_rownum - 1, 0):to_rownum])
+        else:
+            status, result = conn.async_fetchmany_2darray(
+                records=None, from_rownum=from_rownum - 1,
+                to_rownum=to_rownum if trans_obj.server_cursor
+                else to_rownum - 1)
         if not status:
             status = 'Error'
         else:
@@ -1373,9 +1487,12 @@ def fetch_window(trans_id, from_rownum=0, to_rownum=0):
         next_page = 1
         rows_fetched_to = rows_fetched_to - 1
 
+    if total_rows is None:
+        total_rows = conn.total_rows
+
     pagination = {
         'page_size': page_size,
-        'page_count': math.ceil(conn.total_rows / page_size),
+        'page_count': math.ceil(total_rows / page_size),
         'page_no': math.floor((rows_fetched_from - 1) / page_size) + 1,
         'rows_from': rows_fetched_from,
         'rows_to': rows_fetched_to,
@@ -1386,7 +1503,8 @@ def fetch_window(trans_id, from_rownum=0, to_rownum=0):
             'status': status,
             'result': result,
             'pagination': pagination,
-            'row_count': conn.row_count,
+            'row_count': conn.row_count if conn.result_order is None
+            else total_rows,
         }
     )
 
@@ -1399,7 +1517,8 @@ def fetch_window(trans_id, from_rownum=0, to_rownum=0):
 def fetch_all_from_start(trans_id, limit=-1):
     """
     This function is used to fetch all the records from start and reset
-    the cursor back to it's previous position.
+    the cursor back to it's previous position. The records are fetched in
+    the order the result has been sorted/filtered in memory, if any.
     """
     # Check the transaction and connection status
     status, error_msg, conn, trans_obj, session_obj = \
@@ -1414,7 +1533,13 @@ def fetch_all_from_start(trans_id, limit=-1):
         # Reset the cursor to start to fetch all the records.
         conn.reset_cursor_at(0)
 
-        status, result = conn.async_fetchmany_2darray(limit)
+        if conn.result_order is not None and not trans_obj.server_cursor:
+            # The result has been sorted/filtered in memory
+            status, result = conn.async_fetch_rows(
+                conn.result_order if limit < 0
+                else conn.result_order[:limit])
+        else:
+            status, result = conn.async_fetchmany_2darray(limit)
         if not status:
             status = 'Error'
         else:
@@ -1434,6 +1559,98 @@ def fetch_all_from_start(trans_id, limit=-1):
     )
 
 
+@blueprint.route(
+    '/sort_filter_result/<int:trans_id>', methods=["POST"],
+    endpoint='sort_filter_result'
+)
+@pga_login_required
+def sort_filter_result_view(trans_id):
+    """
+    This method is used to sort and filter the result of the last query, in
+    memory, without running the query again. The rows are then fetched in
+    that order using fetch_window.
+
+    When the result is not fully fetched (server cursor), the sort and
+    filter of a View/Edit Data grid are applied by running the query again
+    (reexecute is set in the response), and they cannot be applied for the
+    query tool.
+
+    Args:
+        trans_id: unique transaction id
+    """
+    data = json.loads(request.data) if request.data else {}
+    sort = data.get('sort') or []
+    filters = data.get('filter') or []
+
+    if not isinstance(sort, list) or not isinstance(filters, list) or \
+            any(not isinstance(s, dict) or
+                s.get('order') not in SORT_ORDERS for s in sort) or \
+            any(not isinstance(f, dict) or
+                f.get('operator') not in FILTER_OPERATORS for f in filters):
+        return bad_request(errormsg=gettext("Invalid sort or filter."))
+
+    # Check the transaction and connection status
+    status, error_msg, conn, trans_obj, session_obj = \
+        check_transaction_status(trans_id)
+
+    if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
+        return make_json_response(success=0, errormsg=error_msg,
+                                  info='DATAGRID_TRANSACTION_REQUIRED',
+                                  status=404)
+
+    if not status or conn is None or trans_obj is None or \
+            session_obj is None:
+        return make_json_response(
+            data={'status': False, 'result': error_msg})
+
+    if trans_obj.server_cursor:
+        if not trans_obj.can_filter():
+            return make_json_response(data={
+                'status': False,
+                'result': gettext(
+                    "The result cannot be sorted or filtered, as it is not "
+                    "fully fetched when using a server cursor.")
+            })
+
+        try:
+            data_sorting, row_filter = sort_filter_sql(
+                get_driver(PG_DEFAULT_DRIVER), conn, sort, filters)
+        except (KeyError, TypeError):
+            return bad_request(errormsg=gettext("Invalid sort or filter."))
+        trans_obj.set_data_sorting({'data_sorting': data_sorting})
+        if row_filter:
+            trans_obj.append_filter(row_filter)
+
+        # As we changed the transaction object we need to
+        # restore it and update the session variable.
+        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        update_session_grid_transaction(trans_id, session_obj)
+
+        return make_json_response(
+            data={'status': True, 'result': {'reexecute': True}})
+
+    if not sort and not filters:
+        conn.result_order = None
+        return make_json_response(data={
+            'status': True,
+            'result': {'reexecute': False, 'row_count': conn.total_rows}
+        })
+
+    try:
+        status, result = sort_filter_result(conn, sort, filters)
+    except (KeyError, TypeError, ValueError):
+        return bad_request(errormsg=gettext("Invalid sort or filter."))
+
+    if not status:
+        return make_json_response(data={'status': False, 'result': result})
+
+    conn.result_order = result
+    return make_json_response(data={
+        'status': True,
+        'result': {'reexecute': False, 'row_count': len(result)}
+    })
+
+
 def fetch_pg_types(columns_info, trans_obj):
     """
     This method is used to fetch the pg types, which is required
@@ -1606,6 +1823,115 @@ def save(trans_id):
     )
 
 
+@blueprint.route(
+    '/copy_import/<int:trans_id>', methods=["POST"], endpoint='copy_import'
+)
+@pga_login_required
+def copy_import(trans_id):
+    """
+    Import rows in the CSV format (e.g. a large paste or a CSV file dropped
+    on the data grid) into the table of a View/Edit Data tool, streaming
+    them to the server with COPY FROM STDIN on the connection of the tool,
+    and report the progress via Server-Sent Events (SSE).
+
+    Args:
+        trans_id: unique transaction id
+
+    Request Body:
+        The CSV data, read and sent to the server chunk by chunk.
+
+    Query Parameters:
+        columns: names of the columns of the fields, repeated, in order.
+                 The generated columns are skipped, and the columns having a
+                 default value get it when their field is NULL.
+        mode: 'insert' (default) to insert the rows, or 'upsert' to update
+              the existing rows having the same primary key
+        header: '1' if the data starts with a header line to be skipped
+        delimiter, quote, null, encoding: CSV format of the data
+
+    Returns:
+        SSE stream with events:
+        - {type: "progress", stage: ..., bytes_sent: ..., total_bytes: ...}
+        - {type: "complete", status: ..., message: ..., rows_copied: ...,
+          rows_affected: ..., transaction_status: ...} - End of the import
+        - {type: "error", message: "...", info: "..."} - Import aborted
+    """
+    status, error_msg, conn, trans_obj, session_obj = \
+        check_transaction_status(trans_id)
+
+    if type(error_msg) is Response:
+        return error_msg
+
+    if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
+        return make_json_response(success=0, errormsg=error_msg,
+                                  info='DATAGRID_TRANSACTION_REQUIRED',
+                                  status=404)
+
+    if not status or trans_obj is None or \
+            getattr(trans_obj, 'object_type', None) != 'table':
+        return bad_request(
+            gettext('Data can only be imported into a table.'))
+
+    if not conn.connected():
+        return service_unavailable(
+            gettext("Connection to the server has been lost."),
+            info="CONNECTION_LOST",
+        )
+
+    args = request.args
+    importer = CopyImporter(
+        conn, trans_obj,
+        columns=args.getlist('columns'),
+        primary_keys=list(session_obj.get('primary_keys') or []),
+        mode=args.get('mode', IMPORT_MODE_INSERT),
+        options={
+            'header': args.get('header') == '1',
+            'delimiter': args.get('delimiter'),
+            'quote': args.get('quote'),
+            'null': args.get('null'),
+            'encoding': args.get('encoding'),
+        }
+    )
+    status, msg = importer.validate()
+    if not status:
+        return bad_request(msg)
+
+    total_bytes = request.content_length
+
+    def generate():
+        """Generator for SSE events."""
+        try:
+            for event in importer.run(read_chunks(request.stream),
+                                      total_bytes):
+                yield _nlq_sse_event(event)
+        except (ConnectionLost, SSHTunnelConnectionLost) as e:
+            yield _nlq_sse_event({
+                'type': 'error',
+                'message': str(e),
+                'info': 'CONNECTION_LOST'
+            })
+        except Exception as e:
+            current_app.logger.exception(e)
+            yield _nlq_sse_event({
+                'type': 'error',
+                'message': str(e)
+            })
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache, no-store, must-revalidate',
+            'Pragma': 'no-cache',
+            'Expires': '0',
+            'Connection': 'keep-alive',
+            'X-Accel-Buffering': 'no',
+        }
+    )
+    response.direct_passthrough = True
+    return response
+
+
 @blueprint.route(
     '/filter/inclusive/<int:trans_id>',
     methods=["PUT", "POST"], endpoint='inclusive_filter'
@@ -3018,7 +3344,8 @@ def nlq_chat_stream(trans_id):
                 sid=trans_obj.sid,
                 did=trans_obj.did,
                 system_prompt=NLQ_SYSTEM_PROMPT,
-                conversation_history=conversation_history
+                conversation_history=conversation_history,
+                include_schema_summary=True
             ):
                 if isinstance(item, str):
                     # Text chunk from streaming LLM response
@@ -22,9 +22,11 @@ export const QUERY_TOOL_EVENTS = {
   TRIGGER_SAVE_RESULTS: 'TRIGGER_SAVE_RESULTS',
   TRIGGER_SAVE_RESULTS_END: 'TRIGGER_SAVE_RESULTS_END',
   TRIGGER_PASTE_ROWS: 'TRIGGER_PASTE_ROWS',
+  TRIGGER_COPY_IMPORT: 'TRIGGER_COPY_IMPORT',
   TRIGGER_QUERY_CHANGE: 'TRIGGER_QUERY_CHANGE',
   TRIGGER_INCLUDE_EXCLUDE_FILTER: 'TRIGGER_INCLUDE_EXCLUDE_FILTER',
   TRIGGER_REMOVE_FILTER: 'TRIGGER_REMOVE_FILTER',
+  TRIGGER_SORT_RESULT: 'TRIGGER_SORT_RESULT',
   TRIGGER_SET_LIMIT: 'TRIGGER_SET_LIMIT',
   TRIGGER_GRAPH_VISUALISER: 'TRIGGER_GRAPH_VISUALISER',
   TRIGGER_SELECT_ALL: 'TRIGGER_SELECT_ALL',
@@ -18,6 +18,9 @@ import * as Editors from './Editors';
 import * as Formatters from './Formatters';
 import { PgIconButton } from '../../../../../../static/js/components/Buttons';
 import MapIcon from '@mui/icons-material/Map';
+import ArrowUpwardIcon from '@mui/icons-material/ArrowUpward';
+import ArrowDownwardIcon from '@mui/icons-material/ArrowDownward';
+import SwapVertIcon from '@mui/icons-material/SwapVert';
 import { QueryToolEventsContext } from '../QueryToolComponent';
 import PropTypes from 'prop-types';
 import gettext from 'sources/gettext';
@@ -170,6 +173,8 @@ function SelectableHeaderRenderer({column, isSelected, onColumnSelected, isCellS
   const eventBus = useContext(QueryToolEventsContext);
   const dataGridExtras = useContext(DataGridExtrasContext);
 
+  const sortOrder = dataGridExtras.resultSort?.find((s)=>s.pos == column.pos)?.order;
+
   if(isCellSelected) {
     dataGridExtras.onSelectedCellChange?.(null);
   }
@@ -197,6 +202,15 @@ function SelectableHeaderRenderer({column, isSelected, onColumnSelected, isCellS
         <span className='QueryTool-columnName'>{column.display_name}</span><br/>
         <span>{column.display_type}</span>
       </Box>
+      <PgIconButton title={gettext('Sort the rows')} size="xs" noBorder
+        icon={sortOrder == 'asc' ? <ArrowUpwardIcon data-label="ArrowUpwardIcon"/> :
+          sortOrder == 'desc' ? <ArrowDownwardIcon data-label="ArrowDownwardIcon"/> :
+            <SwapVertIcon data-label="SwapVertIcon"/>}
+        color={sortOrder ? 'primary' : 'default'}
+        onClick={(e)=>{
+          e.stopPropagation();
+          eventBus.fireEvent(QUERY_TOOL_EVENTS.TRIGGER_SORT_RESULT, column);
+        }}/>
       <Box marginLeft="4px">{column.can_edit ?
         <EditIcon fontSize="small" style={{fontSize: '0.875rem'}} data-label="EditIcon"/>:
         <LockIcon fontSize="small" style={{fontSize: '0.875rem'}} data-label="LockIcon"/>
@@ -375,7 +389,7 @@ function getColumnWidth(column, rows, canvasContext, columnWidthBy, maxColumnDat
 }
 
 export default function QueryToolDataGrid({columns, rows, totalRowCount, dataChangeStore,
-  onSelectedCellChange, selectedColumns, onSelectedColumnsChange, columnWidthBy, startRowNum, maxColumnDataDisplayLength, ...props}) {
+  onSelectedCellChange, selectedColumns, onSelectedColumnsChange, columnWidthBy, startRowNum, maxColumnDataDisplayLength, resultSort, ...props}) {
   const [readyColumns, setReadyColumns] = useState([]);
   const [lastSelectedColumn, setLastSelectedColumn] = useState(null);
   const eventBus = useContext(QueryToolEventsContext);
@@ -429,8 +443,8 @@ export default function QueryToolDataGrid({columns, rows, totalRowCount, dataCha
   }, []);
 
   const dataGridExtras = useMemo(()=>({
-    onSelectedCellChange, handleShortcuts, startRowNum
-  }), [onSelectedCellChange]);
+    onSelectedCellChange, handleShortcuts, startRowNum, resultSort
+  }), [onSelectedCellChange, resultSort]);
 
   // Save column width to window object on resize
   const handleColumnResize = (column, width) => {
@@ -503,5 +517,6 @@ QueryToolDataGrid.propTypes = {
   rowKeyGetter: PropTypes.func,
   columnWidthBy: PropTypes.oneOfType([PropTypes.string, PropTypes.number]),
   startRowNum: PropTypes.number,
+  resultSort: PropTypes.array,
   maxColumnDataDisplayLength: PropTypes.number,
 };
@@ -98,6 +98,9 @@ export function MainToolBar({containerRef, onFilterClick, onManageMacros, onAddT
   const executeScript = useCallback(()=>{
     eventBus.fireEvent(QUERY_TOOL_EVENTS.TRIGGER_EXECUTION);
   }, []);
+  const executeAsScript = useCallback((onError)=>{
+    eventBus.fireEvent(QUERY_TOOL_EVENTS.TRIGGER_EXECUTION, null, '', false, onError);
+  }, []);
   const cancelQuery = useCallback(()=>{
     eventBus.fireEvent(QUERY_TOOL_EVENTS.TRIGGER_STOP_EXECUTION);
   }, []);
@@ -652,6 +655,11 @@ export function MainToolBar({containerRef, onFilterClick, onManageMacros, onAddT
           onClick={checkMenuClick}>{gettext('Auto rollback on error?')}</PgMenuItem>
         <PgMenuItem hasCheck value="server_cursor" checked={checkedMenuItems['server_cursor']}
           onClick={checkMenuClick}>{gettext('Use server cursor?')}</PgMenuItem>
+        <PgMenuDivider />
+        <PgMenuItem disabled={buttonsDisabled['execute']}
+          onClick={()=>{executeAsScript('stop');}}>{gettext('Run as script, stop on error')}</PgMenuItem>
+        <PgMenuItem disabled={buttonsDisabled['execute']}
+          onClick={()=>{executeAsScript('continue');}}>{gettext('Run as script, continue on error')}</PgMenuItem>
       </PgMenu>
       <PgMenu
         anchorRef={explainMenuRef}
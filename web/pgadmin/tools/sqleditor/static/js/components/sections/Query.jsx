@@ -139,7 +139,7 @@ export default function Query({onTextSelect, setQtStatePartial}) {
       cmObj.setCursor(errorLineNo, endMarker);
     }
   };
-  const triggerExecution = (explainObject, macroSQL, executeCursor=false)=>{
+  const triggerExecution = (explainObject, macroSQL, executeCursor=false, scriptOnError=null)=>{
     if(queryToolCtx.params.is_query_tool) {
       let external = null;
       let query = editor.current?.getSelection();
@@ -165,7 +165,7 @@ export default function Query({onTextSelect, setQtStatePartial}) {
         query = query || editor.current?.getValue() || '';
       }
       if(query) {
-        eventBus.fireEvent(QUERY_TOOL_EVENTS.EXECUTION_START, query, {explainObject, macroSQL, external, executeCursor});
+        eventBus.fireEvent(QUERY_TOOL_EVENTS.EXECUTION_START, query, {explainObject, macroSQL, external, executeCursor, scriptOnError});
       }
     } else {
       eventBus.fireEvent(QUERY_TOOL_EVENTS.EXECUTION_START, null, {});
@@ -24,6 +24,7 @@ import Explain from '../../../../../../static/js/Explain';
 import { QuerySources } from './QueryHistory';
 import DownloadUtils from '../../../../../../static/js/DownloadUtils';
 import CopyData from '../QueryToolDataGrid/CopyData';
+import { CSVToArray } from '../../../../../../static/js/utils';
 import moment from 'moment';
 import ConfirmSaveContent from '../../../../../../static/js/Dialogs/ConfirmSaveContent';
 import EmptyPanelMessage from '../../../../../../static/js/components/EmptyPanelMessage';
@@ -33,6 +34,12 @@ import pgAdmin from 'sources/pgadmin';
 import { connectServer, connectServerModal } from '../connectServer';
 import { useLatestFunc } from '../../../../../../static/js/custom_hooks';
 
+/* Minimum number of pasted rows imported by the server using COPY, instead
+ * of being added to the grid and saved row by row. */
+const COPY_IMPORT_MIN_ROWS = 1000;
+// Maximum size of the header line of a CSV file dropped on the data grid
+const CSV_HEADER_MAX_BYTES = 64 * 1024;
+
 const StyledBox = styled(Box)(({theme}) => ({
   display: 'flex',
   height: '100%',
@@ -390,6 +397,168 @@ export class ResultSetUtils {
     }
   }
 
+  scriptResultMessage(res) {
+    let msg = '';
+    if(res.notices) {
+      msg += res.notices;
+    }
+    if(!res.status) {
+      msg += gettext('Statement %s (line %s) failed:', res.index, res.line) + '\n' + res.message + '\n';
+    }
+    return msg;
+  }
+
+  /* Run the query as a script, statement by statement, the outcome of the
+   * statements being streamed by the server as they are executed. */
+  async executeScript(query, onError, onResultsAvailable) {
+    let startTime = new Date();
+    this.eventBus.fireEvent(QUERY_TOOL_EVENTS.SET_MESSAGE, '');
+    this.eventBus.fireEvent(QUERY_TOOL_EVENTS.TASK_START, gettext('Running the script...'), startTime);
+    this.setStartTime(startTime);
+    this.query = query;
+    this.historyQuerySource = QuerySources.EXECUTE;
+    onResultsAvailable(null, [], []);
+
+    let complete = null, errorMsg = null;
+    const handleEvent = (event)=>{
+      if(event.type == 'results') {
+        let msg = event.results.map((res)=>this.scriptResultMessage(res)).join('');
+        if(msg) {
+          this.eventBus.fireEvent(QUERY_TOOL_EVENTS.SET_MESSAGE, msg, true);
+        }
+        this.setLoaderText?.(gettext('Running the script (%s statements executed)...', event.executed));
+      } else if(event.type == 'complete') {
+        complete = event;
+      } else if(event.type == 'error') {
+        errorMsg = event.message;
+      }
+    };
+
+    try {
+      const response = await fetch(
+        url_for('sqleditor.query_tool_script', {'trans_id': this.transId}), {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+            [pgAdmin.csrf_token_header]: pgAdmin.csrf_token,
+          },
+          body: JSON.stringify({sql: query, on_error: onError}),
+        }
+      );
+      if(!response.ok) {
+        const errorData = await response.json().catch(()=>({}));
+        throw new Error(errorData.errormsg || gettext('Failed to run the script.'));
+      }
+
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let done = false;
+      while(!done) {
+        let chunk = await reader.read();
+        done = chunk.done;
+        buffer += decoder.decode(chunk.value, {stream: !done});
+        const lines = buffer.split('\n');
+        buffer = done ? '' : lines.pop();
+        for(const line of lines) {
+          if(line.startsWith('data: ')) {
+            handleEvent(JSON.parse(line.slice(6)));
+          }
+        }
+      }
+    } catch(e) {
+      errorMsg = e.message;
+    }
+
+    this.setEndTime(new Date());
+    this.eventBus.fireEvent(QUERY_TOOL_EVENTS.EXECUTION_END);
+    let msg;
+    if(complete) {
+      this.eventBus.fireEvent(QUERY_TOOL_EVENTS.SET_CONNECTION_STATUS, complete.transaction_status);
+      msg = complete.message + ' ' + gettext('Total query runtime: %s.', this.queryRunTime());
+      if(complete.status == 'Cancel') {
+        msg = gettext('Execution Cancelled!') + '\n' + msg;
+      }
+      this.eventBus.fireEvent(QUERY_TOOL_EVENTS.TASK_END,
+        complete.status == 'Cancel' ? gettext('Execution Cancelled') : gettext('Query complete'), this.endTime);
+    } else {
+      msg = errorMsg || gettext('Failed to run the script.');
+      this.eventBus.fireEvent(QUERY_TOOL_EVENTS.TASK_END, gettext('Query failed'), this.endTime);
+    }
+    this.eventBus.fireEvent(QUERY_TOOL_EVENTS.SET_MESSAGE, '\n' + msg, true);
+    this.eventBus.fireEvent(QUERY_TOOL_EVENTS.FOCUS_PANEL, PANELS.MESSAGES);
+    this.eventBus.fireEvent(QUERY_TOOL_EVENTS.PUSH_HISTORY, {
+      status: complete?.status == 'Success',
+      start_time: this.startTime,
+      query: this.query,
+      row_affected: complete?.rows_affected ?? null,
+      total_time: this.queryRunTime(),
+      message: msg,
+      query_source: this.historyQuerySource,
+      is_pgadmin_query: false,
+    });
+  }
+
+  /* Import rows in the CSV format into the table, using COPY on the server.
+   * The progress of the import is streamed by the server while it runs. */
+  async copyImport(data, params, onProgress) {
+    let query = new URLSearchParams();
+    params.columns.forEach((col)=>query.append('columns', col));
+    ['mode', 'delimiter', 'quote', 'null', 'encoding'].forEach((param)=>{
+      if(!_.isUndefined(params[param]) && !_.isNull(params[param])) {
+        query.append(param, params[param]);
+      }
+    });
+    if(params.header) {
+      query.append('header', '1');
+    }
+
+    const response = await fetch(
+      url_for('sqleditor.copy_import', {'trans_id': this.transId}) + '?' + query.toString(), {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'text/csv',
+          [pgAdmin.csrf_token_header]: pgAdmin.csrf_token,
+        },
+        body: data,
+      }
+    );
+    if(!response.ok) {
+      const errorData = await response.json().catch(()=>({}));
+      throw new Error(errorData.errormsg || gettext('Failed to import the data.'));
+    }
+
+    let complete = null;
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let done = false;
+    while(!done) {
+      let chunk = await reader.read();
+      done = chunk.done;
+      buffer += decoder.decode(chunk.value, {stream: !done});
+      const lines = buffer.split('\n');
+      buffer = done ? '' : lines.pop();
+      for(const line of lines) {
+        if(!line.startsWith('data: ')) {
+          continue;
+        }
+        const event = JSON.parse(line.slice(6));
+        if(event.type == 'progress') {
+          onProgress?.(event);
+        } else if(event.type == 'complete') {
+          complete = event;
+        } else if(event.type == 'error') {
+          throw new Error(event.message);
+        }
+      }
+    }
+    if(!complete) {
+      throw new Error(gettext('Failed to import the data.'));
+    }
+    return complete;
+  }
+
   getWindowRows(fromRownum, toRownum) {
     let url = url_for('sqleditor.fetch_window', {
       'trans_id': this.transId,
@@ -528,6 +697,15 @@ export class ResultSetUtils {
     );
   }
 
+  sortFilterResult(reqData) {
+    return this.api.post(
+      url_for('sqleditor.sort_filter_result', {
+        'trans_id': this.transId,
+      }),
+      JSON.stringify(reqData)
+    );
+  }
+
   removeFilter() {
     return this.api.post(
       url_for('sqleditor.remove_filter', {
@@ -660,6 +838,19 @@ export class ResultSetUtils {
     return columns;
   }
 
+  /* With a server cursor, the result is sorted by running the query again
+   * with the data sorting of View/Edit Data (see sort_filter_result), which
+   * is kept across the executions: show it on the column headers. */
+  static getResultSort(data, columns) {
+    if(!data?.server_cursor || _.isEmpty(data.data_sorting)) {
+      return undefined;
+    }
+    return data.data_sorting.map((s)=>{
+      const column = columns.find((c)=>c.display_name == s.name);
+      return column ? {pos: column.pos, name: s.name, order: s.order} : null;
+    }).filter((s)=>s);
+  }
+
   processClipboardVal(columnVal, col, rawCopiedVal, pasteSerials) {
     if(columnVal === '' ) {
       if(col.has_default_val) {
@@ -721,6 +912,42 @@ export class ResultSetUtils {
     return retVal;
   }
 
+  /* Convert the pasted rows to the CSV data imported by copyImport, mapping
+   * the fields to the columns as processRows does. The columns which cannot
+   * be edited are left out, and so are the serial columns (unless they are
+   * pasted), and the bytea ones, which get their default value. A value is
+   * quoted unless it is NULL, so that it is not imported as a NULL. */
+  getCopyImportData(result, columns, options={}) {
+    let {pasteSerials=false} = options;
+    let copiedRowsObjects = [];
+    try {
+      copiedRowsObjects = JSON.parse(localStorage.getItem('copied-rows')) ?? [];
+    } catch {/* Suppress the error */}
+
+    let fieldCount = _.max(result.map((rec)=>rec.length)) ?? 0;
+    let importColumns = columns.filter((col)=>col.pos < fieldCount && col.can_edit &&
+      col.type != 'bytea' && !(col.has_default_val && col.seqtypid && !pasteSerials));
+    if(importColumns.length == 0) {
+      return null;
+    }
+
+    let csvRows = result.map((rec, recIdx)=>importColumns.map((col)=>{
+      /* A missing field is a NULL, as in processRows */
+      let columnVal = _.isUndefined(rec[col.pos]) ? null : this.processClipboardVal(
+        rec[col.pos], col, copiedRowsObjects[recIdx]?.[col.key], pasteSerials);
+      if(_.isNull(columnVal) || _.isUndefined(columnVal)) {
+        /* NULL, or the default value of the column */
+        return '';
+      }
+      return '"' + columnVal.toString().replace(/"/g, '""') + '"';
+    }).join(','));
+
+    return {
+      columns: importColumns.map((col)=>col.name),
+      data: csvRows.join('\n') + '\n',
+    };
+  }
+
   getPlanJson(result, data) {
     if(result && !_.isEmpty(data.colinfo)
       && data.colinfo[0].name == 'QUERY PLAN' && !_.isEmpty(data.types)
@@ -918,7 +1145,8 @@ export function ResultSet() {
   };
 
   const executionStartCallback = async (query, {
-    explainObject, macroSQL, external=false, reconnect=false, executeCursor=false, refreshData=false
+    explainObject, macroSQL, external=false, reconnect=false, executeCursor=false, refreshData=false,
+    scriptOnError=null,
   })=>{
     const yesCallback = async ()=>{
       /* Reset */
@@ -941,7 +1169,10 @@ export function ResultSet() {
       rsu.current.pollForResult(
         (procQueryData, procColumns, procRows)=>{
           setRowsResetKey((prev)=>prev+1);
-          setQueryData(procQueryData);
+          setQueryData(procQueryData && {
+            ...procQueryData,
+            result_sort: ResultSetUtils.getResultSort(procQueryData, procColumns),
+          });
           setRows(procRows);
           setColumns(procColumns);
         },
@@ -974,7 +1205,24 @@ export function ResultSet() {
       );
     };
 
+    const executeScript = async ()=>{
+      eventBus.fireEvent(QUERY_TOOL_EVENTS.HIGHLIGHT_ERROR, null);
+      resetSelectionAndChanges();
+      rsu.current.resetClientPKIndex();
+      setLoaderText(gettext('Running the script...'));
+      setDataOutputQuery(query);
+      await rsu.current.executeScript(query, scriptOnError, ()=>{
+        setQueryData(null);
+        setColumns([]);
+        setRows([]);
+      });
+    };
+
     const executeAndPoll = async ()=>{
+      if(scriptOnError) {
+        await executeScript();
+        return;
+      }
       await yesCallback().then((res)=>{
         if(res){
           pollCallback();
@@ -1024,6 +1272,90 @@ export function ResultSet() {
     }
   };
 
+  const triggerSortResult = async (column)=>{
+    // Cycle the sort of the column: ascending, descending, none
+    const current = queryData?.result_sort?.find((s)=>s.pos == column.pos);
+    let sort = [];
+    if(!current) {
+      sort = [{pos: column.pos, name: column.display_name, order: 'asc'}];
+    } else if(current.order == 'asc') {
+      sort = [{...current, order: 'desc'}];
+    }
+
+    setLoaderText(gettext('Sorting the rows...'));
+    try {
+      const res = await rsu.current.sortFilterResult({sort: sort});
+      setLoaderText('');
+      if(!res.data.data.status) {
+        pgAdmin.Browser.notifier.errorText(res.data.data.result);
+        return;
+      }
+      if(res.data.data.result.reexecute) {
+        // The result is not fully fetched, the query is run again
+        eventBus.fireEvent(QUERY_TOOL_EVENTS.TRIGGER_EXECUTION);
+        return;
+      }
+      setQueryData((prev)=>({...prev, result_sort: sort}));
+      const pageSize = queryData?.pagination?.page_size;
+      eventBus.fireEvent(QUERY_TOOL_EVENTS.FETCH_WINDOW, 1, pageSize > 0 ? pageSize : res.data.data.result.row_count);
+    } catch(err) {
+      eventBus.fireEvent(QUERY_TOOL_EVENTS.HANDLE_API_ERROR, err, {
+        checkTransaction: true,
+      });
+      setLoaderText('');
+    }
+  };
+
+  const triggerCopyImport = async (data, options={})=>{
+    setLoaderText(gettext('Importing the rows...'));
+    try {
+      const complete = await rsu.current.copyImport(data, options, (event)=>{
+        if(event.stage == 'merge') {
+          setLoaderText(gettext('Merging the imported rows...'));
+        } else if(event.total_bytes > 0) {
+          setLoaderText(gettext('Importing the rows (%s%%)...',
+            Math.floor(event.bytes_sent * 100 / event.total_bytes)));
+        }
+      });
+      setLoaderText('');
+      eventBus.fireEvent(QUERY_TOOL_EVENTS.SET_CONNECTION_STATUS, complete.transaction_status);
+      eventBus.fireEvent(QUERY_TOOL_EVENTS.SET_MESSAGE, complete.message);
+      if(!complete.status) {
+        pgAdmin.Browser.notifier.errorText(complete.message);
+        eventBus.fireEvent(QUERY_TOOL_EVENTS.FOCUS_PANEL, PANELS.MESSAGES);
+        return;
+      }
+      pgAdmin.Browser.notifier.success(complete.message);
+      // Show the imported rows
+      eventBus.fireEvent(QUERY_TOOL_EVENTS.TRIGGER_EXECUTION);
+    } catch(err) {
+      setLoaderText('');
+      pgAdmin.Browser.notifier.errorText(err.message);
+    }
+  };
+
+  /* The imported rows are saved into the table straight away, rather than
+   * being added to the grid until they are saved, hence the user is asked
+   * first. The pasted rows are added to the grid if the user cancels. */
+  const confirmCopyImport = (data, options, message, onCancel)=>{
+    let confirmed = false;
+    pgAdmin.Browser.notifier.confirm(
+      gettext('Import rows'),
+      message,
+      ()=>{
+        confirmed = true;
+        triggerCopyImport(data, options);
+      },
+      ()=>{
+        /* Also called once the dialog is closed by OK */
+        if(!confirmed) {
+          onCancel?.();
+        }
+      }
+    );
+  };
+
+  // Fetch LLM status on mount
   // Fetch LLM status on mount
   useEffect(()=>{
     api.get(url_for('llm.status'))
@@ -1124,6 +1456,14 @@ export function ResultSet() {
     });
   }, []);
 
+  useEffect(()=>{
+    return eventBus.registerListener(QUERY_TOOL_EVENTS.TRIGGER_SORT_RESULT, triggerSortResult);
+  }, [queryData]);
+
+  useEffect(()=>{
+    return eventBus.registerListener(QUERY_TOOL_EVENTS.TRIGGER_COPY_IMPORT, triggerCopyImport);
+  }, [columns]);
+
   useEffect(()=>{
     const deregExec = eventBus.registerListener(QUERY_TOOL_EVENTS.EXECUTION_START, executionStartCallback);
     return ()=>{
@@ -1311,22 +1651,17 @@ export function ResultSet() {
       pageDataOutOfSync.current = true;
       if(_.size(dataChangeStore.added)) {
         // Update the rows in a grid after addition
-        respData.data.query_results.forEach((qr)=>{
-          if(!_.isNull(qr.row_added)) {
-            let rowClientPK = Object.keys(qr.row_added)[0];
-            setRows((prevRows)=>{
-              let rowIdx = prevRows.findIndex((r)=>rowKeyGetter(r)==rowClientPK);
-              return [
-                ...prevRows.slice(0, rowIdx),
-                {
-                  ...prevRows[rowIdx],
-                  ...qr.row_added[rowClientPK],
-                },
-                ...prevRows.slice(rowIdx+1),
-              ];
-            });
-          }
-        });
+        // A query result may have several rows added, when they were
+        // saved in a batch.
+        const rowsAdded = Object.assign({}, ...respData.data.query_results
+          .filter((qr)=>!_.isNull(qr.row_added))
+          .map((qr)=>qr.row_added));
+        if(!_.isEmpty(rowsAdded)) {
+          setRows((prevRows)=>prevRows.map((r)=>{
+            const rowClientPK = rowKeyGetter(r);
+            return rowClientPK in rowsAdded ? {...r, ...rowsAdded[rowClientPK]} : r;
+          }));
+        }
       }
       let deletedKeys = Object.keys(dataChangeStore.deleted);
       if(deletedKeys.length == rows.length) {
@@ -1468,6 +1803,18 @@ export function ResultSet() {
 
   useEffect(()=>{
     const triggerAddRows = (_rows, options)=>{
+      const copyImport = options?.fromClipboard && _rows.length >= COPY_IMPORT_MIN_ROWS &&
+        !queryToolCtx.params.is_query_tool && rsu.current.getCopyImportData(_rows, columns, options);
+      if(copyImport) {
+        confirmCopyImport(copyImport.data, {columns: copyImport.columns, header: false,
+          delimiter: ',', quote: '"', null: ''},
+        gettext('The %s pasted rows will be saved into the table straight away. Do you want to continue?', _rows.length),
+        ()=>addRows(_rows, options));
+        return;
+      }
+      addRows(_rows, options);
+    };
+    const addRows = (_rows, options)=>{
       let insPosn = 0;
       if(selectedRows.size > 0) {
         let selectedRowsSorted = Array.from(selectedRows);
@@ -1678,6 +2025,34 @@ export function ResultSet() {
   }, [columns]);
 
   const rowKeyGetter = React.useCallback((row)=>row[rsu.current.clientPK]);
+
+  /* A CSV file dropped on the data grid of a table is imported by the server,
+   * updating the rows having the same primary key. */
+  const canDropCSV = !queryToolCtx.params.is_query_tool && queryData?.can_edit;
+  const onDragOver = (e)=>{
+    if(canDropCSV && e.dataTransfer.types.includes('Files')) {
+      e.preventDefault();
+    }
+  };
+  const onDrop = async (e)=>{
+    const file = e.dataTransfer.files?.[0];
+    if(!canDropCSV || !file || !/\.csv$/i.test(file.name)) {
+      return;
+    }
+    e.preventDefault();
+    /* The fields are mapped to the columns by the header of the file */
+    const header = CSVToArray(
+      (await file.slice(0, CSV_HEADER_MAX_BYTES).text()).replace(/^\uFEFF/, ''), ',', '"'
+    )[0] ?? [];
+    if(header.every((name)=>name == '')) {
+      pgAdmin.Browser.notifier.errorText(gettext('The CSV file has no header.'));
+      return;
+    }
+    confirmCopyImport(file, {columns: header, mode: 'upsert', header: true, delimiter: ',', quote: '"'},
+      gettext('The rows of the file (columns: %s) will be saved into the table straight away, updating the rows having the same primary key. Do you want to continue?',
+        header.join(', ')));
+  };
+
   return (
     <StyledBox ref={containerRef} tabIndex="0">
       <Loader message={loaderText} />
@@ -1689,12 +2064,13 @@ export function ResultSet() {
           canEdit={queryData.can_edit} totalRowCount={queryData?.rows_affected}
           pagination={queryData?.pagination ?? {}} allRowsSelect={allRowsSelect}
         />
-        <Box flexGrow="1" minHeight="0">
+        <Box flexGrow="1" minHeight="0" onDragOver={onDragOver} onDrop={onDrop}>
           <QueryToolDataGrid
             columns={columns}
             rows={rows}
             totalRowCount={queryData?.rows_affected}
             startRowNum={queryData?.pagination?.rows_from}
+            resultSort={queryData?.result_sort}
             columnWidthBy={
               queryToolCtx.preferences?.sqleditor?.column_data_auto_resize == 'by_data' ?
                 queryToolCtx.preferences.sqleditor.column_data_max_width :
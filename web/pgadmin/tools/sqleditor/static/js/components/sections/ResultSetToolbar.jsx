@@ -301,7 +301,9 @@ export function ResultSetToolbar({query, canEdit, totalRowCount, pagination, all
       field_separator: queryToolPref.results_grid_field_separator,
     });
     let copiedRows = copyUtils.getCopiedRows();
-    eventBus.fireEvent(QUERY_TOOL_EVENTS.TRIGGER_ADD_ROWS, copiedRows, {fromClipboard: true, pasteSerials: checkedMenuItems['paste_with_serials']});
+    eventBus.fireEvent(QUERY_TOOL_EVENTS.TRIGGER_ADD_ROWS, copiedRows, {
+      fromClipboard: true, pasteSerials: checkedMenuItems['paste_with_serials'],
+    });
   }, [queryToolPref, checkedMenuItems['paste_with_serials']]);
   const copyData = ()=>{
     eventBus.fireEvent(QUERY_TOOL_EVENTS.COPY_DATA, checkedMenuItems['copy_with_headers']);
@@ -0,0 +1,4 @@
+{# Ranks of the values, in the order of the values, as ordered by the default collation of the database #}
+SELECT pg_catalog.dense_rank() OVER (ORDER BY val) AS rank
+FROM pg_catalog.unnest(%(values)s::text[]) WITH ORDINALITY AS vals(val, pos)
+ORDER BY pos
@@ -0,0 +1,10 @@
+{# Columns of the table into which the data is imported #}
+SELECT att.attname AS name, att.attgenerated != '' AS is_generated,
+    (att.attgenerated = '' AND (att.atthasdef OR att.attidentity != '' OR
+     ty.typdefault IS NOT NULL)) AS has_default_val
+FROM pg_catalog.pg_attribute att
+    JOIN pg_catalog.pg_type ty ON ty.oid = att.atttypid
+WHERE att.attrelid = {{ obj_id }}::oid
+    AND att.attnum > 0
+    AND NOT att.attisdropped
+ORDER BY att.attnum
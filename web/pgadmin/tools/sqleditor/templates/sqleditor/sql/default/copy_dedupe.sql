@@ -0,0 +1,14 @@
+{# Delete the staged rows having the same primary key as a later row, so that the last row wins #}
+DELETE FROM pg_temp.{{ conn|qtIdent(staging_table) }}
+WHERE ctid IN (
+    SELECT ctid FROM (
+        SELECT ctid, pg_catalog.row_number() OVER (
+            PARTITION BY {% for pk in primary_keys %}{% if not loop.first %}, {% endif %}{{ conn|qtIdent(pk) }}{% endfor %}
+
+            ORDER BY ctid DESC) AS row_number
+        FROM pg_temp.{{ conn|qtIdent(staging_table) }}
+        WHERE {% for pk in primary_keys %}{% if not loop.first %} AND {% endif %}{{ conn|qtIdent(pk) }} IS NOT NULL{% endfor %}
+
+    ) staged
+    WHERE row_number > 1
+);
@@ -0,0 +1,6 @@
+{# Copy the rows sent by the client into the table, or the staging table #}
+COPY {% if staging_table %}pg_temp.{{ conn|qtIdent(staging_table) }}{% else %}{{ conn|qtIdent(nsp_name, object_name) }}{% endif %} (
+{% for col in columns %}
+{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) }}{% endfor %}
+
+) FROM STDIN WITH (FORMAT csv, HEADER {% if header %}true{% else %}false{% endif %}, DELIMITER {{ delimiter|qtLiteral(conn) }}, QUOTE {{ quote|qtLiteral(conn) }}, NULL {{ null_string|qtLiteral(conn) }}{% if encoding %}, ENCODING {{ encoding|qtLiteral(conn) }}{% endif %});
@@ -0,0 +1,40 @@
+{# Insert the staged rows, in which the given columns having a default value are null, into the table. These columns are left out, so that they get their default value. In the upsert mode, the existing rows having the same primary key are updated. #}
+{% if columns %}
+WITH imported AS (
+INSERT INTO {{ conn|qtIdent(nsp_name, object_name) }} (
+{% for col in columns %}
+{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) }}{% endfor %}
+
+)
+SELECT {% for col in columns %}{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) }}{% endfor %}
+
+FROM pg_temp.{{ conn|qtIdent(staging_table) }}
+{% if default_columns %}
+WHERE {% for col in default_columns %}{% if not loop.first %} AND {% endif %}{{ conn|qtIdent(col) }} IS {% if col not in null_columns %}NOT {% endif %}NULL{% endfor %}
+
+{% endif %}
+ORDER BY ctid
+{% if primary_keys %}
+ON CONFLICT ({% for pk in primary_keys %}{% if not loop.first %}, {% endif %}{{ conn|qtIdent(pk) }}{% endfor %})
+{% if update_columns %}
+DO UPDATE SET
+{% for col in update_columns %}
+{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) }} = EXCLUDED.{{ conn|qtIdent(col) }}{% endfor %}
+
+{% else %}
+DO NOTHING
+{% endif %}
+{% endif %}
+RETURNING 1
+)
+SELECT count(*) FROM imported;
+{% else %}
+{# All the imported columns are null, and have a default value #}
+DO $$
+BEGIN
+    FOR i IN 1..{{ row_count }} LOOP
+        INSERT INTO {{ conn|qtIdent(nsp_name, object_name) }} DEFAULT VALUES;
+    END LOOP;
+END
+$$;
+{% endif %}
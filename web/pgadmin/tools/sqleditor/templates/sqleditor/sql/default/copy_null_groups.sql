@@ -0,0 +1,7 @@
+{# Count the staged rows, by the columns having a default value which are null #}
+SELECT {% for col in default_columns %}{{ conn|qtIdent(col) }} IS NULL AS is_null_{{ loop.index0 }}, {% endfor %}count(*) AS row_count
+FROM pg_temp.{{ conn|qtIdent(staging_table) }}
+{% if default_columns %}
+GROUP BY {% for col in default_columns %}{% if not loop.first %}, {% endif %}{{ loop.index }}{% endfor %}
+
+{% endif %}
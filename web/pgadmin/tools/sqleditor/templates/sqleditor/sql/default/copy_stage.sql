@@ -0,0 +1,8 @@
+{# Create the staging table, having the types of the imported columns, or drop it #}
+DROP TABLE IF EXISTS pg_temp.{{ conn|qtIdent(staging_table) }};
+{% if not drop %}
+CREATE TEMPORARY TABLE {{ conn|qtIdent(staging_table) }} AS
+SELECT {% for col in columns %}{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) }}{% endfor %}
+
+FROM {{ conn|qtIdent(nsp_name, object_name) }} WITH NO DATA;
+{% endif %}
@@ -0,0 +1,10 @@
+{# Insert the new rows, having the same columns, in one statement #}
+INSERT INTO {{ conn|qtIdent(nsp_name, object_name) | replace("%", "%%") }} (
+{% for col in columns %}
+{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) | replace("%", "%%") }}{% endfor %}
+) VALUES
+{% for row in rows %}
+{% if not loop.first %}, {% endif %}({% for col in columns %}{% if not loop.first %}, {% endif %}{% if use_default %}DEFAULT{% else %}%({{ row[loop.index0] }})s{% if type_cast_required[col] %}::{{ data_type[col] }}{% endif %}{% endif %}{% endfor %}){% endfor %}
+
+{% if pk_names and not has_oids %} returning {{pk_names | replace("%", "%%")}}{% endif %}
+{% if has_oids %} returning oid{% endif %};
@@ -0,0 +1,9 @@
+{# Select the table rows having the given oids/primary keys #}
+SELECT {% if has_oids %}oid, {% endif %}* FROM {{ conn|qtIdent(nsp_name, object_name) | replace("%", "%%") }}
+WHERE
+{% if has_oids %}
+  oid IN ({% for row in rows %}{% if not loop.first %}, {% endif %}%({{ row[0] }})s{% endfor %})
+{% else %}
+  ({% for pk in primary_keys %}{% if not loop.first %}, {% endif %}{{ conn|qtIdent(pk) | replace("%", "%%") }}{% endfor %}) IN (
+{% for row in rows %}{% if not loop.first %}, {% endif %}({% for param in row %}{% if not loop.first %}, {% endif %}%({{ param }})s{% endfor %}){% endfor %})
+{% endif %};
@@ -0,0 +1,13 @@
+{# Update the rows, having the same columns changed, in one statement #}
+UPDATE {{ conn|qtIdent(nsp_name, object_name) | replace("%", "%%") }} SET
+{% for col in columns %}
+{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) | replace("%", "%%") }} = __pgadmin_batch.c{{ loop.index0 }}{% endfor %}
+
+ FROM (VALUES
+{% for values, keys in rows %}
+{% if not loop.first %}, {% endif %}({% for col in columns %}%({{ values[loop.index0] }})s::{{ data_type[col] }}, {% endfor %}{% for pk in primary_keys %}{% if not loop.first %}, {% endif %}%({{ keys[loop.index0] }})s::{{ key_type[pk] }}{% endfor %}){% endfor %}
+
+) AS __pgadmin_batch({% for col in columns %}c{{ loop.index0 }}, {% endfor %}{% for pk in primary_keys %}{% if not loop.first %}, {% endif %}k{{ loop.index0 }}{% endfor %})
+ WHERE
+{% for pk in primary_keys %}
+{% if not loop.first %} AND {% endif %}{{ conn|qtIdent(nsp_name, object_name) | replace("%", "%%") }}.{{ conn|qtIdent(pk) | replace("%", "%%") }} = __pgadmin_batch.k{{ loop.index0 }}{% endfor %};
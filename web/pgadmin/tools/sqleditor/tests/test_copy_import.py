@@ -0,0 +1,199 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import secrets
+import uuid
+from unittest.mock import patch
+
+from werkzeug.exceptions import ClientDisconnected
+
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils
+from .execute_query_test_utils import async_poll
+
+
+class TestCopyImport(BaseTestGenerator):
+    """
+    This class will test importing CSV data into the table of a View/Edit
+    Data tool, using COPY.
+    """
+    scenarios = [
+        ('Insert the rows', dict(
+            params={'columns': ['id', 'name', 'qty'], 'header': '1'},
+            data='id,name,qty\n3,three,3\n4,"four, or more",\n',
+            expected_status=True,
+            expected_rows=[(1, 'one', 1), (2, 'two', 2), (3, 'three', 3),
+                           (4, 'four, or more', None)],
+        )),
+        ('Upsert the rows', dict(
+            params={'columns': ['qty', 'id', 'name'], 'mode': 'upsert',
+                    'delimiter': '\t'},
+            data='10\t2\tTWO\n30\t3\tthree\n31\t3\tTHREE\n',
+            expected_status=True,
+            expected_rows=[(1, 'one', 1), (2, 'TWO', 10), (3, 'THREE', 31)],
+        )),
+        ('Invalid data', dict(
+            params={'columns': ['id', 'name', 'qty']},
+            data='3,three,3\n4,four,many\n',
+            expected_status=False,
+            expected_rows=[(1, 'one', 1), (2, 'two', 2)],
+        )),
+        ('Upsert without the primary key', dict(
+            params={'columns': ['name', 'qty'], 'mode': 'upsert'},
+            data='three,3\n',
+            expected_status=None,
+            expected_rows=[(1, 'one', 1), (2, 'two', 2)],
+        )),
+        ('Insert some of the columns', dict(
+            params={'columns': ['name', 'id', 'total', 'note']},
+            data='three,3,,\n"",4,99,four\n,5,,""\n',
+            expected_status=True,
+            select='id, name, qty, note, total',
+            expected_rows=[(1, 'one', 1, 'none', 2), (2, 'two', 2, 'none', 4),
+                           (3, 'three', None, 'none', None),
+                           (4, '', None, 'four', None),
+                           (5, None, None, '', None)],
+        )),
+        ('Upsert the columns of the header', dict(
+            params={'columns': ['note', 'id'], 'mode': 'upsert',
+                    'header': '1'},
+            data='note,id\nfirst,1\n,2\n,3\nlast,1\n',
+            expected_status=True,
+            select='id, name, qty, note',
+            expected_rows=[(1, 'one', 1, 'last'), (2, 'two', 2, 'none'),
+                           (3, None, None, 'none')],
+        )),
+        ('Import again after an upload cut short', dict(
+            params={'columns': ['id', 'name', 'qty']},
+            data='3,three,3\n',
+            interrupted=True,
+            expected_status=True,
+            expected_rows=[(1, 'one', 1), (2, 'two', 2), (3, 'three', 3)],
+        )),
+        ('Unknown column', dict(
+            params={'columns': ['id', 'unknown']},
+            data='3,three\n',
+            expected_status=None,
+            expected_rows=[(1, 'one', 1), (2, 'two', 2)],
+        )),
+    ]
+
+    def setUp(self):
+        self.server_id = self.server_information['server_id']
+        database_info = parent_node_dict["database"][-1]
+        self.db_name = database_info["db_name"]
+        self.db_id = database_info["db_id"]
+        db_con = database_utils.connect_database(self,
+                                                 test_utils.SERVER_GROUP,
+                                                 self.server_id,
+                                                 self.db_id)
+        if not db_con["info"] == "Database connected.":
+            raise Exception("Could not connect to the database.")
+
+        self.table = "test_copy_import_%s" % (str(uuid.uuid4())[1:8])
+        test_utils.create_table_with_query(
+            self.server, self.db_name,
+            """CREATE TABLE {0} (id integer PRIMARY KEY, name text,
+            qty integer, note text DEFAULT 'none',
+            total integer GENERATED ALWAYS AS (qty * 2) STORED);
+            INSERT INTO {0} (id, name, qty) VALUES (1, 'one', 1),
+            (2, 'two', 2);""".format(
+                self.table))
+
+        self.connection = test_utils.get_db_connection(
+            self.db_name,
+            self.server['username'],
+            self.server['db_password'],
+            self.server['host'],
+            self.server['port']
+        )
+        pg_cursor = self.connection.cursor()
+        pg_cursor.execute("""SELECT oid FROM pg_catalog.pg_class WHERE
+         relname = '%s' AND relkind IN ('r','s','t')""" % self.table)
+        table_id = pg_cursor.fetchone()[0]
+
+        # Initialize View/Edit Data
+        self.trans_id = str(secrets.choice(range(1, 9999999)))
+        url = '/sqleditor/initialize/viewdata/{0}/3/table/{1}/{2}/{3}/{4}' \
+            .format(self.trans_id, test_utils.SERVER_GROUP, self.server_id,
+                    self.db_id, table_id)
+        response = self.tester.post(url)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.tester.get(
+            '/sqleditor/view_data/start/{0}'.format(self.trans_id))
+        self.assertEqual(response.status_code, 200)
+        response = async_poll(tester=self.tester,
+                              poll_url='/sqleditor/poll/{0}'.format(
+                                  self.trans_id))
+        self.assertEqual(response.status_code, 200)
+
+    def _post_import(self, data):
+        return self.tester.post(
+            '/sqleditor/copy_import/{0}'.format(self.trans_id),
+            query_string=self.params, data=data, content_type='text/csv')
+
+    def _get_events(self, response):
+        return [json.loads(line[6:])
+                for line in response.data.decode('utf-8').splitlines()
+                if line.startswith('data: ')]
+
+    def _interrupt_import(self):
+        """
+        Import rows the upload of which is cut short: the import is rolled
+        back, and the connection is left as it was.
+        """
+        def read_chunks(stream):
+            yield b'10,ten,10\n'
+            raise ClientDisconnected()
+
+        with patch('pgadmin.tools.sqleditor.read_chunks',
+                   side_effect=read_chunks):
+            response = self._post_import(self.data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get_events(response)[-1]['type'], 'error')
+
+    def runTest(self):
+        if getattr(self, 'interrupted', False):
+            self._interrupt_import()
+
+        response = self._post_import(self.data)
+
+        if self.expected_status is None:
+            self.assertEqual(response.status_code, 400)
+        else:
+            self.assertEqual(response.status_code, 200)
+            events = self._get_events(response)
+            complete = events[-1]
+            self.assertEqual(complete['type'], 'complete')
+            self.assertEqual(complete['status'], self.expected_status,
+                             complete['message'])
+            if self.expected_status:
+                self.assertEqual(complete['rows_copied'],
+                                 self.data.count('\n') -
+                                 (1 if self.params.get('header') else 0))
+
+        pg_cursor = self.connection.cursor()
+        pg_cursor.execute('SELECT {0} FROM {1} ORDER BY id'.format(
+            getattr(self, 'select', 'id, name, qty'), self.table))
+        self.assertEqual([tuple(row) for row in pg_cursor.fetchall()],
+                         self.expected_rows)
+
+    def tearDown(self):
+        # Close View/Edit Data
+        response = self.tester.delete(
+            '/sqleditor/close/{0}'.format(self.trans_id))
+        self.assertEqual(response.status_code, 200)
+
+        self.connection.close()
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
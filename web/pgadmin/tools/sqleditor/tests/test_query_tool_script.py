@@ -0,0 +1,110 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import secrets
+
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils as utils
+
+SCRIPT = """
+CREATE TEMPORARY TABLE test_script_{0} (id int);
+INSERT INTO test_script_{0} SELECT generate_series(1, 10);
+DO $$
+BEGIN
+    RAISE NOTICE 'Hello, world!';
+END $$;
+SELECT 1/0;
+UPDATE test_script_{0} SET id = id + 1;
+"""
+
+
+class TestQueryToolScript(BaseTestGenerator):
+    """ This class will test running scripts in the query tool. """
+    scenarios = [
+        ('Run a script, stopping at the first error', dict(
+            on_error='stop',
+            expected_status='Error',
+            expected_messages=['CREATE TABLE', 'INSERT 0 10', 'DO',
+                               None],
+        )),
+        ('Run a script, continuing after an error', dict(
+            on_error='continue',
+            expected_status='Error',
+            expected_messages=['CREATE TABLE', 'INSERT 0 10', 'DO',
+                               None, 'UPDATE 10'],
+        )),
+    ]
+
+    def setUp(self):
+        database_info = parent_node_dict["database"][-1]
+        self.server_id = database_info["server_id"]
+        self.db_id = database_info["db_id"]
+        db_con = database_utils.connect_database(self,
+                                                 utils.SERVER_GROUP,
+                                                 self.server_id,
+                                                 self.db_id)
+        if not db_con["info"] == "Database connected.":
+            raise Exception("Could not connect to the database.")
+
+        # Initialize query tool
+        self.trans_id = str(secrets.choice(range(1, 9999999)))
+        url = '/sqleditor/initialize/sqleditor/{0}/{1}/{2}/{3}'.format(
+            self.trans_id, utils.SERVER_GROUP, self.server_id, self.db_id)
+        response = self.tester.post(url, data=json.dumps({
+            "dbname": database_info["db_name"]
+        }))
+        self.assertEqual(response.status_code, 200)
+
+    def runTest(self):
+        url = '/sqleditor/query_tool/script/{0}'.format(self.trans_id)
+        response = self.tester.post(
+            url, data=json.dumps({
+                'sql': SCRIPT.format(self.trans_id),
+                'on_error': self.on_error
+            }), content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+
+        events = [json.loads(line[len('data: '):])
+                  for line in response.data.decode('utf-8').split('\n')
+                  if line.startswith('data: ')]
+        results = [r for e in events if e['type'] == 'results'
+                   for r in e['results']]
+        complete = events[-1]
+
+        self.assertEqual(complete['type'], 'complete')
+        self.assertEqual(complete['status'], self.expected_status)
+        self.assertEqual(complete['executed'],
+                         len(self.expected_messages))
+        self.assertEqual(complete['failed'], 1)
+
+        self.assertEqual([r['message'] if r['status'] else None
+                          for r in results], self.expected_messages)
+        self.assertEqual([r['line'] for r in results][:4], [2, 3, 4, 8])
+        self.assertEqual(results[1]['rows_affected'], 10)
+        self.assertIn('Hello, world!', results[2]['notices'])
+        self.assertIn('division by zero', results[3]['message'])
+
+        # Invalid error handling mode
+        response = self.tester.post(
+            url, data=json.dumps({'sql': 'SELECT 1', 'on_error': 'retry'}),
+            content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def tearDown(self):
+        # Close query tool
+        url = '/sqleditor/close/{0}'.format(self.trans_id)
+        response = self.tester.delete(url)
+        self.assertEqual(response.status_code, 200)
+
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
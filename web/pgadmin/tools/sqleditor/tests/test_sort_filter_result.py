@@ -0,0 +1,193 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import csv
+import json
+import math
+import secrets
+
+from pgadmin.browser.server_groups.servers.databases.tests import utils as \
+    database_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression import parent_node_dict
+from regression.python_test_utils import test_utils as utils
+from .execute_query_test_utils import execute_query
+
+QUERY = """
+SELECT id, CASE WHEN id % 4 = 0 THEN NULL ELSE id % 3 END AS grp,
+    (DATE '2024-01-01' + id) AS day, 'row ' || id AS label
+FROM generate_series(1, 12) id
+"""
+
+
+class TestSortFilterResult(BaseTestGenerator):
+    """
+    This class will test sorting and filtering the result of a query, in
+    memory, and fetching it with fetch_window.
+    """
+    scenarios = [
+        ('Sort on two columns', dict(
+            data={'sort': [{'pos': 1, 'name': 'grp', 'order': 'desc'},
+                           {'pos': 2, 'name': 'day', 'order': 'asc'}]},
+            expected_ids=[4, 8, 12, 2, 5, 11, 1, 7, 10, 3, 6, 9],
+        )),
+        ('Filter and sort', dict(
+            data={'sort': [{'pos': 0, 'name': 'id', 'order': 'desc'}],
+                  'filter': [{'pos': 1, 'name': 'grp', 'operator': '>=',
+                              'value': '1'},
+                             {'pos': 2, 'name': 'day', 'operator': '<',
+                              'value': '2024-01-10'}]},
+            expected_ids=[7, 5, 2, 1],
+        )),
+        ('Filter on text', dict(
+            data={'filter': [{'pos': 3, 'name': 'label',
+                              'operator': 'contains', 'value': 'ROW 1'}]},
+            expected_ids=[1, 10, 11, 12],
+        )),
+        ('Sort on text, as per the collation', dict(
+            query="""
+            SELECT id, id % 3 AS grp, (DATE '2024-01-01' + id) AS day,
+                label
+            FROM (VALUES (1, 'Zebra'), (2, 'apple'), (3, 'Äpfel'),
+                (4, 'zebra'), (5, NULL), (6, 'Apple'), (7, 'éclair'),
+                (8, 'Eclair'), (9, 'apple')) AS vals(id, label)
+            """,
+            data={'sort': [{'pos': 3, 'name': 'label', 'order': 'asc'}]},
+            expected_ids=None,
+        )),
+        ('Filter on text with a comparison, as per the collation', dict(
+            query="""
+            SELECT id, id % 3 AS grp, (DATE '2024-01-01' + id) AS day,
+                label
+            FROM (VALUES (1, 'Zebra'), (2, 'apple'), (3, 'Äpfel'),
+                (4, 'zebra'), (5, NULL), (6, 'Apple'), (7, 'éclair'),
+                (8, 'Eclair'), (9, 'apple')) AS vals(id, label)
+            """,
+            data={'filter': [{'pos': 3, 'name': 'label', 'operator': '<',
+                              'value': 'b'}]},
+            expected_sql="WHERE label < 'b' ORDER BY id",
+            expected_ids=None,
+        )),
+        ('Remove the sort and filter', dict(
+            data={},
+            expected_ids=list(range(1, 13)),
+        )),
+    ]
+
+    def setUp(self):
+        database_info = parent_node_dict["database"][-1]
+        self.db_name = database_info["db_name"]
+        self.server_id = database_info["server_id"]
+        self.db_id = database_info["db_id"]
+        db_con = database_utils.connect_database(self,
+                                                 utils.SERVER_GROUP,
+                                                 self.server_id,
+                                                 self.db_id)
+        if not db_con["info"] == "Database connected.":
+            raise Exception("Could not connect to the database.")
+
+        # Initialize query tool
+        self.trans_id = str(secrets.choice(range(1, 9999999)))
+        url = '/sqleditor/initialize/sqleditor/{0}/{1}/{2}/{3}'.format(
+            self.trans_id, utils.SERVER_GROUP, self.server_id, self.db_id)
+        response = self.tester.post(url, data=json.dumps({
+            "dbname": database_info["db_name"]
+        }))
+        self.assertEqual(response.status_code, 200)
+
+    def _get_expected_ids(self, query):
+        """
+        Return the ids of the rows, as sorted/filtered by the server, i.e.
+        as per the collation of the database.
+        """
+        connection = utils.get_db_connection(
+            self.db_name,
+            self.server['username'],
+            self.server['db_password'],
+            self.server['host'],
+            self.server['port'],
+            self.server['sslmode'])
+        try:
+            pg_cursor = connection.cursor()
+            pg_cursor.execute('SELECT id FROM ({0}) AS q {1}'.format(
+                query, getattr(self, 'expected_sql',
+                               'ORDER BY label, id')))
+            return [row[0] for row in pg_cursor.fetchall()]
+        finally:
+            connection.close()
+
+    def runTest(self):
+        query = getattr(self, 'query', QUERY)
+        if self.expected_ids is None:
+            self.expected_ids = self._get_expected_ids(query)
+
+        is_success, _ = execute_query(
+            tester=self.tester, query=query,
+            start_query_tool_url='/sqleditor/query_tool/start/{0}'.format(
+                self.trans_id),
+            poll_url='/sqleditor/poll/{0}'.format(self.trans_id))
+        self.assertTrue(is_success)
+
+        url = '/sqleditor/sort_filter_result/{0}'.format(self.trans_id)
+        response = self.tester.post(url, data=json.dumps(self.data),
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        response_data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertTrue(response_data['status'])
+        self.assertFalse(response_data['result']['reexecute'])
+        self.assertEqual(response_data['result']['row_count'],
+                         len(self.expected_ids))
+
+        # Fetch the sorted rows, page by page
+        ids = []
+        for from_rownum in range(1, len(self.expected_ids) + 1, 5):
+            response = self.tester.get(
+                '/sqleditor/fetch_window/{0}/{1}/{2}'.format(
+                    self.trans_id, from_rownum, from_rownum + 4))
+            self.assertEqual(response.status_code, 200)
+            response_data = json.loads(response.data.decode('utf-8'))['data']
+            self.assertEqual(response_data['pagination']['page_count'],
+                             math.ceil(len(self.expected_ids) / 5))
+            ids += [int(row[0]) for row in response_data['result']]
+        self.assertEqual(ids, self.expected_ids)
+
+        # All the rows, and the first ones, are fetched in that order too
+        for limit, expected_ids in ((100, self.expected_ids),
+                                    (3, self.expected_ids[:3])):
+            response = self.tester.get(
+                '/sqleditor/fetch_all_from_start/{0}/{1}'.format(
+                    self.trans_id, limit))
+            self.assertEqual(response.status_code, 200)
+            response_data = json.loads(response.data.decode('utf-8'))['data']
+            self.assertEqual([int(row[0]) for row in response_data['result']],
+                             expected_ids)
+
+        # And downloaded in that order
+        response = self.tester.post(
+            '/sqleditor/query_tool/download/{0}'.format(self.trans_id),
+            data={'query': query})
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.reader(response.get_data(as_text=True).splitlines()))
+        self.assertEqual(rows[0][0], 'id')
+        self.assertEqual([int(row[0]) for row in rows[1:]],
+                         self.expected_ids)
+
+        # An invalid sort order
+        response = self.tester.post(
+            url, data=json.dumps({'sort': [{'pos': 0, 'order': 'up'}]}),
+            content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def tearDown(self):
+        # Close query tool
+        url = '/sqleditor/close/{0}'.format(self.trans_id)
+        response = self.tester.delete(url)
+        self.assertEqual(response.status_code, 200)
+
+        database_utils.disconnect_database(self, self.server_id, self.db_id)
@@ -0,0 +1,367 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Import CSV data into the table of a View/Edit Data tool, in process, by
+streaming it to the server with COPY FROM STDIN.
+"""
+
+import time
+
+from flask import render_template
+from flask_babel import gettext
+
+from pgadmin.tools.sqleditor.utils.constant_definition import \
+    TX_STATUS_IDLE
+
+IMPORT_MODE_INSERT = 'insert'
+IMPORT_MODE_UPSERT = 'upsert'
+IMPORT_MODES = (IMPORT_MODE_INSERT, IMPORT_MODE_UPSERT)
+
+# Size (in bytes) of the chunks of data read from the client and sent to the
+# server, one at a time.
+COPY_CHUNK_SIZE = 256 * 1024
+
+# Minimum time (in seconds) between two progress events
+COPY_PROGRESS_INTERVAL = 0.5
+
+# Temporary table the rows are copied into, before being merged into the
+# table, when they cannot be copied into the table as they are.
+STAGING_TABLE = 'pgadmin_import_staging'
+
+IMPORT_SAVEPOINT = 'copy_import'
+
+
+def read_chunks(stream, chunk_size=COPY_CHUNK_SIZE):
+    """
+    Read a stream (e.g. the body of the request) chunk by chunk, so that the
+    data is never held in memory as a whole.
+    """
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+class CopyImporter:
+    """
+    Imports rows in the CSV format into the table of a View/Edit Data tool,
+    on the connection of the tool, using COPY FROM STDIN: the data is
+    streamed to the server as it is received, and parsed by the server,
+    hence the cost of an import is the one of the COPY, whatever the number
+    of rows.
+
+    The fields of the records are the given columns of the table, in order.
+    As in the data grid, the generated columns are not imported, and the
+    columns having a default value get it when their field is NULL.
+
+    When all the fields are inserted as they are, the rows are copied into
+    the table directly. Otherwise, they are copied into a temporary staging
+    table first, and then inserted into the table, one INSERT per set of
+    defaulted columns being NULL, so that these columns are left out (and
+    get their default value). In the upsert mode, the existing rows having
+    the same primary key are updated (INSERT ... ON CONFLICT DO UPDATE), the
+    last record winning when several records have the same primary key.
+
+    The import is atomic: it is run in its own transaction, or under a
+    savepoint when a transaction is already in progress, and rolled back as
+    a whole if any of the rows cannot be imported.
+    """
+
+    def __init__(self, conn, command_obj, columns, primary_keys=None,
+                 mode=IMPORT_MODE_INSERT, options=None):
+        """
+        Args:
+            conn: connection of the tool
+            command_obj: command object of the tool (a TableCommand)
+            columns: names of the columns of the table, in the order of the
+                fields of the CSV records
+            primary_keys: names of the primary key columns of the table
+            mode: one of IMPORT_MODES
+            options: CSV format: {'header': False, 'delimiter': ',',
+                'quote': '"', 'null': '', 'encoding': None}
+        """
+        self.conn = conn
+        self.command_obj = command_obj
+        self.columns = list(columns)
+        self.primary_keys = list(primary_keys or [])
+        self.mode = mode
+        self.options = options or {}
+
+        # Set by validate(): the columns inserted into the table, and those
+        # of them having a default value.
+        self.insert_columns = list(self.columns)
+        self.default_columns = []
+
+    @property
+    def use_staging(self):
+        return self.mode == IMPORT_MODE_UPSERT or \
+            bool(self.default_columns) or \
+            len(self.insert_columns) != len(self.columns)
+
+    def validate(self):
+        """
+        Check that the import can be run.
+
+        Returns:
+            (status, error message)
+        """
+        if self.mode not in IMPORT_MODES:
+            return False, gettext('Invalid import mode.')
+        if not self.columns:
+            return False, gettext('Please provide the columns to import.')
+        if len(set(self.columns)) != len(self.columns):
+            return False, gettext('A column cannot be imported twice.')
+
+        for option in ('delimiter', 'quote'):
+            value = self.options.get(option)
+            if value is not None and \
+                    (not isinstance(value, str) or len(value) != 1):
+                return False, gettext(
+                    'The {0} must be a single character.').format(option)
+
+        status, res = self.conn.execute_dict(self._render(
+            'copy_columns.sql', obj_id=self.command_obj.obj_id))
+        if not status:
+            return False, res
+        table_columns = {row['name']: row for row in res['rows']}
+
+        for col in self.columns:
+            if col not in table_columns:
+                return False, gettext(
+                    'Column "{0}" not found in the table.').format(col)
+
+        self.insert_columns = [
+            col for col in self.columns
+            if not table_columns[col]['is_generated']]
+        self.default_columns = [
+            col for col in self.insert_columns
+            if table_columns[col]['has_default_val']]
+        if not self.insert_columns:
+            return False, gettext('Please provide the columns to import.')
+
+        if self.mode == IMPORT_MODE_UPSERT:
+            if not self.primary_keys:
+                return False, gettext(
+                    'No primary key found for this object, so unable to '
+                    'update the existing rows.')
+            if any(pk not in self.insert_columns
+                   for pk in self.primary_keys):
+                return False, gettext(
+                    'All the primary key columns must be imported to update '
+                    'the existing rows.')
+
+        return True, None
+
+    def _render(self, template, **kwargs):
+        kwargs.setdefault('columns', self.columns)
+        return render_template(
+            '/'.join([self.command_obj.sql_path, template]),
+            conn=self.conn,
+            nsp_name=self.command_obj.nsp_name,
+            object_name=self.command_obj.object_name,
+            staging_table=STAGING_TABLE if self.use_staging else None,
+            **kwargs
+        )
+
+    def copy_sql(self):
+        options = self.options
+        return self._render(
+            'copy_from.sql',
+            header=bool(options.get('header')),
+            delimiter=options.get('delimiter') or ',',
+            quote=options.get('quote') or '"',
+            null_string=options.get('null') or '',
+            encoding=options.get('encoding')
+        )
+
+    def merge_sql(self, null_columns, row_count):
+        """
+        Returns the query inserting the staged rows, in which the given
+        defaulted columns (and only those) are NULL, into the table.
+        """
+        columns = [col for col in self.insert_columns
+                   if col not in null_columns]
+        primary_keys = self.primary_keys \
+            if self.mode == IMPORT_MODE_UPSERT else []
+        return self._render(
+            'copy_merge.sql',
+            columns=columns,
+            default_columns=self.default_columns,
+            null_columns=null_columns,
+            primary_keys=primary_keys,
+            update_columns=[col for col in columns
+                            if col not in primary_keys],
+            row_count=row_count
+        )
+
+    def run(self, chunks, total_bytes=None, auto_commit=True):
+        """
+        Run the import.
+
+        Args:
+            chunks: iterator producing the CSV data
+            total_bytes: size of the data, if known, to report the progress
+            auto_commit: if the import should be committed, when it is not
+                run in a transaction already in progress
+
+        Yields:
+            {'type': 'progress', 'stage': 'copy'/'merge',
+             'bytes_sent': ..., 'total_bytes': ...}, while the import runs
+
+            {'type': 'complete', 'status': True/False, 'message': ...,
+             'rows_copied': ..., 'rows_affected': ...,
+             'transaction_status': ...}, at the end
+        """
+        conn = self.conn
+        start = time.monotonic()
+
+        in_transaction = conn.transaction_status() != TX_STATUS_IDLE
+        status, result = conn.execute_void(
+            'SAVEPOINT {0};'.format(IMPORT_SAVEPOINT) if in_transaction
+            else 'BEGIN;'
+        )
+        if not status:
+            yield self._complete(False, result)
+            return
+
+        rollback = 'ROLLBACK TO SAVEPOINT {0};'.format(IMPORT_SAVEPOINT) \
+            if in_transaction else 'ROLLBACK;'
+        try:
+            status, result, rows_copied, rows_affected = yield from \
+                self._import(chunks, total_bytes)
+        except BaseException:
+            # The client has gone away (or the upload has been cut short)
+            # while the data was being imported, or the import has failed:
+            # do not leave the connection in the transaction of the import.
+            conn.execute_void(rollback)
+            raise
+
+        if not status:
+            conn.execute_void(rollback)
+            yield self._complete(False, result)
+            return
+
+        if in_transaction:
+            status, result = conn.execute_void(
+                'RELEASE SAVEPOINT {0};'.format(IMPORT_SAVEPOINT))
+        elif auto_commit:
+            status, result = conn.execute_void('COMMIT;')
+        if not status:
+            yield self._complete(False, result)
+            return
+
+        yield self._complete(
+            True,
+            gettext('{0} row(s) imported in {1} msec.').format(
+                rows_affected, round((time.monotonic() - start) * 1000)),
+            rows_copied, rows_affected
+        )
+
+    def _import(self, chunks, total_bytes):
+        """
+        Copy the data, and merge it into the table when it is staged.
+
+        Yields the progress events, and returns (status, error message,
+        number of rows copied, number of rows inserted/updated).
+        """
+        conn = self.conn
+
+        if self.use_staging:
+            status, result = conn.execute_void(self._render('copy_stage.sql'))
+            if not status:
+                return False, result, 0, 0
+
+        last_progress = time.monotonic()
+        copy = conn.copy_from(self.copy_sql(), chunks)
+        try:
+            for status, result in copy:
+                if not status:
+                    return False, result, 0, 0
+
+                now = time.monotonic()
+                if now - last_progress >= COPY_PROGRESS_INTERVAL:
+                    yield {'type': 'progress', 'stage': 'copy',
+                           'bytes_sent': result, 'total_bytes': total_bytes}
+                    last_progress = now
+        finally:
+            # Abort the copy on the server, if it has not been finished
+            copy.close()
+
+        rows_copied = conn.rows_affected()
+        if not self.use_staging:
+            return True, None, rows_copied, rows_copied
+
+        yield {'type': 'progress', 'stage': 'merge',
+               'bytes_sent': total_bytes, 'total_bytes': total_bytes}
+
+        status, rows_affected = self._merge()
+        if not status:
+            return False, rows_affected, rows_copied, 0
+
+        status, result = conn.execute_void(
+            self._render('copy_stage.sql', drop=True))
+        if not status:
+            return False, result, rows_copied, 0
+
+        return True, None, rows_copied, rows_affected
+
+    def _merge(self):
+        """
+        Insert (or upsert) the staged rows into the table.
+
+        Returns:
+            (status, number of rows inserted/updated or error message)
+        """
+        conn = self.conn
+
+        if self.mode == IMPORT_MODE_UPSERT:
+            status, result = conn.execute_void(self._render(
+                'copy_dedupe.sql', primary_keys=self.primary_keys))
+            if not status:
+                return False, result
+
+        status, res = conn.execute_dict(self._render(
+            'copy_null_groups.sql', default_columns=self.default_columns))
+        if not status:
+            return False, res
+
+        rows_affected = 0
+        for group in res['rows']:
+            # The counts (bigint) are fetched as strings
+            row_count = int(group['row_count'])
+            if not row_count:
+                continue
+            null_columns = [
+                col for idx, col in enumerate(self.default_columns)
+                if group['is_null_{0}'.format(idx)]]
+            sql = self.merge_sql(null_columns, row_count)
+
+            if len(null_columns) == len(self.insert_columns):
+                # All the columns get their default value
+                status, result = conn.execute_void(sql)
+                result = row_count
+            else:
+                status, result = conn.execute_scalar(sql)
+            if not status:
+                return False, result
+            rows_affected += int(result)
+
+        return True, rows_affected
+
+    def _complete(self, status, message, rows_copied=0, rows_affected=0):
+        return {
+            'type': 'complete',
+            'status': status,
+            'message': message,
+            'rows_copied': rows_copied,
+            'rows_affected': rows_affected,
+            'transaction_status': self.conn.transaction_status(),
+        }
@@ -0,0 +1,353 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Sort and filter the result of a query in memory, without running the query
+again.
+"""
+
+import operator
+from decimal import Decimal, InvalidOperation
+
+import psycopg
+from flask import render_template
+from flask_babel import gettext
+from psycopg.types.datetime import DateLoader, TimeLoader, TimetzLoader, \
+    TimestampLoader, TimestamptzLoader, IntervalLoader
+
+from pgadmin.tools.sqleditor.utils.constant_definition import \
+    TX_STATUS_INERROR
+
+SORT_ORDERS = ('asc', 'desc')
+
+COMPARISON_OPERATORS = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+IS_NULL = 'is null'
+IS_NOT_NULL = 'is not null'
+CONTAINS = 'contains'
+FILTER_OPERATORS = tuple(COMPARISON_OPERATORS) + \
+    (IS_NULL, IS_NOT_NULL, CONTAINS)
+
+# smallint, integer, bigint, oid
+INTEGER_TYPES = (21, 23, 20, 26)
+# real, double precision
+FLOAT_TYPES = (700, 701)
+NUMERIC_TYPE = 1700
+BOOLEAN_TYPE = 16
+# text, character varying, character: ordered by the server, as per the
+# default collation of the database
+COLLATABLE_TYPES = (25, 1043, 1042)
+DATETIME_LOADERS = {
+    1082: DateLoader,
+    1083: TimeLoader,
+    1266: TimetzLoader,
+    1114: TimestampLoader,
+    1184: TimestamptzLoader,
+    1186: IntervalLoader,
+}
+
+# The keys are (rank, value) pairs, so that NaN and infinite values are
+# ordered as PostgreSQL does, before/after all the other values.
+_NEGATIVE_INFINITY_KEY = (0, 0)
+_POSITIVE_INFINITY_KEY = (2, 0)
+
+
+class ResultViewError(Exception):
+    """
+    Raised when the result cannot be sorted/filtered in memory, e.g. when
+    one of its values cannot be compared as PostgreSQL does.
+    """
+    pass
+
+
+def _float_key(value):
+    value = float(value)
+    if value != value:
+        # NaN is greater than any other value in PostgreSQL
+        return _POSITIVE_INFINITY_KEY
+    return 1, value
+
+
+def _numeric_key(value):
+    value = Decimal(value.decode('ascii'))
+    if value.is_nan():
+        return _POSITIVE_INFINITY_KEY
+    return 1, value
+
+
+def _datetime_key(loader):
+    def key(value):
+        if value == b'infinity':
+            return _POSITIVE_INFINITY_KEY
+        if value == b'-infinity':
+            return _NEGATIVE_INFINITY_KEY
+        return 1, loader.load(value)
+    return key
+
+
+def get_sort_key(type_code, context=None):
+    """
+    Return the function giving the sort key of a (not NULL) value of the
+    given type, as sent by the server in the text format.
+
+    The numbers, booleans, dates and times are compared by value. The other
+    values are compared on their text representation, byte by byte: i.e.
+    by code point for a UTF-8 database, like the "C" collation would. The
+    text values must be compared with collation_keys() instead.
+
+    Args:
+        type_code: oid of the type of the values
+        context: connection used to parse the dates and times (as per its
+            DateStyle/IntervalStyle)
+    """
+    if type_code in INTEGER_TYPES:
+        return lambda value: (1, int(value))
+    if type_code in FLOAT_TYPES:
+        return _float_key
+    if type_code == NUMERIC_TYPE:
+        return _numeric_key
+    if type_code == BOOLEAN_TYPE:
+        return lambda value: (1, value == b't')
+    if type_code in DATETIME_LOADERS:
+        return _datetime_key(
+            DATETIME_LOADERS[type_code](type_code, context))
+    return lambda value: (1, value)
+
+
+def column_keys(type_code, values, context=None):
+    """
+    Return the sort keys of all the values of a column, None for NULL.
+    """
+    key = get_sort_key(type_code, context)
+    try:
+        return [None if value is None else key(value) for value in values]
+    except (ValueError, InvalidOperation, psycopg.DataError) as e:
+        raise ResultViewError(gettext(
+            "The values of the column cannot be compared: {0}").format(e))
+
+
+def collation_keys(conn, values, encoding='utf-8'):
+    """
+    Return the {value: sort key} of the (not NULL) values of a text column,
+    the values being ranked by the server, as ORDER BY does under the
+    default collation of the database (the collation of the column itself
+    is not known from the result).
+    """
+    distinct = list({value for value in values if value is not None})
+    if not distinct:
+        return {}
+
+    if conn.transaction_status() == TX_STATUS_INERROR:
+        raise ResultViewError(gettext(
+            "The text values cannot be compared, as the current transaction "
+            "is aborted."))
+
+    try:
+        params = {'values': [value.decode(encoding) for value in distinct]}
+    except UnicodeDecodeError as e:
+        raise ResultViewError(gettext(
+            "The values of the column cannot be compared: {0}").format(e))
+
+    status, res = conn.execute_dict(
+        render_template('sqleditor/sql/default/collation_ranks.sql'),
+        params)
+    if not status:
+        raise ResultViewError(res)
+
+    # The ranks (bigint) are fetched as strings
+    return {value: (1, int(row['rank']))
+            for value, row in zip(distinct, res['rows'])}
+
+
+def sort_rows(order, keys, descending=False):
+    """
+    Sort the rows in the given order on the keys of a column, in place. The
+    NULLs come last in ascending order, and first in descending order, as
+    in PostgreSQL.
+
+    The sort is stable, hence the rows can be sorted on several columns by
+    sorting them on each column, from the last one to the first one.
+    """
+    order.sort(key=lambda row: (keys[row] is None, keys[row] or ()),
+               reverse=descending)
+
+
+def filter_rows(order, keys, values, oper, operand=None, encoding='utf-8'):
+    """
+    Return the rows of the given order matching a condition on a column.
+
+    Args:
+        order: positions of the rows to filter
+        keys: sort keys of the values of the column
+        values: values of the column, as sent by the server
+        oper: one of FILTER_OPERATORS
+        operand: sort key of the value compared to, for a comparison
+            operator, or text to look for, for CONTAINS
+        encoding: encoding of the values
+    """
+    if oper == IS_NULL:
+        return [row for row in order if keys[row] is None]
+    if oper == IS_NOT_NULL:
+        return [row for row in order if keys[row] is not None]
+    if oper == CONTAINS:
+        # Case insensitive search on the text representation of the values
+        operand = operand.casefold()
+        return [row for row in order
+                if values[row] is not None and
+                operand in values[row].decode(encoding).casefold()]
+
+    # A comparison with NULL is never true
+    compare = COMPARISON_OPERATORS[oper]
+    return [row for row in order
+            if keys[row] is not None and compare(keys[row], operand)]
+
+
+def sort_filter_result(conn, sort=None, filters=None):
+    """
+    Compute the order of the rows of the result of the last query run on
+    the connection, sorted and filtered as requested: only the columns used
+    are read, as a whole, from the result already fetched. The values of the
+    text columns are ranked by the server (see collation_keys()), so that
+    they are ordered as ORDER BY would.
+
+    Args:
+        conn: connection the query has been run on
+        sort: [{'pos': <position of the column>, 'order': 'asc'/'desc'}]
+        filters: [{'pos': <position of the column>,
+                   'operator': <one of FILTER_OPERATORS>,
+                   'value': <text of the value compared to>}], all the
+            conditions must be true.
+
+    Returns:
+        (status, positions of the rows or error message)
+    """
+    sort = sort or []
+    filters = filters or []
+
+    positions = sorted({int(s['pos']) for s in sort} |
+                       {int(f['pos']) for f in filters})
+    if any(pos < 0 for pos in positions):
+        return False, gettext("Column not found in the result.")
+
+    status, columns = conn.async_fetch_columns(positions)
+    if not status:
+        return False, columns
+    columns = dict(zip(positions, columns))
+
+    context = conn.conn
+    encoding = conn.python_encoding
+    keys = {}
+    ranks = {}
+
+    # The text values compared to are ranked along with those of the column
+    operands = {}
+    for condition in filters:
+        if condition['operator'] in COMPARISON_OPERATORS and \
+                condition.get('value') is not None:
+            operands.setdefault(int(condition['pos']), []).append(
+                str(condition['value']).encode(encoding))
+
+    def get_keys(pos):
+        if pos not in keys:
+            type_code, values = columns[pos]
+            if type_code in COLLATABLE_TYPES:
+                ranks[pos] = collation_keys(
+                    conn, values + operands.get(pos, []), encoding)
+                keys[pos] = [None if value is None else ranks[pos][value]
+                             for value in values]
+            else:
+                keys[pos] = column_keys(type_code, values, context)
+        return keys[pos]
+
+    def get_operand_key(pos, operand):
+        type_code = columns[pos][0]
+        if type_code in COLLATABLE_TYPES:
+            get_keys(pos)
+            return ranks[pos][operand]
+        return column_keys(type_code, [operand], context)[0]
+
+    try:
+        order = list(range(conn.total_rows))
+
+        for condition in filters:
+            pos = int(condition['pos'])
+            oper = condition['operator']
+            operand = condition.get('value')
+            values = columns[pos][1]
+
+            if oper in COMPARISON_OPERATORS:
+                if operand is None:
+                    # Nothing is equal, or not, to NULL
+                    order = []
+                    continue
+                operand = get_operand_key(
+                    pos, str(operand).encode(encoding))
+            elif oper == CONTAINS:
+                operand = '' if operand is None else str(operand)
+
+            order = filter_rows(order, get_keys(pos), values, oper,
+                                operand, encoding)
+
+        for item in reversed(sort):
+            sort_rows(order, get_keys(int(item['pos'])),
+                      item['order'] == 'desc')
+    except ResultViewError as e:
+        return False, str(e)
+
+    return True, order
+
+
+def sort_filter_sql(driver, conn, sort=None, filters=None):
+    """
+    Translate the sort and filters into the data sorting and the row filter
+    of a View/Edit Data command, for a result which is not fully fetched,
+    hence has to be sorted/filtered by running the query again.
+
+    Args:
+        driver: database driver, used to quote the identifiers and literals
+        conn: connection
+        sort: [{'name': <name of the column>, 'order': 'asc'/'desc'}]
+        filters: [{'name': <name of the column>,
+                   'operator': <one of FILTER_OPERATORS>,
+                   'value': <text of the value compared to>}]
+
+    Returns:
+        (data sorting, row filter)
+    """
+    data_sorting = [{'name': s['name'], 'order': s['order']}
+                    for s in sort or []]
+
+    conditions = []
+    for condition in filters or []:
+        column = driver.qtIdent(conn, condition['name'])
+        oper = condition['operator']
+        value = condition.get('value')
+
+        if oper == IS_NULL:
+            conditions.append(column + ' IS NULL')
+        elif oper == IS_NOT_NULL:
+            conditions.append(column + ' IS NOT NULL')
+        elif oper == CONTAINS:
+            pattern = '%' + str(value or '').replace('\\', '\\\\').replace(
+                '%', '\\%').replace('_', '\\_') + '%'
+            conditions.append('CAST({0} AS text) ILIKE {1}'.format(
+                column, driver.qtLiteral(pattern, conn)))
+        elif value is None:
+            conditions.append('false')
+        else:
+            conditions.append('{0} {1} {2}'.format(
+                column, oper, driver.qtLiteral(value, conn)))
+
+    return data_sorting, ' AND '.join(conditions) or None
@@ -0,0 +1,196 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Run a script of SQL statements one statement after the other."""
+
+import time
+
+from flask_babel import gettext
+from sqlparse import engine, tokens as sql_tokens
+
+from pgadmin.tools.sqleditor.utils.constant_definition import \
+    TX_STATUS_IDLE, TX_STATUS_INERROR
+from pgadmin.tools.sqleditor.utils.is_begin_required import is_begin_required
+
+ON_ERROR_STOP = 'stop'
+ON_ERROR_CONTINUE = 'continue'
+
+# Maximum number of statement results sent to the client at once
+SCRIPT_RESULTS_BATCH = 100
+
+# Maximum time (in seconds) the results of the statements already executed
+# are held back, waiting for the batch to be full.
+SCRIPT_RESULTS_INTERVAL = 0.5
+
+
+def split_script(script):
+    """
+    Split a script in statements, using sqlparse. The statements are
+    produced one at a time, while the script is being parsed, so that the
+    whole list of statements is never held in memory. Empty statements
+    (e.g. made of comments only) are skipped.
+
+    Yields:
+        (line number of the statement in the script, statement)
+    """
+    line = 1
+    for stmt in engine.FilterStack().run(script):
+        text = str(stmt)
+        stripped = text.lstrip()
+        start = line + text.count('\n', 0, len(text) - len(stripped))
+        line += text.count('\n')
+
+        if any(not token.is_whitespace and
+               token.ttype not in sql_tokens.Comment and
+               not token.match(sql_tokens.Punctuation, ';')
+               for token in stmt.flatten()):
+            yield start, stripped.rstrip()
+
+
+class ScriptRunner:
+    """
+    Runs the statements of a script on the connection of a query tool, one
+    after the other, as psql does: each statement is sent on its own, so
+    that (in auto-commit mode) it is committed on its own, and the outcome
+    of every statement is known.
+
+    The transaction settings of the query tool are honoured: a transaction
+    is started before the first statement when auto-commit is off, and
+    rolled back after a failing statement when auto-rollback is on.
+
+    Only the status of the statements is kept (not the rows they return),
+    and it is handed over to the caller in batches, so the memory used does
+    not depend on the size of the script.
+    """
+
+    def __init__(self, conn, trans_obj, on_error=ON_ERROR_STOP):
+        self.conn = conn
+        self.trans_obj = trans_obj
+        self.on_error = on_error
+        self.aborted = False
+
+    def _is_aborted(self):
+        """
+        Check whether the script has been cancelled, either while a
+        statement was running, or between two statements. The abort flag of
+        the connection is reset by execute_async(), hence it is latched, and
+        checked before each statement.
+        """
+        if self.conn.execution_aborted:
+            self.aborted = True
+        return self.aborted
+
+    def _execute(self, sql):
+        """
+        Execute one statement.
+
+        Returns:
+            (status, status message of the statement or error message,
+            number of rows affected)
+        """
+        conn = self.conn
+
+        if not self.trans_obj.auto_commit and \
+                conn.transaction_status() == TX_STATUS_IDLE and \
+                is_begin_required(sql):
+            conn.execute_void("BEGIN;")
+
+        status, result = conn.execute_async(sql)
+        rows_affected = 0
+        if status:
+            result = conn.status_message()
+            rows_affected = conn.total_rows
+        elif self.trans_obj.auto_rollback and \
+                conn.transaction_status() == TX_STATUS_INERROR:
+            conn.execute_void("ROLLBACK;")
+
+        # Free the rows returned by the statement, if any
+        conn.release_async_cursor()
+
+        return status, result, rows_affected
+
+    def run(self, script):
+        """
+        Run the script.
+
+        Yields:
+            {'type': 'results', 'executed': <number of statements executed>,
+             'results': [<statement result>, ...]}, for each batch of
+            statements, where a statement result is:
+            {'index': ..., 'line': ..., 'status': True/False,
+             'message': <status message, or error>,
+             'rows_affected': ..., 'notices': ..., 'duration': <ms>}
+
+            {'type': 'complete', 'status': 'Success'/'Error'/'Cancel',
+             'message': <summary>, 'executed': ..., 'failed': ...,
+             'rows_affected': ..., 'transaction_status': ...}, at the end
+        """
+        conn = self.conn
+        conn.execution_aborted = False
+
+        results = []
+        executed = failed = rows_affected = 0
+        status = 'Success'
+        last_flush = time.monotonic()
+
+        for line, sql in split_script(script):
+            if self._is_aborted():
+                status = 'Cancel'
+                break
+
+            start = time.monotonic()
+            st, message, rows = self._execute(sql)
+            now = time.monotonic()
+
+            executed += 1
+            rows_affected += max(rows, 0)
+            if not st:
+                failed += 1
+
+            notices = conn.messages()
+            results.append({
+                'index': executed,
+                'line': line,
+                'status': st,
+                'message': message,
+                'rows_affected': rows,
+                'notices': ''.join(notices) if notices else None,
+                'duration': round((now - start) * 1000, 3),
+            })
+
+            if self._is_aborted():
+                status = 'Cancel'
+                break
+            if not st:
+                status = 'Error'
+                if self.on_error == ON_ERROR_STOP:
+                    break
+
+            if len(results) >= SCRIPT_RESULTS_BATCH or \
+                    now - last_flush >= SCRIPT_RESULTS_INTERVAL:
+                yield {'type': 'results', 'executed': executed,
+                       'results': results}
+                results = []
+                last_flush = now
+
+        if results:
+            yield {'type': 'results', 'executed': executed,
+                   'results': results}
+
+        yield {
+            'type': 'complete',
+            'status': status,
+            'message': gettext(
+                '{0} statement(s) executed, {1} failed.'
+            ).format(executed, failed),
+            'executed': executed,
+            'failed': failed,
+            'rows_affected': rows_affected,
+            'transaction_status': conn.transaction_status(),
+        }
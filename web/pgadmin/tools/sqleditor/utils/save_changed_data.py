@@ -15,14 +15,38 @@ from pgadmin.utils.exception import ExecuteError
 
 ignore_type_cast_list = ['character', 'character[]', 'bit', 'bit[]']
 
+# Types used for the values of the columns of the above types, when saving
+# several rows at once: unlike the types of the columns, they do not limit
+# the length of the values (i.e. do not truncate them).
+batch_type_cast = {
+    'character': 'bpchar', 'character[]': 'bpchar[]',
+    'bit': 'varbit', 'bit[]': 'varbit[]'
+}
+
+# Maximum number of rows saved by a single statement
+SAVE_BATCH_SIZE = 1000
+
+# Maximum number of parameters of a statement (limit of the protocol)
+MAX_BATCH_PARAMETERS = 65535
+
+BATCH_SAVEPOINT = 'SAVEPOINT save_data_batch;'
+BATCH_ROLLBACK = 'ROLLBACK TO SAVEPOINT save_data_batch;'
+BATCH_RELEASE = 'RELEASE SAVEPOINT save_data_batch;'
+
 
 def save_changed_data(changed_data, columns_info, conn, command_obj,
-                      client_primary_key, auto_commit=True):
+                      client_primary_key, auto_commit=True,
+                      batch_size=SAVE_BATCH_SIZE):
     """
     This function is used to save the data into the database.
     Depending on condition it will either update or insert the
     new row into the database.
 
+    The consecutive added rows having the same columns, and the updated
+    rows having the same columns changed, are saved batch_size rows at a
+    time, using a single statement. When such a statement fails, its rows
+    are saved again one by one, to report the row in error.
+
     Args:
         changed_data: Contains data to be saved
         command_obj: The transaction object (command_obj or trans_obj)
@@ -30,6 +54,8 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
         columns_info: session_obj['columns_info']
         client_primary_key: session_obj['client_primary_key']
         auto_commit: If the changes should be committed automatically.
+        batch_size: Maximum number of rows saved by a single statement,
+            1 to save the rows one by one.
     """
     status = False
     res = None
@@ -167,11 +193,18 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
                     'sql': sql, 'data': data,
                     'client_row': tmp_row_index,
                     'select_sql': select_sql,
-                    'row_id': data.get(client_primary_key)
+                    'row_id': data.get(client_primary_key),
+                    'columns': list(column_data),
+                    'use_default': use_default
                 })
                 # Reset column data
                 column_data = {}
 
+            if batch_size > 1:
+                list_of_sql[of_type] = _batch_added_rows(
+                    list_of_sql[of_type], batch_size, conn, command_obj,
+                    column_type, type_cast_required, pk_names, primary_keys)
+
         # For updated rows
         elif of_type == 'updated':
             list_of_sql[of_type] = []
@@ -194,10 +227,20 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
                     type_cast_required=type_cast_required,
                     conn=conn
                 )
-                list_of_sql[of_type].append({'sql': sql,
-                                             'data': data,
-                                             'row_id':
-                                                 data.get(client_primary_key)})
+                list_of_sql[of_type].append({
+                    'sql': sql,
+                    'data': data,
+                    'row_id': data.get(client_primary_key),
+                    'columns': list(data),
+                    'primary_keys':
+                        changed_data[of_type][each_row]['primary_keys']
+                })
+
+            if batch_size > 1:
+                _, primary_keys = command_obj.get_primary_keys()
+                list_of_sql[of_type] = _batch_updated_rows(
+                    list_of_sql[of_type], batch_size, conn, command_obj,
+                    column_type, primary_keys)
 
         # For deleted rows
         elif of_type == 'deleted':
@@ -241,7 +284,7 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
             )
             list_of_sql[of_type].append({'sql': sql, 'data': {}})
 
-    def failure_handle(res, row_id):
+    def failure_handle(res, row_id, item):
         mogrified_sql = conn.mogrify(item['sql'], item['data'])
         mogrified_sql = mogrified_sql if mogrified_sql is not None \
             else item['sql']
@@ -274,59 +317,150 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
 
         return False, res, query_results, row_id
 
-    for opr, sqls in list_of_sql.items():
-        for item in sqls:
-            if item['sql']:
-                item['data'] = {
-                    pgadmin_alias[k] if k in pgadmin_alias else k: v
-                    for k, v in item['data'].items()
-                }
+    def execute_item(item):
+        """
+        Execute the statement saving a single row, or the deleted rows.
+        Returns the result of the save operation on failure, None otherwise.
+        """
+        item['data'] = {
+            pgadmin_alias[k] if k in pgadmin_alias else k: v
+            for k, v in item['data'].items()
+        }
+
+        row_added = None
+        res = None
+
+        try:
+            # Fetch oids/primary keys
+            if 'select_sql' in item and item['select_sql']:
+                status, res = conn.execute_dict(
+                    item['sql'], item['data'])
+            else:
+                status, res = conn.execute_void(
+                    item['sql'], item['data'])
+        except Exception:
+            failure_handle(res, item.get('row_id', 0), item)
+            raise
 
-                row_added = None
+        if not status:
+            return failure_handle(res, item.get('row_id', 0), item)
 
-                try:
-                    # Fetch oids/primary keys
-                    if 'select_sql' in item and item['select_sql']:
-                        status, res = conn.execute_dict(
-                            item['sql'], item['data'])
-                    else:
-                        status, res = conn.execute_void(
-                            item['sql'], item['data'])
-                except Exception:
-                    failure_handle(res, item.get('row_id', 0))
-                    raise
+        # Select added row from the table
+        if 'select_sql' in item:
+            params = {
+                pgadmin_alias[k] if k in pgadmin_alias else k: v
+                for k, v in res['rows'][0].items()
+            }
+            status, sel_res = conn.execute_dict(
+                item['select_sql'], params)
 
-                if not status:
-                    return failure_handle(res, item.get('row_id', 0))
-
-                # Select added row from the table
-                if 'select_sql' in item:
-                    params = {
-                        pgadmin_alias[k] if k in pgadmin_alias else k: v
-                        for k, v in res['rows'][0].items()
-                    }
-                    status, sel_res = conn.execute_dict(
-                        item['select_sql'], params)
-
-                    if not status:
-                        return failure_handle(sel_res, item.get('row_id', 0))
-
-                    if 'rows' in sel_res and len(sel_res['rows']) > 0:
-                        row_added = {
-                            item['client_row']: sel_res['rows'][0]}
-
-                rows_affected = conn.rows_affected()
-                mogrified_sql = conn.mogrify(item['sql'], item['data'])
-                mogrified_sql = mogrified_sql if mogrified_sql is not None \
-                    else item['sql']
-                # store the result of each query in dictionary
-                query_results.append({
-                    'status': status,
-                    'result': None if row_added else res,
-                    'sql': mogrified_sql,
-                    'rows_affected': rows_affected,
-                    'row_added': row_added
-                })
+            if not status:
+                return failure_handle(sel_res, item.get('row_id', 0), item)
+
+            if 'rows' in sel_res and len(sel_res['rows']) > 0:
+                row_added = {
+                    item['client_row']: sel_res['rows'][0]}
+
+        rows_affected = conn.rows_affected()
+        mogrified_sql = conn.mogrify(item['sql'], item['data'])
+        mogrified_sql = mogrified_sql if mogrified_sql is not None \
+            else item['sql']
+        # store the result of each query in dictionary
+        query_results.append({
+            'status': status,
+            'result': None if row_added else res,
+            'sql': mogrified_sql,
+            'rows_affected': rows_affected,
+            'row_added': row_added
+        })
+        return None
+
+    def execute_batch(item):
+        """
+        Execute the statement saving several rows at once. If it fails, the
+        rows are saved one by one, to find the row in error.
+        Returns the result of the save operation on failure, None otherwise.
+        """
+        status, res = conn.execute_void(BATCH_SAVEPOINT)
+        if not status:
+            return failure_handle(res, None, item)
+
+        if item.get('returning'):
+            status, res = conn.execute_dict(item['sql'], item['data'])
+        else:
+            status, res = conn.execute_void(item['sql'], item['data'])
+
+        if not status:
+            status, res = conn.execute_void(BATCH_ROLLBACK)
+            if status:
+                status, res = conn.execute_void(BATCH_RELEASE)
+            if not status:
+                return failure_handle(res, None, item)
+
+            for row_item in item['rows']:
+                failure = execute_item(row_item)
+                if failure is not None:
+                    return failure
+            return None
+
+        rows_affected = conn.rows_affected()
+        row_added = None
+
+        status, res_release = conn.execute_void(BATCH_RELEASE)
+        if not status:
+            return failure_handle(res_release, None, item)
+
+        # Select the added rows from the table, using their oids/primary
+        # keys, in the order of the insertion.
+        if item.get('returning') and \
+                len(res['rows']) == len(item['rows']):
+            keys = [tuple(row.values()) for row in res['rows']]
+            params = {}
+            select_rows = []
+            for row_no, key in enumerate(keys):
+                names = ['k{0}_{1}'.format(key_no, row_no)
+                         for key_no in range(len(key))]
+                params.update(zip(names, key))
+                select_rows.append(names)
+
+            status, sel_res = conn.execute_dict(
+                render_template(
+                    "/".join([command_obj.sql_path, 'select_batch.sql']),
+                    rows=select_rows, **item['select_args']), params)
+            if not status:
+                return failure_handle(sel_res, None, item)
+
+            key_names = list(res['rows'][0])
+            selected = {
+                tuple(row[name] for name in key_names): row
+                for row in sel_res['rows']
+            }
+            row_added = {
+                row_item['client_row']: selected[key]
+                for row_item, key in zip(item['rows'], keys)
+                if key in selected
+            }
+
+        mogrified_sql = conn.mogrify(item['sql'], item['data'])
+        query_results.append({
+            'status': True,
+            'result': None if row_added else res,
+            'sql': mogrified_sql if mogrified_sql is not None
+            else item['sql'],
+            'rows_affected': rows_affected,
+            'row_added': row_added or None
+        })
+        return None
+
+    for opr, sqls in list_of_sql.items():
+        for item in sqls:
+            if item['sql']:
+                if 'rows' in item:
+                    failure = execute_batch(item)
+                else:
+                    failure = execute_item(item)
+                if failure is not None:
+                    return failure
 
     # Commit the transaction if no error is found & autocommit is activated
     if auto_commit:
@@ -338,6 +472,160 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
     return status, res, query_results, _rowid
 
 
+def _batches(items, batch_size, group_key, row_parameters):
+    """
+    Split the items in batches of consecutive items having the same group
+    key, of at most batch_size items, and at most MAX_BATCH_PARAMETERS
+    parameters (row_parameters per item).
+    """
+    max_rows = min(batch_size,
+                   max(MAX_BATCH_PARAMETERS // max(row_parameters, 1), 1))
+    batch = []
+    for item in items:
+        key = group_key(item)
+        if batch and (group_key(batch[0]) != key or len(batch) >= max_rows):
+            yield batch
+            batch = []
+        batch.append(item)
+    if batch:
+        yield batch
+
+
+def _batch_added_rows(items, batch_size, conn, command_obj, column_type,
+                      type_cast_required, pk_names, primary_keys):
+    """
+    Replace the consecutive INSERT statements of the rows having the same
+    columns by multi-row INSERT statements.
+    """
+    has_oids = command_obj.has_oids()
+    result = []
+
+    # Up to one parameter per column, and per primary key (to select the
+    # rows added)
+    row_parameters = max(len(column_type), len(primary_keys or {}), 1)
+
+    for batch in _batches(items, batch_size,
+                          lambda item: (tuple(item['columns']),
+                                        item['use_default']),
+                          row_parameters):
+        if len(batch) == 1:
+            result.append(batch[0])
+            continue
+
+        columns = batch[0]['columns']
+        use_default = batch[0]['use_default']
+        params = {}
+        rows = []
+        for row_no, item in enumerate(batch):
+            names = ['c{0}_{1}'.format(col_no, row_no)
+                     for col_no in range(len(columns))]
+            if not use_default:
+                params.update(
+                    (name, item['data'].get(col))
+                    for name, col in zip(names, columns))
+            rows.append(names)
+
+        result.append({
+            'sql': render_template(
+                "/".join([command_obj.sql_path, 'insert_batch.sql']),
+                columns=columns,
+                rows=rows,
+                object_name=command_obj.object_name,
+                nsp_name=command_obj.nsp_name,
+                data_type=column_type,
+                pk_names=pk_names,
+                has_oids=has_oids,
+                type_cast_required=type_cast_required,
+                use_default=use_default,
+                conn=conn
+            ),
+            'data': params,
+            'rows': batch,
+            'returning': bool(pk_names) or has_oids,
+            'select_args': dict(
+                object_name=command_obj.object_name,
+                nsp_name=command_obj.nsp_name,
+                primary_keys=primary_keys,
+                has_oids=has_oids,
+                conn=conn
+            )
+        })
+
+    return result
+
+
+def _batch_updated_rows(items, batch_size, conn, command_obj, column_type,
+                        primary_keys):
+    """
+    Replace the UPDATE statements of the rows having the same columns
+    changed by UPDATE ... FROM (VALUES ...) statements.
+    """
+    if not primary_keys:
+        return items
+
+    # Cast the values to types not limiting their length, the values are
+    # checked when assigned to the columns.
+    data_type = {
+        col: batch_type_cast.get(typ, typ) for col, typ in column_type.items()
+    }
+    key_type = {
+        pk: 'varbit' if typ == 'bit' else typ
+        for pk, typ in primary_keys.items()
+    }
+
+    groups = OrderedDict()
+    for item in items:
+        groups.setdefault(
+            (tuple(item['columns']), tuple(item['primary_keys'])), []
+        ).append(item)
+
+    result = []
+    for (columns, keys), group in groups.items():
+        if set(keys) != set(primary_keys) or \
+                any(col not in data_type for col in columns):
+            result.extend(group)
+            continue
+
+        for batch in _batches(group, batch_size, lambda item: None,
+                              len(columns) + len(keys)):
+            if len(batch) == 1:
+                result.append(batch[0])
+                continue
+
+            params = {}
+            rows = []
+            for row_no, item in enumerate(batch):
+                values = ['c{0}_{1}'.format(col_no, row_no)
+                          for col_no in range(len(columns))]
+                params.update(
+                    (name, item['data'].get(col))
+                    for name, col in zip(values, columns))
+                pk_values = ['k{0}_{1}'.format(key_no, row_no)
+                             for key_no in range(len(primary_keys))]
+                params.update(
+                    (name, item['primary_keys'][pk])
+                    for name, pk in zip(pk_values, primary_keys))
+                rows.append((values, pk_values))
+
+            result.append({
+                'sql': render_template(
+                    "/".join([command_obj.sql_path, 'update_batch.sql']),
+                    columns=columns,
+                    rows=rows,
+                    primary_keys=primary_keys,
+                    object_name=command_obj.object_name,
+                    nsp_name=command_obj.nsp_name,
+                    data_type=data_type,
+                    key_type=key_type,
+                    conn=conn
+                ),
+                'data': params,
+                'rows': batch
+            })
+
+    return result
+
+
 def execute_void_wrapper(conn, sql, query_results):
     """
     Executes a sql query with no return and adds it to query_results
@@ -0,0 +1,126 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import unicodedata
+from unittest.mock import MagicMock
+
+from pgadmin.tools.sqleditor.utils.result_view import sort_filter_result
+from pgadmin.utils.route import BaseTestGenerator
+
+# (type oid, values as sent by the server)
+COLUMNS = [
+    # numeric
+    (1700, [b'10', b'9.5', None, b'NaN', b'-1', b'9.50']),
+    # double precision
+    (701, [b'Infinity', b'2', b'NaN', b'-Infinity', None, b'1e-3']),
+    # timestamp
+    (1114, [b'2024-01-02 10:00:00', b'infinity', b'2024-01-02 09:00:00',
+            None, b'-infinity', b'2023-12-31 23:59:59.5']),
+    # text
+    (25, [b'b', b'B', b'\xc3\xa9t\xc3\xa9', None, b'a', b'ab']),
+]
+
+
+def _collation_ranks(query, params):
+    """
+    Rank the text values as a linguistic collation (e.g. en_US) would: the
+    accents and the case only matter for the values equal otherwise, the
+    lower case first.
+    """
+    def key(value):
+        base = ''.join(
+            char for char in unicodedata.normalize('NFD', value)
+            if not unicodedata.combining(char))
+        return base.casefold(), value.swapcase()
+
+    ordered = sorted(set(params['values']), key=key)
+    return True, {'rows': [{'rank': str(ordered.index(value) + 1)}
+                           for value in params['values']]}
+
+
+class SortFilterResultTest(BaseTestGenerator):
+    """
+    The rows of the result are sorted and filtered in memory, as PostgreSQL
+    would, comparing the values of the columns by type, and the text values
+    as per the collation of the database.
+    """
+
+    scenarios = [
+        ('Sort on a numeric column', dict(
+            sort=[{'pos': 0, 'order': 'asc'}], filters=None,
+            expected=[4, 1, 5, 0, 3, 2],
+        )),
+        ('Sort on a numeric column, descending', dict(
+            sort=[{'pos': 0, 'order': 'desc'}], filters=None,
+            expected=[2, 3, 0, 1, 5, 4],
+        )),
+        ('Sort on a float column', dict(
+            sort=[{'pos': 1, 'order': 'asc'}], filters=None,
+            expected=[3, 5, 1, 0, 2, 4],
+        )),
+        ('Sort on a timestamp column', dict(
+            sort=[{'pos': 2, 'order': 'asc'}], filters=None,
+            expected=[4, 5, 2, 0, 1, 3],
+        )),
+        ('Sort on a text column', dict(
+            sort=[{'pos': 3, 'order': 'asc'}], filters=None,
+            expected=[4, 5, 0, 1, 2, 3],
+        )),
+        ('Sort on two columns', dict(
+            sort=[{'pos': 0, 'order': 'asc'}, {'pos': 3, 'order': 'desc'}],
+            filters=None,
+            expected=[4, 1, 5, 0, 3, 2],
+        )),
+        ('Filter on a text column with a comparison', dict(
+            sort=[{'pos': 3, 'order': 'desc'}],
+            filters=[{'pos': 3, 'operator': '>', 'value': 'a'}],
+            expected=[2, 1, 0, 5],
+        )),
+        ('Filter with a comparison', dict(
+            sort=None,
+            filters=[{'pos': 0, 'operator': '=', 'value': '9.5'}],
+            expected=[1, 5],
+        )),
+        ('Filter on NULL', dict(
+            sort=None,
+            filters=[{'pos': 2, 'operator': 'is not null'},
+                     {'pos': 1, 'operator': 'is null'}],
+            expected=[4],
+        )),
+        ('Filter on the text, and sort', dict(
+            sort=[{'pos': 2, 'order': 'desc'}],
+            filters=[{'pos': 3, 'operator': 'contains', 'value': 'B'}],
+            expected=[1, 0, 5],
+        )),
+        ('Filter on a timestamp', dict(
+            sort=None,
+            filters=[{'pos': 2, 'operator': '>',
+                      'value': '2024-01-01 00:00:00'}],
+            expected=[0, 1, 2],
+        )),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        conn = MagicMock(total_rows=6, python_encoding='utf-8', conn=None)
+        conn.async_fetch_columns.side_effect = \
+            lambda positions: (True, [COLUMNS[pos] for pos in positions])
+        conn.transaction_status.return_value = 0
+        conn.execute_dict.side_effect = _collation_ranks
+
+        with self.app.app_context():
+            status, order = sort_filter_result(conn, self.sort,
+                                               self.filters)
+        self.assertTrue(status)
+        self.assertEqual(order, self.expected)
+
+    def tearDown(self):
+        pass
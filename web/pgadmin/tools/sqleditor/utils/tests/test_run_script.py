@@ -0,0 +1,198 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch, MagicMock
+
+from pgadmin.tools.sqleditor.utils import run_script
+from pgadmin.tools.sqleditor.utils.run_script import ScriptRunner, \
+    split_script, ON_ERROR_STOP, ON_ERROR_CONTINUE
+from pgadmin.utils.route import BaseTestGenerator
+
+SCRIPT = """-- Create the table
+CREATE TABLE t (id int);
+
+INSERT INTO t VALUES (1), (2);
+/* nothing to run */ ;
+CREATE FUNCTION f() RETURNS int AS $$
+BEGIN
+    RETURN 1;
+END;
+$$ LANGUAGE plpgsql;
+SELECT 1/0; SELECT * FROM t;
+-- The end
+"""
+
+
+class SplitScriptTest(BaseTestGenerator):
+    """
+    The script is split in statements, with the line they start at,
+    skipping the empty ones.
+    """
+
+    scenarios = [
+        ('Split a script', dict(
+            script=SCRIPT,
+            expected=[
+                (1, '-- Create the table\nCREATE TABLE t (id int);'),
+                (4, 'INSERT INTO t VALUES (1), (2);'),
+                (6, 'CREATE FUNCTION f() RETURNS int AS $$\nBEGIN\n'
+                    '    RETURN 1;\nEND;\n$$ LANGUAGE plpgsql;'),
+                (11, 'SELECT 1/0;'),
+                (11, 'SELECT * FROM t;'),
+            ]
+        )),
+        ('Split an empty script', dict(
+            script='\n-- Nothing\n',
+            expected=[]
+        )),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        self.assertEqual(list(split_script(self.script)), self.expected)
+
+    def tearDown(self):
+        pass
+
+
+class ScriptRunnerTest(BaseTestGenerator):
+    """
+    The statements are executed one after the other, and their results are
+    sent in batches.
+    """
+
+    scenarios = [
+        ('Stop at the first error', dict(
+            on_error=ON_ERROR_STOP,
+            auto_commit=True,
+            expected_status='Error',
+            expected_executed=4,
+            expected_queries=[
+                '-- Create the table\nCREATE TABLE t (id int);',
+                'INSERT INTO t VALUES (1), (2);',
+                'CREATE FUNCTION f() RETURNS int AS $$\nBEGIN\n'
+                '    RETURN 1;\nEND;\n$$ LANGUAGE plpgsql;',
+                'SELECT 1/0;',
+            ]
+        )),
+        ('Continue after an error, in a transaction', dict(
+            on_error=ON_ERROR_CONTINUE,
+            auto_commit=False,
+            expected_status='Error',
+            expected_executed=5,
+            expected_queries=[
+                'BEGIN;',
+                '-- Create the table\nCREATE TABLE t (id int);',
+                'INSERT INTO t VALUES (1), (2);',
+                'CREATE FUNCTION f() RETURNS int AS $$\nBEGIN\n'
+                '    RETURN 1;\nEND;\n$$ LANGUAGE plpgsql;',
+                'SELECT 1/0;',
+                'SELECT * FROM t;',
+            ]
+        )),
+    ]
+
+    def setUp(self):
+        pass
+
+    def _conn(self):
+        conn = MagicMock(execution_aborted=False)
+        conn.transaction_status.return_value = 0
+        conn.messages.return_value = []
+        conn.total_rows = 2
+        conn.status_message.return_value = 'OK'
+
+        def execute_void(sql):
+            self.queries.append(sql)
+            # In a transaction, from now on
+            conn.transaction_status.return_value = 2
+            return True, None
+
+        def execute_async(sql):
+            self.queries.append(sql)
+            conn.execution_aborted = False
+            if '1/0' in sql:
+                return False, 'division by zero'
+            return True, None
+
+        conn.execute_void.side_effect = execute_void
+        conn.execute_async.side_effect = execute_async
+        return conn
+
+    def runTest(self):
+        self.queries = []
+        trans_obj = MagicMock(auto_commit=self.auto_commit,
+                              auto_rollback=False)
+
+        with patch.object(run_script, 'SCRIPT_RESULTS_BATCH', 2):
+            events = list(ScriptRunner(self._conn(), trans_obj,
+                                       self.on_error).run(SCRIPT))
+
+        self.assertEqual(self.queries, self.expected_queries)
+
+        results = [r for e in events[:-1] for r in e['results']]
+        self.assertTrue(all(len(e['results']) <= 2 for e in events[:-1]))
+        self.assertEqual([r['index'] for r in results],
+                         list(range(1, self.expected_executed + 1)))
+        self.assertEqual(results[3]['line'], 11)
+        self.assertFalse(results[3]['status'])
+        self.assertEqual(results[3]['message'], 'division by zero')
+        self.assertEqual(results[1]['rows_affected'], 2)
+
+        complete = events[-1]
+        self.assertEqual(complete['type'], 'complete')
+        self.assertEqual(complete['status'], self.expected_status)
+        self.assertEqual(complete['executed'], self.expected_executed)
+        self.assertEqual(complete['failed'], 1)
+
+    def tearDown(self):
+        pass
+
+
+class ScriptRunnerCancelTest(ScriptRunnerTest):
+    """
+    The script is cancelled while a statement is running, or between two
+    statements.
+    """
+
+    scenarios = [
+        ('Cancel while a statement is running', dict(
+            cancel_between=False,
+        )),
+        ('Cancel between two statements', dict(
+            cancel_between=True,
+        )),
+    ]
+
+    def runTest(self):
+        self.queries = []
+        trans_obj = MagicMock(auto_commit=True, auto_rollback=False)
+        conn = self._conn()
+
+        if not self.cancel_between:
+            def release_async_cursor():
+                # Cancelled during the second statement
+                if len(self.queries) == 2:
+                    conn.execution_aborted = True
+            conn.release_async_cursor.side_effect = release_async_cursor
+
+        events = []
+        with patch.object(run_script, 'SCRIPT_RESULTS_BATCH', 1):
+            for event in ScriptRunner(conn, trans_obj).run(SCRIPT):
+                events.append(event)
+                if self.cancel_between and event['type'] == 'results' and \
+                        event['executed'] == 2:
+                    conn.execution_aborted = True
+
+        self.assertEqual(len(self.queries), 2)
+        complete = events[-1]
+        self.assertEqual(complete['status'], 'Cancel')
+        self.assertEqual(complete['executed'], 2)
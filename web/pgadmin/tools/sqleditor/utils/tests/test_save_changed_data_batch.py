@@ -0,0 +1,139 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+from unittest.mock import patch
+
+from pgadmin.tools.sqleditor.utils.save_changed_data import \
+    BATCH_SAVEPOINT, BATCH_RELEASE
+from pgadmin.utils.driver.psycopg3.connection import Connection
+from .test_save_changed_data import TestSaveChangedData
+
+
+def _added(rows):
+    return {
+        'updated': {}, 'staged_rows': {}, 'deleted': {}, 'updated_index': {},
+        'added': {
+            str(idx): {'err': False, 'data': dict(row, __temp_PK=str(idx))}
+            for idx, row in enumerate(rows, start=3)
+        },
+        'added_index': {str(idx): str(idx)
+                        for idx in range(3, len(rows) + 3)},
+        'columns': []
+    }
+
+
+def _updated(rows):
+    return {
+        'added': {}, 'staged_rows': {}, 'deleted': {}, 'added_index': {},
+        'updated': {
+            str(pk): {'err': False, 'data': row, 'primary_keys': {
+                'pk_col': pk}}
+            for pk, row in rows.items()
+        },
+        'updated_index': {str(pk): str(pk) for pk in rows},
+        'columns': []
+    }
+
+
+class TestSaveChangedDataBatch(TestSaveChangedData):
+    """
+    This class tests saving several added/updated rows at once, in a single
+    statement, and the report of the row in error when it fails.
+    """
+    scenarios = [
+        ('When inserting several valid rows', dict(
+            save_payload=_added([
+                {'pk_col': '3', 'normal_col': 'three', 'char_col': 'ch3',
+                 'bit_col': '00011'},
+                {'pk_col': '4', 'normal_col': 'four', 'char_col': 'ch4',
+                 'bit_col': '00100'},
+                {'pk_col': '5', 'normal_col': 'five', 'char_col': 'ch5',
+                 'bit_col': '00101'},
+            ]),
+            save_status=True,
+            expected_statements=1,
+            expected_rows_added=['3', '4', '5'],
+            check_sql='SELECT * FROM %s WHERE pk_col > 2 ORDER BY pk_col',
+            check_result=[[3, 'three', 'ch3 ', '00011'],
+                          [4, 'four', 'ch4 ', '00100'],
+                          [5, 'five', 'ch5 ', '00101']]
+        )),
+        ('When inserting several rows, one being invalid', dict(
+            save_payload=_added([
+                {'pk_col': '3', 'bit_col': '00011'},
+                {'pk_col': '4', 'bit_col': '1'},
+                {'pk_col': '5', 'bit_col': '00101'},
+            ]),
+            save_status=False,
+            expected_error_sql="'1'",
+            check_sql='SELECT * FROM %s WHERE pk_col > 2',
+            check_result='SELECT 0'
+        )),
+        ('When updating several rows', dict(
+            save_payload=_updated({
+                1: {'normal_col': 'ONE', 'bit_col': '10000'},
+                2: {'normal_col': 'TWO', 'bit_col': '01000'},
+            }),
+            save_status=True,
+            expected_statements=1,
+            expected_rows_added=[],
+            check_sql='SELECT * FROM %s ORDER BY pk_col',
+            check_result=[[1, 'ONE', 'ch1 ', '10000'],
+                          [2, 'TWO', 'ch2 ', '01000']]
+        )),
+        ('When updating several rows, one being invalid', dict(
+            save_payload=_updated({
+                1: {'char_col': 'ch11'},
+                2: {'char_col': 'too long'},
+            }),
+            save_status=False,
+            expected_error_sql="'too long'",
+            check_sql='SELECT char_col FROM %s ORDER BY pk_col',
+            check_result=[['ch1 '], ['ch2 ']]
+        )),
+    ]
+
+    def _save_changed_data(self):
+        statements = []
+        execute_void = Connection.execute_void
+
+        def record_execute_void(conn, sql, *args, **kwargs):
+            statements.append(sql)
+            return execute_void(conn, sql, *args, **kwargs)
+
+        with patch.object(Connection, 'execute_void', autospec=True,
+                          side_effect=record_execute_void):
+            response = self.tester.post(self.save_url,
+                                        data=json.dumps(self.save_payload),
+                                        content_type='html/json')
+        self.assertEqual(response.status_code, 200)
+
+        # The savepoint of each batch is released
+        self.assertIn(BATCH_SAVEPOINT, statements)
+        self.assertEqual(statements.count(BATCH_SAVEPOINT),
+                         statements.count(BATCH_RELEASE))
+
+        response_data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(response_data['status'], self.save_status)
+
+        # Leave out BEGIN/COMMIT
+        query_results = [qr for qr in response_data['query_results']
+                         if qr['sql'] not in ('BEGIN;', 'COMMIT;')]
+        if self.save_status:
+            self.assertEqual(len(query_results), self.expected_statements)
+            rows_added = sorted(key for qr in query_results
+                                if qr['row_added'] for key in qr['row_added'])
+            self.assertEqual(rows_added, self.expected_rows_added)
+        else:
+            # The row in error is reported, and the save is rolled back
+            failed = [qr for qr in query_results if not qr['status']]
+            self.assertEqual(len(failed), 1)
+            self.assertIn(self.expected_error_sql, failed[0]['sql'])
+            self.assertIn('ROLLBACK', query_results[-1]['sql'])
@@ -33,6 +33,7 @@ from pgadmin.utils.validation_utils import validate_email
 from pgadmin.model import db, Role, User, UserPreference, Server, \
     ServerGroup, Process, Setting, roles_users, SharedServer
 from pgadmin.utils.paths import create_users_storage_directory
+from pgadmin.utils.server_access import invalidate_server_access
 from pgadmin.tools.user_management.PgAdminPermissions import PgAdminPermissions
 from sqlalchemy import func
 
@@ -756,6 +757,8 @@ def delete_user(uid):
         UserPreference.query.filter_by(uid=uid).delete()
 
         Server.query.filter_by(user_id=uid).delete()
+        # Bulk deletes are not seen by the ORM events
+        invalidate_server_access()
 
         ServerGroup.query.filter_by(user_id=uid).delete()
 
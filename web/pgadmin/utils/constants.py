@@ -16,6 +16,8 @@ MIMETYPE_APP_JS = 'application/javascript'
 MIMETYPE_APP_JSON = 'application/json'
 
 NO_CACHE_CONTROL = 'no-cache, no-store, must-revalidate'
+# May be stored by the browser (only), but must be revalidated before use
+REVALIDATE_CACHE_CONTROL = 'private, no-cache'
 
 # Preference labels
 PREF_LABEL_KEYBOARD_SHORTCUTS = gettext('Keyboard shortcuts')
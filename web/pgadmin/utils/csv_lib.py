@@ -56,22 +56,33 @@ Agreement.
 # Handle the null value if value is None or equal to
 # 'replace_nulls_with' then it represents the null value, so no need to
 # quote it.
+# None values are written as 'replace_nulls_with' (when given).
+# Added a fast path (FastWriter), writing the rows with the C csv module
+# for the dialects it supports, driven by the types of the columns
+# ('column_types' parameter of Writer).
 ############################################################################
 
 __all__ = ["QUOTE_MINIMAL", "QUOTE_ALL", "QUOTE_NONNUMERIC", "QUOTE_NONE",
            "Error", "Dialect", "__doc__", "Excel", "ExcelTab",
            "field_size_limit", "Reader", "Writer", "register_dialect",
            "get_dialect", "list_dialects", "unregister_dialect",
-           "__version__", "DictReader", "DictWriter"]
+           "__version__", "DictReader", "DictWriter", "NUMERIC_COLUMN",
+           "TEXT_COLUMN"]
 
 import re
 import numbers
 from io import StringIO
+import csv as _csv
 from csv import (
     QUOTE_MINIMAL, QUOTE_ALL, QUOTE_NONNUMERIC, QUOTE_NONE,
     __version__, __doc__, Error, field_size_limit,
 )
 
+# Types of the columns (see Writer), for the ones which only hold numbers
+# (or booleans), and the ones which only hold strings, respectively.
+NUMERIC_COLUMN = 'numeric'
+TEXT_COLUMN = 'text'
+
 
 class QuoteStrategy():
     quoting = None
@@ -115,6 +126,8 @@ class QuoteStrategy():
         return self.dialect.escapechar
 
     def prepare(self, raw_field, only=None):
+        if raw_field is None:
+            raw_field = self.dialect.replace_nulls_with
         field = str(raw_field if raw_field is not None else '')
         quoted = self.quoted(field=field, raw_field=raw_field, only=only)
 
@@ -214,8 +227,171 @@ class QuoteNoneStrategy(QuoteStrategy):
         return False
 
 
+class Unquoted():
+    """
+    A field written as is by the C csv module, with QUOTE_NONNUMERIC (which
+    does not quote the objects that can be converted to float).
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return self.value
+
+    def __float__(self):
+        return 0.0
+
+
+class FastWriter():
+    """
+    Writes the rows with the C csv module, or a plain join, with the same
+    output as the quoting strategies, when the dialect allows it.
+
+    The C module decides whether to quote a field from its Python type, hence
+    the fields are converted first (e.g. a null to an Unquoted field, or any
+    value to a string to be quoted), depending on the type of their column:
+    NUMERIC_COLUMN, TEXT_COLUMN or None (any value).
+    """
+    def __init__(self, fileobj, dialect, column_types=None):
+        self.fileobj = fileobj
+        self.dialect = dialect
+        self.column_types = column_types
+        self.nulls = dialect.replace_nulls_with or ''
+        self.null = Unquoted(self.nulls)
+
+        if dialect.quoting == QUOTE_NONE:
+            self.writer = None
+        else:
+            self.writer = _csv.writer(
+                fileobj, delimiter=dialect.delimiter,
+                quotechar=dialect.quotechar, doublequote=True,
+                lineterminator=dialect.lineterminator,
+                quoting=QUOTE_NONNUMERIC)
+
+        converters = {
+            QUOTE_NONNUMERIC: self.nonnumeric_converter,
+            QUOTE_ALL: self.all_converter,
+            QUOTE_NONE: self.none_converter,
+        }[dialect.quoting]
+        self.converters = None if column_types is None else \
+            [converters(column_type) for column_type in column_types]
+        self.converter = converters(None)
+
+    @staticmethod
+    def supported(dialect):
+        """
+        Whether the C csv module quotes the fields (as converted) as the
+        quoting strategy of the dialect does.
+
+        QUOTE_MINIMAL is not supported: the C module quotes a few more
+        fields (e.g. with a carriage return), depending on the Python
+        version.
+        """
+        if dialect.quoting == QUOTE_NONE:
+            return not dialect.escapechar
+
+        specialchars = dialect.delimiter + (dialect.quotechar or '') + '\r\n'
+        return dialect.quoting in (QUOTE_NONNUMERIC, QUOTE_ALL) and \
+            dialect.quotechar is not None and dialect.doublequote and \
+            not dialect.escapechar and \
+            not any(c in specialchars
+                    for c in dialect.replace_nulls_with or '') and \
+            not any(c.isalnum() or c in '.+-' for c in specialchars[:2])
+
+    def nonnumeric_converter(self, column_type):
+        null = self.null
+        nulls = self.dialect.replace_nulls_with
+
+        if column_type == NUMERIC_COLUMN:
+            return lambda value: null if value is None else value
+        if column_type == TEXT_COLUMN:
+            return lambda value: null \
+                if value is None or value == nulls else value
+
+        def convert(value):
+            if value is None or value == nulls:
+                return null
+            if type(value) is str or isinstance(value, numbers.Number):
+                return value
+            # e.g. a UUID, that the C module would not quote (as it can be
+            # converted to an integer)
+            return str(value)
+        return convert
+
+    def all_converter(self, column_type):
+        null = self.null
+        nulls = self.dialect.replace_nulls_with
+
+        if column_type == NUMERIC_COLUMN:
+            return lambda value: null if value is None else str(value)
+        if column_type == TEXT_COLUMN:
+            return lambda value: null \
+                if value is None or value == nulls else value
+        return lambda value: null if value is None or value == nulls else \
+            value if type(value) is str else str(value)
+
+    def none_converter(self, column_type):
+        nulls = self.nulls
+
+        if column_type == TEXT_COLUMN:
+            return lambda value: nulls if value is None else value
+        return lambda value: nulls if value is None else str(value)
+
+    def convert(self, row, typed=True):
+        if not isinstance(row, list):
+            row = list(row)
+        if typed and self.converters is not None and \
+                len(row) == len(self.converters):
+            return [convert(value)
+                    for convert, value in zip(self.converters, row)]
+        convert = self.converter
+        return [convert(value) for value in row]
+
+    def writerow(self, row, typed=True):
+        """
+        :param typed: whether the fields are of the types of the columns
+            (e.g. not for the header).
+        """
+        row = self.convert(row, typed)
+
+        if len(row) == 1:
+            if self.writer is None and row[0] == '':
+                raise Error('single empty field record must be quoted')
+            if row[0] is self.null and not self.nulls:
+                # The C module would quote a single empty field
+                return self.fileobj.write(self.dialect.lineterminator)
+
+        if self.writer is None:
+            return self.fileobj.write(
+                self.dialect.delimiter.join(row) +
+                self.dialect.lineterminator)
+        return self.writer.writerow(row)
+
+    def writerows(self, rows):
+        if self.converters is None or len(self.converters) < 2:
+            for row in rows:
+                self.writerow(row)
+            return
+
+        if self.writer is None:
+            delimiter = self.dialect.delimiter
+            lineterminator = self.dialect.lineterminator
+            return self.fileobj.write(''.join([
+                delimiter.join(self.convert(row)) + lineterminator
+                for row in rows]))
+        return self.writer.writerows(map(self.convert, rows))
+
+
 class Writer():
-    def __init__(self, fileobj, dialect='excel', **fmtparams):
+    def __init__(self, fileobj, dialect='excel', column_types=None,
+                 **fmtparams):
+        """
+        :param column_types: types of the columns (NUMERIC_COLUMN,
+            TEXT_COLUMN or None), to write the rows with the C csv module
+            (see FastWriter).
+        """
         if fileobj is None:
             raise TypeError('fileobj must be file-like, not None')
 
@@ -236,12 +412,16 @@ class Writer():
             QUOTE_NONE: QuoteNoneStrategy,
         }
         self.strategy = strategies[self.dialect.quoting](self.dialect)
+        self.fast_writer = FastWriter(fileobj, self.dialect, column_types) \
+            if FastWriter.supported(self.dialect) else None
 
     def writerow(self, row):
         if row is None:
             raise Error('row must be an iterable')
 
         row = list(row)
+        if self.fast_writer is not None:
+            return self.fast_writer.writerow(row)
         only = len(row) == 1
         row = [self.strategy.prepare(field, only=only) for field in row]
 
@@ -249,6 +429,9 @@ class Writer():
         return self.fileobj.write(line)
 
     def writerows(self, rows):
+        if self.fast_writer is not None:
+            return self.fast_writer.writerows(rows)
+
         for row in rows:
             self.writerow(row)
 
@@ -715,6 +898,7 @@ class DictReader():
 class DictWriter():
     def __init__(self, f, fieldnames, *args, **kwds):
         self.fieldnames = fieldnames    # list of keys for the dict
+        self._fieldset = set(fieldnames)
         self.extrasaction = kwds.get('extrasaction', "raise")
         self.restval = kwds.get('restval', "")  # for writing short dicts
         if self.extrasaction.lower() not in ("raise", "ignore"):
@@ -725,15 +909,20 @@ class DictWriter():
 
     def writeheader(self):
         header = dict(zip(self.fieldnames, self.fieldnames))
+        if self.writer.fast_writer is not None:
+            # The names are not of the types of the columns
+            return self.writer.fast_writer.writerow(
+                self._dict_to_list(header), typed=False)
         self.writerow(header)
 
     def _dict_to_list(self, rowdict):
-        if self.extrasaction == "raise":
-            wrong_fields = [k for k in rowdict if k not in self.fieldnames]
+        if self.extrasaction == "raise" and \
+                not self._fieldset.issuperset(rowdict):
+            wrong_fields = [k for k in rowdict if k not in self._fieldset]
             if wrong_fields:
                 raise ValueError("dict contains fields not in fieldnames: " +
                                  ", ".join([repr(x) for x in wrong_fields]))
-        return (rowdict.get(key, self.restval) for key in self.fieldnames)
+        return [rowdict.get(key, self.restval) for key in self.fieldnames]
 
     def writerow(self, rowdict):
         return self.writer.writerow(self._dict_to_list(rowdict))
@@ -0,0 +1,119 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Cache of the reverse engineered SQL of the database objects.
+
+Generating the reverse engineered SQL of an object (the SQL tab) may run
+dozens of catalog queries, e.g. for a partitioned table with many indexes.
+The generated SQL is cached per (user, server, database, node type, object
+OID), along with a fingerprint of the catalog rows it is built from (see
+e.g. tables/sql/default/ddl_fingerprint.sql), which is checked with a
+single query before the cached SQL is used.
+
+The cached SQL of a database (or of a server) is discarded when pgAdmin
+modifies any of its objects (see NodeView.dispatch_request), and expires
+after REVERSE_ENGINEERED_SQL_CACHE_TTL seconds.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Response, current_app
+from flask_security import current_user
+
+import config
+from pgadmin.utils.ajax import get_no_cache_header
+
+# {(user id, sid, did, node type, oid): (expiry time, fingerprint, data)}
+_ddl_cache = OrderedDict()
+_ddl_cache_lock = threading.Lock()
+
+
+def get_cached_sql(key, fingerprint):
+    """Returns the SQL cached for the object, if it is still fresh (i.e.
+    the fingerprint of its catalog rows has not changed), None otherwise.
+    """
+    with _ddl_cache_lock:
+        cached = _ddl_cache.get(key)
+        if cached is None:
+            return None
+
+        expiry, cached_fingerprint, data = cached
+        if expiry <= time.monotonic() or cached_fingerprint != fingerprint:
+            del _ddl_cache[key]
+            return None
+
+        _ddl_cache.move_to_end(key)
+        return data
+
+
+def cache_sql(key, fingerprint, data):
+    """Caches the SQL of the object, evicting the least recently used."""
+    ttl = config.REVERSE_ENGINEERED_SQL_CACHE_TTL
+    if ttl <= 0:
+        return
+
+    with _ddl_cache_lock:
+        _ddl_cache[key] = (time.monotonic() + ttl, fingerprint, data)
+        _ddl_cache.move_to_end(key)
+        while len(_ddl_cache) > config.REVERSE_ENGINEERED_SQL_CACHE_SIZE:
+            _ddl_cache.popitem(last=False)
+
+
+def invalidate_ddl_cache(sid, did=None):
+    """Discards the SQL cached for the objects of a database, or of all the
+    databases of the server (did = None), for all the users.
+    """
+    with _ddl_cache_lock:
+        for key in [key for key in _ddl_cache
+                    if key[1] == sid and (did is None or key[2] == did)]:
+            del _ddl_cache[key]
+
+
+def cached_reverse_engineered_sql(oid_arg):
+    """
+    This function will behave as a decorator of the 'sql' method of a node
+    view, which caches the reverse engineered SQL of the object (identified
+    by the oid_arg argument).
+
+    The view must implement get_ddl_fingerprint(oid), returning the
+    (status, fingerprint) of the catalog rows of the object, using the
+    connection (self.conn) set by its check_precondition decorator.
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrap(self, *args, **kwargs):
+            if config.REVERSE_ENGINEERED_SQL_CACHE_TTL <= 0:
+                return f(self, *args, **kwargs)
+
+            oid = kwargs[oid_arg]
+            status, fingerprint = self.get_ddl_fingerprint(oid)
+            if not status:
+                current_app.logger.warning(
+                    'Failed to fetch the DDL fingerprint of the object '
+                    '{0}: {1}'.format(oid, fingerprint))
+                return f(self, *args, **kwargs)
+
+            key = (current_user.id, kwargs['sid'], kwargs['did'],
+                   self.node_type, oid)
+            data = get_cached_sql(key, fingerprint)
+            if data is not None:
+                return Response(
+                    response=data, status=200, mimetype='application/json',
+                    headers=get_no_cache_header())
+
+            response = f(self, *args, **kwargs)
+            if response.status_code == 200:
+                cache_sql(key, fingerprint, response.get_data())
+            return response
+
+        return wrap
+    return decorator
@@ -0,0 +1,242 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Cache of the dependency graph of the databases.
+
+The dependencies and the dependents of an object (the Dependencies and
+Dependents tabs) are fetched by a catalog query on pg_depend (and
+pg_shdepend) per object. The dependency graph of a database holds them for
+all the objects which are not system objects, fetched by a single scan of
+pg_depend and pg_shdepend joined with the names of the objects (the same
+depends/*/default/*.sql templates, rendered with graph=True).
+
+The graph also answers the objects depending, directly or not, on an
+object (i.e. the objects dropped along with it by DROP ... CASCADE), and
+orders a set of objects by their dependencies (e.g. the script of the
+schema diff).
+
+The graph is cached per (user, server, database), and expires after
+DEPENDENCY_GRAPH_CACHE_TTL seconds. At most DEPENDENCY_GRAPH_CACHE_SIZE
+graphs are cached, the least recently used being evicted. The cached graphs
+of a server are discarded when pgAdmin modifies any of its objects (see
+NodeView.dispatch_request).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import render_template
+from flask_security import current_user
+
+import config
+from pgadmin.utils.constants import DATABASE_LAST_SYSTEM_OID
+
+# {(user id, sid, database name): (expiry time, graph)}, in the order they
+# have been used
+_dependency_graphs = OrderedDict()
+_dependency_graphs_lock = threading.Lock()
+
+
+def _group_rows(rows):
+    """Returns the {oid: [row]} of the rows, by their graph_key column."""
+    groups = dict()
+    for row in rows:
+        groups.setdefault(row.pop('graph_key'), list()).append(row)
+    return groups
+
+
+def _postorder(roots, successors):
+    """
+    Returns the objects reachable from the roots, each of them after its
+    successors (but for the circular ones), in depth-first order.
+    """
+    order = list()
+    visited = set()
+
+    for root in roots:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(successors(root)))]
+        while stack:
+            oid, children = stack[-1]
+            for child in children:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(successors(child))))
+                    break
+            else:
+                stack.pop()
+                order.append(oid)
+
+    return order
+
+
+class DependencyGraph:
+    """
+    The dependencies of the objects (which are not system objects) of a
+    database.
+
+    Methods:
+    -------
+    * get_dependencies(oid), get_dependents(oid), get_role_dependencies(oid)
+      - Returns the rows of the dependencies.sql, dependents.sql and
+        role_dependencies.sql templates of the object.
+
+    * get_dependents_closure(oid)
+      - Returns the objects dropped along with the object by DROP ...
+        CASCADE.
+
+    * sort_by_dependency(oids)
+      - Returns the objects, ordered by their dependencies.
+    """
+
+    def __init__(self, dependencies, dependents, role_dependencies):
+        self.dependencies = _group_rows(dependencies)
+        self.dependents = _group_rows(dependents)
+        self.role_dependencies = _group_rows(role_dependencies)
+
+        # The {oid: {(referenced oid, deptype)}} of the objects, and the
+        # {oid: {(referencing oid, deptype)}}.
+        self.references = dict()
+        self.referenced_by = dict()
+        for oid, rows in self.dependencies.items():
+            for row in rows:
+                if row['refobjid'] == oid:
+                    continue
+                self.references.setdefault(oid, set()).add(
+                    (row['refobjid'], row['deptype']))
+                self.referenced_by.setdefault(row['refobjid'], set()).add(
+                    (oid, row['deptype']))
+
+    def get_dependencies(self, oid):
+        return list(self.dependencies.get(oid, []))
+
+    def get_dependents(self, oid):
+        return list(self.dependents.get(oid, []))
+
+    def get_role_dependencies(self, oid):
+        return list(self.role_dependencies.get(oid, []))
+
+    def get_dependents_closure(self, oid):
+        """
+        Returns the OIDs of the objects depending, directly or not, on the
+        object, in the order they are dropped in by DROP ... CASCADE (i.e.
+        each object before the objects it depends on). The objects having
+        an internal part dropped (e.g. a view, the rule of which depends on
+        a dropped table) are dropped as well.
+        """
+        def successors(obj):
+            for ref, deptype in self.referenced_by.get(obj, ()):
+                yield ref
+            for ref, deptype in self.references.get(obj, ()):
+                if deptype == 'i':
+                    yield ref
+
+        return [obj for obj in _postorder([oid], successors) if obj != oid]
+
+    def _get_creation_references(self, oid, oids):
+        """
+        Returns the objects which must be created before the object, i.e.
+        its normal dependencies, and those of its parts (e.g. the column
+        defaults, constraints, indexes and triggers of a table) which are
+        not among the objects ordered.
+        """
+        references = set()
+        parts = [oid]
+        visited = {oid}
+        while parts:
+            part = parts.pop()
+            for ref, deptype in self.references.get(part, ()):
+                if deptype == 'n':
+                    references.add(ref)
+            for ref, deptype in self.referenced_by.get(part, ()):
+                if deptype in ('a', 'i') and ref not in oids and \
+                        ref not in visited:
+                    visited.add(ref)
+                    parts.append(ref)
+
+        references.discard(oid)
+        return references
+
+    def sort_by_dependency(self, oids):
+        """
+        Returns the OIDs, each object after the objects it depends on
+        (directly or not), but for the circular dependencies. The objects
+        not depending on each other are kept in the given order.
+        """
+        oids = list(oids)
+        keys = set(oids)
+
+        return [oid for oid in _postorder(
+            oids, lambda obj: self._get_creation_references(obj, keys))
+            if oid in keys]
+
+
+def build_dependency_graph(conn):
+    """Returns the (status, graph) of the database of the connection."""
+    sql_path = 'depends/{0}/#{1}#'.format(
+        conn.manager.server_type, conn.manager.version)
+    results = dict()
+
+    for template, column in (('dependencies.sql', 'dep.objid'),
+                             ('dependents.sql', 'dep.refobjid'),
+                             ('role_dependencies.sql', 'dep.objid')):
+        SQL = render_template(
+            "/".join([sql_path, template]), graph=True, conn=conn,
+            where_clause="WHERE {0} > {1}::oid".format(
+                column, DATABASE_LAST_SYSTEM_OID),
+            last_system_oid=DATABASE_LAST_SYSTEM_OID)
+        status, res = conn.execute_dict(SQL)
+        if not status:
+            return False, res
+        results[template] = res['rows']
+
+    return True, DependencyGraph(results['dependencies.sql'],
+                                 results['dependents.sql'],
+                                 results['role_dependencies.sql'])
+
+
+def get_dependency_graph(conn):
+    """
+    Returns the (status, graph) of the database of the connection, which is
+    built (and cached) if it is not cached yet, or has expired.
+    """
+    key = (current_user.id, conn.manager.sid, conn.db)
+    with _dependency_graphs_lock:
+        cached = _dependency_graphs.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            _dependency_graphs.move_to_end(key)
+            return True, cached[1]
+
+    status, graph = build_dependency_graph(conn)
+    ttl = config.DEPENDENCY_GRAPH_CACHE_TTL
+    if status and ttl > 0:
+        with _dependency_graphs_lock:
+            now = time.monotonic()
+            # Evict the expired graphs, then the least recently used ones
+            for expired in [k for k, (expiry, _) in _dependency_graphs.items()
+                            if expiry <= now]:
+                del _dependency_graphs[expired]
+            _dependency_graphs[key] = (now + ttl, graph)
+            _dependency_graphs.move_to_end(key)
+            while len(_dependency_graphs) > config.DEPENDENCY_GRAPH_CACHE_SIZE:
+                _dependency_graphs.popitem(last=False)
+
+    return status, graph
+
+
+def invalidate_dependency_graph(sid):
+    """Discards the cached graphs of the databases of the server, for all
+    the users.
+    """
+    with _dependency_graphs_lock:
+        for key in [key for key in _dependency_graphs if key[1] == sid]:
+            del _dependency_graphs[key]
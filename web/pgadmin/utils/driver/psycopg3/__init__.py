@@ -15,6 +15,7 @@ object.
 """
 import datetime
 import re
+from functools import lru_cache
 from flask import session
 from flask_babel import gettext
 from flask_login import current_user
@@ -24,15 +25,63 @@ from threading import Lock
 
 import config
 from pgadmin.model import Server
-from pgadmin.utils.server_access import get_server, \
-    get_user_server_query
+from pgadmin.utils.server_access import get_server_access, \
+    get_request_server, get_user_server_query
 from pgadmin.utils.exception import ObjectGone
-from .keywords import scan_keyword
+from .keywords import KEYWORDS
 from ..abstract import BaseDriver
 from .connection import Connection
 from .server_manager import ServerManager
 
-connection_restore_lock = Lock()
+# Keywords of the other databases, quoted as well
+EXTRA_KEYWORDS = {
+    'connect': 3,
+    'convert': 3,
+    'distributed': 0,
+    'exec': 3,
+    'log': 0,
+    'long': 3,
+    'minus': 3,
+    'nocache': 3,
+    'number': 3,
+    'package': 3,
+    'pls_integer': 3,
+    'raw': 3,
+    'return': 3,
+    'smalldatetime': 3,
+    'smallfloat': 3,
+    'smallmoney': 3,
+    'sysdate': 3,
+    'systimestap': 3,
+    'tinyint': 3,
+    'tinytext': 3,
+    'varchar2': 3
+}
+
+# Category of the keywords, looked up by ScanKeywordExtraLookup (an
+# unreserved extra keyword keeps the category of the PostgreSQL keyword).
+SCAN_KEYWORDS = dict(KEYWORDS, **{
+    key: category for key, category in EXTRA_KEYWORDS.items() if category
+})
+
+# Types, which should not be quoted even though they contain a space.
+UNQUOTED_TYPES = frozenset((
+    'bit varying',
+    '"char"',
+    'character varying',
+    'double precision',
+    'timestamp without time zone',
+    'timestamp with time zone',
+    'time without time zone',
+    'time with time zone',
+    '"trigger"',
+    '"unknown"'
+))
+
+SPECIAL_CHARS_RE = re.compile('[^a-z_0-9]+')
+
+# Maximum number of identifiers, quoted by qtIdent and qtTypeIdent, cached
+QUOTED_IDENTIFIERS_CACHE_SIZE = 16384
 
 
 class Driver(BaseDriver):
@@ -65,9 +114,43 @@ class Driver(BaseDriver):
 
     def __init__(self, **kwargs):
         self.managers = dict()
+        # Locks serializing the restoration of the connections, per session
+        # and server (see _restore_lock)
+        self.restore_locks = dict()
+        self.restore_locks_lock = Lock()
 
         super(Driver, self).__init__()
 
+    def _restore_lock(self, sid=None):
+        """
+        Returns the lock to be held while restoring the connections of the
+        given server (or of all the servers, when not given) for the current
+        session.
+
+        Restoring a connection may have to wait for a database server (or
+        for it to time out), hence only the requests of the same session, for
+        the same server, wait for each other.
+        """
+        key = (session.sid, sid)
+        with self.restore_locks_lock:
+            lock = self.restore_locks.get(key)
+            if lock is None:
+                lock = self.restore_locks[key] = Lock()
+        return lock
+
+    def _discard_restore_locks(self, sess, sid=None):
+        """
+        Discards the restore locks of the given session (only the one of the
+        given server, when given), which are not held.
+        """
+        with self.restore_locks_lock:
+            for key in [
+                key for key, lock in self.restore_locks.items()
+                if key[0] == sess and (sid is None or key[1] == sid) and
+                not lock.locked()
+            ]:
+                del self.restore_locks[key]
+
     def _restore_connections_from_session(self):
         """
         Used internally by connection_manager to restore connections
@@ -96,7 +179,8 @@ class Driver(BaseDriver):
                         manager.update_session()
             return managers
 
-        return {}
+        # Restored by another request of this session, while waiting
+        return self.managers[session.sid]
 
     def connection_manager(self, sid=None):
         """
@@ -116,13 +200,12 @@ class Driver(BaseDriver):
         # server. This is the primary security boundary — all
         # check_precondition decorators and tool endpoints flow
         # through connection_manager().
+        # The servers accessible to the user and the server row are only
+        # fetched once per request (see pgadmin.utils.server_access): this
+        # is called many times by a single request.
         if config.SERVER_MODE:
-            if current_user and current_user.is_authenticated:
-                server_data = get_server(sid)
-            else:
-                raise ObjectGone(
-                    gettext("Server not found."))
-            if server_data is None:
+            if not (current_user and current_user.is_authenticated) or \
+                    get_server_access(sid) is None:
                 raise ObjectGone(
                     gettext("Server not found."))
         else:
@@ -130,12 +213,11 @@ class Driver(BaseDriver):
             # Return None instead of raising so callers that
             # handle None gracefully (e.g., test teardown,
             # cleanup paths) are not disrupted.
-            server_data = Server.query.filter_by(id=sid).first()
-            if server_data is None:
+            if get_request_server(sid) is None:
                 return None
 
         if session.sid not in self.managers:
-            with connection_restore_lock:
+            with self._restore_lock():
                 # The wait is over but the object might have been loaded
                 # by some other thread check again
                 managers = self._restore_connections_from_session()
@@ -143,14 +225,16 @@ class Driver(BaseDriver):
             managers = self.managers[session.sid]
             if str(sid) in managers:
                 manager = managers[str(sid)]
-                with connection_restore_lock:
+                with self._restore_lock(sid):
                     manager._restore_connections()
                     manager.update_session()
 
         managers['pinged'] = datetime.datetime.now()
         if str(sid) not in managers:
-            # server_data was already access-checked above;
-            # it cannot be None at this point.
+            server_data = get_request_server(sid)
+            if server_data is None:
+                raise ObjectGone(
+                    gettext("Server not found."))
             manager = ServerManager(server_data)
             # Suppress passexec for non-owners of shared
             # servers — it runs commands on the client machine
@@ -265,6 +349,7 @@ class Driver(BaseDriver):
         if session.sid in self.managers and \
                 str(sid) in self.managers[session.sid]:
             del self.managers[session.sid][str(sid)]
+        self._discard_restore_locks(session.sid, sid)
 
     def gc_timeout(self):
         """
@@ -290,6 +375,7 @@ class Driver(BaseDriver):
                                                                ServerManager)
                 ]:
                     mgr.release()
+                self._discard_restore_locks(sess)
 
     def gc_own(self):
         """
@@ -307,6 +393,8 @@ class Driver(BaseDriver):
             ):
                 mgr.release()
 
+        self._discard_restore_locks(session.sid)
+
     @staticmethod
     def qtLiteral(value, conn, force_quote=False):
         if not conn:
@@ -348,31 +436,7 @@ class Driver(BaseDriver):
         # COL_NAME_KEYWORD        1
         # TYPE_FUNC_NAME_KEYWORD  2
         # RESERVED_KEYWORD        3
-        extra_keywords = {
-            'connect': 3,
-            'convert': 3,
-            'distributed': 0,
-            'exec': 3,
-            'log': 0,
-            'long': 3,
-            'minus': 3,
-            'nocache': 3,
-            'number': 3,
-            'package': 3,
-            'pls_integer': 3,
-            'raw': 3,
-            'return': 3,
-            'smalldatetime': 3,
-            'smallfloat': 3,
-            'smallmoney': 3,
-            'sysdate': 3,
-            'systimestap': 3,
-            'tinyint': 3,
-            'tinytext': 3,
-            'varchar2': 3
-        }
-
-        return extra_keywords.get(key, None) or scan_keyword(key)
+        return SCAN_KEYWORDS.get(key, None)
 
     @staticmethod
     def needsQuoting(key, for_types):
@@ -387,18 +451,7 @@ class Driver(BaseDriver):
         elif for_types and value.endswith('[]'):
             val_noarray = value[:-2]
 
-        if for_types and val_noarray.lower() in [
-            'bit varying',
-            '"char"',
-            'character varying',
-            'double precision',
-            'timestamp without time zone',
-            'timestamp with time zone',
-            'time without time zone',
-            'time with time zone',
-            '"trigger"',
-            '"unknown"'
-        ]:
+        if for_types and val_noarray.lower() in UNQUOTED_TYPES:
             return False
 
         # If already quoted?, If yes then do not quote again
@@ -409,7 +462,7 @@ class Driver(BaseDriver):
         if '0' <= val_noarray[0] <= '9':
             return True
 
-        if re.search('[^a-z_0-9]+', val_noarray):
+        if SPECIAL_CHARS_RE.search(val_noarray):
             return True
 
         # check string is keywaord or not
@@ -445,7 +498,9 @@ class Driver(BaseDriver):
                 continue
             value = val
 
-            if Driver.needsQuoting(val, True):
+            if type(val) is str:
+                value = quote_identifier(val, True)
+            elif Driver.needsQuoting(val, True):
                 value = value.replace("\"", "\"\"")
                 value = "\"" + value + "\""
 
@@ -473,10 +528,25 @@ class Driver(BaseDriver):
 
             value = val
 
-            if Driver.needsQuoting(val, False):
+            if type(val) is str:
+                value = quote_identifier(val, False)
+            elif Driver.needsQuoting(val, False):
                 value = value.replace("\"", "\"\"")
                 value = "\"" + value + "\""
 
             res = ((res and res + '.') or '') + value
 
         return res
+
+
+@lru_cache(maxsize=QUOTED_IDENTIFIERS_CACHE_SIZE)
+def quote_identifier(value, for_types):
+    """
+    Quote an identifier (or a type, if for_types), if needed.
+
+    The same names are quoted over and over again, while rendering the SQL
+    templates, hence - the most recently used are cached.
+    """
+    if Driver.needsQuoting(value, for_types):
+        return "\"" + value.replace("\"", "\"\"") + "\""
+    return value
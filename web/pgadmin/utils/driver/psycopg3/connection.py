@@ -35,7 +35,8 @@ from .cursor import DictCursor, AsyncDictCursor, AsyncDictServerCursor
 from .typecast import register_binary_data_typecasters,\
     register_global_typecasters, register_string_typecasters,\
     register_binary_typecasters, register_array_to_string_typecasters,\
-    register_numeric_typecasters, ALL_JSON_TYPES
+    register_numeric_typecasters, ALL_JSON_TYPES, CSV_NUMERIC_DATATYPES,\
+    CSV_TEXT_DATATYPES
 from .encoding import get_encoding, configure_driver_encodings
 from pgadmin.utils.text_sanitize import sanitize_external_text
 from pgadmin.utils import csv_lib as csv
@@ -179,6 +180,9 @@ class Connection(BaseConnection):
         self.__backend_pid = None
         self.execution_aborted = False
         self.row_count = 0
+        # Order of the rows of the result of the last asynchronous query,
+        # when it has been sorted/filtered in memory
+        self.result_order = None
         self.__notices = None
         self.__notifies = None
         self.password = None
@@ -855,7 +859,8 @@ WHERE db.datname = current_database()""")
 
     def execute_on_server_as_csv(self, records=2000):
         """
-        To fetch query result and generate CSV output
+        To fetch query result and generate CSV output, in the order the
+        result has been sorted/filtered in memory, if any (see result_order).
 
         Args:
             params: Additional parameters
@@ -864,6 +869,7 @@ WHERE db.datname = current_database()""")
             Generator response
         """
         cur = self.__async_cursor
+        result_order = self.result_order
         if not cur:
             return False, self.CURSOR_NOT_FOUND
 
@@ -903,29 +909,6 @@ WHERE db.datname = current_database()""")
             return False, \
                 gettext('The query executed did not return any data.')
 
-        def handle_null_values(results, replace_nulls_with):
-            """
-            This function is used to replace null values with the given string
-
-            :param results:
-            :param replace_nulls_with: null values will be replaced by this
-            string.
-            :return: modified result
-            """
-
-            temp_results = []
-            for row in results:
-                res = dict()
-                for k, v in row.items():
-                    if v is None:
-                        res[k] = replace_nulls_with
-                    else:
-                        res[k] = v
-                temp_results.append(res)
-            results = temp_results
-
-            return results
-
         def gen(conn_obj, trans_obj, quote='strings', quote_char="'",
                 field_separator=',', replace_nulls_with=None):
 
@@ -933,22 +916,43 @@ WHERE db.datname = current_database()""")
                 cur.scroll(0, mode='absolute')
             except Exception as e:
                 print(str(e))
+
+            if result_order is not None:
+                positions = iter([
+                    result_order[i:i + records]
+                    for i in range(0, len(result_order), records)
+                ])
+
+            def fetch():
+                if result_order is None:
+                    return cur.fetchmany(records)
+                return cur.fetchrows(next(positions, []))
+
             # Make sure numeric values will be fetched without quoting
             register_numeric_typecasters(cur)
-            results = cur.fetchmany(records)
+            results = fetch()
             if not results:
                 yield gettext('The query executed did not return any data.')
                 return
 
             header = []
             json_columns = []
+            # The type of the columns lets the CSV writer decide whether to
+            # quote a field without looking at its value
+            column_types = []
 
             for c in cur.ordered_description():
                 # This is to handle the case in which column name is non-ascii
                 column_name = c.to_dict()['name']
+                type_code = c.to_dict()['type_code']
                 header.append(column_name)
-                if c.to_dict()['type_code'] in ALL_JSON_TYPES:
+                if type_code in ALL_JSON_TYPES:
                     json_columns.append(column_name)
+                column_types.append(
+                    csv.NUMERIC_COLUMN
+                    if type_code in CSV_NUMERIC_DATATYPES else
+                    csv.TEXT_COLUMN if type_code in CSV_TEXT_DATATYPES
+                    else None)
 
             res_io = StringIO()
 
@@ -963,19 +967,19 @@ WHERE db.datname = current_database()""")
                 res_io, fieldnames=header, delimiter=field_separator,
                 quoting=quote,
                 quotechar=quote_char,
-                replace_nulls_with=replace_nulls_with
+                replace_nulls_with=replace_nulls_with,
+                column_types=column_types
             )
 
             csv_writer.writeheader()
-            # Replace the null values with given string if configured.
-            if replace_nulls_with is not None:
-                results = handle_null_values(results, replace_nulls_with)
+            # The null values are replaced with the given string (if
+            # configured) by the writer.
             csv_writer.writerows(results)
 
             yield res_io.getvalue()
 
             while True:
-                results = cur.fetchmany(records)
+                results = fetch()
 
                 if not results:
                     break
@@ -985,12 +989,10 @@ WHERE db.datname = current_database()""")
                     res_io, fieldnames=header, delimiter=field_separator,
                     quoting=quote,
                     quotechar=quote_char,
-                    replace_nulls_with=replace_nulls_with
+                    replace_nulls_with=replace_nulls_with,
+                    column_types=column_types
                 )
 
-                # Replace the null values with given string if configured.
-                if replace_nulls_with is not None:
-                    results = handle_null_values(results, replace_nulls_with)
                 csv_writer.writerows(results)
                 yield res_io.getvalue()
 
@@ -1099,6 +1101,7 @@ WHERE db.datname = current_database()""")
         """
         self.__async_cursor = None
         self.__async_query_error = None
+        self.result_order = None
 
         status, cur = self.__cursor(scrollable=True,
                                     server_cursor=server_cursor)
@@ -1221,6 +1224,72 @@ WHERE db.datname = current_database()""")
 
         return True, None
 
+    def copy_from(self, query, chunks):
+        """
+        This function runs the given COPY ... FROM STDIN statement, streaming
+        the chunks of data (bytes or str) produced by the given iterator to
+        the server, without holding them all in memory.
+
+        It is a generator yielding (True, number of bytes sent) after each
+        chunk, and (False, error message) if the copy fails. The number of
+        rows copied is available using rows_affected() once it is exhausted.
+
+        Args:
+            query: COPY ... FROM STDIN statement to run.
+            chunks: iterator producing the data to copy.
+        """
+        status, cur = self.__cursor()
+        self.row_count = 0
+
+        if not status:
+            yield False, str(cur)
+            return
+        query_id = str(secrets.choice(range(1, 9999999)))
+
+        current_app.logger.log(
+            25,
+            "Execute (copy) by {pga_user} on "
+            "{db_user}@{db_host}/{db_name} #{server_id} - "
+            "{conn_id} (Query-id: {query_id}):\n{query}".format(
+                pga_user=current_user.email,
+                db_user=self.conn.info.user,
+                db_host=self.conn.info.host,
+                db_name=self.conn.info.dbname,
+                server_id=self.manager.sid,
+                conn_id=self.conn_id,
+                query=query,
+                query_id=query_id
+            )
+        )
+
+        try:
+            for sent in cur.copy_from(
+                    query.encode(self.python_encoding), chunks):
+                yield True, sent
+        except psycopg.Error as pe:
+            cur.close_cursor()
+            if not self.connected():
+                raise ConnectionLost(
+                    self.manager.sid,
+                    self.db,
+                    None if self.conn_id[0:3] == 'DB:' else self.conn_id[5:]
+                )
+            errmsg = self._formatted_exception_msg(pe, False)
+            current_app.logger.error(
+                "Failed to execute query (copy_from) for the server "
+                "#{server_id} - {conn_id} (Query-id: {query_id}):\n"
+                "Error Message:{errmsg}".format(
+                    server_id=self.manager.sid,
+                    conn_id=self.conn_id,
+                    errmsg=errmsg,
+                    query_id=query_id
+                )
+            )
+            yield False, errmsg
+            return
+
+        self.row_count = cur.rowcount
+
     def __attempt_execution_reconnect(self, fn, *args, **kwargs):
         self.reconnecting = True
         setattr(g, self.ARGS_STR.format(
@@ -1436,6 +1505,67 @@ WHERE db.datname = current_database()""")
 
         return True, result
 
+    def async_fetch_columns(self, positions):
+        """
+        This function returns the values of the given columns, for all the
+        rows of the result of the last asynchronous query, column by column:
+        the values are returned as sent by the server (i.e. bytes in the text
+        format, None for NULL), without being converted to python objects.
+
+        The result must be complete, i.e. it is not available when the query
+        has been executed using a server cursor.
+
+        Args:
+            positions: positions of the columns
+
+        Returns:
+            (status, [(type oid, [values]), ...] or error message)
+        """
+        cur = self.__async_cursor
+        if not cur or cur.closed or cur.pgresult is None:
+            return False, self.CURSOR_NOT_FOUND
+
+        if type(cur) is AsyncDictServerCursor:
+            return False, gettext(
+                "The result is not fully fetched when using a server cursor."
+            )
+
+        if self.conn.pgconn.is_busy():
+            return False, gettext(
+                "Asynchronous query execution/operation underway."
+            )
+
+        try:
+            return True, [
+                (cur.description[pos].type_code, cur.column_values(pos))
+                for pos in positions
+            ]
+        except IndexError:
+            return False, gettext("Column not found in the result.")
+
+    def async_fetch_rows(self, positions):
+        """
+        This function returns the rows at the given positions (starting from
+        0), in the given order, of the result of the last asynchronous query
+        as a 2 dimensional array.
+
+        Args:
+            positions: positions of the rows
+        """
+        cur = self.__async_cursor
+        if not cur:
+            return False, self.CURSOR_NOT_FOUND
+
+        if self.conn.pgconn.is_busy():
+            return False, gettext(
+                "Asynchronous query execution/operation underway."
+            )
+
+        try:
+            return True, cur.fetchrows(positions, _tupples=True)
+        except (psycopg.ProgrammingError, IndexError):
+            return True, None
+
     def connected(self):
         if self.conn:
             if not self.conn.closed:
@@ -391,6 +391,73 @@ class AsyncDictCursor(_async_cursor):
         self.row_factory = dict_row
         return res
 
+    def fetchrows(self, positions, _tupples=False):
+        """
+        Fetch the tuples at the given positions, in the given order, as
+        ordered dictionary list.
+        """
+        self._odt_desc = None
+        self.row_factory = tuple_row
+        res = asyncio.run(self._fetchrows(positions))
+        if not _tupples and res is not None:
+            res = [self._dict_tuple(t) for t in res]
+
+        self.row_factory = dict_row
+        return res
+
+    async def _fetchrows(self, positions):
+        """
+        Fetch the tuples at the given positions, in the given order.
+        """
+        rows = []
+        for position in positions:
+            await self.cursor.scroll(self, position, mode="absolute")
+            rows.append(await self.cursor.fetchone(self))
+        return rows
+
+    def column_values(self, position):
+        """
+        Return the values of a column for all the tuples of the current
+        result, as sent by the server (None for NULL).
+        """
+        pgresult = self.pgresult
+        get_value = pgresult.get_value
+        return [get_value(row, position) for row in range(pgresult.ntuples)]
+
+    def copy_from(self, query, chunks):
+        """
+        Run a COPY ... FROM STDIN statement, sending the given chunks of
+        data to the server as they are produced.
+
+        This is a generator yielding the number of bytes sent after each
+        chunk, so that the caller can report the progress of the copy while
+        it runs. The number of rows copied is available in rowcount once it
+        is exhausted.
+
+        All the steps of the copy are run on the same event loop, which is
+        kept open until the copy is finished (unlike asyncio.run, which
+        would close the copy context at the end of each step).
+        """
+        loop = asyncio.new_event_loop()
+        copy_ctx = self.cursor.copy(self, query)
+        try:
+            copy = loop.run_until_complete(copy_ctx.__aenter__())
+            sent = 0
+            try:
+                for chunk in chunks:
+                    loop.run_until_complete(copy.write(chunk))
+                    sent += len(chunk)
+                    yield sent
+            except BaseException as e:
+                # Abort the copy on the server (e.g. when the data cannot be
+                # read any more, or the caller stops the copy)
+                loop.run_until_complete(
+                    copy_ctx.__aexit__(type(e), e, e.__traceback__))
+                raise
+            loop.run_until_complete(copy_ctx.__aexit__(None, None, None))
+        finally:
+            loop.close()
+
     async def _scrollcur(self, position, mode):
         """
         Fetch all tuples as ordered dictionary list.
@@ -14,6 +14,8 @@ import os
 import datetime
 import config
 import logging
+import threading
+from contextlib import contextmanager
 from flask import current_app, session
 from flask_security import current_user
 from flask_babel import gettext
@@ -37,6 +39,13 @@ if config.SUPPORT_SSH_TUNNEL:
 CONN_STRING = 'CONN:{0}'
 DB_STRING = 'DB:{0}'
 
+# Connections used by the current thread, instead of the default connections
+# to the databases, per server (see ServerManager.thread_connections): the
+# {sid: (conn_id, {my_id: Connection})}. They are not in the connections of
+# the manager, hence neither shared with the other threads, nor stored in
+# the session.
+_thread_connections = threading.local()
+
 
 class ServerManager(object):
     """
@@ -252,6 +261,22 @@ WHERE db.oid = {0}""".format(did))
             # the reason its not connected might be missing key
             raise CryptKeyMissing()
 
+        if conn_id is None and database is not None:
+            thread_conns = getattr(
+                _thread_connections, 'managers', {}).get(self.sid)
+            if thread_conns is not None:
+                thread_conn_id, connections = thread_conns
+                my_id = CONN_STRING.format(
+                    '{0}:{1}'.format(thread_conn_id, database))
+                if my_id not in connections:
+                    connections[my_id] = Connection(
+                        self, my_id, database, auto_reconnect=auto_reconnect,
+                        async_=0,
+                        use_binary_placeholder=use_binary_placeholder,
+                        array_to_string=array_to_string
+                    )
+                return connections[my_id]
+
         if database is None:
             # Check SSH Tunnel is alive or not.
             if self.use_ssh_tunnel == 1:
@@ -461,6 +486,25 @@ WHERE db.oid = {0}""".format(did))
 
         return False, True, my_id
 
+    @contextmanager
+    def thread_connections(self, conn_id):
+        """
+        Use separate connections (one per database, identified by conn_id
+        and the database name), instead of the default connections to the
+        databases, in the current thread, e.g. to run the node views in
+        worker threads in parallel. They are private to the thread (i.e.
+        not added to the connections of the manager), and released on exit.
+        """
+        managers = _thread_connections.__dict__.setdefault('managers', {})
+        connections = dict()
+        managers[self.sid] = (conn_id, connections)
+        try:
+            yield
+        finally:
+            del managers[self.sid]
+            for conn in connections.values():
+                conn._release()
+
     def release(self, database=None, conn_id=None, did=None):
         # Stop the SSH tunnel if release() function calls without
         # any parameter.
@@ -517,13 +561,24 @@ WHERE db.oid = {0}""".format(did))
                 conn.password = passwd
 
     def update_session(self):
+        """
+        Store the state of the manager in the session, if it has changed.
+
+        This is called on every look up of the manager (i.e. many times per
+        request), hence the session is only marked as modified, and written
+        at the end of the request, when the state stored in it is not the
+        current one anymore.
+        """
         managers = session['__pgsql_server_managers'] \
             if '__pgsql_server_managers' in session else dict()
         updated_mgr = self.as_dict()
 
+        if managers.get(self.sid) == updated_mgr:
+            # Unchanged (or still not connected)
+            return
+
         if not updated_mgr:
-            if self.sid in managers:
-                managers.pop(self.sid)
+            managers.pop(self.sid)
         else:
             managers[self.sid] = updated_mgr
         session['__pgsql_server_managers'] = managers
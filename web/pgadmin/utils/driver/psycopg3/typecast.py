@@ -128,6 +128,15 @@ PSYCOPG_SUPPORTED_RANGE_ARRAY_TYPES = (3905, 3927, 3907, 3913, 3909, 3911)
 # datemultirange[] tsmultirange[], tstzmultirange[]
 PSYCOPG_SUPPORTED_MULTIRANGE_ARRAY_TYPES = (6155, 6150, 6157, 6151, 6152, 6153)
 
+# boolean, bigint, smallint, integer, oid, real, double precision, numeric
+# These are fetched as Python numbers (or booleans) for the CSV output (see
+# register_numeric_typecasters).
+CSV_NUMERIC_DATATYPES = (16, 20, 21, 23, 26, 700, 701, 1700)
+
+# "char", name, text, character, character varying, json, jsonb
+# These are always fetched as strings.
+CSV_TEXT_DATATYPES = (18, 19, 25, 1042, 1043) + PSYCOPG_SUPPORTED_JSON_TYPES
+
 
 def register_global_typecasters():
     # This registers a unicode type caster for datatype 'RECORD_ARRAY'.
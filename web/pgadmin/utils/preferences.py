@@ -14,6 +14,7 @@ module within the system.
 
 import decimal
 import json
+from contextlib import contextmanager
 
 import dateutil.parser as dateutil_parser
 from flask import current_app
@@ -25,6 +26,130 @@ from pgadmin.model import db, Preferences as PrefTable, \
     PreferenceCategory as PrefCategoryTbl
 
 
+class _PreferenceIds():
+    """
+    Internal class to find (or create) the configuration table entries of the
+    modules, categories and preferences, one query at a time. When an entry
+    is duplicated, the first one (lowest id) is used.
+    """
+
+    def module_id(self, name):
+        # Find the entry for this module in the configuration database.
+        module = ModulePrefTable.query.filter_by(name=name).order_by(
+            ModulePrefTable.id).first()
+
+        # Can't find the reference for it in the configuration database,
+        # create on for it.
+        if module is None:
+            module = ModulePrefTable(name=name)
+            db.session.add(module)
+            db.session.commit()
+            module = ModulePrefTable.query.filter_by(name=name).order_by(
+                ModulePrefTable.id).first()
+
+        return module.id
+
+    def category_id(self, mid, name):
+        cat = PrefCategoryTbl.query.filter_by(
+            mid=mid
+        ).filter_by(name=name).order_by(PrefCategoryTbl.id).first()
+
+        if cat is None:
+            cat = PrefCategoryTbl(name=name, mid=mid)
+            db.session.add(cat)
+            db.session.commit()
+            cat = PrefCategoryTbl.query.filter_by(
+                mid=mid
+            ).filter_by(name=name).order_by(PrefCategoryTbl.id).first()
+
+        return cat.id
+
+    def preference_id(self, cid, name):
+        # Look into the configuration table to find out the id of the specific
+        # preference.
+        res = PrefTable.query.filter_by(
+            name=name, cid=cid
+        ).order_by(PrefTable.id).first()
+
+        if res is None:
+            # Could not find in the configuration table, we will create new
+            # entry for it.
+            res = PrefTable(name=name, cid=cid)
+            db.session.add(res)
+            db.session.commit()
+            res = PrefTable.query.filter_by(
+                name=name, cid=cid
+            ).order_by(PrefTable.id).first()
+
+        return res.id
+
+
+class _BulkPreferenceIds(_PreferenceIds):
+    """
+    Internal class to find the configuration table entries of the modules,
+    categories and preferences while registering them in bulk.
+
+    All the existing entries are loaded upfront in three queries. When an
+    entry is duplicated (e.g. created by two workers starting at the same
+    time), the first one (lowest id) is used, as by _PreferenceIds. The
+    missing entries are added to the current transaction (flushed to get
+    their id), which is committed when the next module is registered, and
+    at the end of the registration.
+    """
+
+    def __init__(self):
+        self.modules = dict()
+        for mid, name in db.session.query(
+                ModulePrefTable.id, ModulePrefTable.name
+        ).order_by(ModulePrefTable.id):
+            self.modules.setdefault(name, mid)
+
+        self.categories = dict()
+        for cid, mid, name in db.session.query(
+                PrefCategoryTbl.id, PrefCategoryTbl.mid, PrefCategoryTbl.name
+        ).order_by(PrefCategoryTbl.id):
+            self.categories.setdefault((mid, name), cid)
+
+        self.preferences = dict()
+        for pid, cid, name in db.session.query(
+                PrefTable.id, PrefTable.cid, PrefTable.name
+        ).order_by(PrefTable.id):
+            self.preferences.setdefault((cid, name), pid)
+
+        self.pending = False
+
+    def _create(self, row):
+        db.session.add(row)
+        db.session.flush()
+        self.pending = True
+        return row.id
+
+    def commit(self):
+        """Commit the entries created since the last commit."""
+        if self.pending:
+            db.session.commit()
+            self.pending = False
+
+    def module_id(self, name):
+        # Commit the entries of the previous module
+        self.commit()
+        if name not in self.modules:
+            self.modules[name] = self._create(ModulePrefTable(name=name))
+        return self.modules[name]
+
+    def category_id(self, mid, name):
+        if (mid, name) not in self.categories:
+            self.categories[(mid, name)] = self._create(
+                PrefCategoryTbl(name=name, mid=mid))
+        return self.categories[(mid, name)]
+
+    def preference_id(self, cid, name):
+        if (cid, name) not in self.preferences:
+            self.preferences[(cid, name)] = self._create(
+                PrefTable(name=name, cid=cid))
+        return self.preferences[(cid, name)]
+
+
 class _Preference():
     """
     Internal class representing module, and categoy bound preference.
@@ -77,49 +202,42 @@ class _Preference():
         self.disabled = kwargs.get('disabled', False)
         self.dependents = kwargs.get('dependents', None)
 
-        # Look into the configuration table to find out the id of the specific
-        # preference.
-        res = PrefTable.query.filter_by(
-            name=name, cid=cid
-        ).first()
-
-        if res is None:
-            # Could not find in the configuration table, we will create new
-            # entry for it.
-            res = PrefTable(name=self.name, cid=cid)
-            db.session.add(res)
-            db.session.commit()
-            res = PrefTable.query.filter_by(
-                name=name, cid=cid
-            ).first()
+        # Save the id of the configuration table entry for letter use.
+        self.pid = Preferences.ids().preference_id(cid, name)
 
-        # Save this id for letter use.
-        self.pid = res.id
-
-    def get(self):
+    def get(self, user_values=None):
         """
         get
         Fetch the value from the server for the current user from the
         configuration table (if available), otherwise returns the default value
         for it.
 
+        :param user_values: Values of the preferences of the current user by
+                            preference id, as returned by
+                            Preferences.user_values(). The configuration
+                            table is queried when not given.
+
         :returns: value for this preference.
         """
-        res = UserPrefTable.query.filter_by(
-            pid=self.pid
-        ).filter_by(uid=current_user.id).first()
+        if user_values is None:
+            res = UserPrefTable.query.filter_by(
+                pid=self.pid
+            ).filter_by(uid=current_user.id).first()
+            value = None if res is None else res.value
+        else:
+            value = user_values.get(self.pid)
 
         # Could not find any preference for this user, return default value.
-        if res is None:
+        if value is None:
             return self.default
 
         # The data stored in the configuration will be in string format, we
         # need to convert them in proper format.
-        is_format_data, data = self._get_format_data(res)
+        is_format_data, data = self._get_format_data(value)
         if is_format_data:
             return data
 
-        if self._type == 'text' and res.value == '' and not self.allow_blanks:
+        if self._type == 'text' and value == '' and not self.allow_blanks:
             return self.default
 
         parser_map = {
@@ -130,37 +248,37 @@ class _Preference():
             'keyboardshortcut': json.loads
         }
         try:
-            return parser_map.get(self._type, lambda v: v)(res.value)
+            return parser_map.get(self._type, lambda v: v)(value)
         except Exception as e:
             current_app.logger.exception(e)
             return self.default
 
-    def _get_format_data(self, res):
+    def _get_format_data(self, value):
         """
         Configuration data get stored in string format, convert it in to
         required format.
-        :param res: type value.
+        :param value: stored value.
         """
         if self._type in ('boolean', 'switch', 'node'):
-            return True, res.value == 'True'
+            return True, value == 'True'
         if self._type == 'options':
             for opt in self.options:
-                if 'value' in opt and opt['value'] == res.value:
-                    return True, res.value
+                if 'value' in opt and opt['value'] == value:
+                    return True, value
 
             if self.control_props and 'creatable' in self.control_props and \
                     self.control_props['creatable']:
-                return True, res.value
+                return True, value
 
             if self.select and 'tags' in self.select and self.select['tags']:
-                return True, res.value
+                return True, value
             return True, self.default
         if self._type == 'select':
-            if res.value:
-                res.value = res.value.replace('[', '')
-                res.value = res.value.replace(']', '')
-                res.value = res.value.replace('\'', '')
-                return True, [val.strip() for val in res.value.split(',')]
+            if value:
+                value = value.replace('[', '')
+                value = value.replace(']', '')
+                value = value.replace('\'', '')
+                return True, [val.strip() for val in value.split(',')]
             return True, None
 
         return False, None
@@ -246,11 +364,14 @@ class _Preference():
 
         return ret_val
 
-    def to_json(self):
+    def to_json(self, user_values=None):
         """
         to_json
         Returns the JSON object representing this preferences.
 
+        :param user_values: Values of the preferences of the current user by
+                            preference id (see get()).
+
         :returns: the JSON representation for this preferences
         """
         res = {
@@ -265,7 +386,7 @@ class _Preference():
             'max_val': self.max_val,
             'options': self.options,
             'select': self.select,
-            'value': self.get(),
+            'value': self.get(user_values),
             'fields': self.fields,
             'hidden': self.hidden,
             'disabled': self.disabled,
@@ -301,6 +422,7 @@ class Preferences():
     -------- -----------
     """
     modules = dict()
+    _bulk_ids = None
 
     def __init__(self, name, label=None):
         """
@@ -316,19 +438,7 @@ class Preferences():
         self.name = name
         self.label = label
         self.categories = dict()
-
-        # Find the entry for this module in the configuration database.
-        module = ModulePrefTable.query.filter_by(name=name).first()
-
-        # Can't find the reference for it in the configuration database,
-        # create on for it.
-        if module is None:
-            module = ModulePrefTable(name=name)
-            db.session.add(module)
-            db.session.commit()
-            module = ModulePrefTable.query.filter_by(name=name).first()
-
-        self.mid = module.id
+        self.mid = Preferences.ids().module_id(name)
 
         if name in Preferences.modules:
             m = Preferences.modules[name]
@@ -336,11 +446,53 @@ class Preferences():
         else:
             Preferences.modules[name] = self
 
-    def to_json(self):
+    @classmethod
+    def ids(cls):
+        """
+        ids
+        Returns the object used to find/create the configuration table
+        entries of the modules, categories and preferences.
+        """
+        return cls._bulk_ids or _PreferenceIds()
+
+    @classmethod
+    @contextmanager
+    def bulk_registration(cls):
+        """
+        bulk_registration
+        Context manager to register many modules and preferences at once,
+        e.g. at start up.
+
+        Rather than querying (and possibly creating) the configuration table
+        entry of each module, category and preference one after the other,
+        all the entries are loaded in three queries, and the missing ones are
+        created in one transaction per module.
+        """
+        if cls._bulk_ids is not None:
+            # Already registering in bulk
+            yield
+            return
+
+        cls._bulk_ids = _BulkPreferenceIds()
+        try:
+            yield
+            cls._bulk_ids.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            cls._bulk_ids = None
+
+    def to_json(self, user_values=None):
         """
         to_json
         Converts the preference object to the JSON Format.
 
+        :param user_values: Values of the preferences of the current user by
+                            preference id, as returned by user_values(). The
+                            configuration table is queried for each
+                            preference when not given.
+
         :returns: a JSON object contains information.
         """
         res = {
@@ -361,7 +513,7 @@ class Preferences():
             res['categories'].append(interm)
 
             for p in cat['preferences']:
-                pref = (cat['preferences'][p]).to_json().copy()
+                pref = (cat['preferences'][p]).to_json(user_values).copy()
                 pref.update({'mid': self.mid, 'cid': cat['id']})
                 interm['preferences'].append(pref)
 
@@ -386,20 +538,8 @@ class Preferences():
 
             return res
 
-        cat = PrefCategoryTbl.query.filter_by(
-            mid=self.mid
-        ).filter_by(name=name).first()
-
-        if cat is None:
-            cat = PrefCategoryTbl(name=name, mid=self.mid)
-            db.session.add(cat)
-            db.session.commit()
-            cat = PrefCategoryTbl.query.filter_by(
-                mid=self.mid
-            ).filter_by(name=name).first()
-
         self.categories[name] = res = {
-            'id': cat.id,
+            'id': Preferences.ids().category_id(self.mid, name),
             'name': name,
             'label': label,
             'preferences': dict()
@@ -493,12 +633,34 @@ class Preferences():
         :returns: a list of the preferences for each of the modules.
         """
         res = []
+        user_values = cls.user_values()
 
         for m in Preferences.modules:
-            res.append(Preferences.modules[m].to_json())
+            res.append(Preferences.modules[m].to_json(user_values))
 
         return res
 
+    @staticmethod
+    def user_values(user_id=None):
+        """
+        user_values
+        Fetch the values of all the preferences set by the user in a single
+        query.
+
+        :param user_id: User to fetch the values for; defaults to the current
+                        user.
+
+        :returns: a dictionary of the stored (string) values by preference id.
+        """
+        if user_id is None:
+            user_id = current_user.id
+
+        return dict(
+            db.session.query(UserPrefTable.pid, UserPrefTable.value).filter(
+                UserPrefTable.uid == user_id
+            )
+        )
+
     @classmethod
     def register_preference(
         cls, module, category, name, label, _type, **kwargs
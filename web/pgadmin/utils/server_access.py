@@ -14,7 +14,9 @@ helpers enforce that users can only access servers they own or that
 have been explicitly shared with them via SharedServer entries.
 """
 
-from sqlalchemy import or_, case, func, literal
+from sqlalchemy import or_, case, func, literal, event
+from sqlalchemy.orm import Session
+from flask import g, has_app_context
 from flask_security import current_user
 
 from pgadmin.model import db, Server, ServerGroup
@@ -65,6 +67,92 @@ def get_server(sid, only_owned=False):
     ).first()
 
 
+def get_request_server(sid):
+    """Same as get_server(sid), memoized for the current request.
+
+    A single request (e.g. a tree expansion) may look up the same server
+    many times, through the check_precondition decorators; the server row
+    is only fetched once. The memo is discarded when any server is
+    created, updated or deleted (see invalidate_server_access()).
+    """
+    if not has_app_context():
+        return get_server(sid)
+
+    servers = g.setdefault('_request_servers', {})
+    if sid not in servers:
+        servers[sid] = get_server(sid)
+    return servers[sid]
+
+
+def set_request_servers(servers):
+    """Add servers loaded in bulk (e.g. all the servers of a group) to the
+    memo of get_request_server(), for the current request.
+
+    The server objects must not be modified (e.g. by an overlay of the
+    shared server properties) for the rest of the request.
+    """
+    if not has_app_context():
+        return
+
+    request_servers = g.setdefault('_request_servers', {})
+    for server in servers:
+        request_servers.setdefault(server.id, server)
+
+
+def _load_server_access(user_id):
+    rows = db.session.query(
+        Server.id, Server.user_id, Server.shared
+    ).filter(
+        or_(Server.user_id == user_id, Server.shared)
+    ).all()
+    return {row.id: (row.user_id, bool(row.shared)) for row in rows}
+
+
+def get_server_access(sid):
+    """Check if the current user can access a server, in server mode.
+
+    The servers accessible to the user are loaded at once, with a single
+    query, and memoized for the current request only, so that a server
+    deleted, or no longer shared, is not accessible from the next request
+    on (whichever process has changed it).
+
+    Returns:
+        (owner id, shared) if the server is accessible, None otherwise.
+    """
+    if not has_app_context():
+        return _load_server_access(current_user.id).get(sid)
+
+    if '_server_access' not in g:
+        g._server_access = _load_server_access(current_user.id)
+    return g._server_access.get(sid)
+
+
+def invalidate_server_access():
+    """Discard the servers accessible to the user, memoized for the current
+    request.
+
+    It is called when a server is created, updated or deleted, as the
+    ownership or the sharing of the server may have changed, and when the
+    changes are rolled back. The bulk deletes (which are not seen by the
+    ORM events) must call it explicitly.
+    """
+    if has_app_context():
+        g.pop('_server_access', None)
+        g.pop('_request_servers', None)
+
+
+@event.listens_for(Server, 'after_insert')
+@event.listens_for(Server, 'after_update')
+@event.listens_for(Server, 'after_delete')
+def _server_changed(mapper, connection, target):
+    invalidate_server_access()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _session_rolled_back(session):
+    invalidate_server_access()
+
+
 def get_server_group(gid,hide_shared=False):
     """Fetch a server group by ID, verifying user access.
 
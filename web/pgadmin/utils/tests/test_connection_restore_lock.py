@@ -0,0 +1,173 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import datetime
+import threading
+from unittest.mock import patch, MagicMock
+
+import config
+from pgadmin.utils.driver.psycopg3 import Driver
+from pgadmin.utils.route import BaseTestGenerator
+
+SLOW_SERVER = 1
+FAST_SERVER = 2
+TIMEOUT = 10
+
+
+class ThreadSession:
+    """The session of the request run by the current thread."""
+    local = threading.local()
+
+    @property
+    def sid(self):
+        return self.local.sid
+
+
+class FakeServerManager:
+    """
+    A server manager, reconnecting to a server (which may be slow to
+    respond) on restoration.
+    """
+    def __init__(self, sid, respond):
+        self.sid = sid
+        self.respond = respond
+        self.restoring = threading.Event()
+        self.concurrent = False
+        self._active = 0
+
+    def _restore_connections(self):
+        self._active += 1
+        self.concurrent = self.concurrent or self._active > 1
+        self.restoring.set()
+        self.respond.wait(TIMEOUT)
+        self._active -= 1
+
+    def update_session(self):
+        pass
+
+
+class TestConnectionRestoreLock(BaseTestGenerator):
+    """
+    Restoring the connections of a session to a slow (or unreachable)
+    server only makes the requests of the same session, to the same server,
+    wait.
+    """
+    scenarios = [
+        ('Another session, same server', dict(
+            request_session='other', request_server=SLOW_SERVER,
+            expected_wait=False)),
+        ('Same session, another server', dict(
+            request_session='slow', request_server=FAST_SERVER,
+            expected_wait=False)),
+        ('Same session, same server', dict(
+            request_session='slow', request_server=SLOW_SERVER,
+            expected_wait=True)),
+    ]
+
+    def runTest(self):
+        driver = Driver()
+        slow_server = threading.Event()
+        fast_server = threading.Event()
+        fast_server.set()
+
+        # Only the connection of the 'slow' session to the slow server has
+        # been lost, and has to be restored.
+        driver.managers['slow'] = {
+            str(SLOW_SERVER): FakeServerManager(SLOW_SERVER, slow_server),
+            str(FAST_SERVER): FakeServerManager(FAST_SERVER, fast_server)
+        }
+        driver.managers['other'] = {
+            str(SLOW_SERVER): FakeServerManager(SLOW_SERVER, fast_server),
+            str(FAST_SERVER): FakeServerManager(FAST_SERVER, fast_server)
+        }
+
+        done = threading.Event()
+
+        def request(sess, sid, event=None):
+            ThreadSession.local.sid = sess
+            driver.connection_manager(sid)
+            if event is not None:
+                event.set()
+
+        with patch('pgadmin.utils.driver.psycopg3.session',
+                   ThreadSession()), \
+                patch('pgadmin.utils.driver.psycopg3.get_request_server',
+                      return_value=MagicMock()), \
+                patch.object(config, 'SERVER_MODE', False):
+            slow = threading.Thread(target=request,
+                                    args=('slow', SLOW_SERVER))
+            slow.start()
+            manager = driver.managers['slow'][str(SLOW_SERVER)]
+            self.assertTrue(manager.restoring.wait(TIMEOUT))
+
+            other = threading.Thread(
+                target=request,
+                args=(self.request_session, self.request_server, done))
+            other.start()
+
+            try:
+                # Still waiting for the slow server
+                self.assertEqual(done.wait(0.5), not self.expected_wait)
+            finally:
+                slow_server.set()
+                slow.join(TIMEOUT)
+                other.join(TIMEOUT)
+
+        self.assertTrue(done.is_set())
+        self.assertFalse(manager.concurrent)
+
+
+class TestConnectionRestoreLockPruning(BaseTestGenerator):
+    """
+    The restore locks of a server are discarded along with its manager, and
+    those of a session when its connections are released.
+    """
+    scenarios = [
+        ('Delete the manager of a server', dict(
+            action='delete_manager',
+            expected={('idle', None), ('idle', SLOW_SERVER),
+                      ('slow', None), ('slow', FAST_SERVER)})),
+        ('Release the connections of the idle sessions', dict(
+            action='gc_timeout',
+            expected={('slow', None), ('slow', SLOW_SERVER),
+                      ('slow', FAST_SERVER)})),
+        ('Release the connections of the session', dict(
+            action='gc_own',
+            expected={('idle', None), ('idle', SLOW_SERVER)})),
+    ]
+
+    def runTest(self):
+        driver = Driver()
+        for sess in ('slow', 'idle'):
+            driver.managers[sess] = {'pinged': datetime.datetime.now()}
+            for sid in (None, SLOW_SERVER, FAST_SERVER):
+                ThreadSession.local.sid = sess
+                with patch('pgadmin.utils.driver.psycopg3.session',
+                           ThreadSession()):
+                    driver._restore_lock(sid)
+        driver.managers['idle']['pinged'] -= datetime.timedelta(days=1)
+
+        # Held by a request, kept
+        held = driver.restore_locks[('idle', FAST_SERVER)]
+        held.acquire()
+
+        ThreadSession.local.sid = 'slow'
+        try:
+            with patch('pgadmin.utils.driver.psycopg3.session',
+                       ThreadSession()), \
+                    patch.object(driver, 'connection_manager',
+                                 return_value=None):
+                if self.action == 'delete_manager':
+                    driver.delete_manager(SLOW_SERVER)
+                else:
+                    getattr(driver, self.action)()
+        finally:
+            held.release()
+
+        self.assertEqual(set(driver.restore_locks),
+                         self.expected | {('idle', FAST_SERVER)})
@@ -0,0 +1,88 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import uuid
+from decimal import Decimal
+from io import StringIO
+
+from pgadmin.utils import csv_lib as csv
+from pgadmin.utils.route import BaseTestGenerator
+
+FIELDNAMES = ['id', 'amount', 'name', 'ref']
+COLUMN_TYPES = [csv.NUMERIC_COLUMN, csv.NUMERIC_COLUMN, csv.TEXT_COLUMN,
+                None]
+ROWS = [
+    {'id': 1, 'amount': Decimal('1.50'), 'name': 'it\'s, "quoted"',
+     'ref': uuid.UUID(int=1)},
+    {'id': 2, 'amount': None, 'name': 'NULL', 'ref': None},
+    {'id': 3, 'amount': 2.5, 'name': '', 'ref': True},
+]
+
+
+class TestCSVFastWriter(BaseTestGenerator):
+    """
+    The rows are written by the C csv module, when the dialect allows it,
+    with the same output as the pure-Python quoting strategies.
+    """
+    scenarios = [
+        ('Quote the strings', dict(
+            params=dict(quoting=csv.QUOTE_NONNUMERIC,
+                        replace_nulls_with='NULL'),
+            fast=True,
+            expected='"id","amount","name","ref"\r\n'
+                     '1,1.50,"it\'s, ""quoted""",'
+                     '"00000000-0000-0000-0000-000000000001"\r\n'
+                     '2,NULL,NULL,NULL\r\n'
+                     '3,2.5,"",True\r\n')),
+        ('Quote all the fields', dict(
+            params=dict(quoting=csv.QUOTE_ALL, quotechar="'",
+                        delimiter=';'),
+            fast=True,
+            expected="'id';'amount';'name';'ref'\r\n"
+                     "'1';'1.50';'it''s, \"quoted\"';"
+                     "'00000000-0000-0000-0000-000000000001'\r\n"
+                     "'2';;'NULL';\r\n"
+                     "'3';'2.5';'';'True'\r\n")),
+        ('Quote none of the fields', dict(
+            params=dict(quoting=csv.QUOTE_NONE, delimiter='|',
+                        replace_nulls_with='[null]'),
+            fast=True,
+            expected='id|amount|name|ref\r\n'
+                     '1|1.50|it\'s, "quoted"|'
+                     '00000000-0000-0000-0000-000000000001\r\n'
+                     '2|[null]|NULL|[null]\r\n'
+                     '3|2.5||True\r\n')),
+        ('Quote the strings, nulls with the delimiter', dict(
+            params=dict(quoting=csv.QUOTE_NONNUMERIC,
+                        replace_nulls_with='a,b'),
+            fast=False,
+            expected=None)),
+        ('Quote the special characters only', dict(
+            params=dict(quoting=csv.QUOTE_MINIMAL),
+            fast=False,
+            expected=None)),
+    ]
+
+    def _write(self, column_types, fast):
+        res_io = StringIO()
+        writer = csv.DictWriter(res_io, fieldnames=FIELDNAMES,
+                                column_types=column_types, **self.params)
+        self.assertEqual(writer.writer.fast_writer is not None, self.fast)
+        if not fast:
+            writer.writer.fast_writer = None
+        writer.writeheader()
+        writer.writerows(ROWS)
+        return res_io.getvalue()
+
+    def runTest(self):
+        expected = self._write(None, fast=False)
+        if self.expected is not None:
+            self.assertEqual(expected, self.expected)
+
+        self.assertEqual(self._write(None, fast=True), expected)
+        self.assertEqual(self._write(COLUMN_TYPES, fast=True), expected)
@@ -0,0 +1,63 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from unittest.mock import patch, MagicMock
+
+from pgadmin.utils import dependency_graph
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestDependencyGraphCache(BaseTestGenerator):
+    """
+    The cache of the dependency graphs is bounded: the expired graphs are
+    evicted when a graph is cached, and then the least recently used ones.
+    """
+    scenarios = [
+        ('Evict the least recently used graph', dict(
+            expire=False,
+            expected=[(2, 'db'), (0, 'db'), (3, 'db')])),
+        ('Evict the expired graphs', dict(
+            expire=True,
+            expected=[(3, 'db')])),
+    ]
+
+    def setUp(self):
+        dependency_graph._dependency_graphs.clear()
+
+    def _get(self, sid):
+        conn = MagicMock(db='db')
+        conn.manager.sid = sid
+        return dependency_graph.get_dependency_graph(conn)
+
+    def runTest(self):
+        now = [1000.0]
+        with patch.object(dependency_graph, 'current_user',
+                          MagicMock(id=1)), \
+                patch.object(dependency_graph.time, 'monotonic',
+                             side_effect=lambda: now[0]), \
+                patch.object(dependency_graph.config,
+                             'DEPENDENCY_GRAPH_CACHE_TTL', 30), \
+                patch.object(dependency_graph.config,
+                             'DEPENDENCY_GRAPH_CACHE_SIZE', 3), \
+                patch.object(dependency_graph, 'build_dependency_graph',
+                             side_effect=lambda conn: (True, MagicMock())):
+            for sid in range(3):
+                self._get(sid)
+            # Used again, hence not the least recently used one any more
+            self._get(0)
+
+            if self.expire:
+                now[0] += 60
+            self._get(3)
+
+        self.assertEqual([key[1:] for key in
+                          dependency_graph._dependency_graphs],
+                         self.expected)
+
+    def tearDown(self):
+        dependency_graph._dependency_graphs.clear()
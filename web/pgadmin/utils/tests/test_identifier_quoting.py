@@ -0,0 +1,68 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from pgadmin.utils.driver.psycopg3 import Driver, quote_identifier
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestIdentifierQuoting(BaseTestGenerator):
+    """
+    The identifiers are quoted by qtIdent and qtTypeIdent the same way,
+    whether they are looked up in the cache of the quoted identifiers or
+    not.
+    """
+    scenarios = [
+        ('Plain identifier', dict(
+            args=('public', 'table_1'), expected='public.table_1',
+            expected_type='public.table_1')),
+        ('Reserved keyword', dict(
+            args=('user',), expected='"user"', expected_type='"user"')),
+        ('Unreserved keyword', dict(
+            args=('action',), expected='action', expected_type='action')),
+        ('Column name keyword', dict(
+            args=('integer',), expected='"integer"',
+            expected_type='integer')),
+        ('Extra keyword', dict(
+            args=('varchar2',), expected='"varchar2"',
+            expected_type='"varchar2"')),
+        ('Unreserved extra keyword', dict(
+            args=('log',), expected='log', expected_type='log')),
+        ('Mixed case and quotes', dict(
+            args=('Tab"le',), expected='"Tab""le"',
+            expected_type='"Tab""le"')),
+        ('Leading digit', dict(
+            args=('1abc',), expected='"1abc"', expected_type='"1abc"')),
+        ('Type with a space', dict(
+            args=('pg_catalog', 'character varying[]'),
+            expected='pg_catalog."character varying[]"',
+            expected_type='pg_catalog.character varying[]')),
+        ('Quoted type', dict(
+            args=('"char"',), expected='"""char"""',
+            expected_type='"char"')),
+        ('Empty and numeric parts', dict(
+            args=('', 'public', 5), expected='public."5"',
+            expected_type='public."5"')),
+    ]
+
+    def runTest(self):
+        # Looked up in the cache after the first time
+        for _ in range(2):
+            self.assertEqual(Driver.qtIdent(None, *self.args),
+                             self.expected)
+            self.assertEqual(Driver.qtTypeIdent(None, *self.args),
+                             self.expected_type)
+
+        for arg in self.args:
+            if isinstance(arg, str) and arg:
+                self.assertEqual(quote_identifier(arg, False),
+                                 quote_identifier.__wrapped__(arg, False))
+                self.assertEqual(quote_identifier(arg, True),
+                                 quote_identifier.__wrapped__(arg, True))
+
+        self.assertEqual(list(Driver.qtIdent(None, list(self.args[-1:]))),
+                         [self.expected.rsplit('.', 1)[-1]])
@@ -0,0 +1,77 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from unittest.mock import patch
+
+from werkzeug.routing import Map, Rule
+
+import pgadmin
+from pgadmin import LazyBuilderRule, get_url_rule_class
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestLazyBuilderRule(BaseTestGenerator):
+    """
+    The URL builders of the rules are only compiled when a URL is built, and
+    build the same URLs as the werkzeug ones.
+    """
+    scenarios = [
+        ('Static rule', dict(
+            rule='/browser/', values={},
+            expected=('', '/browser/')
+        )),
+        ('Rule with converters and a query string', dict(
+            rule='/sqleditor/<int:trans_id>/<path:name>',
+            values={'trans_id': 5, 'name': 'a/b', 'x': 'y z'},
+            expected=('', '/sqleditor/5/a/b?x=y+z')
+        )),
+    ]
+
+    def runTest(self):
+        with patch.object(LazyBuilderRule, 'compile_builder', autospec=True,
+                          side_effect=LazyBuilderRule.compile_builder) \
+                as compiled:
+            lazy = LazyBuilderRule(self.rule, endpoint='lazy')
+            Map([lazy])
+            self.assertEqual(compiled.call_count, 0)
+
+            self.assertEqual(lazy.build(self.values), self.expected)
+            self.assertEqual(lazy.build(self.values), self.expected)
+            self.assertEqual(compiled.call_count, 1)
+
+        eager = Rule(self.rule, endpoint='eager')
+        Map([eager])
+        self.assertEqual(eager.build(self.values), self.expected)
+        self.assertEqual(eager.build(self.values, append_unknown=False),
+                         lazy.build(self.values, append_unknown=False))
+
+
+class TestUrlRuleClass(BaseTestGenerator):
+    """
+    LazyBuilderRule is only used with the werkzeug versions it works with.
+    """
+    scenarios = [
+        ('Supported werkzeug', dict(
+            werkzeug_version='3.1.3', build=None, expected=LazyBuilderRule
+        )),
+        ('Unsupported werkzeug version', dict(
+            werkzeug_version='4.0.0', build=None, expected=Rule
+        )),
+        ('Werkzeug no longer calling the builder', dict(
+            werkzeug_version='3.1.3', build=AttributeError, expected=Rule
+        )),
+    ]
+
+    def runTest(self):
+        with patch.object(pgadmin, 'version',
+                          return_value=self.werkzeug_version), \
+                patch.object(LazyBuilderRule, 'compile_builder',
+                             autospec=True,
+                             side_effect=self.build or
+                             LazyBuilderRule.compile_builder):
+            self.assertIs(get_url_rule_class(), self.expected)
@@ -0,0 +1,115 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from pgadmin.model import db, ModulePreference, PreferenceCategory, \
+    Preferences as PrefTable
+from pgadmin.utils.preferences import Preferences
+from pgadmin.utils.route import BaseTestGenerator
+
+MODULE_NAME = 'test_bulk_registration'
+OTHER_MODULE_NAME = 'test_bulk_registration_other'
+
+
+class TestPreferencesBulkRegistration(BaseTestGenerator):
+    """
+    Registering preferences in bulk creates the missing configuration table
+    entries in one transaction per module, and reuses the existing ones (the
+    first one, if duplicated) without any other query than the three made
+    upfront.
+    """
+    scenarios = [
+        ('Bulk registration of a new module', dict()),
+    ]
+
+    def setUp(self):
+        pass
+
+    def _register(self):
+        module = Preferences(MODULE_NAME, 'Test')
+        module.register('display', 'first', 'First', 'boolean', True,
+                        category_label='Display')
+        module.register('display', 'second', 'Second', 'integer', 1,
+                        category_label='Display')
+        return module
+
+    def _register_modules(self):
+        module = self._register()
+        other = Preferences(OTHER_MODULE_NAME, 'Other')
+        other.register('display', 'first', 'First', 'boolean', True,
+                       category_label='Display')
+        return module
+
+    def _count_statements(self, func):
+        statements = []
+
+        def _count(*args):
+            statements.append(args[2])
+
+        with self.app.app_context():
+            engine = db.engine
+            event.listen(engine, 'before_cursor_execute', _count)
+            try:
+                with self.app.test_request_context(), \
+                        Preferences.bulk_registration():
+                    module = func()
+            finally:
+                event.remove(engine, 'before_cursor_execute', _count)
+        return module, statements
+
+    def runTest(self):
+        with patch.object(db.session, 'commit',
+                          wraps=db.session.commit) as commit:
+            module, _ = self._count_statements(self._register_modules)
+            # Committed once per module
+            self.assertEqual(commit.call_count, 2)
+
+        with self.app.app_context():
+            mid = ModulePreference.query.filter_by(
+                name=MODULE_NAME).first().id
+            cat = PreferenceCategory.query.filter_by(
+                mid=mid, name='display').first()
+            first = PrefTable.query.filter_by(cid=cat.id,
+                                              name='first').first()
+
+        self.assertEqual(module.mid, mid)
+        self.assertEqual(module.categories['display']['id'], cat.id)
+        self.assertEqual(
+            module.categories['display']['preferences']['first'].pid,
+            first.id)
+
+        # Duplicated, e.g. by two workers starting at the same time
+        with self.app.app_context():
+            db.session.add(PrefTable(cid=cat.id, name='first'))
+            db.session.commit()
+
+        # Registered again, e.g. by another worker: nothing is created, and
+        # the first of the duplicated entries is used
+        Preferences.modules.pop(MODULE_NAME, None)
+        module, statements = self._count_statements(self._register)
+        self.assertEqual(len(statements), 3)
+        self.assertEqual(module.mid, mid)
+        self.assertEqual(
+            module.categories['display']['preferences']['first'].pid,
+            first.id)
+
+    def tearDown(self):
+        with self.app.app_context():
+            for name in (MODULE_NAME, OTHER_MODULE_NAME):
+                Preferences.modules.pop(name, None)
+                mid = ModulePreference.query.filter_by(name=name).first()
+                if mid is None:
+                    continue
+                for cat in PreferenceCategory.query.filter_by(mid=mid.id):
+                    PrefTable.query.filter_by(cid=cat.id).delete()
+                    db.session.delete(cat)
+                db.session.delete(mid)
+            db.session.commit()
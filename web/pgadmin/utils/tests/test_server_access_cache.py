@@ -0,0 +1,129 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from unittest.mock import patch, MagicMock
+
+from sqlalchemy import event, update
+
+import config
+from pgadmin.model import db, Server, ServerGroup, User
+from pgadmin.utils import server_access
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestServerAccessCache(BaseTestGenerator):
+    """
+    The servers accessible to a user are fetched once per request, and
+    fetched again when a server is changed, or the changes are rolled back;
+    a server row is fetched once per request.
+    """
+    scenarios = [
+        ('Server access memoized per request', dict()),
+    ]
+
+    def setUp(self):
+        with self.app.app_context():
+            user = User.query.first()
+            group = ServerGroup.query.filter_by(user_id=user.id).first()
+            server = Server(
+                user_id=user.id, servergroup_id=group.id,
+                name='test_server_access_cache', host='localhost',
+                port=5432, maintenance_db='postgres', username='postgres',
+                save_password=0, use_ssh_tunnel=0, tunnel_authentication=0,
+                tunnel_prompt_password=0, shared=False)
+            db.session.add(server)
+            db.session.commit()
+            self.owner_id = user.id
+            self.server_id = server.id
+
+    def _count_statements(self, user_id, func, requests=1):
+        statements = []
+
+        def _count(*args):
+            statements.append(args[2])
+
+        results = []
+        with self.app.app_context():
+            engine = db.engine
+        event.listen(engine, 'before_cursor_execute', _count)
+        try:
+            with patch.object(server_access, 'current_user',
+                              MagicMock(id=user_id)):
+                # Every request has its own application context, even
+                # though the test runner has pushed one for the whole run
+                for _ in range(requests):
+                    with self.app.app_context(), \
+                            self.app.test_request_context():
+                        results.append(func())
+        finally:
+            event.remove(engine, 'before_cursor_execute', _count)
+        return results, statements
+
+    def _access(self):
+        # A tree expansion checks the access to the server many times
+        return [server_access.get_server_access(self.server_id)
+                for _ in range(10)]
+
+    def runTest(self):
+        other_id = self.owner_id + 100000
+
+        with patch.object(config, 'SERVER_MODE', True):
+            results, statements = self._count_statements(
+                self.owner_id, self._access, requests=2)
+            self.assertEqual(len(statements), 2)
+            for result in results:
+                self.assertEqual(result,
+                                 [(self.owner_id, False)] * 10)
+
+            # Not accessible to another user...
+            results, _ = self._count_statements(other_id, self._access)
+            self.assertEqual(results[0], [None] * 10)
+
+            # ... until the server is shared, e.g. by another process, which
+            # is seen by the next request
+            with self.app.app_context():
+                db.session.execute(
+                    update(Server).where(Server.id == self.server_id).values(
+                        shared=True))
+                db.session.commit()
+
+            results, _ = self._count_statements(other_id, self._access)
+            self.assertEqual(results[0], [(self.owner_id, True)] * 10)
+
+            # Unshared, and shared again but rolled back, in the request
+            def _unshare():
+                server = Server.query.get(self.server_id)
+                server.shared = False
+                db.session.commit()
+                access = [server_access.get_server_access(self.server_id)]
+
+                server.shared = True
+                db.session.flush()
+                access.append(server_access.get_server_access(self.server_id))
+                db.session.rollback()
+                access.append(server_access.get_server_access(self.server_id))
+                return access
+
+            results, _ = self._count_statements(other_id, _unshare)
+            self.assertEqual(results[0], [None, (self.owner_id, True), None])
+
+            results, _ = self._count_statements(other_id, self._access)
+            self.assertEqual(results[0], [None] * 10)
+
+            # The server row is fetched once per request
+            results, statements = self._count_statements(
+                self.owner_id,
+                lambda: {server_access.get_request_server(self.server_id).id
+                         for _ in range(10)})
+            self.assertEqual(len(statements), 1)
+            self.assertEqual(results[0], {self.server_id})
+
+    def tearDown(self):
+        with self.app.app_context():
+            Server.query.filter_by(id=self.server_id).delete()
+            db.session.commit()
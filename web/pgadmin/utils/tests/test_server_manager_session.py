@@ -0,0 +1,64 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2026, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from unittest.mock import patch
+
+from pgadmin.utils.driver.psycopg3 import server_manager
+from pgadmin.utils.driver.psycopg3.server_manager import ServerManager
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.session import ManagedSession
+
+CONNECTED = {'sid': 1, 'ver': 160000, 'sversion': 160000,
+             'connections': {'DB:postgres': {'conn_id': 'DB:postgres',
+                                             'database': 'postgres'}}}
+
+
+class TestServerManagerUpdateSession(BaseTestGenerator):
+    """
+    The state of a server manager is only stored in the session (which is
+    then written at the end of the request) when it has changed.
+    """
+    scenarios = [
+        ('Unchanged state', dict(
+            stored={1: CONNECTED}, state=CONNECTED,
+            expected_modified=False, expected={1: CONNECTED})),
+        ('Not connected', dict(
+            stored=None, state=None,
+            expected_modified=False, expected=None)),
+        ('Connected', dict(
+            stored=None, state=CONNECTED,
+            expected_modified=True, expected={1: CONNECTED})),
+        ('New connection', dict(
+            stored={1: dict(CONNECTED, connections={})}, state=CONNECTED,
+            expected_modified=True, expected={1: CONNECTED})),
+        ('Disconnected', dict(
+            stored={1: CONNECTED, 2: CONNECTED}, state=None,
+            expected_modified=True, expected={2: CONNECTED})),
+    ]
+
+    def runTest(self):
+        sess = ManagedSession(sid='test_server_manager_update_session')
+        if self.stored is not None:
+            sess['__pgsql_server_managers'] = {
+                sid: dict(state) for sid, state in self.stored.items()}
+        sess.modified = False
+
+        manager = ServerManager.__new__(ServerManager)
+        manager.sid = 1
+
+        with patch.object(server_manager, 'session', sess), \
+                patch.object(ServerManager, 'as_dict',
+                             side_effect=lambda: self.state and dict(
+                                 self.state)):
+            # Looked up many times during the same request
+            for _ in range(10):
+                manager.update_session()
+
+        self.assertEqual(sess.modified, self.expected_modified)
+        self.assertEqual(sess.force_write, self.expected_modified)
+        self.assertEqual(sess.get('__pgsql_server_managers'), self.expected)
@@ -99,7 +99,7 @@ describe('FileManger', ()=>{
 
   beforeAll(()=>{
     networkMock = new MockAdapter(axios);
-    networkMock.onPost(`/file_manager/filemanager/${transId}/`).reply(200, {data: {result: files}});
+    networkMock.onPost(`/file_manager/filemanager/${transId}/`).reply(200, {data: {result: {files: files, next_cursor: null, total: files.length}}});
     networkMock.onPost(`/file_manager/save_file_dialog_view/${transId}`).reply(200, {});
     networkMock.onDelete(`/file_manager/delete_trans_id/${transId}`).reply(200, {});
   });